@@ -0,0 +1,32 @@
+"""Benchmark of ivy.Array construction throughput, and of the per-op overhead of
+wrapping the returns of ivy functions in ivy.Array instances.
+
+Run with ``python benchmarks/array_construction.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 100000
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    native = ivy.native_array([1.0, 2.0, 3.0])
+    x = ivy.array(native)
+    construct = min(timeit.repeat(lambda: ivy.Array(native), number=NUMBER, repeat=3))
+    print("ivy.Array construction: {:.0f} arrays/s".format(NUMBER / construct))
+    backend_add = ivy.current_backend().add
+    raw = min(
+        timeit.repeat(lambda: backend_add(native, native), number=NUMBER, repeat=3)
+    )
+    wrapped = min(timeit.repeat(lambda: ivy.add(x, x), number=NUMBER, repeat=3))
+    print("ivy.add overhead: {:.2f} us/op".format((wrapped - raw) / NUMBER * 1e6))
+    access = min(
+        timeit.repeat(lambda: ivy.Array(native).dtype, number=NUMBER, repeat=3)
+    )
+    print("construction + dtype access: {:.0f} arrays/s".format(NUMBER / access))
+    ivy.unset_backend()
@@ -0,0 +1,43 @@
+"""Benchmark of repeated ``ivy.set_backend``/``ivy.unset_backend`` round-trips, both
+from an empty backend stack and nested within another backend.
+
+Run with ``python benchmarks/backend_switching.py``.
+"""
+
+# global
+import time
+import timeit
+
+# local
+import ivy
+from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
+
+NUMBER = 100
+
+
+def _round_trip(backend):
+    ivy.set_backend(backend)
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    for backend in available_frameworks:
+        start = time.perf_counter()
+        _round_trip(backend)
+        first = time.perf_counter() - start
+        repeated = min(
+            timeit.repeat(lambda: _round_trip(backend), number=NUMBER, repeat=3)
+        )
+        ivy.set_backend("numpy")
+        nested = min(
+            timeit.repeat(lambda: _round_trip(backend), number=NUMBER, repeat=3)
+        )
+        ivy.unset_backend()
+        print(
+            "{:<12} first: {:8.2f} ms, repeated: {:8.3f} ms, nested: {:8.3f} ms".format(
+                backend,
+                first * 1e3,
+                repeated / NUMBER * 1e3,
+                nested / NUMBER * 1e3,
+            )
+        )
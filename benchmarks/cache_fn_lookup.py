@@ -0,0 +1,30 @@
+"""Benchmark of ivy.cache_fn lookups with an array argument, keyed by the default
+content digest and by identity through `key_fn`.
+
+Run with ``python benchmarks/cache_fn_lookup.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 10000
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.random_uniform(shape=(256, 256))
+
+    def fn(x):
+        return ivy.sum(x)
+
+    for name, cached in [
+        ("content digest", ivy.cache_fn(fn)),
+        ("identity", ivy.cache_fn(fn, key_fn=lambda x: id(x))),
+    ]:
+        cached(x)
+        lookup = min(timeit.repeat(lambda: cached(x), number=NUMBER, repeat=3))
+        print("{} lookup: {:.2f} us".format(name, lookup / NUMBER * 1e6))
+    ivy.unset_backend()
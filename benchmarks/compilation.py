@@ -0,0 +1,56 @@
+"""Benchmark of compiled replays against eager calls, for the forward pass of a small
+MLP and for a step of the Adam optimizer.
+
+Run with ``python benchmarks/compilation.py``.
+"""
+
+# global
+import logging
+import timeit
+
+# local
+import ivy
+
+NUMBER = 1000
+
+
+class MLP(ivy.Module):
+    def __init__(self, compile_on_next_step=False):
+        self._linear0 = ivy.Linear(32, 64)
+        self._linear1 = ivy.Linear(64, 64)
+        self._linear2 = ivy.Linear(64, 10)
+        ivy.Module.__init__(self, compile_on_next_step=compile_on_next_step)
+
+    def _forward(self, x):
+        x = ivy.relu(self._linear0(x))
+        x = ivy.relu(self._linear1(x))
+        return self._linear2(x)
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    # numpy warns on every variable and stop_gradient call
+    logging.disable(logging.WARNING)
+    x = ivy.random_normal(shape=(8, 32))
+    v = ivy.Container(
+        w=ivy.random_normal(shape=(64, 64)), b=ivy.random_normal(shape=(64,))
+    )
+    grads = ivy.Container(
+        w=ivy.random_normal(shape=(64, 64)), b=ivy.random_normal(shape=(64,))
+    )
+    for compiled in (False, True):
+        mlp = MLP(compile_on_next_step=compiled)
+        mlp(x)
+        forward = min(timeit.repeat(lambda: mlp(x), number=NUMBER, repeat=3))
+        adam = ivy.Adam(lr=1e-3, compile_on_next_step=compiled)
+        adam.step(v, grads)
+        adam.step(v, grads)
+        step = min(timeit.repeat(lambda: adam.step(v, grads), number=NUMBER, repeat=3))
+        print(
+            "{}: MLP forward {:.1f} us, Adam step {:.1f} us".format(
+                "compiled" if compiled else "eager",
+                forward / NUMBER * 1e6,
+                step / NUMBER * 1e6,
+            )
+        )
+    ivy.unset_backend()
@@ -0,0 +1,51 @@
+"""Benchmark of loading a container of 100 arrays, 100 MB in total, from an hdf5 file,
+eagerly and lazily, in full and sliced.
+
+Run with ``python benchmarks/container_hdf5.py``.
+"""
+
+# global
+import os
+import tempfile
+import time
+
+# local
+import ivy
+
+NUM_LEAVES = 100
+
+SHAPE = (256, 1024)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    filepath = os.path.join(tempfile.mkdtemp(), "container.hdf5")
+    ivy.Container(
+        {
+            "layer{}".format(i): {"w": ivy.random_uniform(shape=SHAPE)}
+            for i in range(NUM_LEAVES)
+        }
+    ).cont_to_disk_as_hdf5(filepath)
+    for name, fn in (
+        ("eager", lambda: ivy.Container.cont_from_disk_as_hdf5(filepath)),
+        (
+            "eager, 16 rows",
+            lambda: ivy.Container.cont_from_disk_as_hdf5(filepath, slice(0, 16)),
+        ),
+        ("lazy", lambda: ivy.Container.cont_from_disk_as_hdf5(filepath, lazy=True)),
+        (
+            "lazy, one leaf used",
+            lambda: ivy.to_numpy(
+                ivy.Container.cont_from_disk_as_hdf5(filepath, lazy=True).layer0.w
+            ),
+        ),
+    ):
+        print("{:<20} {:10.1f} ms".format(name, min(_time(fn) for _ in range(3)) * 1e3))
+    os.remove(filepath)
+    ivy.unset_backend()
@@ -0,0 +1,40 @@
+"""Benchmark of ``cont_map``, ``cont_multi_map`` and a nestable op over a parameter
+container with 1,000 leaves.
+
+Run with ``python benchmarks/container_map.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 20
+
+NUM_LEAVES = 1000
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    v = ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.random_normal(shape=(4, 4)),
+                "b": ivy.random_normal(shape=(4,)),
+            }
+            for i in range(NUM_LEAVES // 2)
+        }
+    )
+    grads = v.cont_map(lambda x, kc: x * 0.1)
+    for name, fn in (
+        ("cont_map", lambda: v.cont_map(lambda x, kc: x)),
+        (
+            "cont_multi_map",
+            lambda: ivy.Container.cont_multi_map(lambda xs, kc: xs[0], [v, grads]),
+        ),
+        ("ivy.add", lambda: ivy.add(v, grads)),
+    ):
+        elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+        print("{:<15} {:8.3f} ms".format(name, elapsed * 1e3))
+    ivy.unset_backend()
@@ -0,0 +1,70 @@
+"""Benchmark of the throughput of a queue-backed container, consuming batches from a
+producer process, with and without read-ahead and shared memory hand-off.
+
+Run with ``python benchmarks/container_queues.py``.
+"""
+
+# global
+import multiprocessing
+import time
+
+import numpy as np
+
+# local
+import ivy
+
+NUM_SHARDS = 32
+
+SHARD_SIZE = 256
+
+SHAPE = (3, 64, 64)
+
+
+def _producer(out_queues, shared, delay):
+    for out_queue in out_queues:
+        time.sleep(delay)
+        cont = ivy.Container(
+            images=ivy.random_uniform(shape=(SHARD_SIZE,) + SHAPE),
+            labels=ivy.arange(SHARD_SIZE),
+        )
+        out_queue.put(cont.cont_to_shared_memory() if shared else cont.cont_to_dict())
+
+
+def _consume(shared, prefetch_depth, delay):
+    out_queues = [multiprocessing.Queue() for _ in range(NUM_SHARDS)]
+    producer = multiprocessing.Process(
+        target=_producer, args=(out_queues, shared, delay)
+    )
+    start = time.perf_counter()
+    producer.start()
+    cont = ivy.Container(
+        queues=out_queues,
+        queue_load_sizes=[SHARD_SIZE] * NUM_SHARDS,
+        queue_timeout=60.0,
+        queue_prefetch_depth=prefetch_depth,
+        queue_cache_size=2,
+    )
+    for i in range(NUM_SHARDS):
+        batch = cont[i * SHARD_SIZE : (i + 1) * SHARD_SIZE]
+        # stands in for a training step on the batch
+        time.sleep(delay)
+        np.sum(ivy.to_numpy(batch.images))
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return NUM_SHARDS * SHARD_SIZE / elapsed
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    for delay in (0.0, 0.02):
+        for shared, prefetch_depth in ((False, 0), (False, 4), (True, 4)):
+            print(
+                "step {:4.2f} s, shared memory {:<5}, read-ahead {}: "
+                "{:8.0f} samples/s".format(
+                    delay,
+                    str(shared),
+                    prefetch_depth,
+                    _consume(shared, prefetch_depth, delay),
+                )
+            )
+    ivy.unset_backend()
@@ -0,0 +1,46 @@
+"""Benchmark of a 10k-iteration ``ivy.WhileLoop`` with each installed backend. The
+JAX and TensorFlow backends compile the loop into a single while op, whereas NumPy
+and PyTorch run it in Python.
+
+Run with ``python benchmarks/control_flow.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
+
+NUMBER = 3
+
+NUM_ITERATIONS = 10000
+
+SIZE = 16
+
+
+def test_fn(i, x):
+    return i < NUM_ITERATIONS
+
+
+def body_fn(i, x):
+    return i + 1, ivy.tanh(x) * 0.5 + 0.1
+
+
+if __name__ == "__main__":
+    for backend in available_frameworks:
+        ivy.set_backend(backend)
+        x = ivy.ones((SIZE,))
+        elapsed = min(
+            timeit.repeat(
+                lambda: ivy.WhileLoop(test_fn, body_fn, (0, x)),
+                number=NUMBER,
+                repeat=3,
+            )
+        )
+        print(
+            "{:<12} {:d} iterations: {:8.2f} ms".format(
+                backend, NUM_ITERATIONS, elapsed / NUMBER * 1e3
+            )
+        )
+        ivy.unset_backend()
@@ -0,0 +1,55 @@
+"""Micro-benchmark of the per-call overhead of the function wrappers, comparing the
+default chain of decorators against the fused wrappers enabled with
+``ivy.set_wrapper_fusion_mode(True)``.
+
+Run with ``python benchmarks/func_wrapper_overhead.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 10000
+
+
+def _bench(fused):
+    ivy.set_wrapper_fusion_mode(fused)
+    ivy.set_backend("numpy")
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    native = ivy.to_native(x)
+    calls = {
+        "add": lambda: ivy.add(x, x),
+        "matmul": lambda: ivy.matmul(x, x),
+        "sum": lambda: ivy.sum(x),
+    }
+    backend_calls = {
+        "add": lambda: ivy.current_backend().add(native, native),
+        "matmul": lambda: ivy.current_backend().matmul(native, native),
+        "sum": lambda: ivy.current_backend().sum(native),
+    }
+    ret = dict()
+    for name, call in calls.items():
+        wrapped = min(timeit.repeat(call, number=NUMBER, repeat=3)) / NUMBER
+        raw = min(timeit.repeat(backend_calls[name], number=NUMBER, repeat=3))
+        ret[name] = (wrapped, wrapped - raw / NUMBER)
+    ivy.unset_backend()
+    ivy.unset_wrapper_fusion_mode()
+    return ret
+
+
+if __name__ == "__main__":
+    chained = _bench(False)
+    fused = _bench(True)
+    print(
+        "{:<8}{:>16}{:>16}{:>10}".format("fn", "chained (us)", "fused (us)", "speedup")
+    )
+    for name in chained:
+        c_overhead = chained[name][1] * 1e6
+        f_overhead = fused[name][1] * 1e6
+        print(
+            "{:<8}{:>16.2f}{:>16.2f}{:>10.2f}".format(
+                name, c_overhead, f_overhead, c_overhead / max(f_overhead, 1e-9)
+            )
+        )
@@ -0,0 +1,54 @@
+"""Benchmark of optimizer steps over a container of many small variables, comparing
+the default per-leaf updates against the fused updates over flat buffers.
+
+Run with ``python benchmarks/fused_optimizers.py``.
+"""
+
+# global
+import logging
+import timeit
+
+# local
+import ivy
+
+NUMBER = 10
+
+NUM_LEAVES = 300
+
+
+def _container():
+    return ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.random_normal(shape=(16, 16)),
+                "b": ivy.random_normal(shape=(16,)),
+            }
+            for i in range(NUM_LEAVES // 2)
+        }
+    )
+
+
+def _bench(cls, fused):
+    v, grads = _container(), _container()
+    optimizer = cls(lr=1e-3, fused=fused)
+    v = optimizer.step(v, grads)
+
+    def step():
+        nonlocal v
+        v = optimizer.step(v, grads)
+
+    return min(timeit.repeat(step, number=NUMBER, repeat=3)) / NUMBER
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    # numpy warns on every stop_gradient call
+    logging.disable(logging.WARNING)
+    for cls in (ivy.SGD, ivy.LARS, ivy.Adam, ivy.LAMB):
+        per_leaf, fused = _bench(cls, False), _bench(cls, True)
+        print(
+            "{:<5} per-leaf: {:8.2f} ms, fused: {:8.2f} ms, speedup: {:5.1f}x".format(
+                cls.__name__, per_leaf * 1e3, fused * 1e3, per_leaf / fused
+            )
+        )
+    ivy.unset_backend()
@@ -0,0 +1,41 @@
+"""Micro-benchmark of the per-call overhead of ``handle_nestable``, with and without
+containers present in the arguments, and within ``ivy.NestableMode(False)``.
+
+Run with ``python benchmarks/handle_nestable_overhead.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+from ivy.func_wrapper import handle_nestable
+
+NUMBER = 10000
+
+
+def _identity(*args, **kwargs):
+    return args
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.array([1.0, 2.0])
+    wrapped = handle_nestable(_identity)
+    cont = ivy.Container(a=x, b=x)
+    cases = {
+        "arrays": lambda: wrapped(x, x, axis=0),
+        "nested arrays": lambda: wrapped([x, x], axis=0),
+        "container": lambda: ivy.add(cont, x),
+        "ivy.add": lambda: ivy.add(x, x),
+    }
+    print("{:<16}{:>14}{:>22}".format("case", "default (us)", "NestableMode(False)"))
+    for name, call in cases.items():
+        default = min(timeit.repeat(call, number=NUMBER, repeat=3)) / NUMBER
+        if name == "container":
+            print("{:<16}{:>14.2f}{:>22}".format(name, default * 1e6, "-"))
+            continue
+        with ivy.NestableMode(False):
+            skipped = min(timeit.repeat(call, number=NUMBER, repeat=3)) / NUMBER
+        print("{:<16}{:>14.2f}{:>22.2f}".format(name, default * 1e6, skipped * 1e6))
+    ivy.unset_backend()
@@ -0,0 +1,55 @@
+"""Benchmark of the time and peak memory of ``import ivy`` in a fresh interpreter,
+which also fails if importing ivy loads any of the frameworks or frontends.
+
+Run with ``python benchmarks/import_time.py``.
+"""
+
+# global
+import json
+import subprocess
+import sys
+
+REPEAT = 5
+
+FRAMEWORKS = ("torch", "tensorflow", "jax", "haiku")
+
+_CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+import ivy
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "time": elapsed,
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def _import_ivy():
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    runs = [_import_ivy() for _ in range(REPEAT)]
+    modules = runs[0]["modules"]
+    loaded = sorted(
+        set(m.split(".")[0] for m in modules if m.split(".")[0] in FRAMEWORKS)
+        | set(
+            ".".join(m.split(".")[:4])
+            for m in modules
+            if m.startswith("ivy.functional.frontends.")
+        )
+    )
+    print(
+        "import ivy: {:.1f} ms, peak RSS {:.1f} MB, {} modules".format(
+            min(run["time"] for run in runs) * 1e3,
+            min(run["rss"] for run in runs) / 1024,
+            len(modules),
+        )
+    )
+    if loaded:
+        sys.exit("import ivy loaded {}".format(", ".join(loaded)))
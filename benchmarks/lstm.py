@@ -0,0 +1,48 @@
+"""Benchmark of ``ivy.lstm_update`` and of the compositional implementation, over
+sequences of 500 steps.
+
+Run with ``python benchmarks/lstm.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+from ivy.functional.ivy.layers import lstm_update as compositional_lstm_update
+
+NUMBER = 5
+
+BATCH_SIZE = 32
+
+TIMESTEPS = 500
+
+INPUT_CHANNELS = 64
+
+OUTPUT_CHANNELS = 128
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.random_normal(shape=(BATCH_SIZE, TIMESTEPS, INPUT_CHANNELS))
+    init_h = ivy.zeros((BATCH_SIZE, OUTPUT_CHANNELS))
+    init_c = ivy.zeros((BATCH_SIZE, OUTPUT_CHANNELS))
+    kernel = ivy.random_normal(shape=(INPUT_CHANNELS, 4 * OUTPUT_CHANNELS))
+    recurrent_kernel = ivy.random_normal(shape=(OUTPUT_CHANNELS, 4 * OUTPUT_CHANNELS))
+    bias = ivy.zeros((4 * OUTPUT_CHANNELS,))
+    for name, fn in (
+        ("ivy.lstm_update", ivy.lstm_update),
+        ("compositional", compositional_lstm_update),
+    ):
+        elapsed = (
+            min(
+                timeit.repeat(
+                    lambda: fn(x, init_h, init_c, kernel, recurrent_kernel, bias=bias),
+                    number=NUMBER,
+                    repeat=3,
+                )
+            )
+            / NUMBER
+        )
+        print("{:<16} {:8.2f} ms".format(name, elapsed * 1e3))
+    ivy.unset_backend()
@@ -0,0 +1,81 @@
+"""Benchmark of the throughput of ``ivy.fomaml_step`` against the number of tasks,
+when looping over the tasks and when training them all at once with
+``vectorized=True``.
+
+Run with ``python benchmarks/meta_vectorized.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 5
+
+NUM_TASKS = (1, 4, 16, 64)
+
+TASK_BATCH_SIZE = 16
+
+INPUT_CHANNELS = 8
+
+HIDDEN_CHANNELS = 32
+
+INNER_GRAD_STEPS = 3
+
+
+def cost_fn(sub_batch, v):
+    x = ivy.reshape(sub_batch["x"], (TASK_BATCH_SIZE, INPUT_CHANNELS))
+    y = ivy.reshape(sub_batch["y"], (TASK_BATCH_SIZE, 1))
+    h = ivy.tanh(ivy.linear(x, v["w0"], bias=v["b0"]))
+    return ivy.mean((ivy.linear(h, v["w1"], bias=v["b1"]) - y) ** 2)
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    variables = ivy.Container(
+        {
+            "w0": ivy.random_normal(shape=(HIDDEN_CHANNELS, INPUT_CHANNELS)),
+            "b0": ivy.zeros((HIDDEN_CHANNELS,)),
+            "w1": ivy.random_normal(shape=(1, HIDDEN_CHANNELS)),
+            "b1": ivy.zeros((1,)),
+        }
+    )
+    for num_tasks in NUM_TASKS:
+        batch = ivy.Container(
+            {
+                "x": ivy.random_normal(
+                    shape=(num_tasks, TASK_BATCH_SIZE, INPUT_CHANNELS)
+                ),
+                "y": ivy.random_normal(shape=(num_tasks, TASK_BATCH_SIZE, 1)),
+            }
+        )
+        for vectorized in (False, True):
+            elapsed = (
+                min(
+                    timeit.repeat(
+                        lambda: ivy.fomaml_step(
+                            batch,
+                            cost_fn,
+                            None,
+                            variables,
+                            INNER_GRAD_STEPS,
+                            1e-2,
+                            batched=False,
+                            vectorized=vectorized,
+                        ),
+                        number=NUMBER,
+                        repeat=3,
+                    )
+                )
+                / NUMBER
+            )
+            print(
+                "tasks {:<3} {:<11} {:8.2f} ms  {:8.1f} tasks/s".format(
+                    num_tasks,
+                    "vectorized" if vectorized else "for loop",
+                    elapsed * 1e3,
+                    num_tasks / elapsed,
+                )
+            )
+    ivy.unset_backend()
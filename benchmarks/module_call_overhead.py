@@ -0,0 +1,56 @@
+"""Benchmark of the forward latency of deep stacks of small ``ivy.Linear`` layers
+with the NumPy backend, where the time is dominated by the per-call overhead of the
+modules rather than by the layers themselves. The layers are either chained by
+``ivy.Sequential``, which passes each layer its variables, or called directly by a
+parent module, which extracts the variables of each layer from its own.
+
+Run with ``python benchmarks/module_call_overhead.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 20
+
+BATCH_SIZE = 8
+
+CHANNELS = 16
+
+DEPTHS = (10, 50, 100)
+
+
+class Stack(ivy.Module):
+    def __init__(self, depth):
+        self.layers = [ivy.Linear(CHANNELS, CHANNELS) for _ in range(depth)]
+        ivy.Module.__init__(self)
+
+    def _forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.random_normal(shape=(BATCH_SIZE, CHANNELS))
+    for depth in DEPTHS:
+        models = {
+            "sequential": ivy.Sequential(
+                *[ivy.Linear(CHANNELS, CHANNELS) for _ in range(depth)]
+            ),
+            "stack": Stack(depth),
+        }
+        for name, model in models.items():
+            forward = min(timeit.repeat(lambda: model(x), number=NUMBER, repeat=3))
+            forward_with_v = min(
+                timeit.repeat(lambda: model(x, v=model.v), number=NUMBER, repeat=3)
+            )
+            print(
+                "depth {:<4} {:<10} forward {:8.2f} ms  with v {:8.2f} ms".format(
+                    depth, name, forward / NUMBER * 1e3, forward_with_v / NUMBER * 1e3
+                )
+            )
+    ivy.unset_backend()
@@ -0,0 +1,36 @@
+"""Benchmark of building and reducing an ivy.NestedArray of variable-length sequences.
+
+Run with ``python benchmarks/nested_array.py``.
+"""
+
+# global
+import time
+import numpy as np
+
+# local
+import ivy
+
+NUMBER = 3
+ROWS = 100000
+
+
+def _time(fn):
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        ret = fn()
+    return (time.perf_counter() - start) / NUMBER, ret
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    row_lengths = np.random.randint(1, 20, size=ROWS)
+    values = ivy.array(np.random.uniform(size=(int(row_lengths.sum()), 8)))
+    latency, nested = _time(
+        lambda: ivy.NestedArray.from_row_lengths(values, row_lengths)
+    )
+    print("from_row_lengths ({} rows): {:.3f} s".format(ROWS, latency))
+    latency, _ = _time(lambda: nested * 2.0 + 1.0)
+    print("elementwise: {:.3f} s".format(latency))
+    latency, _ = _time(lambda: nested.mean(axis=1))
+    print("mean over the ragged dimension: {:.3f} s".format(latency))
+    ivy.unset_backend()
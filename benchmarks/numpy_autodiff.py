@@ -0,0 +1,62 @@
+"""Benchmark of a training step of small MLPs with the NumPy backend, which records
+the calls made on the variables on a tape to compute their gradients.
+
+Run with ``python benchmarks/numpy_autodiff.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 20
+
+BATCH_SIZE = 64
+
+INPUT_CHANNELS = 32
+
+HIDDEN_SIZES = (64, 256)
+
+NUM_LAYERS = (2, 4)
+
+
+class MLP(ivy.Module):
+    def __init__(self, hidden_size, num_layers):
+        sizes = [INPUT_CHANNELS] + [hidden_size] * num_layers
+        self.layers = [ivy.Linear(i, o) for i, o in zip(sizes[:-1], sizes[1:])]
+        self.head = ivy.Linear(hidden_size, 1)
+        ivy.Module.__init__(self)
+
+    def _forward(self, x):
+        for layer in self.layers:
+            x = ivy.relu(layer(x))
+        return self.head(x)
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.random_normal(shape=(BATCH_SIZE, INPUT_CHANNELS))
+    target = ivy.random_normal(shape=(BATCH_SIZE, 1))
+    for hidden_size in HIDDEN_SIZES:
+        for num_layers in NUM_LAYERS:
+            model = MLP(hidden_size, num_layers)
+            optimizer = ivy.Adam(1e-3)
+
+            def loss_fn(v):
+                return ivy.mean((model(x, v=v) - target) ** 2)
+
+            def train_step():
+                loss, grads = ivy.execute_with_gradients(loss_fn, model.v)
+                model.v = optimizer.step(model.v, grads)
+
+            forward = min(
+                timeit.repeat(lambda: loss_fn(model.v), number=NUMBER, repeat=3)
+            )
+            step = min(timeit.repeat(train_step, number=NUMBER, repeat=3))
+            print(
+                "hidden {:<4} layers {:<2} forward {:8.2f} ms  step {:8.2f} ms".format(
+                    hidden_size, num_layers, forward / NUMBER * 1e3, step / NUMBER * 1e3
+                )
+            )
+    ivy.unset_backend()
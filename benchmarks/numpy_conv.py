@@ -0,0 +1,55 @@
+"""Benchmark of the latency and peak memory of the numpy backend convolutions on
+ResNet-sized layers.
+
+Run with ``python benchmarks/numpy_conv.py``.
+"""
+
+# global
+import time
+import tracemalloc
+import numpy as np
+
+# local
+import ivy
+
+NUMBER = 3
+
+# (name, NHWC input shape, HWIO filter shape, strides)
+LAYERS = [
+    ("conv3x3 56x56x64->64", (1, 56, 56, 64), (3, 3, 64, 64), 1),
+    ("conv3x3 28x28x128->128", (1, 28, 28, 128), (3, 3, 128, 128), 1),
+    ("conv3x3/2 28x28x256->256", (1, 28, 28, 256), (3, 3, 256, 256), 2),
+    ("conv1x1 14x14x1024->256", (1, 14, 14, 1024), (1, 1, 1024, 256), 1),
+]
+
+
+def _measure(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        fn()
+    return (time.perf_counter() - start) / NUMBER, peak
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    backend = ivy.current_backend()
+    for name, x_shape, filter_shape, strides in LAYERS:
+        x = np.random.uniform(size=x_shape).astype(np.float32)
+        filters = np.random.uniform(size=filter_shape).astype(np.float32)
+        latency, peak = _measure(lambda: backend.conv2d(x, filters, strides, "SAME"))
+        print(
+            "{}: {:.1f} ms, peak {:.1f} MB".format(name, latency * 1e3, peak / 2**20)
+        )
+    x = np.random.uniform(size=(1, 56, 56, 128)).astype(np.float32)
+    filters = np.random.uniform(size=(3, 3, 128)).astype(np.float32)
+    latency, peak = _measure(lambda: backend.depthwise_conv2d(x, filters, 1, "SAME"))
+    print(
+        "depthwise conv3x3 56x56x128: {:.1f} ms, peak {:.1f} MB".format(
+            latency * 1e3, peak / 2**20
+        )
+    )
+    ivy.unset_backend()
@@ -0,0 +1,46 @@
+"""Benchmark of batched embedding lookups with ``ivy.gather`` and ``ivy.gather_nd``
+using ``batch_dims``, and of the accumulation of their gradients with
+``ivy.scatter_nd``, with the NumPy backend.
+
+Run with ``python benchmarks/numpy_gather_scatter.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 5
+
+BATCH_SIZES = (256, 4096)
+
+VOCAB_SIZE = 1000
+
+EMBEDDING_SIZE = 32
+
+NUM_LOOKUPS = 8
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    for batch_size in BATCH_SIZES:
+        tables = ivy.random_normal(shape=(batch_size, VOCAB_SIZE, EMBEDDING_SIZE))
+        indices = ivy.randint(0, VOCAB_SIZE, shape=(batch_size, NUM_LOOKUPS))
+        table = ivy.random_normal(shape=(VOCAB_SIZE, EMBEDDING_SIZE))
+        updates = ivy.random_normal(shape=(batch_size * NUM_LOOKUPS, EMBEDDING_SIZE))
+        ops = {
+            "gather": lambda: ivy.gather(tables, indices, axis=1, batch_dims=1),
+            "gather_nd": lambda: ivy.gather_nd(
+                tables, ivy.expand_dims(indices, axis=-1), batch_dims=1
+            ),
+            "scatter_nd": lambda: ivy.scatter_nd(
+                ivy.reshape(indices, (-1, 1)), updates, table.shape
+            ),
+        }
+        for name, fn in ops.items():
+            elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+            print(
+                "batch {:<5} {:<10} {:8.2f} ms".format(batch_size, name, elapsed * 1e3)
+            )
+    ivy.unset_backend()
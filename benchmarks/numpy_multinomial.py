@@ -0,0 +1,50 @@
+"""Benchmark of the throughput of categorical sampling with ``ivy.multinomial`` and
+the NumPy backend, drawing from the distributions in each row of a 100k-row
+probability matrix.
+
+Run with ``python benchmarks/numpy_multinomial.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 3
+
+NUM_ROWS = 100000
+
+NUM_CLASSES = (10, 100)
+
+NUM_SAMPLES = (1, 8)
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    for num_classes in NUM_CLASSES:
+        probs = ivy.random_uniform(shape=(NUM_ROWS, num_classes))
+        probs = probs / ivy.sum(probs, axis=-1, keepdims=True)
+        for num_samples in NUM_SAMPLES:
+            for replace in (True, False):
+                elapsed = min(
+                    timeit.repeat(
+                        lambda: ivy.multinomial(
+                            num_classes, num_samples, probs=probs, replace=replace
+                        ),
+                        number=NUMBER,
+                        repeat=3,
+                    )
+                )
+                elapsed /= NUMBER
+                print(
+                    "classes {:<4} samples {:<3} replace {:<5} {:8.2f} ms  "
+                    "{:10.0f} rows/s".format(
+                        num_classes,
+                        num_samples,
+                        str(replace),
+                        elapsed * 1e3,
+                        NUM_ROWS / elapsed,
+                    )
+                )
+    ivy.unset_backend()
@@ -0,0 +1,61 @@
+"""Benchmark of the per-sample gradients of a small MLP with the NumPy backend, computed
+by mapping the gradient of the loss of a single sample over the batch with
+``ivy.vmap``, against a Python loop over the samples.
+
+Run with ``python benchmarks/numpy_vmap.py``.
+"""
+
+# global
+import timeit
+
+# local
+import ivy
+
+NUMBER = 5
+
+BATCH_SIZES = (8, 32, 128)
+
+INPUT_CHANNELS = 32
+
+HIDDEN_CHANNELS = 64
+
+
+def loss_fn(v, x, y):
+    h = ivy.relu(ivy.linear(x, v["w0"], bias=v["b0"]))
+    return ivy.mean((ivy.linear(h, v["w1"], bias=v["b1"]) - y) ** 2)
+
+
+def sample_grads(v, x, y):
+    _, grads = ivy.execute_with_gradients(lambda v_: loss_fn(v_, x, y), v)
+    return grads.cont_to_flat_list()
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    variables = ivy.Container(
+        {
+            "w0": ivy.random_normal(shape=(HIDDEN_CHANNELS, INPUT_CHANNELS)),
+            "b0": ivy.zeros((HIDDEN_CHANNELS,)),
+            "w1": ivy.random_normal(shape=(1, HIDDEN_CHANNELS)),
+            "b1": ivy.zeros((1,)),
+        }
+    )
+    per_sample_grads = {
+        "for loop": lambda x, y: [
+            ivy.stack(grads)
+            for grads in zip(*[sample_grads(variables, *xy) for xy in zip(x, y)])
+        ],
+        "vmap": ivy.vmap(lambda x, y: sample_grads(variables, x, y)),
+    }
+    for batch_size in BATCH_SIZES:
+        x = ivy.random_normal(shape=(batch_size, INPUT_CHANNELS))
+        y = ivy.random_normal(shape=(batch_size, 1))
+        for name, fn in per_sample_grads.items():
+            elapsed = min(timeit.repeat(lambda: fn(x, y), number=NUMBER, repeat=3))
+            elapsed /= NUMBER
+            print(
+                "batch {:<4} {:<9} {:8.2f} ms  {:8.1f} samples/s".format(
+                    batch_size, name, elapsed * 1e3, batch_size / elapsed
+                )
+            )
+    ivy.unset_backend()
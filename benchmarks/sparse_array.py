@@ -0,0 +1,50 @@
+"""Benchmark of densifying, converting and multiplying sparse arrays with one million
+nonzero values.
+
+Run with ``python benchmarks/sparse_array.py``.
+"""
+
+# global
+import logging
+import time
+import numpy as np
+
+# local
+import ivy
+from ivy.functional.ivy.experimental.sparse_array import SparseArray
+
+NUMBER = 3
+SHAPE = (4000, 4000)
+NNZ = 1000000
+
+
+def _time(fn):
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        fn()
+    return (time.perf_counter() - start) / NUMBER
+
+
+if __name__ == "__main__":
+    # the numpy backend warns that it has no native sparse arrays
+    logging.disable(logging.WARNING)
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    coo = SparseArray(
+        coo_indices=np.stack(
+            [rng.integers(0, SHAPE[0], NNZ), rng.integers(0, SHAPE[1], NNZ)]
+        ),
+        values=rng.standard_normal(NNZ),
+        dense_shape=SHAPE,
+    )
+    csr = coo.to_csr()
+    dense = rng.standard_normal((SHAPE[1], 64))
+    for name, fn in [
+        ("COO to dense", coo.to_dense_array),
+        ("CSR to dense", csr.to_dense_array),
+        ("COO to CSR", coo.to_csr),
+        ("CSR to CSC", csr.to_csc),
+        ("CSR @ dense (4000x64)", lambda: csr @ dense),
+    ]:
+        print("{}: {:.3f} s".format(name, _time(fn)))
+    ivy.unset_backend()
@@ -0,0 +1,52 @@
+"""Benchmark of ``ivy.split_func_call`` over a large batch, run sequentially and with
+the thread and process executors.
+
+Run with ``python benchmarks/split_func_call.py``.
+"""
+
+# global
+import os
+import timeit
+
+import numpy as np
+
+# local
+import ivy
+
+NUMBER = 5
+
+BATCH_SIZE = 65536
+
+CHUNK_SIZE = 2048
+
+W = np.random.uniform(size=(256, 256)).astype("float32")
+
+
+def _layer(x):
+    return ivy.tanh(ivy.matmul(x, W))
+
+
+if __name__ == "__main__":
+    ivy.set_backend("numpy")
+    x = ivy.random_uniform(shape=(BATCH_SIZE, 256))
+    print("{} cpus".format(os.cpu_count()))
+    for mode in ("concat", "sum"):
+        for executor in (None, "thread", "process"):
+            elapsed = (
+                min(
+                    timeit.repeat(
+                        lambda: ivy.split_func_call(
+                            _layer,
+                            [x],
+                            mode,
+                            chunk_size=CHUNK_SIZE,
+                            executor=executor,
+                        ),
+                        number=NUMBER,
+                        repeat=3,
+                    )
+                )
+                / NUMBER
+            )
+            print("{:<7} {:<8} {:8.2f} ms".format(mode, str(executor), elapsed * 1e3))
+    ivy.unset_backend()
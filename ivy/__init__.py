@@ -1,6 +1,7 @@
 # global
 import warnings
 from ivy._version import __version__ as __version__
+from ivy.context import ContextStack
 import builtins
 
 warnings.filterwarnings("ignore", module="^(?!.*ivy).*$")
@@ -263,10 +264,10 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = list()
-array_decimal_values_stack = list()
-warning_level_stack = list()
-nan_policy_stack = list()
+array_significant_figures_stack = ContextStack("array_significant_figures_stack")
+array_decimal_values_stack = ContextStack("array_decimal_values_stack")
+warning_level_stack = ContextStack("warning_level_stack")
+nan_policy_stack = ContextStack("nan_policy_stack")
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -785,6 +786,7 @@ globals = GlobalsDict(
         "array_mode_stack": general.array_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "wrapper_fusion_mode_stack": general.wrapper_fusion_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
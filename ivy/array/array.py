@@ -8,6 +8,7 @@ from typing import Optional
 
 # local
 import ivy
+from ivy.backend_handler import _determine_backend_from_args
 from .conversions import *
 from .activations import ArrayWithActivations
 from .creation import ArrayWithCreation
@@ -72,69 +73,27 @@ class Array(
     ArrayWithStatisticalExperimental,
     ArrayWithUtilityExperimental,
 ):
+    # only the native array is stored on construction, the remaining attributes are
+    # computed on first access, as most arrays are intermediate function returns
+    __slots__ = ("_data", "_dtype", "_device", "_size", "_backend")
+
+    _pre_repr = "ivy."
+
     def __init__(self, data):
-        ArrayWithActivations.__init__(self)
-        ArrayWithCreation.__init__(self)
-        ArrayWithDataTypes.__init__(self)
-        ArrayWithDevice.__init__(self)
-        ArrayWithElementwise.__init__(self)
-        ArrayWithGeneral.__init__(self)
-        ArrayWithGradients.__init__(self)
-        ArrayWithImage.__init__(self)
-        ArrayWithLayers.__init__(self)
-        ArrayWithLinearAlgebra.__init__(self)
-        ArrayWithLosses.__init__(self)
-        ArrayWithManipulation.__init__(self)
-        ArrayWithNorms.__init__(self)
-        ArrayWithRandom.__init__(self)
-        ArrayWithSearching.__init__(self)
-        ArrayWithSet.__init__(self)
-        ArrayWithSorting.__init__(self)
-        ArrayWithStatistical.__init__(self)
-        ArrayWithUtility.__init__(self)
-        ArrayWithActivationsExperimental.__init__(self),
-        ArrayWithConversionsExperimental.__init__(self),
-        ArrayWithCreationExperimental.__init__(self),
-        ArrayWithData_typeExperimental.__init__(self),
-        ArrayWithDeviceExperimental.__init__(self),
-        ArrayWithElementWiseExperimental.__init__(self),
-        ArrayWithGeneralExperimental.__init__(self),
-        ArrayWithGradientsExperimental.__init__(self),
-        ArrayWithImageExperimental.__init__(self),
-        ArrayWithLayersExperimental.__init__(self),
-        ArrayWithLinearAlgebraExperimental.__init__(self),
-        ArrayWithLossesExperimental.__init__(self),
-        ArrayWithManipulationExperimental.__init__(self),
-        ArrayWithNormsExperimental.__init__(self),
-        ArrayWithRandomExperimental.__init__(self),
-        ArrayWithSearchingExperimental.__init__(self),
-        ArrayWithSetExperimental.__init__(self),
-        ArrayWithSortingExperimental.__init__(self),
-        ArrayWithStatisticalExperimental.__init__(self),
-        ArrayWithUtilityExperimental.__init__(self),
         self._init(data)
 
     def _init(self, data):
-        if ivy.is_ivy_array(data):
+        if isinstance(data, Array):
             self._data = data.data
         else:
             ivy.assertions.check_true(
                 ivy.is_native_array(data), "data must be native array"
             )
             self._data = data
-        self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
-        self.backend = ivy.current_backend_str()
+        self._dtype = None
+        self._device = None
+        self._size = None
+        self._backend = None
 
     # Properties #
     # ---------- #
@@ -147,13 +106,27 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = ivy.dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = ivy.dev(self._data)
         return self._device
 
+    @property
+    def backend(self) -> str:
+        """The backend framework the native array belongs to."""
+        if self._backend is None:
+            backend = _determine_backend_from_args((self._data,))
+            self._backend = (
+                backend.current_backend_str() if backend else ivy.current_backend_str()
+            )
+        return self._backend
+
     @property
     def mT(self) -> ivy.Array:
         """
@@ -173,16 +146,19 @@ class Array(
     @property
     def ndim(self) -> int:
         """Number of array dimensions (axes)."""
-        return len(tuple(self._shape))
+        return len(tuple(self._data.shape))
 
     @property
     def shape(self) -> ivy.Shape:
         """Array dimensions."""
-        return ivy.Shape(self._shape)
+        return ivy.Shape(self._data.shape)
 
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
@@ -209,6 +185,10 @@ class Array(
         )
         self._init(data)
 
+    @backend.setter
+    def backend(self, backend):
+        self._backend = backend
+
     # Built-ins #
     # ----------#
 
@@ -243,12 +223,14 @@ class Array(
             ivy.get_backend(self.backend) if self.backend else ivy.current_backend()
         )
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        dev_str = ivy.as_ivy_dev(self.device)
+        post_repr = ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
         with np.printoptions(precision=dec_vals):
             return (
                 self._pre_repr
                 + rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
-                + self._post_repr.format(ivy.current_backend_str())
+                + post_repr
             )
 
     def __dir__(self):
@@ -269,7 +251,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -297,7 +279,7 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.unset_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        self._init(ivy_array)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithDeviceExperimental(abc.ABC):
-    pass
+    __slots__ = ()
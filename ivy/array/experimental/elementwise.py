@@ -8,6 +8,8 @@ import ivy
 
 
 class ArrayWithElementWiseExperimental(abc.ABC):
+    __slots__ = ()
+
     def sinc(self: ivy.Array, *, out: Optional[ivy.Array] = None) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.sinc. This method simply wraps the
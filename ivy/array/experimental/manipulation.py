@@ -18,6 +18,8 @@ import ivy
 
 
 class ArrayWithManipulationExperimental(abc.ABC):
+    __slots__ = ()
+
     def moveaxis(
         self: ivy.Array,
         source: Union[int, Sequence[int]],
@@ -8,6 +8,8 @@ import ivy
 
 class ArrayWithRandomExperimental(abc.ABC):
     # dirichlet
+    __slots__ = ()
+
     def dirichlet(
         self: ivy.Array,
         /,
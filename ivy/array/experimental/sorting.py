@@ -9,6 +9,8 @@ import ivy
 
 class ArrayWithSortingExperimental(abc.ABC):
     # msort
+    __slots__ = ()
+
     def msort(
         self: ivy.Array,
         /,
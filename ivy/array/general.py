@@ -11,6 +11,8 @@ import ivy
 
 
 class ArrayWithGeneral(abc.ABC):
+    __slots__ = ()
+
     def is_native_array(
         self: ivy.Array,
         /,
@@ -9,6 +9,8 @@ import ivy
 
 
 class ArrayWithGradients(abc.ABC):
+    __slots__ = ()
+
     def stop_gradient(
         self: ivy.Array,
         /,
@@ -8,6 +8,8 @@ import ivy
 
 
 class ArrayWithSearching(abc.ABC):
+    __slots__ = ()
+
     def argmax(
         self: ivy.Array,
         /,
@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithSet(abc.ABC):
+    __slots__ = ()
+
     def unique_counts(self: ivy.Array) -> Tuple[ivy.Array, ivy.Array]:
         """
         ivy.Array instance method variant of ivy.unique_counts. This method simply
@@ -9,6 +9,8 @@ import ivy
 
 
 class ArrayWithStatistical(abc.ABC):
+    __slots__ = ()
+
     def min(
         self: ivy.Array,
         /,
@@ -37,7 +37,7 @@ def _wrap_function(function_name: str) -> Callable:
         as the first arg parameter or kwarg parameter. Return the new function with
         the name function_name and the new args variable or kwargs as the new inputs.
         """
-        function = ivy.__dict__[function_name]
+        function = getattr(ivy, function_name)
         # gives us the position and name of the array argument
         data_idx = function.array_spec[0]
         if len(args) >= data_idx[0][0]:
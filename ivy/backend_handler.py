@@ -1,18 +1,43 @@
 # global
 import ivy
 import importlib
+import threading
+import contextvars
+import weakref
 import numpy as np
+from contextlib import contextmanager
+from types import ModuleType
 from ivy import verbosity
 from typing import Optional
 
 # local
 from ivy.func_wrapper import _wrap_function
+from ivy.context import ContextStack
 
-backend_stack = []
+backend_stack = ContextStack("backend_stack")
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
 
+# the wrapped ivy namespace of each backend, keyed by the backend name, the backend
+# version and whether the wrappers are fused, along with the ivy_original_dict the
+# namespaces were built from
+_backend_namespace_cache = dict()
+_cached_original_dict = dict()
+
+# the ivy namespace of the current thread or asyncio task, if it has set a backend of
+# its own, see ivy.context.ContextStack
+_context_namespace = contextvars.ContextVar("ivy_namespace", default=None)
+_removed = object()
+# the number of context namespaces alive, the ivy module is only a _ContextModule
+# while there is at least one
+_num_context_namespaces = 0
+_context_namespace_lock = threading.RLock()
+# whether an attribute of the ivy module has been set or deleted since the original
+# ivy namespace was captured, which is true until the first capture as the ivy
+# module is still being imported
+_original_dict_changed = True
+
 
 class ContextManager:
     def __init__(self, module):
@@ -216,6 +241,190 @@ def current_backend(*args, **kwargs):
     return importlib.import_module(_backend_dict[implicit_backend])
 
 
+def _is_same_dict(dict_a, dict_b):
+    return len(dict_a) == len(dict_b) and all(
+        k in dict_b and dict_b[k] is v for k, v in dict_a.items()
+    )
+
+
+def _backend_namespace(backend, fuse):
+    """Returns the ivy namespace for `backend`, with every function wrapped, along
+    with the names to remove from the ivy namespace. The namespace is built once per
+    backend and backend version, so that switching backends is a dictionary update.
+
+    Parameters
+    ----------
+    backend
+        the backend module.
+    fuse
+        whether the function wrappers are fused.
+
+    Returns
+    -------
+    ret
+        the wrapped namespace and the names to remove from the ivy namespace.
+    """
+    global _cached_original_dict
+    if not _is_same_dict(ivy_original_dict, _cached_original_dict):
+        _backend_namespace_cache.clear()
+        _cached_original_dict = ivy_original_dict
+    key = (
+        backend.current_backend_str(),
+        str(getattr(backend, "backend_version", None)),
+        fuse,
+    )
+    if key in _backend_namespace_cache:
+        return _backend_namespace_cache[key]
+    namespace = dict()
+    to_remove = list()
+    for k, v in ivy_original_dict.items():
+        # get_backend adds the dtypes the backend does not support to it as well
+        if k in backend.invalid_dtypes:
+            to_remove.append(k)
+            continue
+        compositional = k not in backend.__dict__
+        if compositional:
+            backend.__dict__[k] = v
+        namespace[k] = _wrap_function(
+            key=k,
+            to_wrap=backend.__dict__[k],
+            original=v,
+            compositional=compositional,
+            fuse=fuse,
+        )
+    _backend_namespace_cache[key] = (namespace, to_remove)
+    return namespace, to_remove
+
+
+class _IvyModule(ModuleType):
+    """The class of the ivy module, which notes when an attribute is set or deleted,
+    so that the original ivy namespace is only captured again once it changes."""
+
+    def __setattr__(self, name, value):
+        global _original_dict_changed
+        _original_dict_changed = True
+        ModuleType.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        global _original_dict_changed
+        _original_dict_changed = True
+        ModuleType.__delattr__(self, name)
+
+
+class _ContextModule(_IvyModule):
+    """The class of the ivy module while a thread or asyncio task has an ivy namespace
+    of its own, such as that of a backend set in the context. Attributes are looked
+    up in the namespace of the current context first, and in the ivy module
+    otherwise."""
+
+    def __getattribute__(
+        self,
+        name,
+        _get_namespace=_context_namespace.get,
+        _module_getattribute=ModuleType.__getattribute__,
+    ):
+        namespace = _get_namespace()
+        if namespace is None or name not in namespace:
+            return _module_getattribute(self, name)
+        value = namespace[name]
+        if value is _removed:
+            raise AttributeError(
+                "module 'ivy' has no attribute '{}' with the current "
+                "backend".format(name)
+            )
+        return value
+
+
+ivy.__class__ = _IvyModule
+
+
+class _ContextNamespace(dict):
+    """The ivy namespace of a thread or asyncio task which has set a backend of its
+    own. Once the last of these is released, the ivy module reverts to an _IvyModule,
+    so that attribute lookups no longer go through _ContextModule."""
+
+
+def _acquire_context_namespace():
+    """Makes the ivy module look up the namespaces of the contexts, until the matching
+    call to _release_context_namespace. Only then do the attribute lookups of every
+    context go through _ContextModule."""
+    global _num_context_namespaces
+    with _context_namespace_lock:
+        _num_context_namespaces += 1
+        if type(ivy) is _IvyModule:
+            ivy.__class__ = _ContextModule
+
+
+def _release_context_namespace():
+    global _num_context_namespaces
+    with _context_namespace_lock:
+        _num_context_namespaces -= 1
+        if not _num_context_namespaces and type(ivy) is _ContextModule:
+            ivy.__class__ = _IvyModule
+
+
+def _new_context_namespace(namespace):
+    namespace = _ContextNamespace(namespace)
+    _acquire_context_namespace()
+    # the namespace is also alive in any task created while it was set, so it is
+    # released once no context refers to it anymore
+    weakref.finalize(namespace, _release_context_namespace).atexit = False
+    return namespace
+
+
+@contextmanager
+def _using_namespace(namespace):
+    """Gives the current thread or asyncio task the ivy namespace `namespace` while
+    the context is active."""
+    _acquire_context_namespace()
+    token = _context_namespace.set(namespace)
+    try:
+        yield
+    finally:
+        _context_namespace.reset(token)
+        _release_context_namespace()
+
+
+def _set_ivy_namespace(backend):
+    """Updates the ivy namespace to that of `backend`, or to the original ivy
+    namespace if `backend` is None.
+
+    In the global context the ivy module itself is updated. Threads and asyncio
+    tasks which have their own backend stack get a namespace of their own instead,
+    which the ivy module looks up while they are running. Once their stack holds the
+    same backends as the global stack again, they go back to using the ivy module.
+    """
+    fuse = ivy.get_wrapper_fusion_mode()
+    if backend_stack.is_local():
+        if backend_stack.release():
+            _context_namespace.set(None)
+            return
+        if backend is None:
+            namespace = ivy_original_dict
+        else:
+            namespace, to_remove = _backend_namespace(backend, fuse)
+            namespace = dict(namespace, **dict.fromkeys(to_remove, _removed))
+        _context_namespace.set(_new_context_namespace(namespace))
+        return
+    if backend is None:
+        ivy.__dict__.update(ivy_original_dict)
+        return
+    namespace, to_remove = _backend_namespace(backend, fuse)
+    ivy.__dict__.update(namespace)
+    for k in to_remove:
+        ivy.__dict__.pop(k, None)
+
+
+def _update_original_dict():
+    """Recaptures the original ivy namespace if an attribute of the ivy module has
+    been set or deleted since it was last captured, which is only possible while no
+    backend is set in the global context."""
+    global ivy_original_dict, _original_dict_changed
+    if _original_dict_changed and not backend_stack.is_local() and not backend_stack:
+        ivy_original_dict = ivy.__dict__.copy()
+        _original_dict_changed = False
+
+
 def set_backend(backend: str):
     """Sets `backend` to be the global backend.
 
@@ -241,9 +450,7 @@ def set_backend(backend: str):
         "backend must be one from {}".format(list(_backend_dict.keys())),
     )
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
-    if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+    _update_original_dict()
     if isinstance(backend, str):
         temp_stack = list()
         while backend_stack:
@@ -257,16 +464,7 @@ def set_backend(backend: str):
         ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
     backend_stack.append(backend)
     set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
-        )
+    _set_ivy_namespace(backend)
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
@@ -330,9 +528,7 @@ def get_backend(backend: Optional[str] = None):
     # ToDo: change this so that it doesn't depend at all on the global ivy. Currently
     #  all backend-agnostic implementations returned in this module will still
     #  use the global ivy backend.
-    global ivy_original_dict
-    if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+    _update_original_dict()
     # current global backend is retrieved if backend isn't specified,
     # otherwise `backend` argument will be used
     if backend is None:
@@ -394,16 +590,9 @@ def unset_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        # add the wrapped functions of the backend still set, or the original
+        # functions if there is none, to the ivy namespace
+        _set_ivy_namespace(backend_stack[-1] if backend_stack else None)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
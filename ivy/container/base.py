@@ -2,6 +2,7 @@
 
 # global
 import inspect
+import math
 from itertools import chain
 import re
 import abc
@@ -19,8 +20,15 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import queue
 import random
+import weakref
+import threading
+import collections
+import concurrent.futures
+from multiprocessing import shared_memory, resource_tracker
 from operator import mul
+import functools
 from functools import reduce
 from typing import Union, Tuple
 from builtins import set
@@ -47,6 +55,349 @@ def _repr(x):
         return str(x)
 
 
+def _config_key(config):
+    # hashable key of a container config, with the objects which are not simple
+    # values identified by their ids
+    return tuple(
+        (k, v if v is None or isinstance(v, (bool, int, str)) else id(v))
+        for k, v in config.items()
+    )
+
+
+class _TreeDef:
+    """The structure of a container, being the keys of each of its sub-containers in
+    depth-first order and the key-chain of each of its leaves.
+
+    It is computed once and cached on the container, and shared with the containers
+    mapped from it, so that maps can flatten the containers into lists of leaves,
+    map over those lists and unflatten the results, without rebuilding key-chains or
+    reconstructing the containers level by level.
+    """
+
+    def __init__(self, cont):
+        # the (keys, child node index or None for leaves, whether the keys are
+        # sorted) of each sub-container, the root being the first
+        self.nodes = list()
+        self.key_chains = list()
+        self.has_empty = False
+        self._templates = dict()
+        self._build(cont, "")
+
+    def _build(self, cont, key_chain):
+        index = len(self.nodes)
+        self.nodes.append(None)
+        keys = tuple(cont.keys())
+        children = list()
+        for key in keys:
+            value = dict.__getitem__(cont, key)
+            this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
+            if isinstance(value, ivy.Container):
+                self.has_empty |= not value
+                children.append(self._build(value, this_key_chain))
+            else:
+                children.append(None)
+                self.key_chains.append(this_key_chain)
+        try:
+            is_sorted = list(keys) == sorted(keys)
+        except TypeError:
+            is_sorted = True
+        self.nodes[index] = (keys, tuple(children), is_sorted)
+        return index
+
+    def flatten(self, cont, conts=None):
+        """Returns the leaves of the container, or ``None`` if it does not have this
+        structure, appending its sub-containers to `conts` if given."""
+        leaves = list()
+        if not self._flatten(cont, 0, leaves, conts):
+            return None
+        return leaves
+
+    def _flatten(self, cont, index, leaves, conts):
+        keys, children, _ = self.nodes[index]
+        if len(cont) != len(keys):
+            return False
+        if conts is not None:
+            conts.append(cont)
+        for key, child in zip(keys, children):
+            try:
+                value = dict.__getitem__(cont, key)
+            except KeyError:
+                return False
+            if child is None:
+                if isinstance(value, ivy.Container):
+                    return False
+                leaves.append(value)
+            elif not isinstance(value, ivy.Container) or not self._flatten(
+                value, child, leaves, conts
+            ):
+                return False
+        return True
+
+    def unflatten(self, leaves, configs):
+        """Returns a container of this structure with the given leaves, whose
+        sub-containers each have the config at the same position in `configs`, or
+        `configs` itself if it is a single config."""
+        ret, shared = self._unflatten(0, iter(leaves), configs)
+        if shared:
+            ret._treedef = self
+        return ret
+
+    def _template(self, config):
+        key = _config_key(config)
+        template = self._templates.get(key)
+        if template is None:
+            template = ivy.Container(**config).__dict__
+            self._templates[key] = template
+        return template
+
+    def _unflatten(self, index, leaves, configs):
+        keys, children, is_sorted = self.nodes[index]
+        config = configs if isinstance(configs, dict) else configs[index]
+        template = self._template(config)
+        nest_types = template["_types_to_iteratively_nest"]
+        items = list()
+        shared = True
+        for key, child in zip(keys, children):
+            if child is None:
+                value = next(leaves)
+                # returned dicts and iteratively nested types become sub-containers
+                shared &= not isinstance(value, dict) and not (
+                    nest_types and isinstance(value, nest_types)
+                )
+            else:
+                value, child_shared = self._unflatten(child, leaves, configs)
+                shared &= child_shared
+            items.append((key, value))
+        if not shared or template["_rebuild_child_containers"]:
+            return ivy.Container(dict(items), **config), False
+        if template["_alphabetical_keys"] and not is_sorted:
+            items.sort(key=lambda item: item[0])
+        ret = ivy.Container.__new__(ivy.Container)
+        ret.__dict__.update(template)
+        # the configs can be updated inplace, so each container has its own copies
+        ret._config = dict(template["_config"])
+        ret._config_in = dict(template["_config_in"])
+        ret._keyword_color_dict = ret._config["keyword_color_dict"] = dict(
+            template["_keyword_color_dict"]
+        )
+        dict.update(ret, items)
+        return ret, True
+
+
+def _hdf5_selection_shape(dataset, slice_obj):
+    # the shape of the dataset selection, found by slicing a zero-strided view
+    return np.broadcast_to(np.empty((), np.uint8), dataset.shape)[slice_obj].shape
+
+
+def _read_hdf5_dataset(dataset, slice_obj):
+    # reads only the selected rows, straight into a preallocated buffer
+    if dataset.dtype.kind == "O" or not dataset.shape:
+        return np.asarray(dataset[slice_obj])
+    buffer = np.empty(_hdf5_selection_shape(dataset, slice_obj), dataset.dtype)
+    if buffer.size:
+        dataset.read_direct(buffer, source_sel=slice_obj)
+    return buffer
+
+
+class _LazyHDF5File:
+    """An hdf5 file opened for lazily read arrays, which is closed once all of them
+    have been read."""
+
+    def __init__(self, h5_file, arrays):
+        self._h5_file = h5_file
+        self._num_unread = len(arrays)
+        for x in arrays:
+            x._file = self
+        if not arrays:
+            h5_file.close()
+
+    def read(self):
+        self._num_unread -= 1
+        if not self._num_unread:
+            self._h5_file.close()
+
+
+class _LazyHDF5Array(ivy.Array):
+    """An array backed by a dataset of an hdf5 file, whose selection is only read from
+    disk when its data is first accessed."""
+
+    def __init__(self, dataset, slice_obj, ivyh):
+        self._dataset = dataset
+        self._slice_obj = slice_obj
+        self._ivyh = ivyh
+        # the file of the dataset, if it is closed once all its arrays are read
+        self._file = None
+        self._selection_shape = _hdf5_selection_shape(dataset, slice_obj)
+        self._loaded = None
+        self._dtype = None
+        self._device = None
+        self._size = None
+        self._backend = None
+
+    @property
+    def _data(self):
+        if self._loaded is None:
+            self._loaded = ivy.to_native(
+                ivy.default(self._ivyh, ivy).asarray(
+                    _read_hdf5_dataset(self._dataset, self._slice_obj)
+                )
+            )
+            self._dataset = None
+            if self._file is not None:
+                self._file.read()
+                self._file = None
+        return self._loaded
+
+    @_data.setter
+    def _data(self, data):
+        self._loaded = data
+
+    @property
+    def shape(self):
+        if self._loaded is None:
+            return ivy.Shape(self._selection_shape)
+        return ivy.Shape(self._loaded.shape)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return math.prod(self.shape)
+
+
+class _SharedMemoryArray:
+    """A numpy array handed over from another process through a shared memory block,
+    as returned in the leaves of ``cont_to_shared_memory``. The block is unlinked by
+    the process which attaches to it, or by ``release`` if it is never attached."""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def from_array(cls, x):
+        x = np.asarray(x)
+        block = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+        np.ndarray(x.shape, x.dtype, buffer=block.buf)[...] = x
+        # the block outlives this process, and is unlinked by the attaching process
+        resource_tracker.unregister(block._name, "shared_memory")
+        block.close()
+        return cls(block.name, x.shape, x.dtype)
+
+    def attach(self):
+        block = shared_memory.SharedMemory(name=self.name)
+        block.unlink()
+        x = np.ndarray(self.shape, self.dtype, buffer=block.buf)
+        # the mapping is closed once the array and all of its views are released
+        weakref.finalize(x, block.close)
+        return x
+
+    def release(self):
+        """Unlinks the block unless it has been attached or released already."""
+        try:
+            block = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        block.unlink()
+        block.close()
+
+
+def _load_queue_item(cont_ref, item):
+    cont = cont_ref()
+    config = dict() if cont is None else cont._config
+    return (
+        ivy.Container(item, **config)
+        .cont_map(
+            lambda x, kc: ivy.asarray(x.attach())
+            if isinstance(x, _SharedMemoryArray)
+            else x
+        )
+        .to_ivy()
+    )
+
+
+class _StopLoading:
+    """Put into the queues of a queue-backed container which is deleted, to stop the
+    threads waiting for their containers."""
+
+
+class _QueuePrefetcher:
+    """Loads the containers arriving from the queues of a queue-backed container on
+    background threads, reading up to ``depth`` queues ahead of the last one accessed.
+    At most ``cache_size`` of the accessed containers are kept, evicting the least
+    recently used."""
+
+    def __init__(self, queues, load_fn, timeout, depth, cache_size):
+        self._queues = queues
+        self._load_fn = load_fn
+        self._timeout = timeout
+        self._depth = depth
+        self._cache_size = cache_size
+        self._loads = dict()
+        self._used = collections.OrderedDict()
+        self._evicted = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.prefetch(-1)
+
+    def _load(self, i, future):
+        item = self._queues[i].get()
+        if isinstance(item, _StopLoading):
+            future.cancel()
+            return
+        if self._stopped.is_set():
+            # the container is deleted, so the blocks of the item are not attached
+            ivy.Container(item).cont_release_shared_memory()
+            future.cancel()
+            return
+        try:
+            future.set_result(self._load_fn(item))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _start(self, i):
+        with self._lock:
+            if i in self._loads or i in self._evicted:
+                return self._loads.get(i)
+            future = self._loads[i] = concurrent.futures.Future()
+        threading.Thread(target=self._load, args=(i, future), daemon=True).start()
+        return future
+
+    def prefetch(self, i):
+        for j in range(i + 1, min(i + 1 + self._depth, len(self._queues))):
+            self._start(j)
+
+    def get(self, i):
+        future = self._start(i)
+        if future is None:
+            raise IvyException(
+                "the container from queue {} has been evicted, increase "
+                "queue_cache_size to keep more loaded containers".format(i)
+            )
+        try:
+            cont = future.result(timeout=self._timeout)
+        except concurrent.futures.TimeoutError:
+            raise queue.Empty
+        with self._lock:
+            self._used[i] = None
+            self._used.move_to_end(i)
+            while ivy.exists(self._cache_size) and len(self._used) > self._cache_size:
+                evicted = self._used.popitem(last=False)[0]
+                del self._loads[evicted]
+                self._evicted.add(evicted)
+        return cont
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            waiting = [i for i, future in self._loads.items() if not future.done()]
+        for i in waiting:
+            self._queues[i].put(_StopLoading())
+
+
 # noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
     def __init__(
@@ -56,6 +407,8 @@ class ContainerBase(dict, abc.ABC):
         queue_load_sizes=None,
         container_combine_method="list_join",
         queue_timeout=None,
+        queue_prefetch_depth=1,
+        queue_cache_size=None,
         print_limit=10,
         key_length_limit=None,
         print_indent=4,
@@ -87,6 +440,12 @@ class ContainerBase(dict, abc.ABC):
         queue_timeout
             The timeout when waiting for containers to arrive from the queues.
             Default is global.
+        queue_prefetch_depth
+            The number of queues to read ahead of the last one accessed. The containers
+            from these are loaded on background threads. Default is ``1``.
+        queue_cache_size
+            The maximum number of accessed containers from the queues to keep loaded,
+            evicting the least recently used. Default is ``None``, which keeps all.
         print_limit
             The total array size limit when printing the container. Default is 10.
         key_length_limit
@@ -125,11 +484,12 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(self._container_combine_method, str):
                 self._container_combine_method = {
                     "list_join": self.cont_list_join,
-                    "concat": lambda conts: self.concat(conts, 0),
+                    "concat": lambda conts: self.static_concat(conts, axis=0),
                 }[self._container_combine_method]
-            self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.get_queue_timeout())
+            self._queue_prefetch_depth = queue_prefetch_depth
+            self._queue_cache_size = queue_cache_size
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -154,6 +514,8 @@ class ContainerBase(dict, abc.ABC):
         )
         self._config = dict()
         self.cont_inplace_update(dict_in, **self._config_in)
+        if ivy.exists(self._queues):
+            self._cont_queue_prefetcher()
 
     # Class Methods #
     # --------------#
@@ -171,7 +533,7 @@ class ContainerBase(dict, abc.ABC):
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
         inspect_fn = fn
         if isinstance(fn, str):
-            inspect_fn = ivy.__dict__[fn]
+            inspect_fn = getattr(ivy, fn)
         arg_cont_idxs = ivy.nested_argwhere(
             args, ivy.is_ivy_container, to_ignore=ivy.Container
         )
@@ -194,7 +556,7 @@ class ContainerBase(dict, abc.ABC):
         ivy.assertions.check_exists(conts, message="no containers found in arguments")
         cont0 = conts[0]
         if isinstance(fn, str):
-            fn = cont0.cont_ivy.__dict__[fn]
+            fn = getattr(cont0.cont_ivy, fn)
         # Get the function with the name fn_name, enabling containers to specify
         # their backends irrespective of global ivy's backend
 
@@ -677,6 +1039,28 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if (
+            key_chain == ""
+            and not map_nests
+            and not (prune_unapplied and key_chains is not None)
+            and all(isinstance(cont, ivy.Container) for cont in containers)
+        ):
+            # containers of identical structure are mapped as flat lists of leaves
+            treedef, leaves0, _ = container0._cont_flatten()
+            leaves = [
+                leaves0 if cont is container0 else treedef.flatten(cont)
+                for cont in containers
+            ]
+            if not treedef.has_empty and all(ivy.exists(x) for x in leaves):
+                new_leaves = list()
+                for values, this_key_chain in zip(zip(*leaves), treedef.key_chains):
+                    if key_chains is not None:
+                        found = any(this_key_chain.startswith(k) for k in key_chains)
+                        if found != bool(to_apply):
+                            new_leaves.append(values[0])
+                            continue
+                    new_leaves.append(func(list(values), this_key_chain))
+                return treedef.unflatten(new_leaves, config)
         return_dict = dict()
         for key in container0.keys():
             values = [
@@ -1054,7 +1438,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1064,13 +1452,19 @@ class ContainerBase(dict, abc.ABC):
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         slice_obj
-            slice object to slice all h5 elements. (Default value = slice(None))
+            slice object to slice all h5 elements. Only the selected elements are read
+            from disk. (Default value = slice(None))
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading each array from disk until its data is first
+            accessed, in which case the file is kept open until then. A file opened
+            from a filepath is closed once all of its arrays have been read. Default
+            is ``False``.
 
         Returns
         -------
@@ -1091,17 +1485,34 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
+                container_dict[key] = (
+                    _LazyHDF5Array(value, slice_obj, ivyh)
+                    if lazy
+                    else ivy.default(ivyh, ivy).asarray(
+                        _read_hdf5_dataset(value, slice_obj)
+                    )
                 )
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        ret = ivy.Container(container_dict, ivyh=ivyh)
+        if h5_obj is not h5_obj_or_filepath:
+            if lazy:
+                _LazyHDF5File(
+                    h5_obj,
+                    [
+                        x
+                        for x in ret.cont_to_iterator_values()
+                        if isinstance(x, _LazyHDF5Array)
+                    ],
+                )
+            else:
+                h5_obj.close()
+        return ret
 
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1991,6 +2402,38 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_shared_memory(self):
+        """Copy the arrays of the container into shared memory blocks, returning a
+        container which can be put into the queues of a queue-backed container, and is
+        loaded from there without copying the arrays through the queue.
+
+        The blocks are released by the container which loads them, so the returned
+        container should be put into a queue exactly once. If it is never loaded, the
+        blocks should be released with ``cont_release_shared_memory`` instead, as
+        they otherwise outlive the process.
+
+        Returns
+        -------
+        ret
+            Container with handles to the shared memory blocks at its leaves.
+
+        """
+        return self.cont_map(
+            lambda x, kc: _SharedMemoryArray.from_array(ivy.to_numpy(x))
+            if ivy.is_array(x)
+            else x
+        )
+
+    def cont_release_shared_memory(self):
+        """Release the shared memory blocks of a container returned by
+        ``cont_to_shared_memory`` which is never loaded from a queue. The blocks which
+        have been loaded already are left as they are.
+
+        """
+        self.cont_map(
+            lambda x, kc: x.release() if isinstance(x, _SharedMemoryArray) else x
+        )
+
     def cont_to_nested_list(self):
         return_list = list()
         for key, value in self.items():
@@ -3068,6 +3511,19 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def _cont_flatten(self):
+        """Returns the structure of the container, cached on the container, along
+        with its leaves and its sub-containers in depth-first order."""
+        treedef = self.__dict__.get("_treedef")
+        conts = list()
+        leaves = None if treedef is None else treedef.flatten(self, conts)
+        if leaves is None:
+            treedef = _TreeDef(self)
+            self._treedef = treedef
+            conts = list()
+            leaves = treedef.flatten(self, conts)
+        return treedef, leaves, conts
+
     def cont_map(
         self,
         func,
@@ -3106,6 +3562,23 @@ class ContainerBase(dict, abc.ABC):
             New container following the function mapped to each sub-array.
 
         """
+        if not inplace and not map_sequences and key_chain == "":
+            # the leaves are mapped as a flat list
+            treedef, leaves, conts = self._cont_flatten()
+            if not (prune_unapplied and (key_chains is not None or treedef.has_empty)):
+                if key_chains is None:
+                    new_leaves = [
+                        func(value, this_key_chain)
+                        for value, this_key_chain in zip(leaves, treedef.key_chains)
+                    ]
+                else:
+                    new_leaves = [
+                        func(value, this_key_chain)
+                        if (this_key_chain in key_chains) == bool(to_apply)
+                        else value
+                        for value, this_key_chain in zip(leaves, treedef.key_chains)
+                    ]
+                return treedef.unflatten(new_leaves, [cont._config for cont in conts])
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
@@ -3886,6 +4359,20 @@ class ContainerBase(dict, abc.ABC):
         else:
             super.__setattr__(self, name, value)
 
+    def _cont_queue_prefetcher(self):
+        prefetcher = self.__dict__.get("_queue_prefetcher")
+        if prefetcher is None:
+            prefetcher = self._queue_prefetcher = _QueuePrefetcher(
+                self._queues,
+                functools.partial(_load_queue_item, weakref.ref(self)),
+                self._queue_timeout,
+                self._queue_prefetch_depth,
+                self._queue_cache_size,
+            )
+            # the threads are daemons, which need not be stopped at exit
+            weakref.finalize(self, prefetcher.stop).atexit = False
+        return prefetcher
+
     def _get_queue_item(self, query):
         if isinstance(query, int):
             queue_queries = [query]
@@ -3902,21 +4389,14 @@ class ContainerBase(dict, abc.ABC):
                 "Invalid slice type, must be one of integer, slice "
                 "or sequences of slices."
             )
-        queue_idxs = set(
-            [np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries]
+        queue_idxs = sorted(
+            set([np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries])
         )
-        conts = list()
-        for i in queue_idxs:
-            if i not in self._loaded_containers_from_queues:
-                cont = ivy.Container(
-                    self._queues[i].get(timeout=self._queue_timeout), **self._config
-                ).to_ivy()
-                self._loaded_containers_from_queues[i] = cont
-            else:
-                cont = self._loaded_containers_from_queues[i]
-            conts.append(cont)
+        prefetcher = self._cont_queue_prefetcher()
+        prefetcher.prefetch(queue_idxs[-1])
+        conts = [prefetcher.get(i) for i in queue_idxs]
         combined_cont = self._container_combine_method(conts)
-        idx = list(queue_idxs)[0]
+        idx = queue_idxs[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
         if isinstance(query, int):
             shifted_query = query - offset
@@ -4004,6 +4484,8 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_treedef", None)
+        state_dict.pop("_queue_prefetcher", None)
         state_dict["_local_ivy"] = ivy.try_else_none(
             lambda: state_dict["_local_ivy"].current_backend_str()
         )
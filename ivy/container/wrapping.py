@@ -34,7 +34,7 @@ def _wrap_function(function_name: str, static: bool) -> Callable:
         out: Optional[ivy.Container] = None,
         **kwargs
     ):
-        function = ivy.__dict__[function_name]
+        function = getattr(ivy, function_name)
         data_idx = function.array_spec[0]
         if (
             not (data_idx[0][0] == 0 and len(data_idx[0]) == 1)
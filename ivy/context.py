@@ -0,0 +1,148 @@
+# global
+import sys
+import threading
+import contextvars
+
+
+def is_global_context():
+    """Returns whether the caller is in the global context, which is the main thread
+    outside of any running asyncio event loop. Ivy's mode stacks are shared by the
+    whole process in the global context, and are local to the thread or asyncio
+    task everywhere else.
+
+    Code running inside an event loop on the main thread is therefore not in the
+    global context either. This includes notebook cells executed by a kernel which
+    runs them in its event loop, such as ipykernel, where modes set in a cell are
+    local to the task running that cell.
+
+    Returns
+    -------
+    ret
+        True if the caller is in the global context, False otherwise.
+
+    Examples
+    --------
+    >>> ivy.context.is_global_context()
+    True
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    # asyncio cannot have a running loop unless it has been imported
+    asyncio = sys.modules.get("asyncio")
+    return asyncio is None or asyncio._get_running_loop() is None
+
+
+class ContextStack:
+    """A mode stack whose contents are local to the current thread and asyncio task.
+
+    In the global context the stack is shared by the whole process, as the plain
+    lists ivy used before were. Any other thread or task reads that shared stack
+    until it modifies the stack for the first time, at which point it gets its own
+    copy, held in a ``contextvars.ContextVar``. Threads and tasks can therefore
+    each set their own modes without locking and without seeing each other's
+    modes. Tasks inherit the stack of the context they are created from. A copy
+    holding the same items as the shared stack can be dropped with ``release``.
+
+    The stack behaves like a list for the operations ivy uses: ``append``,
+    ``pop``, ``clear``, indexing, iteration, ``len`` and comparison with lists.
+
+    Parameters
+    ----------
+    name
+        the name of the stack, used for the underlying context variable.
+    iterable
+        the initial contents of the shared stack.
+
+    Examples
+    --------
+    >>> stack = ivy.context.ContextStack("my_stack")
+    >>> stack.append(1)
+    >>> stack.append(2)
+    >>> print(stack, stack[-1], len(stack))
+    [1, 2] 2 2
+    """
+
+    __slots__ = ("_name", "_var", "_global")
+
+    def __init__(self, name, iterable=()):
+        self._name = name
+        self._var = contextvars.ContextVar(name)
+        self._global = tuple(iterable)
+
+    def _get(self):
+        value = self._var.get(None)
+        return self._global if value is None else value
+
+    def _set(self, value):
+        if self._var.get(None) is None and is_global_context():
+            self._global = value
+        else:
+            self._var.set(value)
+
+    def is_local(self):
+        """Returns whether the current thread or task has its own copy of the stack,
+        rather than reading the stack shared by the process."""
+        return self._var.get(None) is not None
+
+    def release(self):
+        """Drops the copy of the stack local to the current thread or task if it holds
+        the same items as the shared stack, so that it reads the shared stack again.
+
+        Returns
+        -------
+        ret
+            True if the current thread or task reads the shared stack, False if it
+            keeps its own copy.
+        """
+        value = self._var.get(None)
+        if value is None:
+            return True
+        if len(value) != len(self._global) or any(
+            a is not b for a, b in zip(value, self._global)
+        ):
+            return False
+        self._var.set(None)
+        return True
+
+    def append(self, item):
+        self._set(self._get() + (item,))
+
+    def pop(self, index=-1):
+        value = list(self._get())
+        item = value.pop(index)
+        self._set(tuple(value))
+        return item
+
+    def clear(self):
+        self._set(())
+
+    def copy(self):
+        return list(self._get())
+
+    def __getitem__(self, index):
+        value = self._get()[index]
+        return list(value) if isinstance(index, slice) else value
+
+    def __len__(self):
+        return len(self._get())
+
+    def __bool__(self):
+        return bool(self._get())
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __contains__(self, item):
+        return item in self._get()
+
+    def __eq__(self, other):
+        if isinstance(other, ContextStack):
+            other = other._get()
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(self._get()) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self._get()))
@@ -2,9 +2,12 @@ import ivy
 import functools
 import logging
 from types import FunctionType
-from typing import Callable
+from typing import Callable, Optional
 import inspect
 
+# local
+from ivy.array.conversions import _to_native, _to_ivy
+
 # import typing
 
 
@@ -52,37 +55,57 @@ def _get_first_array(*args, **kwargs):
 # ---------------#
 
 
-def handle_array_like(fn: Callable) -> Callable:
-    @functools.wraps(fn)
-    def new_fn(*args, **kwargs):
+def _get_array_like_params(fn):
+    """Classifies the parameters of `fn` once, returning the positions and the
+    keywords of the parameters which are annotated as arrays (but not as sequences of
+    arrays), so list and tuple arguments passed to them can be converted to arrays."""
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return (), ()
+    positions = list()
+    keywords = list()
+    positional = True
+    for i, param in enumerate(parameters):
+        if param.kind == param.VAR_POSITIONAL:
+            positional = False
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        annotation_str = str(param.annotation)
+        if "Array" not in annotation_str or any(
+            sq in annotation_str for sq in ["Sequence", "List", "Tuple"]
+        ):
+            continue
+        if positional and param.kind != param.KEYWORD_ONLY:
+            positions.append(i)
+        if param.kind != param.POSITIONAL_ONLY:
+            keywords.append(param.name)
+    return tuple(positions), tuple(keywords)
+
+
+def _handle_array_like_args(args, kwargs, positions, keywords):
+    num_args = len(args)
+    if any(i < num_args and isinstance(args[i], (list, tuple)) for i in positions):
         args = list(args)
-        num_args = len(args)
-        try:
-            type_hints = dict(inspect.signature(fn).parameters)
-        except TypeError:
-            return fn(*args, **kwargs)
-        parameters = [param.name for param in type_hints.values()]
-        annotations = [param.annotation for param in type_hints.values()]
+        for i in positions:
+            if i < num_args and isinstance(args[i], (list, tuple)):
+                args[i] = ivy.array(args[i])
+    for keyword in keywords:
+        if keyword in kwargs and isinstance(kwargs[keyword], (list, tuple)):
+            kwargs[keyword] = ivy.array(kwargs[keyword])
+    return args, kwargs
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if "Array" in annotation_str and all(
-                sq not in annotation_str for sq in ["Sequence", "List", "Tuple"]
-            ):
 
-                if i < num_args:
-                    if isinstance(arg, (list, tuple)):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if isinstance(kwarg, (list, tuple)):
-                        kwargs[parameter] = ivy.array(kwarg)
+def handle_array_like(fn: Callable) -> Callable:
+    positions, keywords = _get_array_like_params(fn)
 
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        args, kwargs = _handle_array_like_args(args, kwargs, positions, keywords)
         return fn(*args, **kwargs)
 
     new_fn.handle_array_like = True
+    new_fn._array_like_params = (positions, keywords)
     return new_fn
 
 
@@ -407,8 +430,43 @@ def handle_out_argument(fn: Callable) -> Callable:
 # ------------------#
 
 
+def _scan_args(args, kwargs):
+    """Single pass over the top level of `args` and `kwargs`, returning whether
+    none of them are nests (so no recursion is needed), and whether any of them
+    is an ivy.Container."""
+    flat = True
+    has_container = False
+    for a in (*args, *kwargs.values()):
+        # ivy.Container subclasses dict, so it is checked for first
+        if isinstance(a, ivy.Container):
+            flat = False
+            has_container = True
+        elif isinstance(a, (list, tuple, dict)):
+            flat = False
+    return flat, has_container
+
+
+def _has_container(args, kwargs, flat=None, has_container=False):
+    """Whether any ivy.Container is in `args` or `kwargs`, only recursing into the
+    nests if the top level check is not conclusive."""
+    if flat is None:
+        flat, has_container = _scan_args(args, kwargs)
+    if flat or has_container:
+        return has_container
+    return ivy.nested_any(
+        args, ivy.is_ivy_container, check_nests=True
+    ) or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+
+
+def _container_fn(fn: Callable) -> Optional[Callable]:
+    """Returns the static container method corresponding to `fn`, if it exists."""
+    return getattr(ivy.Container, "static_" + fn.__name__, None)
+
+
 def handle_nestable(fn: Callable) -> Callable:
-    fn_name = fn.__name__
+    # the static container method is bound once, on the first call with containers,
+    # as it might only be added to ivy.Container after `fn` is wrapped
+    cont_fn = None
 
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -429,19 +487,17 @@ def handle_nestable(fn: Callable) -> Callable:
         -------
             The return of the function, with the nestable property handled correctly.
         """
+        nonlocal cont_fn
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        if hasattr(ivy.Container, "static_" + fn_name):
-            cont_fn = getattr(ivy.Container, "static_" + fn_name)
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
-        if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
-        ):
+        if ivy.get_nestable_mode() and _has_container(args, kwargs):
+            if cont_fn is None:
+                cont_fn = _container_fn(fn) or (
+                    lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
+                        fn, *args, **kwargs
+                    )
+                )
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -452,11 +508,142 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Fused Wrapping #
+# ---------------#
+
+# decorators which _fuse_decorators knows how to combine into a single wrapper
+_FUSABLE_DECORATORS = (
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+    "handle_array_like",
+)
+
+
+def _fuse_decorators(fn: Callable, decorators) -> Callable:
+    """Builds a single wrapper for `fn` which is equivalent to applying each of the
+    `decorators` in the order of `FN_DECORATORS`, but which inspects and converts
+    the arguments in one pass instead of once per decorator.
+
+    Parameters
+    ----------
+    fn
+        the backend function to wrap.
+    decorators
+        the names of the decorators to fuse, all of which must be in
+        `_FUSABLE_DECORATORS`.
+
+    Returns
+    -------
+    ret
+        the wrapped function, with the attribute of each fused decorator set.
+    """
+    fn_name = fn.__name__
+    array_like = "handle_array_like" in decorators
+    nans = "handle_nans" in decorators
+    exceptions = "handle_exceptions" in decorators
+    nestable = "handle_nestable" in decorators
+    out_argument = "handle_out_argument" in decorators
+    to_native = "inputs_to_native_arrays" in decorators
+    to_ivy = "outputs_to_ivy_arrays" in decorators
+    handle_out_in_backend = hasattr(fn, "support_native_out")
+    if array_like:
+        positions, keywords = _get_array_like_params(fn)
+    cont_fn = _container_fn(fn) if nestable else None
+
+    def _call(args, kwargs, flat):
+        # inputs_to_native_arrays -> fn -> outputs_to_ivy_arrays
+        array_mode = (to_native or to_ivy) and ivy.get_array_mode()
+        if to_native and array_mode:
+            has_out = "out" in kwargs
+            if has_out:
+                out = kwargs.pop("out")
+            if flat:
+                args = [_to_native(a) for a in args]
+                kwargs = {k: _to_native(v) for k, v in kwargs.items()}
+            else:
+                args, kwargs = ivy.args_to_native(
+                    *args, **kwargs, include_derived={tuple: True}
+                )
+            if has_out:
+                kwargs["out"] = out
+        ret = fn(*args, **kwargs)
+        if to_ivy and array_mode:
+            if isinstance(ret, (list, tuple, dict)):
+                return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+            return _to_ivy(ret)
+        return ret
+
+    def _call_with_out(args, kwargs, flat=False):
+        # handle_out_argument
+        out = kwargs.pop("out", None) if out_argument else None
+        if out is None:
+            return _call(args, kwargs, flat)
+        if handle_out_in_backend:
+            kwargs["out"] = ivy.to_native(out)
+            ret = _call(args, kwargs, flat)
+            if isinstance(ret, (tuple, list)):
+                for i in range(len(ret)):
+                    out[i].data = ivy.to_native(ret[i])
+            else:
+                out.data = ivy.to_native(ret)
+            return out
+        ret = _call(args, kwargs, flat)
+        return ivy.inplace_update(out, ivy.astype(ret, ivy.dtype(out)))
+
+    def _map_leaves(*args, **kwargs):
+        return _call_with_out(args, kwargs)
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        if array_like:
+            args, kwargs = _handle_array_like_args(args, kwargs, positions, keywords)
+        if nans:
+            nan_policy = ivy.get_nan_policy()
+            if nan_policy != "nothing" and (
+                _nest_has_nans(args) or _nest_has_nans(kwargs)
+            ):
+                if nan_policy == "raise_exception":
+                    raise ivy.exceptions.IvyException(
+                        "Nans are not allowed in `raise_exception` policy."
+                    )
+                elif nan_policy == "warns":
+                    logging.warning("Nans are present in the input.")
+        flat, has_container = _scan_args(args, kwargs)
+        try:
+            if nestable and ivy.get_nestable_mode():
+                if _has_container(args, kwargs, flat, has_container):
+                    if cont_fn is not None:
+                        return cont_fn(*args, **kwargs)
+                    return ivy.Container.cont_multi_map_in_function(
+                        _map_leaves, *args, **kwargs
+                    )
+            return _call_with_out(args, kwargs, flat)
+        except Exception as e:
+            if not exceptions:
+                raise
+            ivy.exceptions._print_traceback_history()
+            if isinstance(e, (IndexError, ValueError, AttributeError)):
+                raise ivy.exceptions.IvyError(fn_name, str(e))
+            raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+
+    for attr in decorators:
+        setattr(new_fn, attr, True)
+    return new_fn
+
+
 # Functions #
 
 
 def _wrap_function(
-    key: str, to_wrap: Callable, original: Callable, compositional: bool = False
+    key: str,
+    to_wrap: Callable,
+    original: Callable,
+    compositional: bool = False,
+    fuse: bool = False,
 ) -> Callable:
     """Apply wrapping to backend implementation `to_wrap` if the original implementation
     `original` is also wrapped, and if `to_wrap` is not already wrapped. Attributes
@@ -473,6 +660,9 @@ def _wrap_function(
     compositional
         indicates whether the function being wrapped is compositional
         (Default Value = ``False``).
+    fuse
+        whether to fuse the required decorators into a single wrapper when they are
+        all supported by `_fuse_decorators` (Default Value = ``False``).
 
     Returns
     -------
@@ -493,6 +683,7 @@ def _wrap_function(
                     linalg_v,
                     ivy.__dict__[linalg_k],
                     compositional=compositional,
+                    fuse=fuse,
                 )
         return to_wrap
     if isinstance(to_wrap, FunctionType):
@@ -519,9 +710,15 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        if fuse and decorators and all(d in _FUSABLE_DECORATORS for d in decorators):
+            return _fuse_decorators(to_wrap, decorators)
+        for attr in decorators:
+            to_wrap = getattr(ivy, attr)(to_wrap)
     return to_wrap
 
 
@@ -2,4 +2,13 @@ from .ivy import experimental
 from .ivy.experimental import *
 from . import ivy
 from .ivy import *
-from . import frontends
+
+
+def __getattr__(name):
+    # the frontends are imported on first use, so that importing ivy does not import
+    # them
+    if name == "frontends":
+        import importlib
+
+        return importlib.import_module(".frontends", __name__)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
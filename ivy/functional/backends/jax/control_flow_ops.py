@@ -2,20 +2,20 @@ import jax
 
 
 def if_else(cond, body_fn, orelse_fn, vars):
-    with jax.disable_jit():
-        final_vars = jax.lax.cond(
-            cond, lambda: body_fn(*vars), lambda: orelse_fn(*vars)
-        )
-    return final_vars
+    if not isinstance(cond, jax.core.Tracer):
+        # a concrete predicate selects the branch without tracing either of them
+        return body_fn(*vars) if cond else orelse_fn(*vars)
+    return jax.lax.cond(
+        cond, lambda v: body_fn(*v), lambda v: orelse_fn(*v), tuple(vars)
+    )
 
 
 def while_loop(test_fn, body_fn, vars):
     def body_fn_wrapper(loop_vars):
-        return body_fn(*loop_vars)
+        return tuple(body_fn(*loop_vars))
 
     def test_fn_wrapper(loop_vars):
         return test_fn(*loop_vars)
 
-    with jax.disable_jit():
-        final_loop_vars = jax.lax.while_loop(test_fn_wrapper, body_fn_wrapper, vars)
-    return final_loop_vars
+    # the loop is traced once and compiled into a single XLA while op
+    return jax.lax.while_loop(test_fn_wrapper, body_fn_wrapper, tuple(vars))
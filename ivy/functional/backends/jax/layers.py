@@ -1,6 +1,7 @@
 """Collection of Jax network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -405,3 +406,53 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    batch_shape = x.shape[:-2]
+    timesteps, input_channels = x.shape[-2:]
+    output_channels = recurrent_kernel.shape[0]
+
+    # one projection of all timesteps, with both biases added once
+    Wi_x = jnp.matmul(jnp.reshape(x, (-1, timesteps, input_channels)), kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+
+    def _step(carry, Wi_xt):
+        ht, ct = carry
+        it, ft, gt, ot = jnp.split(Wi_xt + jnp.matmul(ht, recurrent_kernel), 4, -1)
+        ct = jax.nn.sigmoid(ft) * ct + jax.nn.sigmoid(it) * jnp.tanh(gt)
+        ht = jax.nn.sigmoid(ot) * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    # the carried states keep one dtype and one shape across the steps of the scan,
+    # so the initial states are also broadcast over the batch dimensions
+    dtype = jnp.result_type(Wi_x, init_h, init_c, recurrent_kernel)
+    state_shape = batch_shape + (output_channels,)
+    init_h = jnp.broadcast_to(init_h, state_shape).astype(dtype)
+    init_c = jnp.broadcast_to(init_c, state_shape).astype(dtype)
+    (_, ct), hts = jlax.scan(
+        _step,
+        (
+            jnp.reshape(init_h, (-1, output_channels)),
+            jnp.reshape(init_c, (-1, output_channels)),
+        ),
+        jnp.swapaxes(Wi_x, 0, 1),
+    )
+    hts = jnp.swapaxes(hts, 0, 1)
+    return (
+        jnp.reshape(hts, batch_shape + (timesteps, output_channels)),
+        jnp.reshape(ct, batch_shape + (output_channels,)),
+    )
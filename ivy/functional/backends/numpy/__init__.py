@@ -96,7 +96,7 @@ invalid_complex_dtypes = ()
 
 native_inplace_support = False
 
-supports_gradients = False
+supports_gradients = True
 
 
 def closest_valid_dtype(type):
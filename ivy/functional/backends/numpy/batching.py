@@ -0,0 +1,1070 @@
+"""Vectorizing map for the NumPy backend.
+
+While a function is mapped by `vmap`, its mapped arguments are replaced by batched
+arrays, NumPy arrays which hide their leading batch axis, so that the function only
+sees the arrays of a single element of the batch. The ivy namespace is swapped for
+one in which the backend functions apply their batching rule when they are called
+with batched arrays, which makes a single call on the whole batch with the batch axis
+moved where the backend function expects it. The backend functions without a rule
+are called once for each element of the batch instead, and their returns stacked.
+The mapped functions which use the values of the batched arrays as Python values, or
+which update the arrays which are not batched inplace with batched ones, are called
+once for each element of the batch by `vmap` instead.
+
+The NumPy functions called on the batched arrays are called for each element of the
+batch, except for `np.asarray` and `np.array`, which return the NumPy array holding
+the whole batch, as NumPy does not let subclasses intercept them. The arrays are
+converted with `ivy.to_numpy` instead, which is batched.
+
+Maps can be nested, each of them batching the arrays along its own level, and the
+batching rules call the other backend functions through their batching wrappers, so
+that the arrays of the outer levels are batched in turn, and that the calls are
+recorded by the gradient tapes like any other.
+"""
+
+# global
+import contextlib
+import contextvars
+import functools
+import inspect
+import math
+import numbers
+import string
+
+import numpy as np
+
+# local
+import ivy
+
+
+# Helpers #
+# --------#
+
+# the sizes of the batches of the maps of the current thread or asyncio task, from the
+# outermost one, whose level is 1
+_batch_sizes = contextvars.ContextVar("ivy_numpy_batch_sizes", default=())
+
+# the batching wrappers of the backend functions, by name
+_batching_fns = dict()
+
+# the signatures of the batched backend functions
+_signatures = dict()
+
+
+class _Unbatchable(BaseException):
+    """Raised when a function mapped by `vmap` uses a batched array in a way which
+    cannot be batched, so that `vmap` calls it for each element of the batch instead.
+    It is not an Exception, so that it is not caught by the wrappers of the backend
+    functions."""
+
+
+def _check_inplace(x, val):
+    """Raises _Unbatchable if x is updated inplace with val, but is not batched at
+    every level of val."""
+    x_levels, val_levels = (getattr(_to_native(v), "_levels", ()) for v in (x, val))
+    if not set(val_levels) <= set(x_levels):
+        raise _Unbatchable(
+            "an array which is not mapped by vmap cannot be updated inplace with the "
+            "values of the elements of the batch"
+        )
+
+
+class _BatchedArray(np.ndarray):
+    """A NumPy array whose leading axes are the batch axes of its levels, from the
+    outermost one, and which only exposes the shape of an element of the batch.
+
+    The array without the batch axis of its innermost level is its `value`, whose
+    leading axis is that batch axis. The methods which depend on the shape of the
+    array call the batching backend functions, and the NumPy functions which are not
+    backend functions are called on each element of the batch.
+    """
+
+    def __array_finalize__(self, obj):
+        self._levels = getattr(obj, "_levels", ())
+        self._value = None
+
+    @property
+    def value(self):
+        if self._value is None:
+            value = self.view(np.ndarray)
+            for level in self._levels[:-1]:
+                value = _batch(value, level)
+            self._value = value
+        return self._value
+
+    @property
+    def shape(self):
+        return np.ndarray.shape.__get__(self)[len(self._levels) :]
+
+    @property
+    def ndim(self):
+        return np.ndarray.ndim.__get__(self) - len(self._levels)
+
+    @property
+    def size(self):
+        return math.prod(self.shape)
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, query):
+        return _op("get_item")(self, ivy.to_native(query, nested=True))
+
+    def __setitem__(self, query, val):
+        level = self._levels[-1]
+        for i in range(self.value.shape[0]):
+            self.value[i][query] = val.value[i] if _level(val) == level else val
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        level = _level(inputs)
+        if ufunc is np.matmul and method == "__call__" and not kwargs:
+            return _op("matmul")(*inputs)
+        if method != "__call__" or ufunc.signature is not None or "out" in kwargs:
+            return _loop(getattr(ufunc, method), inputs, kwargs, level, np.stack)
+        # the inputs are broadcast against each other after their batch axis
+        ndim = max(x.ndim if isinstance(x, np.ndarray) else np.ndim(x) for x in inputs)
+        values = list()
+        for x in inputs:
+            if _level(x) == level:
+                x = x.value
+                x = x.reshape(x.shape[:1] + (1,) * (ndim + 1 - x.ndim) + x.shape[1:])
+            values.append(x)
+        return _wrap(ufunc(*values, **kwargs), level)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.shape and args[0] is self:
+            return self.shape
+        if func is np.ndim and args[0] is self:
+            return self.ndim
+        return _loop(func, args, kwargs, _level((args, kwargs)), np.stack)
+
+    def __repr__(self):
+        return "_BatchedArray({}, levels={})".format(
+            repr(self.view(np.ndarray)), self._levels
+        )
+
+    def __bool__(self):
+        raise _Unbatchable(
+            "the value of an array mapped by vmap differs between the elements of "
+            "the batch, and cannot be used as a Python value"
+        )
+
+    __float__ = __int__ = __complex__ = __index__ = __bool__
+
+    def item(self, *args):
+        return self.__bool__()
+
+    tolist = item
+
+    def reshape(self, *shape, order="C"):
+        shape = shape[0] if len(shape) == 1 and not isinstance(shape[0], int) else shape
+        return _op("reshape")(self, tuple(shape), order=order)
+
+    def flatten(self, order="C"):
+        return self.reshape(-1, order=order)
+
+    ravel = flatten
+
+    def transpose(self, *axes):
+        axes = axes[0] if len(axes) == 1 and not isinstance(axes[0], int) else axes
+        axes = tuple(reversed(range(self.ndim))) if not axes else tuple(axes)
+        return _op("permute_dims")(self, axes)
+
+    def swapaxes(self, axis1, axis2):
+        return _op("swapaxes")(self, axis1, axis2)
+
+    def squeeze(self, axis=None):
+        return _op("squeeze")(self, axis)
+
+    def _reduction_method(name):
+        def method(self, axis=None, keepdims=False):
+            return _op(name)(self, axis=axis, keepdims=keepdims)
+
+        method.__name__ = name
+        return method
+
+    sum = _reduction_method("sum")
+    mean = _reduction_method("mean")
+    prod = _reduction_method("prod")
+    max = _reduction_method("max")
+    min = _reduction_method("min")
+    all = _reduction_method("all")
+    any = _reduction_method("any")
+    argmax = _reduction_method("argmax")
+    argmin = _reduction_method("argmin")
+    del _reduction_method
+
+
+def _batch(x, level):
+    """Returns the native array x batched at level, along its leading axis."""
+    ret = x.view(_BatchedArray)
+    ret._levels = getattr(x, "_levels", ()) + (level,)
+    ret._value = x
+    return ret
+
+
+def _level(x):
+    # the innermost level the nest x is batched at, or 0 if it is not batched
+    if isinstance(x, _BatchedArray):
+        return x._levels[-1] if x._levels else 0
+    if isinstance(x, (list, tuple)):
+        return max(map(_level, x), default=0)
+    if isinstance(x, ivy.Array):
+        return _level(x.data)
+    return 0
+
+
+def _base(x):
+    """Returns the NumPy array holding the batches of all the levels of x."""
+    while isinstance(x, _BatchedArray) and x._levels:
+        x = x.value
+    return x
+
+
+def _like(x, batched):
+    """Returns the NumPy array x batched at the levels of the array `batched`, whose
+    base has the shape of x."""
+    for level in getattr(batched, "_levels", ()):
+        x = _batch(x, level)
+    return x
+
+
+def _to_native(nest):
+    if isinstance(nest, ivy.Array):
+        return nest.data
+    if isinstance(nest, (list, tuple)) and not hasattr(nest, "_fields"):
+        return type(nest)(_to_native(x) for x in nest)
+    return nest
+
+
+def _wrap(ret, level):
+    # batches the arrays of the return of a call made on the batch of level
+    ret = _to_native(ret)
+    if isinstance(ret, np.ndarray):
+        return _batch(ret, level)
+    if isinstance(ret, np.generic):
+        return _batch(np.asarray(ret), level)
+    if isinstance(ret, tuple) and hasattr(ret, "_fields"):
+        return type(ret)(*[_wrap(x, level) for x in ret])
+    if isinstance(ret, (list, tuple)):
+        return type(ret)(_wrap(x, level) for x in ret)
+    return ret
+
+
+def _op(name):
+    """Returns the batching backend function `name`, which returns native arrays."""
+    fn = _batching_fns[name]
+    return lambda *args, **kwargs: _to_native(fn(*args, **kwargs))
+
+
+def _bind(fn, args, kwargs):
+    signature = _signatures.get(fn)
+    if signature is None:
+        signature = _signatures[fn] = inspect.signature(fn)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound
+
+
+def _call(fn, bound, **arguments):
+    bound.arguments.update(arguments)
+    return fn(*bound.args, **bound.kwargs)
+
+
+def _batch_size(nest, level):
+    if _level(nest) != level:
+        return None
+    if isinstance(nest, ivy.Array):
+        nest = nest.data
+    if isinstance(nest, _BatchedArray):
+        return nest.value.shape[0]
+    sizes = (_batch_size(x, level) for x in nest)
+    return next(size for size in sizes if size is not None)
+
+
+def _slicer(x, level, unstack):
+    # returns the function returning the argument x of the i-th element of the batch
+    if _level(x) != level:
+        return lambda i: x
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if isinstance(x, np.ndarray):
+        return unstack(x.value).__getitem__
+    getters = [_slicer(x_, level, unstack) for x_ in x]
+    return lambda i: type(x)(get(i) for get in getters)
+
+
+def _stack(rets, level, stack):
+    ret = _to_native(rets[0])
+    if isinstance(ret, (np.ndarray, np.generic, numbers.Number)):
+        return _batch(stack([_to_native(r) for r in rets]), level)
+    if isinstance(ret, (list, tuple)) and _has_arrays(ret):
+        stacked = [_stack([r[i] for r in rets], level, stack) for i in range(len(ret))]
+        return type(ret)(*stacked) if hasattr(ret, "_fields") else type(ret)(stacked)
+    if all(r == ret for r in rets[1:]):
+        return ret
+    raise ivy.exceptions.IvyException(
+        "the return {} of a function mapped by vmap differs between the elements of "
+        "the batch, and cannot be batched".format(ret)
+    )
+
+
+def _has_arrays(nest):
+    if isinstance(nest, (np.ndarray, ivy.Array, np.generic, numbers.Number)):
+        return True
+    return isinstance(nest, (list, tuple)) and any(map(_has_arrays, nest))
+
+
+def _loop(fn, args, kwargs, level, stack=None):
+    """Calls fn for each element of the batch of level, and returns the stacked
+    returns. The calls are made with the batching backend functions, which are
+    recorded by the gradient tapes, unless `stack` is given with the NumPy function
+    to stack the returns with."""
+    if stack is None:
+        unstack, stack = lambda x: _op("unstack")(x, axis=0), _op("stack")
+    else:
+        unstack = lambda x: [x[i] for i in range(x.shape[0])]
+    arg_getters = [_slicer(x, level, unstack) for x in args]
+    kwarg_getters = {k: _slicer(v, level, unstack) for k, v in kwargs.items()}
+    rets = list()
+    for i in range(_batch_size((args, list(kwargs.values())), level)):
+        rets.append(
+            fn(
+                *[get(i) for get in arg_getters],
+                **{k: get(i) for k, get in kwarg_getters.items()},
+            )
+        )
+    return _stack(rets, level, stack)
+
+
+def _batching(name, fn):
+    """Wraps the backend function `fn`, so that its calls with batched arrays apply
+    its batching rule to the arrays of their innermost level, or are made for each
+    element of the batch if it has none."""
+    rule = _RULES.get(name, _loop_rule)
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        level = max(_level(args), _level(tuple(kwargs.values())))
+        if not level:
+            return fn(*args, **kwargs)
+        try:
+            bound = _bind(fn, args, kwargs)
+        except TypeError:
+            # the backend wrappers of some backend functions fill in their arguments
+            return _loop(new_fn, args, kwargs, level)
+        if bound.arguments.get("out") is not None:
+            # the wrapper of the backend function updates out with the return
+            bound.arguments["out"] = None
+        return rule(new_fn, bound, level)
+
+    _batching_fns[name] = new_fn
+    return new_fn
+
+
+@contextlib.contextmanager
+def _batch_level(size):
+    """Adds a map over a batch of `size` elements to the current context, and returns
+    its level."""
+    sizes = _batch_sizes.get()
+    token = _batch_sizes.set(sizes + (size,))
+    try:
+        yield len(sizes) + 1
+    finally:
+        _batch_sizes.reset(token)
+
+
+def _with_level(x, level, size):
+    # the native array x batched at level, broadcast along its batch axis if it was
+    # not batched at level
+    levels = getattr(x, "_levels", ())
+    if level in levels:
+        return x
+    if not levels or levels[-1] < level:
+        return _batch(_op("broadcast_to")(x, (size,) + x.shape), level)
+    return _batch(_with_level(x.value, level, size), levels[-1])
+
+
+def _broadcast_batches(nest):
+    """Returns the native arrays of the nest batched at every level of the current
+    context, so that their gradients are computed for each element of the batch."""
+    sizes = _batch_sizes.get()
+    if not sizes:
+        return nest
+
+    def map_fn(x):
+        native = ivy.to_native(x)
+        if not isinstance(native, np.ndarray):
+            return x
+        for level, size in enumerate(sizes, 1):
+            native = _with_level(native, level, size)
+        return ivy.to_ivy(native) if ivy.is_ivy_array(x) else native
+
+    if ivy.is_array(nest):
+        return map_fn(nest)
+    return ivy.nested_map(nest, map_fn, include_derived=True, shallow=False)
+
+
+# Batching Rules #
+# ---------------#
+
+# Each rule takes the batching backend function, the bound arguments of its call and
+# the level to batch, and returns the return of the call batched at level. The rules
+# fall back to calling the function for each element of the batch for the arguments
+# they do not support.
+
+
+def _loop_rule(fn, bound, level):
+    return _loop(fn, bound.args, bound.kwargs, level)
+
+
+def _shift(axis):
+    # the axis of an element of the batch in the batched array
+    if axis is None:
+        return None
+    if isinstance(axis, (list, tuple)):
+        return type(axis)(_shift(a) for a in axis)
+    return axis + 1 if axis >= 0 else axis
+
+
+def _operand(bound, level):
+    # the name of the first argument and its batch, or None if any other argument is
+    # batched, or if the first one is not
+    items = iter(bound.arguments.items())
+    name, x = next(items)
+    if _level(x) != level or any(_level(v) == level for _, v in items):
+        return name, None
+    return name, x.value
+
+
+def _broadcast(x, level, size):
+    # the batch of x, broadcast to the batch if x is not batched at level
+    if _level(x) == level:
+        return x.value
+    return _op("broadcast_to")(x, (size,) + x.shape)
+
+
+def _unbatched(fn, bound, level):
+    # calls fn with the batches of its arguments, and returns the return as it is
+    for k, v in bound.arguments.items():
+        if _level(v) == level:
+            bound.arguments[k] = v.value
+    return fn(*bound.args, **bound.kwargs)
+
+
+def _elementwise(fn, bound, level):
+    operands = {k: v for k, v in bound.arguments.items() if isinstance(v, np.ndarray)}
+    if not any(_level(v) == level for v in operands.values()):
+        return _loop_rule(fn, bound, level)
+    # the operands are broadcast against each other after their batch axis
+    ndim = max(v.ndim for v in operands.values())
+    for k, v in operands.items():
+        if _level(v) == level:
+            v = v.value
+            if v.ndim <= ndim:
+                v = _op("reshape")(
+                    v, v.shape[:1] + (1,) * (ndim + 1 - v.ndim) + v.shape[1:]
+                )
+            bound.arguments[k] = v
+    return _wrap(fn(*bound.args, **bound.kwargs), level)
+
+
+def _shifted(*names, min_ndim=0):
+    """Returns the rule of the backend functions of the array of their first argument
+    whose arguments `names` are axes of that array, and which are batched over any
+    leading axis of arrays of at least `min_ndim` dimensions."""
+
+    def rule(fn, bound, level):
+        name, x = _operand(bound, level)
+        if x is None or x.ndim <= min_ndim:
+            return _loop_rule(fn, bound, level)
+        axes = {k: _shift(bound.arguments[k]) for k in names}
+        return _wrap(_call(fn, bound, **{name: x}, **axes), level)
+
+    return rule
+
+
+def _reduction(flatten=False):
+    """Returns the rule of the reductions over the axes `axis` of the array of their
+    first argument, or over all its axes if `axis` is None, which are flattened first
+    if `flatten` is True."""
+
+    def rule(fn, bound, level):
+        name, x = _operand(bound, level)
+        if x is None:
+            return _loop_rule(fn, bound, level)
+        axis = bound.arguments["axis"]
+        if axis is not None:
+            return _wrap(_call(fn, bound, **{name: x, "axis": _shift(axis)}), level)
+        if not flatten:
+            axis = tuple(range(1, x.ndim))
+            return _wrap(_call(fn, bound, **{name: x, "axis": axis}), level)
+        size, shape = x.shape[0], x.shape[1:]
+        x = _op("reshape")(x, (size, math.prod(shape)))
+        ret = _to_native(_call(fn, bound, **{name: x, "axis": 1}))
+        if bound.arguments.get("keepdims"):
+            ret = _op("reshape")(ret, (size,) + (1,) * len(shape))
+        return _wrap(ret, level)
+
+    return rule
+
+
+_flat_reduction = _reduction(flatten=True)
+
+
+def _vector_norm(fn, bound, level):
+    ret = _flat_reduction(fn, bound, level)
+    if _level(ret) == level and not ret.shape:
+        # the norms of all the axes are returned with a single dimension
+        return _batch(_op("expand_dims")(ret.value, axis=1), level)
+    return ret
+
+
+def _merged(fn, bound, level):
+    # the batch of the layers is merged with the batch axis of their input
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    size = x.shape[0]
+    x = _op("reshape")(x, (size * x.shape[1],) + x.shape[2:])
+    ret = _to_native(_call(fn, bound, **{name: x}))
+    return _wrap(_op("reshape")(ret, (size, -1) + ret.shape[1:]), level)
+
+
+def _reshape(fn, bound, level):
+    name, x = _operand(bound, level)
+    shape = bound.arguments["shape"]
+    if x is None or bound.arguments["order"] != "C" or not bound.arguments["allowzero"]:
+        return _loop_rule(fn, bound, level)
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    return _wrap(_call(fn, bound, x=x, shape=x.shape[:1] + shape), level)
+
+
+def _squeeze(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    axis = bound.arguments["axis"]
+    if axis is None:
+        axis = tuple(i for i, n in enumerate(x.shape[1:]) if n == 1)
+    return _wrap(_call(fn, bound, x=x, axis=_shift(axis)), level)
+
+
+def _permute_dims(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    axes = (0,) + tuple(a % (x.ndim - 1) + 1 for a in bound.arguments["axes"])
+    return _wrap(_call(fn, bound, x=x, axes=axes), level)
+
+
+def _roll(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    if bound.arguments["axis"] is not None:
+        return _wrap(_call(fn, bound, x=x, axis=_shift(bound.arguments["axis"])), level)
+    shape = x.shape
+    x = _op("reshape")(x, (shape[0], math.prod(shape[1:])))
+    ret = _to_native(_call(fn, bound, x=x, axis=1))
+    return _wrap(_op("reshape")(ret, shape), level)
+
+
+def _joined(name, flatten=False):
+    """Returns the rule of the backend functions joining the arrays of their argument
+    `name` along the axis `axis`, whose arrays which are not batched are broadcast to
+    the batch, and which are flattened first if `flatten` is True and `axis` is
+    None."""
+
+    def rule(fn, bound, level):
+        xs = bound.arguments[name]
+        if not isinstance(xs, (list, tuple)):
+            return _loop_rule(fn, bound, level)
+        size = _batch_size(xs, level)
+        others = (v for k, v in bound.arguments.items() if k != name)
+        if size is None or any(_level(v) == level for v in others):
+            return _loop_rule(fn, bound, level)
+        xs = [_broadcast(x, level, size) for x in xs]
+        axis = bound.arguments["axis"]
+        if axis is None and flatten:
+            xs = [_op("reshape")(x, (size, math.prod(x.shape[1:]))) for x in xs]
+            axis = 0
+        return _wrap(_call(fn, bound, **{name: xs, "axis": _shift(axis)}), level)
+
+    return rule
+
+
+def _tile(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    repeats = bound.arguments["repeats"]
+    repeats = (repeats,) if isinstance(repeats, int) else tuple(repeats)
+    ndim = x.ndim - 1
+    if len(repeats) > ndim:
+        x = _op("reshape")(x, x.shape[:1] + (1,) * (len(repeats) - ndim) + x.shape[1:])
+    repeats = (1,) * (max(ndim, len(repeats)) - len(repeats) + 1) + repeats
+    return _wrap(_call(fn, bound, x=x, repeats=repeats), level)
+
+
+def _repeat(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    axis = bound.arguments["axis"]
+    if axis is None:
+        x = _op("reshape")(x, (x.shape[0], math.prod(x.shape[1:])))
+        axis = 0
+    return _wrap(_call(fn, bound, x=x, axis=_shift(axis)), level)
+
+
+def _broadcast_to(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    shape = tuple(bound.arguments["shape"])
+    missing = len(shape) + 1 - x.ndim
+    if missing > 0:
+        x = _op("reshape")(x, x.shape[:1] + (1,) * missing + x.shape[1:])
+    return _wrap(_call(fn, bound, x=x, shape=x.shape[:1] + shape), level)
+
+
+def _pad(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    pad_width = np.broadcast_to(
+        np.asarray(bound.arguments["pad_width"], dtype="int64"), (x.ndim - 1, 2)
+    )
+    pad_width = [(0, 0)] + [tuple(p) for p in pad_width.tolist()]
+    return _wrap(_call(fn, bound, x=x, pad_width=pad_width), level)
+
+
+def _is_advanced(index):
+    return isinstance(index, (np.ndarray, ivy.Array, list, numbers.Integral))
+
+
+def _get_item(fn, bound, level):
+    name, x = _operand(bound, level)
+    if x is None:
+        return _loop_rule(fn, bound, level)
+    query = bound.arguments["query"]
+    query = query if isinstance(query, tuple) else (query,)
+    # NumPy moves the axes of advanced indices which are not next to each other to
+    # the front, which would be before the batch axis
+    advanced = [i for i, index in enumerate(query) if _is_advanced(index)]
+    if any(
+        isinstance(index, (np.ndarray, ivy.Array, list)) for index in query
+    ) and advanced != list(range(advanced[0], advanced[-1] + 1)):
+        return _loop_rule(fn, bound, level)
+    return _wrap(_call(fn, bound, x=x, query=(slice(None),) + query), level)
+
+
+def _gather(fn, bound, level):
+    params, indices = bound.arguments["params"], bound.arguments["indices"]
+    axis, batch_dims = bound.arguments["axis"], bound.arguments["batch_dims"]
+    if not batch_dims and _level(indices) != level:
+        return _wrap(_call(fn, bound, params=params.value, axis=_shift(axis)), level)
+    if not batch_dims and _level(params) != level:
+        ret = _to_native(_call(fn, bound, indices=indices.value))
+        return _wrap(_op("moveaxis")(ret, axis % params.ndim, 0), level)
+    size = _batch_size((params, indices), level)
+    return _wrap(
+        _call(
+            fn,
+            bound,
+            params=_broadcast(params, level, size),
+            indices=_broadcast(indices, level, size),
+            axis=_shift(axis % params.ndim),
+            batch_dims=batch_dims % params.ndim + 1,
+        ),
+        level,
+    )
+
+
+def _gather_nd(fn, bound, level):
+    params, indices = bound.arguments["params"], bound.arguments["indices"]
+    size = _batch_size((params, indices), level)
+    batch_dims = bound.arguments["batch_dims"] % params.ndim
+    return _wrap(
+        _call(
+            fn,
+            bound,
+            params=_broadcast(params, level, size),
+            indices=_broadcast(indices, level, size),
+            batch_dims=batch_dims + 1,
+        ),
+        level,
+    )
+
+
+def _take_along_axis(fn, bound, level):
+    arr, indices = bound.arguments["arr"], bound.arguments["indices"]
+    size = _batch_size((arr, indices), level)
+    return _wrap(
+        _call(
+            fn,
+            bound,
+            arr=_broadcast(arr, level, size),
+            indices=_broadcast(indices, level, size),
+            axis=_shift(bound.arguments["axis"] % arr.ndim),
+        ),
+        level,
+    )
+
+
+def _matmul(fn, bound, level):
+    operands = list()
+    for name, transpose in (("x1", "transpose_a"), ("x2", "transpose_b")):
+        x = bound.arguments[name]
+        batched = _level(x) == level
+        if batched:
+            x = x.value
+            if bound.arguments[transpose]:
+                # the NumPy matmul transposes every axis of its operands
+                x = _op("permute_dims")(x, (0,) + tuple(range(x.ndim - 1, 0, -1)))
+                bound.arguments[transpose] = False
+        operands.append([x, batched])
+    (x1, batched1), (x2, batched2) = operands
+    size = (x1 if batched1 else x2).shape[0]
+    squeezed = list()
+    # the vectors of the batch are promoted to matrices, unlike those which are
+    # broadcast against it
+    if batched1 and x1.ndim == 2:
+        x1 = _op("expand_dims")(x1, axis=1)
+        squeezed.append(-2)
+    if batched2 and x2.ndim == 2:
+        x2 = _op("expand_dims")(x2, axis=-1)
+        squeezed.append(-1)
+    # the batch axes of the matrices of the batch are aligned with those of the other
+    # operand
+    ndim = max(x1.ndim - batched1, x2.ndim - batched2)
+    if batched1 and x1.ndim <= ndim:
+        x1 = _op("reshape")(x1, (size,) + (1,) * (ndim + 1 - x1.ndim) + x1.shape[1:])
+    if batched2 and x2.ndim <= ndim:
+        x2 = _op("reshape")(x2, (size,) + (1,) * (ndim + 1 - x2.ndim) + x2.shape[1:])
+    ret = _to_native(_call(fn, bound, x1=x1, x2=x2))
+    if squeezed:
+        ret = _op("squeeze")(ret, axis=tuple(squeezed))
+    return _wrap(ret, level)
+
+
+def _einsum(fn, bound, level):
+    equation = bound.arguments["equation"].replace(" ", "")
+    inputs, _, output = equation.partition("->")
+    inputs = inputs.split(",")
+    if "->" not in equation:
+        # the implicit output has the indices which appear once, in alphabetical order
+        indices = "".join(inputs).replace(".", "")
+        output = "".join(sorted(c for c in set(indices) if indices.count(c) == 1))
+        output = ("..." if "." in equation else "") + output
+    batch = next(c for c in string.ascii_letters if c not in equation)
+    operands = list()
+    for i, x in enumerate(bound.arguments["operands"]):
+        if _level(x) == level:
+            inputs[i] = batch + inputs[i]
+            x = x.value
+        operands.append(x)
+    equation = ",".join(inputs) + "->" + batch + output
+    return _wrap(_call(fn, bound, equation=equation, operands=tuple(operands)), level)
+
+
+def _contract(x1, x2, x1_axes, x2_axes, level):
+    # contracts the axes x1_axes of x1 with the axes x2_axes of x2, whose batches
+    # are the operands if they are batched at level, as a NumPy tensordot
+    operands, subscripts = list(), list()
+    letters = iter(string.ascii_letters[1:])
+    batch = string.ascii_letters[0]
+    x1_batched, x2_batched = _level(x1) == level, _level(x2) == level
+    x1_subscripts = [next(letters) for _ in range(x1.ndim)]
+    x2_subscripts = [next(letters) for _ in range(x2.ndim)]
+    for a1, a2 in zip(x1_axes, x2_axes):
+        x2_subscripts[a2 % x2.ndim] = x1_subscripts[a1 % x1.ndim]
+    contracted = set(x1_subscripts[a % x1.ndim] for a in x1_axes)
+    output = [c for c in x1_subscripts + x2_subscripts if c not in contracted]
+    for x, batched, x_subscripts in (
+        (x1, x1_batched, x1_subscripts),
+        (x2, x2_batched, x2_subscripts),
+    ):
+        operands.append(x.value if batched else x)
+        subscripts.append((batch if batched else "") + "".join(x_subscripts))
+    equation = ",".join(subscripts) + "->" + batch + "".join(output)
+    return _wrap(_op("einsum")(equation, *operands), level)
+
+
+def _tensordot(fn, bound, level):
+    x1, x2, axes = (bound.arguments[k] for k in ("x1", "x2", "axes"))
+    if isinstance(axes, int):
+        x1_axes, x2_axes = list(range(x1.ndim - axes, x1.ndim)), list(range(axes))
+    else:
+        x1_axes, x2_axes = ([a] if isinstance(a, int) else list(a) for a in axes)
+    return _contract(x1, x2, x1_axes, x2_axes, level)
+
+
+def _vecdot(fn, bound, level):
+    x1, x2, axis = (bound.arguments[k] for k in ("x1", "x2", "axis"))
+    return _contract(x1, x2, [axis], [axis], level)
+
+
+def _inner(fn, bound, level):
+    x1, x2 = bound.arguments["x1"], bound.arguments["x2"]
+    if not x1.ndim or not x2.ndim:
+        return _loop_rule(fn, bound, level)
+    return _contract(x1, x2, [-1], [-1], level)
+
+
+def _outer(fn, bound, level):
+    # the NumPy outer product flattens its operands
+    operands = list()
+    for x in (bound.arguments["x1"], bound.arguments["x2"]):
+        if _level(x) == level:
+            x = _batch(_op("reshape")(x.value, (x.value.shape[0], -1)), level)
+        else:
+            x = _op("reshape")(x, (-1,))
+        operands.append(x)
+    return _contract(*operands, [], [], level)
+
+
+# the backend functions which only depend on the shape of the element of the batch or
+# on the dtype and device of their arguments, or which handle batched arrays
+# themselves, and which are called with the batched arrays as they are
+_UNBATCHED = (
+    "dtype",
+    "dev",
+    "shape",
+    "get_num_dims",
+    "is_native_array",
+    "is_native_sparse_array",
+    "result_type",
+    "to_device",
+    "execute_with_gradients",
+    "value_and_grad",
+    "grad",
+    "jac",
+    "vmap",
+    "while_loop",
+    "if_else",
+    "inplace_update",
+    "inplace_decrement",
+    "inplace_increment",
+)
+
+_ELEMENTWISE = (
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "angle",
+    "array",
+    "asarray",
+    "asin",
+    "asinh",
+    "astype",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_invert",
+    "bitwise_left_shift",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "clip",
+    "copy_array",
+    "copysign",
+    "cos",
+    "cosh",
+    "deg2rad",
+    "divide",
+    "empty_like",
+    "equal",
+    "erf",
+    "exp",
+    "exp2",
+    "expm1",
+    "fix",
+    "float_power",
+    "floor",
+    "floor_divide",
+    "fmax",
+    "fmin",
+    "fmod",
+    "full_like",
+    "gcd",
+    "gelu",
+    "greater",
+    "greater_equal",
+    "heaviside",
+    "i0",
+    "isclose",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "isreal",
+    "lcm",
+    "leaky_relu",
+    "less",
+    "less_equal",
+    "log",
+    "log10",
+    "log1p",
+    "log2",
+    "logaddexp",
+    "logaddexp2",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "logit",
+    "maximum",
+    "minimum",
+    "multiply",
+    "nan_to_num",
+    "negative",
+    "nextafter",
+    "not_equal",
+    "ones_like",
+    "positive",
+    "pow",
+    "rad2deg",
+    "reciprocal",
+    "relu",
+    "remainder",
+    "round",
+    "sigmoid",
+    "sign",
+    "signbit",
+    "sin",
+    "sinc",
+    "sinh",
+    "softplus",
+    "sqrt",
+    "square",
+    "stop_gradient",
+    "subtract",
+    "tan",
+    "tanh",
+    "to_numpy",
+    "trunc",
+    "variable",
+    "where",
+    "xlogy",
+    "zeros_like",
+    "zeta",
+)
+
+# the linear algebra functions of the matrices of the last two axes of their input
+_MATRICES = (
+    "adjoint",
+    "cholesky",
+    "det",
+    "eig",
+    "eigh",
+    "eigvals",
+    "eigvalsh",
+    "inv",
+    "matrix_power",
+    "matrix_rank",
+    "matrix_transpose",
+    "pinv",
+    "qr",
+    "slogdet",
+    "svd",
+    "svdvals",
+    "tril",
+    "triu",
+)
+
+_LAYERS = (
+    "avg_pool1d",
+    "avg_pool2d",
+    "avg_pool3d",
+    "conv1d",
+    "conv2d",
+    "conv3d",
+    "conv_general_dilated",
+    "depthwise_conv2d",
+    "dropout1d",
+    "max_pool1d",
+    "max_pool2d",
+    "max_pool3d",
+)
+
+# the batching rule of each backend function which has one
+_RULES = {
+    **dict.fromkeys(_ELEMENTWISE, _elementwise),
+    **dict.fromkeys(_MATRICES, _shifted(min_ndim=2)),
+    **dict.fromkeys(_LAYERS, _merged),
+    # reductions
+    **dict.fromkeys(
+        (
+            "all",
+            "any",
+            "count_nonzero",
+            "flip",
+            "log_softmax",
+            "max",
+            "mean",
+            "median",
+            "min",
+            "nanmean",
+            "nansum",
+            "prod",
+            "softmax",
+            "std",
+            "sum",
+            "var",
+        ),
+        _reduction(),
+    ),
+    **dict.fromkeys(("argmax", "argmin", "cumprod", "cumsum"), _flat_reduction),
+    "vector_norm": _vector_norm,
+    "is_variable": _unbatched,
+    # linear algebra
+    "matmul": _matmul,
+    "einsum": _einsum,
+    "tensordot": _tensordot,
+    "vecdot": _vecdot,
+    "inner": _inner,
+    "outer": _outer,
+    "diagonal": _shifted("axis1", "axis2"),
+    "trace": _shifted("axis1", "axis2"),
+    "matrix_norm": _shifted("axis"),
+    # manipulation
+    "reshape": _reshape,
+    "expand_dims": _shifted("axis"),
+    "squeeze": _squeeze,
+    "permute_dims": _permute_dims,
+    "swapaxes": _shifted("axis0", "axis1"),
+    "moveaxis": _shifted("source", "destination"),
+    "roll": _roll,
+    "concat": _joined("xs", flatten=True),
+    "stack": _joined("arrays"),
+    "split": _shifted("axis"),
+    "unstack": _shifted("axis"),
+    "tile": _tile,
+    "repeat": _repeat,
+    "broadcast_to": _broadcast_to,
+    "zero_pad": _pad,
+    "constant_pad": _pad,
+    # searching and sorting
+    "argsort": _shifted("axis"),
+    "sort": _shifted("axis"),
+    "top_k": _shifted("axis"),
+    # indexing
+    "get_item": _get_item,
+    "gather": _gather,
+    "gather_nd": _gather_nd,
+    "take_along_axis": _take_along_axis,
+    "one_hot": _shifted("axis"),
+}
@@ -6,6 +6,7 @@ from typing import Optional, Union, Tuple, Literal
 
 # local
 import ivy
+from ..random import _generator
 
 
 def max_pool1d(
@@ -516,7 +517,7 @@ def dropout1d(
             x = np.transpose(x, perm)
         noise_shape = list(x.shape)
         noise_shape[-2] = 1
-        mask = np.random.binomial(1, 1 - prob, noise_shape)
+        mask = _generator().binomial(1, 1 - prob, noise_shape)
         res = np.where(mask, x / (1 - prob), 0)
         if data_format == "NCW":
             res = np.transpose(res, perm)
@@ -6,12 +6,19 @@ import numpy as np
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from .. import backend_version
+from ..random import _generator
 from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _check_shapes_broadcastable,
 )
 
 
+def _legacy_generator(seed):
+    # Generator.beta and Generator.dirichlet may never terminate for tiny parameters
+    # in numpy 1.23, unlike the legacy samplers, which are run on the same stream
+    return np.random.RandomState(_generator(seed).bit_generator)
+
+
 # dirichlet
 def dirichlet(
     alpha: Union[np.ndarray, float, Sequence[float]],
@@ -24,9 +31,7 @@ def dirichlet(
 ) -> np.ndarray:
     size = size if size is not None else len(alpha)
     dtype = dtype if dtype is not None else np.float64
-    if seed is not None:
-        np.random.seed(seed)
-    return np.asarray(np.random.dirichlet(alpha, size=size), dtype=dtype)
+    return np.asarray(_legacy_generator(seed).dirichlet(alpha, size=size), dtype=dtype)
 
 
 dirichlet.support_native_out = False
@@ -44,9 +49,7 @@ def beta(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     shape = _check_bounds_and_get_shape(alpha, beta, shape)
-    if seed is not None:
-        np.random.seed(seed)
-    return np.asarray(np.random.beta(alpha, beta, shape), dtype=dtype)
+    return np.asarray(_legacy_generator(seed).beta(alpha, beta, shape), dtype=dtype)
 
 
 def gamma(
@@ -61,9 +64,7 @@ def gamma(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     shape = _check_bounds_and_get_shape(alpha, beta, shape)
-    if seed is not None:
-        np.random.seed(seed)
-    return np.asarray(np.random.gamma(alpha, beta, shape), dtype=dtype)
+    return np.asarray(_generator(seed).gamma(alpha, beta, shape), dtype=dtype)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("bfloat16",)}, backend_version)
@@ -78,6 +79,4 @@ def poisson(
 ) -> np.ndarray:
     lam = np.array(lam)
     _check_shapes_broadcastable(shape, lam.shape)
-    if seed:
-        np.random.seed(seed)
-    return np.asarray(np.random.poisson(lam, shape), dtype=dtype)
+    return np.asarray(_generator(seed).poisson(lam, shape), dtype=dtype)
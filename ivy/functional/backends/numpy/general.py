@@ -11,6 +11,14 @@ from numbers import Number
 # local
 import ivy
 from ivy.functional.backends.numpy.device import _to_device
+from ivy.functional.backends.numpy.batching import (
+    _batch,
+    _batch_level,
+    _check_inplace,
+    _level,
+    _Unbatchable,
+)
+from ivy.functional.backends.numpy.tape import _transforming
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray, /) -> bool:
@@ -58,55 +66,46 @@ def gather(
     axis = axis % len(params.shape)
     batch_dims = batch_dims % len(params.shape)
     ivy.assertions.check_gather_input_valid(params, indices, axis, batch_dims)
-    result = []
     if batch_dims == 0:
-        result = np.take(params, indices, axis)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = np.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+        return _to_device(np.take(params, indices, axis))
+    # params viewed as batches x outer x axis x inner, gathered with one flat take
+    num_batches = reduce(mul, params.shape[:batch_dims], 1)
+    outer = reduce(mul, params.shape[batch_dims:axis], 1)
+    inner = reduce(mul, params.shape[axis + 1 :], 1)
+    num_indices = reduce(mul, indices.shape[batch_dims:], 1)
+    # wraps the negative indices and raises for the out of bounds ones
+    indices = np.take(np.arange(params.shape[axis]), indices)
+    flat_indices = (
+        np.reshape(np.arange(num_batches) * outer, (-1, 1, 1, 1))
+        + np.reshape(np.arange(outer), (1, -1, 1, 1))
+    ) * params.shape[axis] + np.reshape(indices, (num_batches, 1, num_indices, 1))
+    flat_indices = flat_indices * inner + np.arange(inner)
+    result = np.reshape(
+        np.take(params, flat_indices),
+        params.shape[:axis] + indices.shape[batch_dims:] + params.shape[axis + 1 :],
+    )
     return _to_device(result)
 
 
-def gather_nd_helper(params, indices):
-    indices_shape = indices.shape
-    params_shape = params.shape
+def gather_nd_helper(params, indices, batch_dims=0):
     if len(indices.shape) == 0:
-        num_index_dims = 1
-    else:
-        num_index_dims = indices_shape[-1]
-    result_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = np.array(result_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = np.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = np.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = np.tile(
-        np.reshape(np.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
+        indices = np.expand_dims(indices, -1)
+    params_shape = params.shape[batch_dims:]
+    num_index_dims = indices.shape[-1]
+    num_batches = reduce(mul, params.shape[:batch_dims], 1)
+    num_lookups = reduce(mul, indices.shape[batch_dims:-1], 1)
+    # strides of the indexed dims of params, counted in elements
+    strides = np.array(
+        [reduce(mul, params_shape[i + 1 :], 1) for i in range(num_index_dims)],
+        dtype=np.int64,
     )
-    implicit_indices = np.tile(
-        np.expand_dims(np.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
-    )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = np.reshape(indices_for_flat, (-1,)).astype(np.int32)
-    flat_gather = np.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    res = np.reshape(flat_gather, new_shape)
-    return res
+    inner = reduce(mul, params_shape[num_index_dims:], 1)
+    batch_offsets = np.arange(num_batches) * reduce(mul, params_shape, 1)
+    offsets = np.reshape(
+        np.sum(indices * strides, -1, dtype=np.int64), (num_batches, num_lookups, 1)
+    ) + np.reshape(batch_offsets, (-1, 1, 1))
+    flat_gather = np.take(params, offsets + np.arange(inner))
+    return np.reshape(flat_gather, indices.shape[:-1] + params_shape[num_index_dims:])
 
 
 def gather_nd(
@@ -119,24 +118,7 @@ def gather_nd(
 ) -> np.ndarray:
     ivy.assertions.check_gather_nd_input_valid(params, indices, batch_dims)
     batch_dims = batch_dims % len(params.shape)
-    result = []
-    if batch_dims == 0:
-        result = gather_nd_helper(params, indices)
-    else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = gather_nd_helper(p, np.asarray(i, indices.dtype))
-            result.append(r)
-        result = np.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
-    return _to_device(result)
+    return _to_device(gather_nd_helper(params, indices, batch_dims))
 
 
 def get_num_dims(x, /, *, as_array=False):
@@ -150,6 +132,7 @@ def inplace_arrays_supported():
 def inplace_decrement(
     x: Union[ivy.Array, np.ndarray], val: Union[ivy.Array, np.ndarray]
 ) -> ivy.Array:
+    _check_inplace(x, val)
     (x_native, val_native), _ = ivy.args_to_native(x, val)
     x_native -= val_native
     if ivy.is_ivy_array(x):
@@ -162,6 +145,7 @@ def inplace_decrement(
 def inplace_increment(
     x: Union[ivy.Array, np.ndarray], val: Union[ivy.Array, np.ndarray]
 ) -> ivy.Array:
+    _check_inplace(x, val)
     (x_native, val_native), _ = ivy.args_to_native(x, val)
     x_native += val_native
     if ivy.is_ivy_array(x):
@@ -177,6 +161,7 @@ def inplace_update(
     ensure_in_backend: bool = False,
 ) -> ivy.Array:
     ivy.assertions.check_inplace_sizes_valid(x, val)
+    _check_inplace(x, val)
     if ivy.is_array(x) and ivy.is_array(val):
         (x_native, val_native), _ = ivy.args_to_native(x, val)
 
@@ -217,6 +202,35 @@ def multiprocessing(context=None):
     )
 
 
+_SCATTER_REDUCTIONS = {"sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+def _scatter_reduce(target, indices, updates, reduction, combine):
+    # writes the updates into the rows of target at the flat indices, reducing the
+    # duplicates by sorting the indices and running a segmented ufunc.reduceat
+    if reduction == "replace":
+        target[indices] = updates
+        return target
+    if reduction not in _SCATTER_REDUCTIONS:
+        raise ivy.exceptions.IvyException(
+            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
+                reduction
+            )
+        )
+    if indices.size == 0:
+        return target
+    ufunc = _SCATTER_REDUCTIONS[reduction]
+    order = np.argsort(indices, kind="stable")
+    sorted_indices = indices[order]
+    starts = np.flatnonzero(
+        np.concatenate([[True], sorted_indices[1:] != sorted_indices[:-1]])
+    )
+    unique = sorted_indices[starts]
+    reduced = ufunc.reduceat(updates[order], starts, axis=0)
+    target[unique] = ufunc(target[unique], reduced) if combine else reduced
+    return target
+
+
 def scatter_flat(
     indices: np.ndarray,
     updates: np.ndarray,
@@ -231,38 +245,14 @@ def scatter_flat(
     if ivy.exists(size) and ivy.exists(target):
         ivy.assertions.check_equal(len(target.shape), 1)
         ivy.assertions.check_equal(target.shape[0], size)
-    if reduction == "sum":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        np.add.at(target, indices, updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = np.zeros([size], dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * 1e12
-        np.minimum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == 1e12, 0.0, target), dtype=updates.dtype
-            )
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones([size], dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices, updates)
-        if not target_given:
-            target = np.asarray(
-                np.where(target == -1e12, 0.0, target), dtype=updates.dtype
-            )
+    if target_given:
+        target = np.array(target)
     else:
-        raise ivy.exceptions.IvyException(
-            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
-                reduction
-            )
-        )
+        target = np.zeros([size], dtype=updates.dtype)
+    indices = np.asarray(indices).reshape(-1)
+    indices = np.where(indices < 0, indices + target.shape[0], indices)
+    updates = np.broadcast_to(updates, indices.shape)
+    target = _scatter_reduce(target, indices, updates, reduction, combine=target_given)
     return _to_device(target)
 
 
@@ -298,38 +288,26 @@ def scatter_nd(
             indices = ivy.broadcast_to(
                 indices, updates.shape[:1] + (indices.shape[-1],)
             )._data
-    indices_flat = indices.reshape(-1, indices.shape[-1]).T
-    indices_tuple = tuple(indices_flat) + (Ellipsis,)
-    if reduction == "sum":
-        if not target_given:
-            target = np.zeros(shape, dtype=updates.dtype)
-        np.add.at(target, indices_tuple, updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = np.zeros(shape, dtype=updates.dtype)
-        target = np.asarray(target).copy()
-        target.setflags(write=1)
-        target[indices_tuple] = updates
-    elif reduction == "min":
-        if not target_given:
-            target = np.ones(shape) * 1e12
-        np.minimum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == 1e12, 0, target)
-            target = np.asarray(target, dtype=updates.dtype)
-    elif reduction == "max":
-        if not target_given:
-            target = np.ones(shape, dtype=updates.dtype) * -1e12
-        np.maximum.at(target, indices_tuple, updates)
-        if not target_given:
-            target = np.where(target == -1e12, 0.0, target)
-            target = np.asarray(target, dtype=updates.dtype)
+    if target_given:
+        target = np.array(target)
     else:
-        raise ivy.exceptions.IvyException(
-            'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
-                reduction
-            )
-        )
+        target = np.zeros(shape, dtype=updates.dtype)
+    # the updates are scattered as rows of the target flattened over the indexed dims
+    num_index_dims = indices.shape[-1]
+    index_shape = target.shape[:num_index_dims]
+    row_shape = target.shape[num_index_dims:]
+    indices_flat = indices.reshape(-1, num_index_dims)
+    indices_flat = np.where(indices_flat < 0, indices_flat + index_shape, indices_flat)
+    flat_indices = np.ravel_multi_index(tuple(indices_flat.T), index_shape)
+    updates = np.broadcast_to(updates, flat_indices.shape + row_shape)
+    target_rows = _scatter_reduce(
+        target.reshape((reduce(mul, index_shape, 1), reduce(mul, row_shape, 1))),
+        flat_indices,
+        updates.reshape((flat_indices.shape[0], reduce(mul, row_shape, 1))),
+        reduction,
+        combine=target_given,
+    )
+    target = target_rows.reshape(target.shape)
     if ivy.exists(out):
         return ivy.inplace_update(out, _to_device(target))
     return _to_device(target)
@@ -345,6 +323,20 @@ def shape(x: np.ndarray, /, *, as_array: bool = False) -> Union[ivy.Shape, ivy.A
         return ivy.Shape(x.shape)
 
 
+def _stack_mapped(rets, axis):
+    # stacks the returns of a function mapped by vmap for each element of the batch
+    ret = rets[0]
+    if ivy.is_array(ret) or isinstance(ret, Number):
+        return ivy.to_native(ivy.stack([ivy.asarray(r) for r in rets], axis=axis))
+    if isinstance(ret, (list, tuple)):
+        return type(ret)(
+            _stack_mapped([r[i] for r in rets], axis) for i in range(len(ret))
+        )
+    if isinstance(ret, dict):
+        return type(ret)({k: _stack_mapped([r[k] for r in rets], axis) for k in ret})
+    return ret
+
+
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
@@ -393,37 +385,55 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
+        # the mapped arguments are batched along their mapped axis, moved to the
+        # front, and the others are passed as they are
+        size = axis_size.pop()
+        axes = [in_axes] * len(args) if isinstance(in_axes, int) else in_axes
+        with _transforming():
+            try:
+                with _batch_level(size) as level:
+                    batched = list(args)
+                    for i, axis in enumerate(axes):
+                        if axis is not None:
+                            arg = ivy.to_native(ivy.moveaxis(args[i], axis, 0))
+                            batched[i] = _batch(arg, level)
+                    ret = func(*ivy.to_ivy(batched, nested=True))
+
+                    def _unbatch(x):
+                        x = ivy.to_native(x)
+                        if _level(x) == level:
+                            x = x.value
+                        else:
+                            # the returns which are not batched are the same for
+                            # every element
+                            x = ivy.broadcast_to(x, (size,) + tuple(x.shape))
+                        if out_axes:
+                            x = ivy.moveaxis(x, 0, out_axes)
+                        return ivy.to_native(x)
+
+                    if ivy.is_array(ret):
+                        return _unbatch(ret)
+                    return ivy.nested_map(
+                        ret,
+                        lambda x: _unbatch(x) if ivy.is_array(x) else x,
+                        include_derived=True,
+                    )
+            except _Unbatchable:
+                pass
+            # the function cannot be batched, and is called for each element instead
+            rets = list()
+            for i in range(size):
+                rets.append(
+                    func(
+                        *ivy.to_ivy(
+                            [
+                                arg if axis is None else ivy.moveaxis(arg, axis, 0)[i]
+                                for arg, axis in zip(args, axes)
+                            ],
+                            nested=True,
+                        )
+                    )
                 )
-
-        # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
-
-        if out_axes:
-            res = np.moveaxis(res, 0, out_axes)
-
-        return res
+            return _stack_mapped(rets, out_axes or 0)
 
     return _vmap
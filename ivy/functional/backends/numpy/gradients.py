@@ -1,21 +1,52 @@
 """Collection of NumPy gradient functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import logging
+import weakref
+from typing import Optional, Callable
+
+import numpy as np
+
+# local
 import ivy
+from ivy.functional.ivy.gradients import (
+    _get_required_float_variables,
+    _get_y_and_ret_idxs,
+    _get_native_y,
+    _set_duplicates,
+    _process_func_ret_and_grads,
+)
+from ivy.functional.backends.numpy.batching import (
+    _base,
+    _broadcast_batches,
+    _like,
+)
+from ivy.functional.backends.numpy.tape import _Tape, _current_tape
+
+# the variables created by `variable`, by id, which are forgotten once they are
+# garbage collected
+_variables = weakref.WeakValueDictionary()
 
 
 def variable(x, /):
-    logging.warning(
-        "NumPy does not support autograd, declaring a 'variable' "
-        "is identical to declaring an 'array' when using numpy backend."
-    )
+    if ivy.is_int_dtype(x.dtype):
+        x = x.astype(ivy.default_float_dtype(as_native=True))
+    else:
+        x = x.copy()
+    _variables[id(x)] = x
     return x
 
 
 def is_variable(x, /, *, exclusive=False):
-    # NumPy does not support autograd, checking if x is a variable does have any meaning
-    # for NumPy. Return False.
+    if not isinstance(x, np.ndarray):
+        return False
+    if _variables.get(id(x)) is x:
+        return True
+    # the results of the calls recorded by a tape also depend on its variables
+    tape = _current_tape.get()
+    while tape is not None:
+        if tape.tracks(x):
+            return True
+        tape = tape._parent
     return False
 
 
@@ -26,69 +57,105 @@ def variable_data(x, /):
 def execute_with_gradients(
     func, xs, /, *, retain_grads=False, xs_grad_idxs=None, ret_grad_idxs=None
 ):
-    logging.warning(
-        "NumPy does not support autograd, "
-        "'execute_with_gradients' returns None in place of function gradients."
-    )
-    xs = ivy.to_ivy(xs)
-    func_ret = func(xs)
-    return func_ret, None
-
+    # Batching of the arrays for the maps of vmap, so that their gradients are those
+    # of each element of the batch
+    xs = _broadcast_batches(xs)
 
-def value_and_grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'value_and_grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
+    # Conversion of required arrays to float variables and duplicate index chains
+    xs, xs1, required_duplicate_index_chains, _ = _get_required_float_variables(
+        xs, xs_grad_idxs
     )
 
-    def grad_fn(xs):
-        grads = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return y, grads
-
-    return grad_fn
-
-
-def jac(func):
-    logging.warning(
-        "NumPy does not support autograd, 'jac' "
-        "has no effect on the array, as gradients are not supported in the first place."
+    # Recording the calls on the variables while running the function
+    with _Tape() as tape:
+        tape.watch(xs1)
+        func_ret = func(xs)
+        # Getting the relevant outputs from the function return for gradient
+        # calculation
+        y, ret_idxs = _get_y_and_ret_idxs(func_ret, ret_grad_idxs, create_var=True)
+    xs = xs1
+
+    if isinstance(y, ivy.NativeArray):
+        # Gradient calculation for a single output
+        grads = _set_duplicates(tape.gradients(y, xs), required_duplicate_index_chains)
+    else:
+        # Gradient calculation for multiple outputs
+        y = _get_native_y(y)
+        grad_arr_idxs = ivy.nested_argwhere(y, lambda x: ivy.is_native_array(x))
+        grad_arr_values = ivy.multi_index_nest(y, grad_arr_idxs)
+        grads_ = [tape.gradients(arr_value, xs) for arr_value in grad_arr_values]
+        grads = grads_
+        if isinstance(ret_idxs, list) and len(ret_idxs):
+            grads = {
+                ret_idxs[i]: _set_duplicates(grad, required_duplicate_index_chains)
+                for i, grad in enumerate(grads_)
+            }
+
+    return _process_func_ret_and_grads(func_ret, grads, retain_grads)
+
+
+def _run_taped(func, xs):
+    # runs func on the variables of the nest xs, and returns its native result, the
+    # native variables and the tape of the calls made on them
+    xs = ivy.nested_map(
+        _broadcast_batches(ivy.to_native(xs, nested=True)),
+        lambda x: _like(variable(_base(x)), x) if isinstance(x, np.ndarray) else x,
+        include_derived=True,
+        shallow=False,
     )
+    with _Tape() as tape:
+        tape.watch(xs)
+        y = ivy.to_native(func(ivy.to_ivy(xs, nested=True)))
+    return y, xs, tape
+
 
-    def grad_fn(xs):
-        jacobian = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
+def value_and_grad(func):
+    def callback_fn(xs):
+        y, xs, tape = _run_taped(func, xs)
+        grads = ivy.to_ivy(tape.gradients(y, xs), nested=True)
+        return ivy.to_ivy(y), grads
+
+    return callback_fn
+
+
+def jac(func: Callable):
+    def callback_fn(xs):
+        y, xs, tape = _run_taped(func, xs)
+        # one backward pass for each element of the result
+        rows = list()
+        for i in range(y.size):
+            g = np.zeros(y.size, dtype=y.dtype)
+            g[i] = 1
+            rows.append(tape.gradients(y, xs, np.reshape(g, y.shape)))
+        stack = lambda x: np.reshape(np.stack(x), y.shape + np.shape(x[0]))
+        if isinstance(xs, np.ndarray):
+            return ivy.to_ivy(stack(rows))
+        return ivy.nested_multi_map(
+            lambda x, _: stack([ivy.to_native(row) for row in x]), rows
         )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return jacobian
 
-    return grad_fn
+    return callback_fn
 
 
-def grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
+def grad(func: Callable):
+    def callback_fn(xs):
+        y, xs, tape = _run_taped(func, xs)
+        return ivy.to_ivy(tape.gradients(y, xs), nested=True)
 
-    def grad_fn(xs):
-        grad = ivy.nested_map(
-            xs, lambda x: ivy.zeros_like(x), include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return grad
+    return callback_fn
 
-    return grad_fn
 
-
-def stop_gradient(x, /, *, preserve_type=True, out=None):
-    logging.warning(
-        "NumPy does not support autograd, 'stop_gradient' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-    return x
+def stop_gradient(
+    x: Optional[np.ndarray],
+    /,
+    *,
+    preserve_type: bool = True,
+    out: Optional[np.ndarray] = None,
+):
+    if not is_variable(x):
+        return x
+    # a view is a new array, which is not recorded by any tape
+    ret = x.view()
+    if preserve_type:
+        _variables[id(ret)] = ret
+    return ret
@@ -18,6 +18,59 @@ def _add_dilations(x, dilations, axis):
     )
 
 
+def _conv_pads(x, filter_shape, strides, dilations, padding):
+    # the (before, after) padding of each spatial dimension of the channel last x,
+    # for filters of filter_shape dilated by dilations
+    pad_list = list()
+    for i in range(len(filter_shape)):
+        dilated_size = (filter_shape[i] - 1) * dilations[i] + 1
+        pad = ivy.handle_padding(x.shape[i + 1], strides[i], dilated_size, padding)
+        pad_list.append((pad // 2, pad - pad // 2))
+    return pad_list
+
+
+def _pad_for_conv(x, filter_shape, strides, dilations, padding):
+    # pads the spatial dimensions of the channel last x, for filters of filter_shape
+    # dilated by dilations
+    pad_list = _conv_pads(x, filter_shape, strides, dilations, padding)
+    return np.pad(x, [(0, 0), *pad_list, (0, 0)], "constant")
+
+
+def _conv_windows(x, filter_shape, strides, dilations):
+    # returns a read-only B x O1 x ... x On x K1 x ... x Kn x I view of the windows of
+    # the channel last x, so that no window is copied before the contraction
+    dims = len(filter_shape)
+    out_shape = [
+        (x.shape[i + 1] - (filter_shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    return np.lib.stride_tricks.as_strided(
+        x,
+        (x.shape[0], *out_shape, *filter_shape, x.shape[-1]),
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+            x.strides[-1],
+        ),
+        writeable=False,
+    )
+
+
+def _conv(x, filters, strides, padding, dilations):
+    # convolves the channel last x with the K1 x ... x Kn x I x O filters, as a single
+    # matrix product of the im2col matrix of x and the flattened filters
+    dims = filters.ndim - 2
+    filter_shape = filters.shape[:dims]
+    x = _pad_for_conv(x, filter_shape, strides, dilations, padding)
+    windows = _conv_windows(x, filter_shape, strides, dilations)
+    return np.tensordot(
+        windows,
+        filters,
+        axes=(list(range(dims + 1, 2 * dims + 2)), list(range(dims + 1))),
+    )
+
+
 def conv1d(
     x: np.ndarray,
     filters: np.ndarray,
@@ -29,26 +82,11 @@ def conv1d(
     dilations: int = 1,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if isinstance(strides, tuple):
-        strides = strides[0]
-    if isinstance(dilations, tuple):
-        dilations = dilations[0]
+    strides = [strides[0] if isinstance(strides, (tuple, list)) else strides]
+    dilations = [dilations[0] if isinstance(dilations, (tuple, list)) else dilations]
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    x_shape = (1,) + x.shape
-    filter_shape = (1,) + filters.shape
-    x_strides = (x.strides[0],) + x.strides
-    filter_strides = (filters.strides[0],) + filters.strides
-    x = np.lib.stride_tricks.as_strided(x, shape=x_shape, strides=x_strides)
-    filters = np.lib.stride_tricks.as_strided(
-        filters, shape=filter_shape, strides=filter_strides
-    )
-    x = np.transpose(x, (1, 0, 2, 3))
-    res = conv2d(x, filters, strides, padding, data_format="NHWC", dilations=dilations)
-    res = np.transpose(res, (1, 0, 2, 3))
-    res = np.lib.stride_tricks.as_strided(
-        res, shape=res.shape[1:], strides=res.strides[1:]
-    )
+    res = _conv(x, filters, strides, padding, dilations)
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
     return res
@@ -125,58 +163,10 @@ def conv2d(
     elif len(dilations) == 1:
         dilations = [dilations[0]] * 2
 
-    # adding dilations
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-
-    filter_shape = list(filters.shape[0:2])
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    pad_h = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_w = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, padding, dilations)
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -266,37 +256,17 @@ def depthwise_conv2d(
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
 
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
-    depth = x.shape[0]
-    filters = np.transpose(filters, (2, 0, 1))
-    x = np.expand_dims(x, -1)
-    filters = np.expand_dims(filters, (-1, -2))
-    x_shape = x[0].shape
-    filter_shape = filters[0].shape
-    filter_h = filter_shape[0] + (filter_shape[0] - 1) * (dilations[0] - 1)
-    filter_w = filter_shape[1] + (filter_shape[1] - 1) * (dilations[1] - 1)
-    if padding == "VALID":
-        out_height = np.ceil(float(x_shape[1] - filter_h + 1) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2] - filter_w + 1) / float(strides[1]))
-    else:
-        out_height = np.ceil(float(x_shape[1]) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2]) / float(strides[1]))
-    if data_format == "NHWC":
-        outputs = np.empty([x_shape[0], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x_shape[0], 0, int(out_height), int(out_width)], x.dtype)
-    for i in range(depth):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
+    filter_shape = filters.shape[:2]
+    x = _pad_for_conv(x, filter_shape, strides, dilations, padding)
+    # B x OH x OW x KH x KW x C
+    windows = _conv_windows(x, filter_shape, strides, dilations)
+    # B x OH x OW x C
+    res = np.einsum("bhwijc,ijc->bhwc", windows, filters)
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -316,67 +286,10 @@ def conv3d(
     if isinstance(dilations, int):
         dilations = [dilations] * 3
 
-    # adding dilations
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-    if dilations[2] > 1:
-        filters = _add_dilations(filters, dilations[2], axis=2)
-
-    filter_shape = list(filters.shape[0:3])
-
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    pad_d = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_h = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    pad_w = ivy.handle_padding(x_shape[2], strides[2], filter_shape[2], padding)
-
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_d // 2, pad_d - pad_d // 2),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
     # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, padding, dilations)
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -491,70 +404,28 @@ def conv_general_dilated(
         x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
     for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
 
-    filter_shape = list(filters.shape[0:dims])
-
-    x_shape = list(x.shape[1 : dims + 1])
-    pad_specific = [
-        ivy.handle_padding(x_shape[i], strides[i], filter_shape[i], padding)
-        for i in range(dims)
-    ]
-    pad_list = [
-        (pad_specific[i] // 2, pad_specific[i] - pad_specific[i] // 2)
-        for i in range(dims)
-    ]
-    x = np.pad(
-        x,
+    filter_shape = filters.shape[0:dims]
+    x = _pad_for_conv(x, filter_shape, strides, dilations, padding)
+    # B x O1 x ... x On x K1 x ... x Kn x I
+    windows = _conv_windows(x, filter_shape, strides, dilations)
+    input_dim = filters.shape[-2]
+    group_dim = filters.shape[-1] // feature_group_count
+    axes = (list(range(dims + 1, 2 * dims + 2)), list(range(dims + 1)))
+    # B x O1 x ... x On x O
+    res = np.concatenate(
         [
-            (0, 0),
-            *pad_list,
-            (0, 0),
+            np.tensordot(
+                windows[..., i * input_dim : (i + 1) * input_dim],
+                filters[..., i * group_dim : (i + 1) * group_dim],
+                axes=axes,
+            )
+            for i in range(feature_group_count)
         ],
-        "constant",
+        axis=-1,
     )
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
 
     res = np.add(res, bias) if bias is not None else res
     if data_format == "channel_first":
@@ -651,3 +522,62 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def _lstm_pack_gates(x):
+    # reorders the gates along the last axis from [i, f, g, o] to [i, f, o, g], so
+    # that the three sigmoid gates are contiguous
+    i, f, g, o = np.split(x, 4, axis=-1)
+    return np.concatenate([i, f, o, g], axis=-1)
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    batch_shape = x.shape[:-2]
+    timesteps, input_channels = x.shape[-2:]
+    output_channels = recurrent_kernel.shape[0]
+    x = np.reshape(x, (-1, timesteps, input_channels))
+    # the initial states may be broadcast over the batch dimensions
+    state_shape = batch_shape + (output_channels,)
+    ht = np.reshape(np.broadcast_to(init_h, state_shape), (-1, output_channels))
+    ct = np.reshape(np.broadcast_to(init_c, state_shape), (-1, output_channels))
+
+    # one projection of all timesteps, with both biases added once
+    Wi_x = np.matmul(x, _lstm_pack_gates(kernel))
+    if bias is not None:
+        Wi_x += _lstm_pack_gates(bias)
+    if recurrent_bias is not None:
+        Wi_x += _lstm_pack_gates(recurrent_bias)
+    Wh = _lstm_pack_gates(recurrent_kernel)
+
+    # the gates of each step are activated in place, and the hidden states are
+    # written into a preallocated output
+    hts = np.empty(x.shape[:1] + (timesteps, output_channels), Wi_x.dtype)
+    sigmoid_slice = slice(0, 3 * output_channels)
+    tanh_slice = slice(3 * output_channels, 4 * output_channels)
+    for t in range(timesteps):
+        gates = Wi_x[:, t]
+        gates += np.matmul(ht, Wh)
+        sigmoid_gates = gates[:, sigmoid_slice]
+        np.negative(sigmoid_gates, out=sigmoid_gates)
+        np.exp(sigmoid_gates, out=sigmoid_gates)
+        sigmoid_gates += 1
+        np.reciprocal(sigmoid_gates, out=sigmoid_gates)
+        it, ft, ot = np.split(sigmoid_gates, 3, axis=-1)
+        gt = np.tanh(gates[:, tanh_slice], out=gates[:, tanh_slice])
+        ct = ft * ct + it * gt
+        ht = np.multiply(ot, np.tanh(ct), out=hts[:, t])
+
+    return (
+        np.reshape(hts, batch_shape + (timesteps, output_channels)),
+        np.reshape(ct, batch_shape + (output_channels,)),
+    )
@@ -1,11 +1,14 @@
 """Collection of Numpy random functions, wrapped to fit Ivy syntax and signature."""
 
 # global
+import threading
+import contextvars
 import numpy as np
 from typing import Optional, Union, Sequence
 
 # local
 import ivy
+from ivy.context import is_global_context
 from ivy.functional.ivy.random import (
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
@@ -14,6 +17,45 @@ from ivy.functional.ivy.random import (
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 
+# Generators #
+# -----------#
+
+# the global context shares one generator, and every other thread or asyncio task
+# gets its own independent stream, spawned from the seed sequence of the process
+_global_rng = dict(seed_sequence=np.random.SeedSequence())
+_global_rng["generator"] = np.random.Generator(
+    np.random.PCG64(_global_rng["seed_sequence"])
+)
+_local_rng = contextvars.ContextVar("numpy_generator")
+_spawn_lock = threading.Lock()
+
+
+def _seed(seed_value):
+    seed_sequence = np.random.SeedSequence(seed_value)
+    generator = np.random.Generator(np.random.PCG64(seed_sequence))
+    if is_global_context():
+        _global_rng.update(seed_sequence=seed_sequence, generator=generator)
+    else:
+        _local_rng.set((threading.current_thread(), generator))
+
+
+def _generator(seed=None):
+    """Returns the random generator of the current thread or asyncio task, first
+    seeding it with `seed` if given."""
+    if seed is not None:
+        _seed(seed)
+    if is_global_context():
+        return _global_rng["generator"]
+    thread, generator = _local_rng.get((None, None))
+    # a thread started from a copied context must not share the generator
+    if thread is not threading.current_thread():
+        with _spawn_lock:
+            (seed_sequence,) = _global_rng["seed_sequence"].spawn(1)
+        generator = np.random.Generator(np.random.PCG64(seed_sequence))
+        _local_rng.set((threading.current_thread(), generator))
+    return generator
+
+
 # Extra #
 # ------#
 
@@ -28,10 +70,8 @@ def random_uniform(
     out: Optional[np.ndarray] = None,
     seed: Optional[int] = None,
 ) -> np.ndarray:
-    if seed:
-        np.random.seed(seed)
     shape = _check_bounds_and_get_shape(low, high, shape)
-    return np.asarray(np.random.uniform(low, high, shape), dtype=dtype)
+    return np.asarray(_generator(seed).uniform(low, high, shape), dtype=dtype)
 
 
 def random_normal(
@@ -46,9 +86,7 @@ def random_normal(
 ) -> np.ndarray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
-    if seed:
-        np.random.seed(seed)
-    return np.asarray(np.random.normal(mean, std, shape), dtype=dtype)
+    return np.asarray(_generator(seed).normal(mean, std, shape), dtype=dtype)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("bfloat16",)}, backend_version)
@@ -64,28 +102,44 @@ def multinomial(
     seed: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if seed:
-        np.random.seed(seed)
+    generator = _generator(seed)
     if probs is None:
-        probs = (
-            np.ones(
-                (
-                    batch_size,
-                    population_size,
-                )
-            )
-            / population_size
-        )
+        probs = np.ones((batch_size, population_size)) / population_size
     orig_probs_shape = list(probs.shape)
     num_classes = orig_probs_shape[-1]
-    probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
+    probs_flat = np.reshape(probs, (-1, num_classes))
     probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True, dtype="float64")
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack)
+    num_rows = probs_flat.shape[0]
+    if replace:
+        # inverse CDF sampling of all the rows with one searchsorted, by offsetting
+        # the cumulative probabilities and the uniform samples of each row by its index
+        cdf = np.cumsum(probs_flat, -1)
+        cdf[:, -1] = 1.0
+        offsets = np.arange(num_rows)[:, None]
+        samples_flat = np.searchsorted(
+            np.reshape(cdf + offsets, (-1,)),
+            np.reshape(generator.random((num_rows, num_samples)) + offsets, (-1,)),
+            side="right",
+        )
+        samples_flat = np.minimum(
+            np.reshape(samples_flat, (num_rows, num_samples)) - offsets * num_classes,
+            num_classes - 1,
+        )
+    else:
+        if np.any(np.count_nonzero(probs_flat, -1) < num_samples):
+            raise ivy.exceptions.IvyException(
+                "Fewer non-zero entries in probs than num_samples"
+            )
+        # the Gumbel top-k trick, which draws the samples in the order that drawing
+        # them one at a time and renormalizing the probabilities would
+        with np.errstate(divide="ignore"):
+            keys = np.log(probs_flat) + generator.gumbel(size=probs_flat.shape)
+        if num_samples < num_classes:
+            top = np.argpartition(-keys, num_samples - 1, -1)[:, :num_samples]
+        else:
+            top = np.broadcast_to(np.arange(num_classes), keys.shape)
+        order = np.argsort(-np.take_along_axis(keys, top, -1), -1)
+        samples_flat = np.take_along_axis(top, order, -1)
     return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
 
 
@@ -105,18 +159,14 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
-    if seed:
-        np.random.seed(seed)
-    return np.random.randint(low, high, shape, dtype=dtype)
+    return _generator(seed).integers(low, high, shape, dtype=dtype)
 
 
 def seed(*, seed_value: int = 0) -> None:
-    np.random.seed(seed_value)
+    _seed(seed_value)
 
 
 def shuffle(
     x: np.ndarray, /, *, seed: Optional[int] = None, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    if seed:
-        np.random.seed(seed)
-    return np.random.permutation(x)
+    return _generator(seed).permutation(x)
@@ -0,0 +1,1224 @@
+"""Reverse-mode automatic differentiation for the NumPy backend.
+
+While a gradient function is running, the ivy namespace is swapped for one in which
+the backend functions record their calls on a tape. Only the outermost calls which
+have a vector-Jacobian product (VJP) are recorded, as the calls they make themselves
+are covered by their VJP, and mixed functions without a VJP are replaced by their
+compositional implementation, so that the ivy functions they call are recorded
+instead. Calling any other function with float results on the arrays whose gradients
+are computed raises an error, rather than silently losing their gradients. Arrays are
+identified by their id, which the tape keeps valid by holding on to every array it
+records.
+
+The gradients are computed by walking the tape backwards with plain NumPy, so they
+are not recorded themselves, and only first-order gradients are supported. The arrays
+batched by `vmap` are recorded by the NumPy arrays holding their batch, so that the
+gradients of the arrays of each element of the batch are computed at once.
+"""
+
+# global
+import contextlib
+import contextvars
+import functools
+import inspect
+import math
+from types import FunctionType
+
+import numpy as np
+
+# local
+import ivy
+from ivy import backend_handler
+from ivy.func_wrapper import FN_DECORATORS, _wrap_function
+from ivy.functional.backends.numpy.batching import (
+    _UNBATCHED,
+    _base,
+    _batching,
+    _level,
+    _like,
+)
+from ivy.functional.backends.numpy.elementwise import erf as _erf
+from ivy.functional.backends.numpy.experimental.layers import (
+    max_pool1d as _max_pool1d,
+    max_pool2d as _max_pool2d,
+    max_pool3d as _max_pool3d,
+)
+from ivy.functional.backends.numpy.layers import (
+    _conv,
+    _conv_pads,
+    _conv_windows,
+)
+from ivy.functional.backends.numpy.statistical import cumsum as _cumsum
+
+
+# Helpers #
+# --------#
+
+# the innermost tape of the current thread or asyncio task, if any
+_current_tape = contextvars.ContextVar("ivy_numpy_tape", default=None)
+
+# the namespaces with recording and batching backend functions, built once per backend
+# namespace
+_transform_namespaces = dict()
+
+# the backend functions whose outputs are constant with respect to their inputs, or
+# which are not part of the computation, and which are therefore never recorded
+_NON_DIFFERENTIABLE = (
+    "zeros_like",
+    "ones_like",
+    "full_like",
+    "empty_like",
+    "floor",
+    "ceil",
+    "round",
+    "trunc",
+    "sign",
+    "fix",
+    "heaviside",
+    "floor_divide",
+    "stop_gradient",
+    "variable",
+    "variable_data",
+    "is_variable",
+    "execute_with_gradients",
+    "value_and_grad",
+    "grad",
+    "jac",
+    "inplace_update",
+    "inplace_decrement",
+    "inplace_increment",
+    "to_numpy",
+    "to_scalar",
+    "to_list",
+)
+
+# the signatures of the recorded backend functions
+_signatures = dict()
+
+
+def _bind(fn, args, kwargs):
+    """Returns every argument of the call of `fn`, including the defaults, by
+    name."""
+    signature = _signatures.get(fn)
+    if signature is None:
+        signature = _signatures[fn] = inspect.signature(fn)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+class _TapeOp:
+    """A recorded call of a backend function."""
+
+    __slots__ = ("name", "params", "inputs", "ret", "outputs")
+
+    def __init__(self, name, params, inputs, ret, outputs):
+        self.name = name
+        # every argument of the call by name
+        self.params = params
+        # the node indices of the recorded arrays of each argument, by name
+        self.inputs = inputs
+        self.ret = ret
+        # the (path, node index) of each float array in the return of the call
+        self.outputs = outputs
+
+
+class _Tape:
+    """Records the backend calls made on the arrays it watches, and computes the
+    gradients of their results by walking the recorded calls backwards.
+
+    The tape is used as a context manager, while which the ivy namespace records
+    the calls of the current thread or asyncio task. Tapes can be nested, in which
+    case every active tape records the calls on the arrays it watches.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.ops = list()
+        # the value of each node, which also keeps the arrays alive so that their
+        # ids are not reused while recording
+        self.values = list()
+        self.ids = dict()
+        self._parent = None
+        self._tokens = None
+
+    def __enter__(self):
+        self._parent = _current_tape.get()
+        backend_handler._acquire_context_namespace()
+        self._tokens = (
+            backend_handler._context_namespace.set(_transform_namespace()),
+            _current_tape.set(self),
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        namespace_token, tape_token = self._tokens
+        _current_tape.reset(tape_token)
+        backend_handler._context_namespace.reset(namespace_token)
+        backend_handler._release_context_namespace()
+        self._tokens = None
+
+    def tracks(self, x):
+        return id(_base(x)) in self.ids
+
+    def watch(self, x):
+        """Adds the native arrays of the nest `x` to the tape as its leaves."""
+
+        def add_node(x_):
+            if isinstance(x_, np.ndarray):
+                self._add_node(_base(x_))
+            return x_
+
+        if isinstance(x, np.ndarray):
+            add_node(x)
+            return
+        ivy.nested_map(x, add_node, include_derived=True, shallow=False)
+
+    def _add_node(self, x):
+        self.ids[id(x)] = len(self.values)
+        self.values.append(x)
+        return len(self.values) - 1
+
+    def _indices(self, nest):
+        # the nest of the node indices of the recorded arrays in nest, or None if
+        # there are none
+        if isinstance(nest, np.ndarray):
+            return self.ids.get(id(nest))
+        if isinstance(nest, (list, tuple)):
+            indices = [self._indices(x) for x in nest]
+            return None if all(i is None for i in indices) else indices
+        return None
+
+    def _add_outputs(self, ret, path, outputs):
+        if isinstance(ret, np.ndarray):
+            if np.issubdtype(ret.dtype, np.inexact):
+                outputs.append((path, self._add_node(ret)))
+        elif isinstance(ret, (list, tuple)):
+            for i, x in enumerate(ret):
+                self._add_outputs(x, path + (i,), outputs)
+
+    def record(self, name, fn, args, kwargs, ret):
+        # backend functions can return the ivy arrays returned by the ivy functions
+        # they call
+        ret = _to_native(ret)
+        params = _bind(fn, args, kwargs)
+        inputs = dict()
+        for k, v in params.items():
+            indices = self._indices(v)
+            if indices is not None:
+                inputs[k] = indices
+        if not inputs:
+            return
+        outputs = list()
+        self._add_outputs(ret, (), outputs)
+        if outputs:
+            self.ops.append(_TapeOp(name, params, inputs, ret, outputs))
+
+    # Backward #
+
+    def gradients(self, y, xs, g=None):
+        """Returns the gradients of the native array `y` with respect to the native
+        arrays of the nest `xs`, with `g` as the gradient of `y` if given."""
+        grads = dict()
+        y_base = _base(y)
+        index = self.ids.get(id(y_base))
+        if index is not None:
+            if g is None:
+                g = np.ones_like(y_base)
+            elif _level(y) and not _level(g):
+                # the gradient is the same for every element of the batch
+                g = np.broadcast_to(g, y_base.shape)
+            grads[index] = _base(g)
+            for op in reversed(self.ops):
+                if index < op.outputs[0][1]:
+                    continue
+                out_grads = [grads.pop(i, None) for _, i in op.outputs]
+                if all(g_ is None for g_ in out_grads):
+                    continue
+                if len(op.outputs) == 1 and op.outputs[0][0] == ():
+                    g_ = out_grads[0]
+                else:
+                    g_ = _fill_grads(op.ret, dict(zip(op.outputs, out_grads)))
+                vjps = _VJPS[op.name]
+                for k, indices in op.inputs.items():
+                    vjp = vjps.get(k)
+                    if vjp is not None:
+                        grad = vjp(g_, op.ret, **op.params)
+                        _accumulate(grads, indices, op.params[k], grad)
+
+        def map_fn(x):
+            if not isinstance(x, np.ndarray):
+                return x
+            x_base = _base(x)
+            grad = grads.get(self.ids.get(id(x_base)))
+            return _like(np.zeros_like(x_base) if grad is None else grad, x)
+
+        if isinstance(xs, np.ndarray):
+            return map_fn(xs)
+        return ivy.nested_map(xs, map_fn, include_derived=True, shallow=False)
+
+
+def _to_native(nest):
+    if isinstance(nest, ivy.Array):
+        return nest.data
+    if isinstance(nest, (list, tuple)):
+        return [_to_native(x) for x in nest]
+    return nest
+
+
+def _fill_grads(ret, grads, path=()):
+    # the gradient of each float array of the return, with zeros for those which
+    # did not receive any
+    if isinstance(ret, np.ndarray):
+        for (path_, _), grad in grads.items():
+            if path_ == path:
+                return np.zeros_like(ret) if grad is None else grad
+        return None
+    if isinstance(ret, (list, tuple)):
+        return [_fill_grads(x, grads, path + (i,)) for i, x in enumerate(ret)]
+    return None
+
+
+def _unbroadcast(grad, shape):
+    # sums the gradient of an array broadcast to the shape of grad back to shape
+    grad = np.asarray(grad)
+    if grad.shape == shape:
+        return grad
+    if grad.ndim > len(shape):
+        grad = np.sum(grad, axis=tuple(range(grad.ndim - len(shape))))
+    axes = tuple(i for i, n in enumerate(shape) if n == 1 and grad.shape[i] != 1)
+    if axes:
+        grad = np.sum(grad, axis=axes, keepdims=True)
+    return np.broadcast_to(grad, shape)
+
+
+def _accumulate(grads, indices, x, grad):
+    if grad is None or indices is None:
+        return
+    if isinstance(indices, list):
+        for i, x_, grad_ in zip(indices, x, grad):
+            _accumulate(grads, i, x_, grad_)
+        return
+    grad = _unbroadcast(grad, x.shape).astype(x.dtype, copy=False)
+    # the gradients are never updated in-place, as they can be shared between inputs
+    grads[indices] = grad if indices not in grads else grads[indices] + grad
+
+
+def _taped(name, fn):
+    """Wraps the backend function `fn`, so that its outermost calls are recorded by
+    the tapes of the current context which watch any of its inputs. Functions
+    without a VJP are not recorded, and the calls they make are recorded instead."""
+    differentiable = name in _VJPS
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        current = tape = _current_tape.get()
+        if tape is None or tape.depth:
+            return fn(*args, **kwargs)
+        tapes = list()
+        while tape is not None:
+            if tape._indices([args, list(kwargs.values())]) is not None:
+                tapes.append(tape)
+            tape = tape._parent
+        if not tapes:
+            return fn(*args, **kwargs)
+        if not differentiable:
+            ret = fn(*args, **kwargs)
+            _check_recorded(name, tapes, ret)
+            return ret
+        current.depth += 1
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            current.depth -= 1
+        if isinstance(ret, np.generic):
+            # numpy scalars cannot be told apart by their ids, unlike 0-dim arrays
+            ret = np.asarray(ret)
+        for tape in tapes:
+            tape.record(name, fn, args, kwargs, ret)
+        return ret
+
+    return new_fn
+
+
+def _check_recorded(name, tapes, ret):
+    # float results which are not recorded would be constants, which silently loses
+    # the gradients of the inputs
+    ret = _to_native(ret)
+    rets = ret if isinstance(ret, list) else [ret]
+    floats = [
+        x
+        for x in rets
+        if isinstance(x, np.ndarray) and np.issubdtype(x.dtype, np.inexact)
+    ]
+    if floats and not any(tape.tracks(x) for tape in tapes for x in floats):
+        raise ivy.exceptions.IvyException(
+            "'{}' has no gradient with the NumPy backend, but it is called with arrays "
+            "whose gradients are computed.".format(name)
+        )
+
+
+def _transform_namespace():
+    """Returns the ivy namespace of the current backend in which every wrapped
+    backend function records its calls on the tapes of the current context, and
+    batches its calls with the arrays batched by `vmap`."""
+    backend = ivy.current_backend()
+    namespace, to_remove = backend_handler._backend_namespace(backend, False)
+    cached = _transform_namespaces.get(backend.current_backend_str())
+    if cached is not None and cached[0] is namespace:
+        return cached[1]
+    original_dict = backend_handler.ivy_original_dict
+    transformed = dict(namespace, **dict.fromkeys(to_remove, backend_handler._removed))
+    for k in namespace:
+        original = original_dict.get(k)
+        to_wrap = backend.__dict__.get(k)
+        if (
+            not isinstance(to_wrap, FunctionType)
+            or to_wrap is original
+            or not any(hasattr(original, attr) for attr in FN_DECORATORS)
+        ):
+            continue
+        if k not in _VJPS and hasattr(original, "mixed_function"):
+            # the ivy functions called by the compositional implementation are
+            # recorded and batched instead
+            transformed[k] = original
+            continue
+        fn = to_wrap if k in _NON_DIFFERENTIABLE else _taped(k, to_wrap)
+        if k not in _UNBATCHED:
+            fn = _batching(k, fn)
+        if fn is not to_wrap:
+            transformed[k] = _wrap_function(k, fn, original)
+    _transform_namespaces[backend.current_backend_str()] = (namespace, transformed)
+    return transformed
+
+
+@contextlib.contextmanager
+def _transforming():
+    """Swaps the ivy namespace of the current context for that of the transforms,
+    without recording any call."""
+    with backend_handler._using_namespace(_transform_namespace()):
+        yield
+
+
+# Vector-Jacobian Products #
+# -------------------------#
+
+# Each VJP takes the gradient of the return of the call, the return itself and every
+# argument of the call by name, and returns the gradient of one of the arguments. The
+# gradients may have the broadcast shape of the argument, which is summed back.
+
+
+def _identity(g, ret, **_):
+    return g
+
+
+def _reshape_like(name):
+    return lambda g, ret, **params: np.reshape(g, np.shape(params[name]))
+
+
+def _alpha(alpha):
+    return 1 if alpha is None else alpha
+
+
+def _reduction_axes(x, axis):
+    if axis is None:
+        return tuple(range(x.ndim))
+    axis = (axis,) if isinstance(axis, int) else axis
+    return tuple(a % x.ndim for a in axis)
+
+
+def _expand_reduced(g, x, axis, keepdims):
+    # broadcasts the gradient of a reduction of x over axis back to the shape of x
+    if not keepdims:
+        g = np.expand_dims(g, _reduction_axes(x, axis))
+    return np.broadcast_to(g, x.shape)
+
+
+def _reduced_size(x, axis):
+    return math.prod(x.shape[a] for a in _reduction_axes(x, axis))
+
+
+def _extremum(g, ret, x, axis=None, keepdims=False, **_):
+    # the gradient is shared between the elements which are equal to the extremum
+    mask = x == _expand_reduced(ret, x, axis, keepdims)
+    count = np.sum(mask, axis=_reduction_axes(x, axis), keepdims=True)
+    return _expand_reduced(g, x, axis, keepdims) * mask / count
+
+
+def _min_max_x1(g, ret, x1, x2, **_):
+    x1_mask = x1 == ret
+    return g * x1_mask / (x1_mask + (x2 == ret))
+
+
+def _min_max_x2(g, ret, x1, x2, **_):
+    x2_mask = x2 == ret
+    return g * x2_mask / (x2_mask + (x1 == ret))
+
+
+def _pow_x2(g, ret, x1, x2, **_):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return g * ret * np.where(x1 > 0, np.log(np.where(x1 > 0, x1, 1)), 0)
+
+
+def _deviation(g, ret, x, axis=None, correction=0.0, keepdims=False, **_):
+    # the gradient of the variance
+    mean = np.mean(x, axis=_reduction_axes(x, axis), keepdims=True)
+    n = _reduced_size(x, axis) - correction
+    return _expand_reduced(g, x, axis, keepdims) * 2 * (x - mean) / n
+
+
+def _std_x(g, ret, x, axis=None, keepdims=False, **params):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = _expand_reduced(ret, x, axis, keepdims)
+        return _deviation(g, ret, x, axis=axis, keepdims=keepdims, **params) / (2 * std)
+
+
+def _prod_x(g, ret, x, axis=None, keepdims=False, **_):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _expand_reduced(g * ret, x, axis, keepdims) / x
+
+
+def _gelu_x(g, ret, x, approximate=False, **_):
+    if approximate:
+        inner = 0.7978845608 * (x + 0.044715 * x**3)
+        t = np.tanh(inner)
+        return g * (
+            0.5 * (1 + t)
+            + 0.5 * x * (1 - t**2) * 0.7978845608 * (1 + 3 * 0.044715 * x**2)
+        )
+    cdf = 0.5 * (1 + _erf(x / np.sqrt(2)))
+    pdf = np.exp(-0.5 * x**2) / np.sqrt(2 * np.pi)
+    return g * (cdf + x * pdf)
+
+
+def _softplus_x(g, ret, x, beta=None, threshold=None, **_):
+    x_beta = x if beta is None else x * beta
+    grad = g / (1 + np.exp(-x_beta))
+    if threshold is not None:
+        return np.where(x_beta > threshold, g, grad)
+    return grad
+
+
+def _matmul_operands(g, x1, x2, transpose_a, transpose_b):
+    # the gradient and operands of the product as batches of matrices
+    a = np.swapaxes(x1, -1, -2) if transpose_a else x1
+    b = np.swapaxes(x2, -1, -2) if transpose_b else x2
+    if b.ndim == 1:
+        g, b = g[..., None], b[:, None]
+    if a.ndim == 1:
+        g, a = np.expand_dims(g, -2), a[None]
+    return g, a, b
+
+
+def _matmul_x1(g, ret, x1, x2, transpose_a=False, transpose_b=False, **_):
+    g, a, b = _matmul_operands(g, x1, x2, transpose_a, transpose_b)
+    grad = np.matmul(g, np.swapaxes(b, -1, -2))
+    return np.swapaxes(grad, -1, -2) if transpose_a else grad
+
+
+def _matmul_x2(g, ret, x1, x2, transpose_a=False, transpose_b=False, **_):
+    g, a, b = _matmul_operands(g, x1, x2, transpose_a, transpose_b)
+    grad = np.matmul(np.swapaxes(a, -1, -2), g)
+    if x2.ndim == 1:
+        return grad[..., 0]
+    return np.swapaxes(grad, -1, -2) if transpose_b else grad
+
+
+def _tensordot_axes(x1, x2, axes):
+    if isinstance(axes, int):
+        return list(range(x1.ndim - axes, x1.ndim)), list(range(axes))
+    x1_axes, x2_axes = axes
+    x1_axes = [x1_axes] if isinstance(x1_axes, int) else x1_axes
+    x2_axes = [x2_axes] if isinstance(x2_axes, int) else x2_axes
+    return [a % x1.ndim for a in x1_axes], [a % x2.ndim for a in x2_axes]
+
+
+def _tensordot_x1(g, ret, x1, x2, axes=2, **_):
+    x1_axes, x2_axes = _tensordot_axes(x1, x2, axes)
+    x1_free = [a for a in range(x1.ndim) if a not in x1_axes]
+    x2_free = [a for a in range(x2.ndim) if a not in x2_axes]
+    grad = np.tensordot(g, x2, axes=(list(range(len(x1_free), g.ndim)), x2_free))
+    # the contracted axes of the gradient follow the order of the axes of x2
+    order = x1_free + [x1_axes[i] for i in np.argsort(x2_axes)]
+    return np.transpose(grad, np.argsort(order))
+
+
+def _tensordot_x2(g, ret, x1, x2, axes=2, **_):
+    x1_axes, x2_axes = _tensordot_axes(x1, x2, axes)
+    x1_free = [a for a in range(x1.ndim) if a not in x1_axes]
+    grad = np.tensordot(x1, g, axes=(x1_free, list(range(len(x1_free)))))
+    x2_free = [a for a in range(x2.ndim) if a not in x2_axes]
+    order = [x2_axes[i] for i in np.argsort(x1_axes)] + x2_free
+    return np.transpose(grad, np.argsort(order))
+
+
+def _einsum_operands(g, ret, equation, operands, **_):
+    equation = equation.replace(" ", "")
+    if "->" not in equation or "." in equation:
+        raise ivy.exceptions.IvyException(
+            "the gradient of einsum is only supported for explicit equations "
+            "without ellipses with the NumPy backend"
+        )
+    inputs, output = equation.split("->")
+    inputs = inputs.split(",")
+    grads = list()
+    for i, x in enumerate(operands):
+        if any(inputs[i].count(c) > 1 for c in inputs[i]):
+            raise ivy.exceptions.IvyException(
+                "the gradient of einsum is not supported for repeated indices of "
+                "an operand with the NumPy backend"
+            )
+        others = [(s, o) for j, (s, o) in enumerate(zip(inputs, operands)) if j != i]
+        # the operand itself is replaced by ones, so that its indices which are not
+        # in the output or in the other operands are broadcast
+        subscripts = ",".join([output] + [s for s, _ in others] + [inputs[i]])
+        grads.append(
+            np.einsum(
+                subscripts + "->" + inputs[i],
+                g,
+                *[o for _, o in others],
+                np.ones_like(x),
+            )
+        )
+    return grads
+
+
+def _concat_xs(g, ret, xs, axis=0, **_):
+    if axis is None:
+        sizes = [np.size(x) for x in xs]
+        return [
+            np.reshape(grad, np.shape(x))
+            for grad, x in zip(np.split(np.ravel(g), np.cumsum(sizes)[:-1]), xs)
+        ]
+    sizes = [np.shape(x)[axis] for x in xs]
+    return np.split(g, np.cumsum(sizes)[:-1], axis=axis)
+
+
+def _stack_arrays(g, ret, arrays, axis=0, **_):
+    return list(np.moveaxis(g, axis, 0))
+
+
+def _split_x(g, ret, x, axis=0, **_):
+    return np.concatenate(g, axis=axis)
+
+
+def _unstack_x(g, ret, x, axis=0, keepdims=False, **_):
+    if keepdims:
+        return np.concatenate(g, axis=axis)
+    return np.stack(g, axis=axis)
+
+
+def _tile_x(g, ret, x, repeats, **_):
+    repeats = tuple(repeats)
+    dims = max(x.ndim, len(repeats))
+    repeats = (1,) * (dims - len(repeats)) + repeats
+    shape = (1,) * (dims - x.ndim) + x.shape
+    # each dimension of the gradient is split into its repeats and its size
+    g = np.reshape(g, [n for pair in zip(repeats, shape) for n in pair])
+    return np.reshape(np.sum(g, axis=tuple(range(0, 2 * dims, 2))), x.shape)
+
+
+def _repeat_x(g, ret, x, repeats, axis=None, **_):
+    x_shape = x.shape
+    if axis is None:
+        x = np.ravel(x)
+        axis = 0
+    axis %= x.ndim
+    if isinstance(repeats, int) or np.size(repeats) == 1:
+        repeats = int(np.ravel(repeats)[0])
+        shape = x.shape[:axis] + (x.shape[axis], repeats) + x.shape[axis + 1 :]
+        return np.reshape(np.sum(np.reshape(g, shape), axis=axis + 1), x_shape)
+    repeats = np.asarray(repeats)
+    starts = np.concatenate([[0], np.cumsum(repeats)[:-1]])
+    grad = np.add.reduceat(g, np.minimum(starts, max(g.shape[axis] - 1, 0)), axis)
+    # reduceat takes a single element for the elements which are not repeated
+    mask = np.reshape(repeats > 0, [-1 if i == axis else 1 for i in range(x.ndim)])
+    return np.reshape(np.where(mask, grad, 0), x_shape)
+
+
+def _roll_x(g, ret, x, shift, axis=None, **_):
+    shift = -shift if isinstance(shift, int) else tuple(-s for s in shift)
+    return np.roll(g, shift, axis=axis)
+
+
+def _pad_x(g, ret, x, pad_width, **_):
+    pad_width = np.broadcast_to(np.asarray(pad_width, dtype="int64"), (x.ndim, 2))
+    return g[tuple(slice(lo, g.shape[i] - hi) for i, (lo, hi) in enumerate(pad_width))]
+
+
+def _clip_x(g, ret, x, x_min, x_max, **_):
+    x_min = -np.inf if x_min is None else x_min
+    x_max = np.inf if x_max is None else x_max
+    return g * ((x >= x_min) & (x <= x_max))
+
+
+def _get_item_x(g, ret, x, query, **_):
+    grad = np.zeros(x.shape, dtype=g.dtype)
+    np.add.at(grad, query, g)
+    return grad
+
+
+def _gather_params(g, ret, params, indices, axis=-1, batch_dims=0, **_):
+    axis %= params.ndim
+    batch_dims %= params.ndim
+    grad = np.zeros(params.shape, dtype=g.dtype)
+    query = (slice(None),) * (axis - batch_dims)
+    for batch in np.ndindex(*params.shape[:batch_dims]):
+        np.add.at(grad[batch], query + (indices[batch],), g[batch])
+    return grad
+
+
+def _scatter_windows(window_grads, x, pads, strides, dilations):
+    # sums the gradients of the B x O1 x ... x On x K1 x ... x Kn x I windows of the
+    # channel last x padded by pads back into the padded x
+    dims = len(pads)
+    grad = np.zeros(
+        (x.shape[0], *[n + lo + hi for n, (lo, hi) in zip(x.shape[1:-1], pads)])
+        + x.shape[-1:],
+        dtype=window_grads.dtype,
+    )
+    # the windows are scattered back one filter position at a time
+    for k in np.ndindex(*window_grads.shape[dims + 1 : 2 * dims + 1]):
+        query = tuple(
+            slice(
+                k[i] * dilations[i],
+                k[i] * dilations[i] + strides[i] * (window_grads.shape[i + 1] - 1) + 1,
+                strides[i],
+            )
+            for i in range(dims)
+        )
+        grad[(slice(None),) + query] += window_grads[(slice(None),) * (dims + 1) + k]
+    return grad
+
+
+def _unpad(grad, pads):
+    return grad[
+        (slice(None),)
+        + tuple(slice(lo, grad.shape[i + 1] - hi) for i, (lo, hi) in enumerate(pads))
+    ]
+
+
+def _conv_params(strides, dilations, dims):
+    def expand(v):
+        if isinstance(v, int):
+            return [v] * dims
+        return [v[0]] * dims if len(v) == 1 else list(v)
+
+    return expand(strides), expand(dilations)
+
+
+def _conv_x(g, ret, x, filters, strides, padding, data_format="NWC", dilations=1, **_):
+    dims = filters.ndim - 2
+    strides, dilations = _conv_params(strides, dilations, dims)
+    channel_first = data_format[1] == "C"
+    if channel_first:
+        x, g = np.moveaxis(x, 1, -1), np.moveaxis(g, 1, -1)
+    pads = _conv_pads(x, filters.shape[:dims], strides, dilations, padding)
+    # B x O1 x ... x On x K1 x ... x Kn x I
+    window_grads = np.tensordot(g, filters, axes=([dims + 1], [dims + 1]))
+    grad = _unpad(_scatter_windows(window_grads, x, pads, strides, dilations), pads)
+    return np.moveaxis(grad, -1, 1) if channel_first else grad
+
+
+def _conv_filters(
+    g, ret, x, filters, strides, padding, data_format="NWC", dilations=1, **_
+):
+    dims = filters.ndim - 2
+    strides, dilations = _conv_params(strides, dilations, dims)
+    if data_format[1] == "C":
+        x, g = np.moveaxis(x, 1, -1), np.moveaxis(g, 1, -1)
+    filter_shape = filters.shape[:dims]
+    pads = _conv_pads(x, filter_shape, strides, dilations, padding)
+    x = np.pad(x, [(0, 0), *pads, (0, 0)], "constant")
+    windows = _conv_windows(x, filter_shape, strides, dilations)
+    return np.tensordot(windows, g, axes=(list(range(dims + 1)),) * 2)
+
+
+_CONV_VJPS = {"x": _conv_x, "filters": _conv_filters}
+
+
+def _fit_spatial(x, shape):
+    # crops or zero pads the end of the spatial dimensions of the channel last x to
+    # those of shape
+    x = x[(slice(None),) + tuple(slice(0, n) for n in shape[1:-1])]
+    return np.pad(
+        x, [(0, 0), *[(0, n - m) for n, m in zip(shape[1:-1], x.shape[1:-1])], (0, 0)]
+    )
+
+
+def _conv_transpose_params(x, filters, strides, data_format, dilations):
+    dims = filters.ndim - 2
+    strides, dilations = _conv_params(strides, dilations, dims)
+    channel_first = data_format[1] == "C"
+    if channel_first:
+        x = np.moveaxis(x, 1, -1)
+    # the transposed convolution is the adjoint of the convolution with the input and
+    # output channels of the filters swapped
+    return x, np.swapaxes(filters, -1, -2), strides, dilations, channel_first
+
+
+def _conv_transpose_x(
+    g, ret, x, filters, strides, padding, data_format="NWC", dilations=1, **_
+):
+    x, filters, strides, dilations, channel_first = _conv_transpose_params(
+        x, filters, strides, data_format, dilations
+    )
+    if channel_first:
+        g = np.moveaxis(g, 1, -1)
+    grad = _fit_spatial(_conv(g, filters, strides, padding, dilations), x.shape)
+    return np.moveaxis(grad, -1, 1) if channel_first else grad
+
+
+def _conv_transpose_filters(
+    g, ret, x, filters, strides, padding, data_format="NWC", dilations=1, **_
+):
+    x, filters, strides, dilations, channel_first = _conv_transpose_params(
+        x, filters, strides, data_format, dilations
+    )
+    if channel_first:
+        g = np.moveaxis(g, 1, -1)
+    dims = filters.ndim - 2
+    pads = _conv_pads(g, filters.shape[:dims], strides, dilations, padding)
+    # the filters of the convolution of g which is multiplied with x by the adjoint
+    out_shape = [
+        (n + lo + hi - (k - 1) * d - 1) // s + 1
+        for n, (lo, hi), k, d, s in zip(
+            g.shape[1:-1], pads, filters.shape[:dims], dilations, strides
+        )
+    ]
+    x = _fit_spatial(x, (x.shape[0], *out_shape, x.shape[-1]))
+    grad = _conv_filters(x, None, g, filters, strides, padding, dilations=dilations)
+    return np.swapaxes(grad, -1, -2)
+
+
+_CONV_TRANSPOSE_VJPS = {"x": _conv_transpose_x, "filters": _conv_transpose_filters}
+
+
+def _depthwise_params(x, g, filters, strides, data_format, dilations):
+    strides = [strides] * 2 if isinstance(strides, int) else strides
+    strides = [strides[1], strides[2]] if len(strides) == 4 else strides
+    strides, dilations = _conv_params(strides, dilations, 2)
+    if data_format == "NCHW":
+        x, g = np.moveaxis(x, 1, -1), np.moveaxis(g, 1, -1)
+    filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
+    return x, g, filters, strides, dilations
+
+
+def _depthwise_conv2d_x(
+    g, ret, x, filters, strides, padding, data_format="NHWC", dilations=1, **_
+):
+    x, g, filters, strides, dilations = _depthwise_params(
+        x, g, filters, strides, data_format, dilations
+    )
+    pads = _conv_pads(x, filters.shape[:2], strides, dilations, padding)
+    # B x OH x OW x KH x KW x C
+    window_grads = np.einsum("bhwc,ijc->bhwijc", g, filters)
+    grad = _unpad(_scatter_windows(window_grads, x, pads, strides, dilations), pads)
+    return np.moveaxis(grad, -1, 1) if data_format == "NCHW" else grad
+
+
+def _depthwise_conv2d_filters(
+    g, ret, x, filters, strides, padding, data_format="NHWC", dilations=1, **_
+):
+    filters_shape = filters.shape
+    x, g, filters, strides, dilations = _depthwise_params(
+        x, g, filters, strides, data_format, dilations
+    )
+    pads = _conv_pads(x, filters.shape[:2], strides, dilations, padding)
+    x = np.pad(x, [(0, 0), *pads, (0, 0)], "constant")
+    windows = _conv_windows(x, filters.shape[:2], strides, dilations)
+    return np.einsum("bhwijc,bhwc->ijc", windows, g).reshape(filters_shape)
+
+
+def _pool_params(x, kernel, strides, padding, data_format):
+    # the channel last x, with the normalized kernel and strides, and the (before,
+    # after) edge padding of each of its spatial dimensions
+    dims = x.ndim - 2
+    channel_first = data_format[1] == "C"
+    if channel_first:
+        x = np.moveaxis(x, 1, -1)
+    kernel, strides = _conv_params(kernel, strides, dims)
+    pads = [
+        (pad // 2, pad - pad // 2)
+        for pad in (
+            ivy.handle_padding(n, s, k, padding)
+            for n, s, k in zip(x.shape[1:-1], strides, kernel)
+        )
+    ]
+    return x, kernel, strides, pads, channel_first
+
+
+def _avg_pool_x(g, ret, x, kernel, strides, padding, data_format="NWC", **_):
+    x, kernel, strides, pads, channel_first = _pool_params(
+        x, kernel, strides, padding, data_format
+    )
+    if channel_first:
+        g = np.moveaxis(g, 1, -1)
+    dims = len(kernel)
+    # B x O1 x ... x On x K1 x ... x Kn x C
+    window_grads = np.broadcast_to(
+        np.expand_dims(g / math.prod(kernel), tuple(range(dims + 1, 2 * dims + 1))),
+        g.shape[:-1] + tuple(kernel) + g.shape[-1:],
+    )
+    grad = _scatter_windows(window_grads, x, pads, strides, [1] * dims)
+    # the edge padding repeats the elements at the edges, which receive the gradients
+    # of their copies
+    spatial = x.shape[1:-1]
+    sources = np.pad(np.arange(math.prod(spatial)).reshape(spatial), pads, "edge")
+    batch_channels = (x.shape[0], x.shape[-1])
+    unpadded = np.zeros((math.prod(spatial),) + batch_channels, dtype=g.dtype)
+    np.add.at(
+        unpadded, sources.ravel(), np.moveaxis(grad, 0, -2).reshape(-1, *batch_channels)
+    )
+    grad = np.moveaxis(unpadded.reshape(spatial + batch_channels), -2, 0)
+    return np.moveaxis(grad, -1, 1) if channel_first else grad
+
+
+def _max_pool_x(max_pool):
+    def vjp(g, ret, x, kernel, strides, padding, data_format="NWC", **_):
+        # pooling the ranks of the elements finds the position of the maximum of each
+        # window, with the same padding and windows as the pooling of x
+        order = np.argsort(x, axis=None, kind="stable")
+        ranks = np.empty(x.size, dtype="int64")
+        ranks[order] = np.arange(x.size)
+        pooled = max_pool(
+            ranks.reshape(x.shape), kernel, strides, padding, data_format=data_format
+        )
+        grad = np.zeros(x.size, dtype=g.dtype)
+        np.add.at(grad, order[pooled.ravel()], g.ravel())
+        return grad.reshape(x.shape)
+
+    return vjp
+
+
+def _expand_norm(v, x, axis):
+    # broadcasts v, reduced from x over axis, back to the shape of x
+    axes = _reduction_axes(x, axis)
+    return np.broadcast_to(
+        np.reshape(v, [1 if i in axes else n for i, n in enumerate(x.shape)]), x.shape
+    )
+
+
+def _vector_norm_x(g, ret, x, axis=None, ord=2, **_):
+    g, norm = _expand_norm(g, x, axis), _expand_norm(ret, x, axis)
+    if ord == 0:
+        return np.zeros_like(x)
+    if ord in (np.inf, -np.inf):
+        # the gradient is shared between the elements which reach the norm
+        mask = np.abs(x) == norm
+        count = np.sum(mask, axis=_reduction_axes(x, axis), keepdims=True)
+        return g * np.sign(x) * mask / np.maximum(count, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grad = g * np.sign(x) * (np.abs(x) / norm) ** (ord - 1)
+    return np.where(norm == 0, 0, grad)
+
+
+def _matrix_norm_x(g, ret, x, ord="fro", axis=(-2, -1), keepdims=False, **_):
+    axis = tuple(a % x.ndim for a in axis)
+    g, norm = _expand_norm(g, x, axis), _expand_norm(ret, x, axis)
+    if ord == "fro":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(norm == 0, 0, g * x / norm)
+    if ord in ("nuc", 2, -2):
+        u, _, vh = np.linalg.svd(np.moveaxis(x, axis, (-2, -1)), full_matrices=False)
+        if ord == "nuc":
+            grad = u @ vh
+        else:
+            # the outer product of the singular vectors of the extreme singular value
+            i = 0 if ord == 2 else -1
+            grad = u[..., :, i : i + 1 or None] @ vh[..., i : i + 1 or None, :]
+        return g * np.moveaxis(grad, (-2, -1), axis)
+    # the norms of the columns for 1 and -1, and of the rows for inf and -inf
+    summed = axis[0] if ord in (1, -1) else axis[1]
+    sums = np.broadcast_to(np.sum(np.abs(x), axis=summed, keepdims=True), x.shape)
+    mask = sums == norm
+    count = np.sum(mask, axis=axis, keepdims=True) // x.shape[summed]
+    return g * np.sign(x) * mask / count
+
+
+def _sort_x(g, ret, x, axis=-1, descending=False, **_):
+    indices = np.argsort(x, axis=axis, kind="stable")
+    if descending:
+        indices = np.flip(indices, axis)
+    grad = np.zeros(x.shape, dtype=g.dtype)
+    np.put_along_axis(grad, indices, g, axis)
+    return grad
+
+
+def _gather_nd_params(g, ret, params, indices, batch_dims=0, **_):
+    # the general module imports this one
+    from ivy.functional.backends.numpy.general import gather_nd_helper
+
+    positions = gather_nd_helper(
+        np.arange(params.size).reshape(params.shape),
+        np.asarray(indices),
+        batch_dims % params.ndim,
+    )
+    grad = np.zeros(params.size, dtype=g.dtype)
+    np.add.at(grad, positions.ravel(), g.ravel())
+    return grad.reshape(params.shape)
+
+
+def _scatter_nd_updates(g, ret, indices, updates, reduction="sum", **_):
+    if isinstance(indices, (tuple, list, int)):
+        indices = np.array([[indices]] if isinstance(indices, int) else indices)
+        if indices.ndim < 2:
+            indices = np.expand_dims(indices, -1)
+    num_index_dims = indices.shape[-1]
+    index_shape = g.shape[:num_index_dims]
+    row_size = math.prod(g.shape[num_index_dims:])
+    indices = indices.reshape(-1, num_index_dims)
+    indices = np.where(indices < 0, indices + index_shape, indices)
+    flat_indices = np.ravel_multi_index(tuple(indices.T), index_shape)
+    rows = g.reshape(-1, row_size)[flat_indices]
+    if reduction == "replace":
+        # only the last update of each index is written
+        _, last = np.unique(flat_indices[::-1], return_index=True)
+        written = np.zeros(flat_indices.shape, dtype=bool)
+        written[flat_indices.size - 1 - last] = True
+        rows = rows * written[:, None]
+    elif reduction in ("min", "max"):
+        written = np.broadcast_to(updates, rows.shape[:1] + g.shape[num_index_dims:])
+        rows = rows * (
+            written.reshape(rows.shape) == ret.reshape(-1, row_size)[flat_indices]
+        )
+    elif reduction != "sum":
+        raise ivy.exceptions.IvyException(
+            'reduction is {}, but it must be one of "sum", "min", "max" or '
+            '"replace"'.format(reduction)
+        )
+    rows = rows.reshape(rows.shape[:1] + g.shape[num_index_dims:])
+    return rows.reshape(updates.shape) if rows.size == updates.size else rows
+
+
+def _take_along_axis_arr(g, ret, arr, indices, axis, **_):
+    query = tuple(
+        indices
+        if i == axis % arr.ndim
+        else np.arange(n).reshape([-1 if j == i else 1 for j in range(arr.ndim)])
+        for i, n in enumerate(arr.shape)
+    )
+    grad = np.zeros(arr.shape, dtype=g.dtype)
+    np.add.at(grad, query, g)
+    return grad
+
+
+def _diagonal_x(g, ret, x, offset=0, axis1=-2, axis2=-1, **_):
+    # the diagonals are along the last axis of g
+    grad = np.zeros(np.moveaxis(x, (axis1, axis2), (-2, -1)).shape, dtype=g.dtype)
+    n = g.shape[-1]
+    grad[..., np.arange(n) + max(-offset, 0), np.arange(n) + max(offset, 0)] = g
+    return np.moveaxis(grad, (-2, -1), (axis1, axis2))
+
+
+def _trace_x(g, ret, x, offset=0, axis1=0, axis2=1, **_):
+    n = np.diagonal(x, offset, axis1, axis2).shape[-1]
+    g = np.broadcast_to(np.expand_dims(g, -1), np.shape(g) + (n,))
+    return _diagonal_x(g, ret, x, offset=offset, axis1=axis1, axis2=axis2)
+
+
+# the VJPs of each recorded backend function, by the name of the argument they
+# compute the gradient of
+_VJPS = {
+    # elementwise
+    "abs": {"x": lambda g, ret, x, **_: g * np.sign(x)},
+    "add": {
+        "x1": _identity,
+        "x2": lambda g, ret, alpha=None, **_: g * _alpha(alpha),
+    },
+    "subtract": {
+        "x1": _identity,
+        "x2": lambda g, ret, alpha=None, **_: -g * _alpha(alpha),
+    },
+    "multiply": {
+        "x1": lambda g, ret, x2, **_: g * x2,
+        "x2": lambda g, ret, x1, **_: g * x1,
+    },
+    "divide": {
+        "x1": lambda g, ret, x2, **_: g / x2,
+        "x2": lambda g, ret, x2, **_: -g * ret / x2,
+    },
+    "negative": {"x": lambda g, ret, **_: -g},
+    "positive": {"x": _identity},
+    "pow": {
+        "x1": lambda g, ret, x1, x2, **_: g * x2 * np.power(x1, np.subtract(x2, 1)),
+        "x2": _pow_x2,
+    },
+    "square": {"x": lambda g, ret, x, **_: 2 * g * x},
+    "sqrt": {"x": lambda g, ret, **_: g / (2 * ret)},
+    "reciprocal": {"x": lambda g, ret, **_: -g * ret**2},
+    "exp": {"x": lambda g, ret, **_: g * ret},
+    "expm1": {"x": lambda g, ret, **_: g * (ret + 1)},
+    "log": {"x": lambda g, ret, x, **_: g / x},
+    "log1p": {"x": lambda g, ret, x, **_: g / (1 + x)},
+    "log2": {"x": lambda g, ret, x, **_: g / (x * np.log(2))},
+    "log10": {"x": lambda g, ret, x, **_: g / (x * np.log(10))},
+    "sin": {"x": lambda g, ret, x, **_: g * np.cos(x)},
+    "cos": {"x": lambda g, ret, x, **_: -g * np.sin(x)},
+    "tan": {"x": lambda g, ret, **_: g * (1 + ret**2)},
+    "sinh": {"x": lambda g, ret, x, **_: g * np.cosh(x)},
+    "cosh": {"x": lambda g, ret, x, **_: g * np.sinh(x)},
+    "tanh": {"x": lambda g, ret, **_: g * (1 - ret**2)},
+    "asin": {"x": lambda g, ret, x, **_: g / np.sqrt(1 - x**2)},
+    "acos": {"x": lambda g, ret, x, **_: -g / np.sqrt(1 - x**2)},
+    "atan": {"x": lambda g, ret, x, **_: g / (1 + x**2)},
+    "atan2": {
+        "x1": lambda g, ret, x1, x2, **_: g * x2 / (x1**2 + x2**2),
+        "x2": lambda g, ret, x1, x2, **_: -g * x1 / (x1**2 + x2**2),
+    },
+    "asinh": {"x": lambda g, ret, x, **_: g / np.sqrt(x**2 + 1)},
+    "acosh": {"x": lambda g, ret, x, **_: g / np.sqrt(x**2 - 1)},
+    "atanh": {"x": lambda g, ret, x, **_: g / (1 - x**2)},
+    "exp2": {"x": lambda g, ret, **_: g * ret * np.log(2)},
+    "logaddexp": {
+        "x1": lambda g, ret, x1, **_: g * np.exp(x1 - ret),
+        "x2": lambda g, ret, x2, **_: g * np.exp(x2 - ret),
+    },
+    "logaddexp2": {
+        "x1": lambda g, ret, x1, **_: g * np.exp2(x1 - ret),
+        "x2": lambda g, ret, x2, **_: g * np.exp2(x2 - ret),
+    },
+    "deg2rad": {"x": lambda g, ret, **_: g * np.pi / 180},
+    "rad2deg": {"x": lambda g, ret, **_: g * 180 / np.pi},
+    "erf": {"x": lambda g, ret, x, **_: g * 2 / np.sqrt(np.pi) * np.exp(-(x**2))},
+    "minimum": {"x1": _min_max_x1, "x2": _min_max_x2},
+    "maximum": {"x1": _min_max_x1, "x2": _min_max_x2},
+    "fmin": {"x1": _min_max_x1, "x2": _min_max_x2},
+    "fmax": {"x1": _min_max_x1, "x2": _min_max_x2},
+    "remainder": {
+        "x1": _identity,
+        "x2": lambda g, ret, x1, x2, **_: -g * np.floor_divide(x1, x2),
+    },
+    "where": {
+        "x1": lambda g, ret, condition, **_: np.where(condition, g, 0),
+        "x2": lambda g, ret, condition, **_: np.where(condition, 0, g),
+    },
+    "clip": {
+        "x": _clip_x,
+        "x_min": lambda g, ret, x, x_min, **_: g * (x < x_min),
+        "x_max": lambda g, ret, x, x_max, **_: g * (x > x_max),
+    },
+    "astype": {"x": _identity},
+    "asarray": {"obj": _identity},
+    "copy_array": {"x": _identity},
+    # activations
+    "relu": {"x": lambda g, ret, x, **_: g * (x > 0)},
+    "leaky_relu": {
+        "x": lambda g, ret, x, alpha=0.2, **_: g * np.where(x > 0, 1, alpha)
+    },
+    "sigmoid": {"x": lambda g, ret, **_: g * ret * (1 - ret)},
+    "softmax": {
+        "x": lambda g, ret, axis=None, **_: ret
+        * (g - np.sum(g * ret, axis=axis, keepdims=True))
+    },
+    "log_softmax": {
+        "x": lambda g, ret, axis=None, **_: g
+        - np.exp(ret) * np.sum(g, axis=axis, keepdims=True)
+    },
+    "gelu": {"x": _gelu_x},
+    "softplus": {"x": _softplus_x},
+    # reductions
+    "sum": {
+        "x": lambda g, ret, x, axis=None, keepdims=False, **_: _expand_reduced(
+            g, x, axis, keepdims
+        )
+    },
+    "mean": {
+        "x": lambda g, ret, x, axis=None, keepdims=False, **_: _expand_reduced(
+            g, x, axis, keepdims
+        )
+        / _reduced_size(x, axis)
+    },
+    "prod": {"x": _prod_x},
+    "max": {"x": _extremum},
+    "min": {"x": _extremum},
+    "var": {"x": _deviation},
+    "std": {"x": _std_x},
+    "nansum": {
+        "x": lambda g, ret, x, axis=None, keepdims=False, **_: (
+            _expand_reduced(g, x, axis, keepdims) * ~np.isnan(x)
+        )
+    },
+    "vector_norm": {"x": _vector_norm_x},
+    "matrix_norm": {"x": _matrix_norm_x},
+    "sort": {"x": _sort_x},
+    "msort": {"a": lambda g, ret, a, **_: _sort_x(g, ret, np.asarray(a), axis=0)},
+    "cumsum": {
+        "x": lambda g, ret, axis=0, exclusive=False, reverse=False, **_: _cumsum(
+            g, axis, exclusive, not reverse
+        )
+    },
+    # linear algebra
+    "matmul": {"x1": _matmul_x1, "x2": _matmul_x2},
+    "tensordot": {"x1": _tensordot_x1, "x2": _tensordot_x2},
+    "einsum": {"operands": _einsum_operands},
+    # the NumPy vecdot contracts the axis of x1 with that of x2 as a tensordot
+    "vecdot": {
+        "x1": lambda g, ret, x1, x2, axis=-1, **_: _tensordot_x1(
+            g, ret, x1, x2, axes=([axis], [axis])
+        ),
+        "x2": lambda g, ret, x1, x2, axis=-1, **_: _tensordot_x2(
+            g, ret, x1, x2, axes=([axis], [axis])
+        ),
+    },
+    "outer": {
+        "x1": lambda g, ret, x1, x2, **_: np.reshape(g @ np.ravel(x2), x1.shape),
+        "x2": lambda g, ret, x1, x2, **_: np.reshape(np.ravel(x1) @ g, x2.shape),
+    },
+    "matrix_transpose": {"x": lambda g, ret, **_: np.swapaxes(g, -1, -2)},
+    "det": {
+        "x": lambda g, ret, x, **_: (
+            (g * ret)[..., None, None] * np.swapaxes(np.linalg.inv(x), -1, -2)
+        )
+    },
+    "trace": {"x": _trace_x},
+    "diagonal": {"x": _diagonal_x},
+    "tril": {"x": lambda g, ret, k=0, **_: np.tril(g, k)},
+    "triu": {"x": lambda g, ret, k=0, **_: np.triu(g, k)},
+    # manipulation
+    "reshape": {"x": _reshape_like("x")},
+    "expand_dims": {"x": _reshape_like("x")},
+    "squeeze": {"x": _reshape_like("x")},
+    "permute_dims": {"x": lambda g, ret, axes, **_: np.transpose(g, np.argsort(axes))},
+    "swapaxes": {"x": lambda g, ret, axis0, axis1, **_: np.swapaxes(g, axis0, axis1)},
+    "moveaxis": {
+        "a": lambda g, ret, source, destination, **_: np.moveaxis(
+            g, destination, source
+        )
+    },
+    "flip": {"x": lambda g, ret, axis=None, **_: np.flip(g, axis=axis)},
+    "flipud": {"m": lambda g, ret, **_: np.flipud(g)},
+    "fliplr": {"m": lambda g, ret, **_: np.fliplr(g)},
+    "roll": {"x": _roll_x},
+    "concat": {"xs": _concat_xs},
+    "stack": {"arrays": _stack_arrays},
+    "split": {"x": _split_x},
+    "unstack": {"x": _unstack_x},
+    "tile": {"x": _tile_x},
+    "repeat": {"x": _repeat_x},
+    "broadcast_to": {"x": _identity},
+    "zero_pad": {"x": _pad_x},
+    "constant_pad": {"x": _pad_x},
+    "get_item": {"x": _get_item_x},
+    "gather": {"params": _gather_params},
+    "gather_nd": {"params": _gather_nd_params},
+    "scatter_nd": {"updates": _scatter_nd_updates},
+    "take_along_axis": {"arr": _take_along_axis_arr},
+    # layers
+    "conv1d": _CONV_VJPS,
+    "conv2d": _CONV_VJPS,
+    "conv3d": _CONV_VJPS,
+    "conv1d_transpose": _CONV_TRANSPOSE_VJPS,
+    "conv2d_transpose": _CONV_TRANSPOSE_VJPS,
+    "conv3d_transpose": _CONV_TRANSPOSE_VJPS,
+    "depthwise_conv2d": {
+        "x": _depthwise_conv2d_x,
+        "filters": _depthwise_conv2d_filters,
+    },
+    "max_pool1d": {"x": _max_pool_x(_max_pool1d)},
+    "max_pool2d": {"x": _max_pool_x(_max_pool2d)},
+    "max_pool3d": {"x": _max_pool_x(_max_pool3d)},
+    "avg_pool1d": {"x": _avg_pool_x},
+    "avg_pool2d": {"x": _avg_pool_x},
+    "avg_pool3d": {"x": _avg_pool_x},
+}
@@ -21,4 +21,14 @@ def while_loop(test_fn, body_fn, vars):
     def test_fn_wrapper(*loop_vars):
         return test_fn(*loop_vars)
 
-    return tf.while_loop(test_fn_wrapper, body_fn_wrapper, vars)
+    if not tf.executing_eagerly():
+        return tf.while_loop(test_fn_wrapper, body_fn_wrapper, vars)
+
+    # eager tf.while_loop runs the loop in python, so it is traced into a graph. The
+    # graph is traced again on every call, as the trace would otherwise keep the
+    # python values and eager tensors the functions capture from the first call
+    @tf.function(autograph=False)
+    def graph_while_loop(*loop_vars):
+        return tf.while_loop(test_fn_wrapper, body_fn_wrapper, loop_vars)
+
+    return graph_while_loop(*vars)
@@ -680,3 +680,52 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = x.shape[:-2]
+    timesteps, input_channels = x.shape[-2:]
+    output_channels = recurrent_kernel.shape[0]
+    params = [kernel.t().contiguous(), recurrent_kernel.t().contiguous()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        zeros = torch.zeros(
+            4 * output_channels, dtype=kernel.dtype, device=kernel.device
+        )
+        params += [
+            bias if bias is not None else zeros,
+            recurrent_bias if recurrent_bias is not None else zeros,
+        ]
+    # the initial states may be broadcast over the batch dimensions, whereas
+    # torch.lstm takes one for each sequence
+    state_shape = tuple(batch_shape) + (output_channels,)
+    init_h = torch.broadcast_to(init_h, state_shape)
+    init_c = torch.broadcast_to(init_c, state_shape)
+    hts, _, ct = torch.lstm(
+        x.reshape(-1, timesteps, input_channels),
+        (
+            init_h.reshape(1, -1, output_channels),
+            init_c.reshape(1, -1, output_channels),
+        ),
+        params,
+        has_biases,
+        1,
+        0.0,
+        False,
+        False,
+        True,
+    )
+    return (
+        hts.reshape(batch_shape + (timesteps, output_channels)),
+        ct.reshape(batch_shape + (output_channels,)),
+    )
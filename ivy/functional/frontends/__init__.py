@@ -7,11 +7,19 @@ versions = {
 
 # flake8: noqa
 import importlib
+import importlib.metadata
+import sys
 
-from . import numpy
-from . import jax
-from . import tensorflow
-from . import torch
+# the frontends are imported on first use, so that importing ivy does not import
+# all of them, and read ivy's dtypes from its original namespace when they are
+# imported, see _original_ivy
+_frontends = ("numpy", "jax", "tensorflow", "torch")
+
+
+def __getattr__(name):
+    if name in _frontends:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
 
 
 def fn_name_from_version_specific_fn_name(name, version):
@@ -78,20 +86,18 @@ def set_frontend_to_specific_version(frontend):
     f = str(frontend.__name__)
     f = f[f.index("frontends") + 10 :]
     str_f = str(f)
-    try:
-        f = importlib.import_module(f)
-        f_version = f.__version__
-    except ImportError:
-        f_version = versions[str_f]
+    # the version is read from the package metadata, so that the framework itself
+    # is only imported if it was already
+    if str_f in sys.modules:
+        f_version = sys.modules[str_f].__version__
+    else:
+        try:
+            f_version = importlib.metadata.version(str_f)
+        except importlib.metadata.PackageNotFoundError:
+            f_version = versions[str_f]
 
     for i in list(frontend.__dict__):
         if "_v_" in i:
             orig_name = fn_name_from_version_specific_fn_name(i, f_version)
             if orig_name:
                 frontend.__dict__[orig_name] = frontend.__dict__[i]
-
-
-set_frontend_to_specific_version(torch)
-set_frontend_to_specific_version(tensorflow)
-set_frontend_to_specific_version(jax)
-set_frontend_to_specific_version(numpy)
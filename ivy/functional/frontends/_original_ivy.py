@@ -0,0 +1,20 @@
+"""ivy's original namespace, as it is when no backend is set.
+
+The frontends are imported on first use, by which time a backend might be set that
+removes some of ivy's dtypes from the ivy namespace, such as ``ivy.bfloat16`` with
+NumPy. The tables the frontends build when they are imported therefore read the
+dtypes from this module instead, which resolves them explicitly in the original
+namespace.
+"""
+
+# local
+import ivy
+
+
+def __getattr__(name):
+    try:
+        return ivy.backend_handler.ivy_original_dict[name]
+    except KeyError:
+        raise AttributeError(
+            "module 'ivy' has no attribute '{}' in its original namespace".format(name)
+        )
@@ -7,3 +7,10 @@ from . import nn
 from . import numpy
 from . import random
 from . import _src
+
+
+# point the version specific functions to the version of the installed framework
+import sys
+from ivy.functional.frontends import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
@@ -1,6 +1,19 @@
 # global
 import ivy
-from ivy.functional.frontends.jax.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.jax.func_wrapper import (
+    to_ivy_arrays_and_back,
+    _to_ivy_array,
+)
+
+
+def _returning_ivy_arrays(fn):
+    # the functions may return frontend arrays, which ivy's control flow can't carry
+    def new_fn(*args):
+        return ivy.nested_map(
+            fn(*args), _to_ivy_array, include_derived={tuple: True}, shallow=False
+        )
+
+    return new_fn
 
 
 @to_ivy_arrays_and_back
@@ -12,14 +25,17 @@ def cond(pred, true_fun, false_fun, *operands, operand=None, linear=None):
             )
         operands = (operand,)
 
-    if pred:
-        return true_fun(*operands)
-    return false_fun(*operands)
+    return ivy.IfElse(
+        pred,
+        _returning_ivy_arrays(true_fun),
+        _returning_ivy_arrays(false_fun),
+        operands,
+    )
 
 
 @to_ivy_arrays_and_back
 def map(f, xs):
-    return ivy.stack([f(x) for x in xs])
+    return ivy.vmap(_returning_ivy_arrays(f))(xs)
 
 
 @to_ivy_arrays_and_back
@@ -31,6 +47,17 @@ def switch(index, branches, *operands, operand=None):
             )
         operands = (operand,)
 
-    index = max(index, 0)
-    index = min(len(branches) - 1, index)
-    return branches[index](*operands)
+    return _switch(index, branches, operands)
+
+
+def _switch(index, branches, operands, i=0):
+    # nested conditionals, so that a traced index selects the branch at run time,
+    # with out of range indices clamped to the first and last branches
+    if i == len(branches) - 1:
+        return branches[i](*operands)
+    return ivy.IfElse(
+        index <= i,
+        _returning_ivy_arrays(branches[i]),
+        _returning_ivy_arrays(lambda *ops: _switch(index, branches, ops, i + 1)),
+        operands,
+    )
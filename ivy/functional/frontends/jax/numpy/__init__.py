@@ -6,6 +6,7 @@ from typing import Union, Tuple, Iterable
 
 # local
 import ivy
+from ivy.functional.frontends import _original_ivy as _ivy
 from ivy.exceptions import handle_exceptions
 from ivy.functional.frontends.numpy import dtype
 
@@ -29,123 +30,123 @@ bool = dtype("bool")
 
 # jax-numpy casting table
 jax_numpy_casting_table = {
-    ivy.bool: [
-        ivy.bool,
-        ivy.int8,
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.uint8,
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
-        ivy.bfloat16,
+    _ivy.bool: [
+        _ivy.bool,
+        _ivy.int8,
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.uint8,
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
+        _ivy.bfloat16,
     ],
-    ivy.int8: [
-        ivy.int8,
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
-        ivy.bfloat16,
+    _ivy.int8: [
+        _ivy.int8,
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
+        _ivy.bfloat16,
     ],
-    ivy.int16: [
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int16: [
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.int32: [
-        ivy.int32,
-        ivy.int64,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int32: [
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.int64: [
-        ivy.int64,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int64: [
+        _ivy.int64,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.uint8: [
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.uint8,
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
-        ivy.bfloat16,
+    _ivy.uint8: [
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.uint8,
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
+        _ivy.bfloat16,
     ],
-    ivy.uint16: [
-        ivy.int32,
-        ivy.int64,
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.uint16: [
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.uint32: [
-        ivy.int64,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.uint32: [
+        _ivy.int64,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.uint64: [
-        ivy.uint64,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.uint64: [
+        _ivy.uint64,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.float16: [
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.float16: [
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.float32: [
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.float32: [
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.float64: [
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.float64: [
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.complex64: [ivy.complex64, ivy.complex128, ivy.bfloat16],
-    ivy.complex128: [ivy.complex128, ivy.bfloat16],
-    ivy.bfloat16: [
-        ivy.bfloat16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.complex64: [_ivy.complex64, _ivy.complex128, _ivy.bfloat16],
+    _ivy.complex128: [_ivy.complex128, _ivy.bfloat16],
+    _ivy.bfloat16: [
+        _ivy.bfloat16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
 }
 
@@ -153,175 +154,175 @@ jax_numpy_casting_table = {
 # jax-numpy type promotion table
 # data type promotion
 jax_promotion_table = {
-    (ivy.bool, ivy.bool): ivy.bool,
-    (ivy.bool, ivy.uint8): ivy.uint8,
-    (ivy.bool, ivy.uint16): ivy.uint16,
-    (ivy.bool, ivy.uint32): ivy.uint32,
-    (ivy.bool, ivy.uint64): ivy.uint64,
-    (ivy.bool, ivy.int8): ivy.int8,
-    (ivy.bool, ivy.int16): ivy.int16,
-    (ivy.bool, ivy.int32): ivy.int32,
-    (ivy.bool, ivy.int64): ivy.int64,
-    (ivy.bool, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bool, ivy.float16): ivy.float16,
-    (ivy.bool, ivy.float32): ivy.float32,
-    (ivy.bool, ivy.float64): ivy.float64,
-    (ivy.uint8, ivy.bool): ivy.uint8,
-    (ivy.uint8, ivy.uint8): ivy.uint8,
-    (ivy.uint8, ivy.uint16): ivy.uint16,
-    (ivy.uint8, ivy.uint32): ivy.uint32,
-    (ivy.uint8, ivy.uint64): ivy.uint64,
-    (ivy.uint8, ivy.int8): ivy.int16,
-    (ivy.uint8, ivy.int16): ivy.int16,
-    (ivy.uint8, ivy.int32): ivy.int32,
-    (ivy.uint8, ivy.int64): ivy.int64,
-    (ivy.uint8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.uint8, ivy.float16): ivy.float16,
-    (ivy.uint8, ivy.float32): ivy.float32,
-    (ivy.uint8, ivy.float64): ivy.float64,
-    (ivy.uint16, ivy.bool): ivy.uint16,
-    (ivy.uint16, ivy.uint8): ivy.uint16,
-    (ivy.uint16, ivy.uint16): ivy.uint16,
-    (ivy.uint16, ivy.uint32): ivy.uint32,
-    (ivy.uint16, ivy.uint64): ivy.uint64,
-    (ivy.uint16, ivy.int8): ivy.int32,
-    (ivy.uint16, ivy.int16): ivy.int32,
-    (ivy.uint16, ivy.int32): ivy.int32,
-    (ivy.uint16, ivy.int64): ivy.int64,
-    (ivy.uint16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.uint16, ivy.float16): ivy.float16,
-    (ivy.uint16, ivy.float32): ivy.float32,
-    (ivy.uint16, ivy.float64): ivy.float64,
-    (ivy.uint32, ivy.bool): ivy.uint32,
-    (ivy.uint32, ivy.uint8): ivy.uint32,
-    (ivy.uint32, ivy.uint16): ivy.uint32,
-    (ivy.uint32, ivy.uint32): ivy.uint32,
-    (ivy.uint32, ivy.uint64): ivy.uint64,
-    (ivy.uint32, ivy.int8): ivy.int64,
-    (ivy.uint32, ivy.int16): ivy.int64,
-    (ivy.uint32, ivy.int32): ivy.int64,
-    (ivy.uint32, ivy.int64): ivy.int64,
-    (ivy.uint32, ivy.bfloat16): ivy.bfloat16,
-    (ivy.uint32, ivy.float16): ivy.float16,
-    (ivy.uint32, ivy.float32): ivy.float32,
-    (ivy.uint32, ivy.float64): ivy.float64,
-    (ivy.uint64, ivy.bool): ivy.uint64,
-    (ivy.uint64, ivy.uint8): ivy.uint64,
-    (ivy.uint64, ivy.uint16): ivy.uint64,
-    (ivy.uint64, ivy.uint32): ivy.uint64,
-    (ivy.uint64, ivy.uint64): ivy.uint64,
-    (ivy.uint64, ivy.int8): ivy.float64,
-    (ivy.uint64, ivy.int16): ivy.float64,
-    (ivy.uint64, ivy.int32): ivy.float64,
-    (ivy.uint64, ivy.int64): ivy.float64,
-    (ivy.uint64, ivy.bfloat16): ivy.bfloat16,
-    (ivy.uint64, ivy.float16): ivy.float16,
-    (ivy.uint64, ivy.float32): ivy.float32,
-    (ivy.uint64, ivy.float64): ivy.float64,
-    (ivy.int8, ivy.bool): ivy.int8,
-    (ivy.int8, ivy.uint8): ivy.int16,
-    (ivy.int8, ivy.uint16): ivy.int32,
-    (ivy.int8, ivy.uint32): ivy.int64,
-    (ivy.int8, ivy.uint64): ivy.float64,
-    (ivy.int8, ivy.int8): ivy.int8,
-    (ivy.int8, ivy.int16): ivy.int16,
-    (ivy.int8, ivy.int32): ivy.int32,
-    (ivy.int8, ivy.int64): ivy.int64,
-    (ivy.int8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.int8, ivy.float16): ivy.float16,
-    (ivy.int8, ivy.float32): ivy.float32,
-    (ivy.int8, ivy.float64): ivy.float64,
-    (ivy.int16, ivy.bool): ivy.int16,
-    (ivy.int16, ivy.uint8): ivy.int16,
-    (ivy.int16, ivy.uint16): ivy.int32,
-    (ivy.int16, ivy.uint32): ivy.int64,
-    (ivy.int16, ivy.uint64): ivy.float64,
-    (ivy.int16, ivy.int8): ivy.int16,
-    (ivy.int16, ivy.int16): ivy.int16,
-    (ivy.int16, ivy.int32): ivy.int32,
-    (ivy.int16, ivy.int64): ivy.int64,
-    (ivy.int16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.int16, ivy.float16): ivy.float16,
-    (ivy.int16, ivy.float32): ivy.float32,
-    (ivy.int16, ivy.float64): ivy.float64,
-    (ivy.int32, ivy.bool): ivy.int32,
-    (ivy.int32, ivy.uint8): ivy.int32,
-    (ivy.int32, ivy.uint16): ivy.int32,
-    (ivy.int32, ivy.uint32): ivy.int64,
-    (ivy.int32, ivy.uint64): ivy.float64,
-    (ivy.int32, ivy.int8): ivy.int32,
-    (ivy.int32, ivy.int16): ivy.int32,
-    (ivy.int32, ivy.int32): ivy.int32,
-    (ivy.int32, ivy.int64): ivy.int64,
-    (ivy.int32, ivy.bfloat16): ivy.bfloat16,
-    (ivy.int32, ivy.float16): ivy.float16,
-    (ivy.int32, ivy.float32): ivy.float32,
-    (ivy.int32, ivy.float64): ivy.float64,
-    (ivy.int64, ivy.bool): ivy.int64,
-    (ivy.int64, ivy.uint8): ivy.int64,
-    (ivy.int64, ivy.uint16): ivy.int64,
-    (ivy.int64, ivy.uint32): ivy.int64,
-    (ivy.int64, ivy.uint64): ivy.float64,
-    (ivy.int64, ivy.int8): ivy.int64,
-    (ivy.int64, ivy.int16): ivy.int64,
-    (ivy.int64, ivy.int32): ivy.int64,
-    (ivy.int64, ivy.int64): ivy.int64,
-    (ivy.int64, ivy.bfloat16): ivy.bfloat16,
-    (ivy.int64, ivy.float16): ivy.float16,
-    (ivy.int64, ivy.float32): ivy.float32,
-    (ivy.int64, ivy.float64): ivy.float64,
-    (ivy.bfloat16, ivy.bool): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint8): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint32): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint64): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int8): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int32): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int64): ivy.bfloat16,
-    (ivy.bfloat16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.float16): ivy.float32,
-    (ivy.bfloat16, ivy.float32): ivy.float32,
-    (ivy.bfloat16, ivy.float64): ivy.float64,
-    (ivy.float16, ivy.bool): ivy.float16,
-    (ivy.float16, ivy.uint8): ivy.float16,
-    (ivy.float16, ivy.uint16): ivy.float16,
-    (ivy.float16, ivy.uint32): ivy.float16,
-    (ivy.float16, ivy.uint64): ivy.float16,
-    (ivy.float16, ivy.int8): ivy.float16,
-    (ivy.float16, ivy.int16): ivy.float16,
-    (ivy.float16, ivy.int32): ivy.float16,
-    (ivy.float16, ivy.int64): ivy.float16,
-    (ivy.float16, ivy.bfloat16): ivy.float32,
-    (ivy.float16, ivy.float16): ivy.float16,
-    (ivy.float16, ivy.float32): ivy.float32,
-    (ivy.float16, ivy.float64): ivy.float64,
-    (ivy.float32, ivy.bool): ivy.float32,
-    (ivy.float32, ivy.uint8): ivy.float32,
-    (ivy.float32, ivy.uint16): ivy.float32,
-    (ivy.float32, ivy.uint32): ivy.float32,
-    (ivy.float32, ivy.uint64): ivy.float32,
-    (ivy.float32, ivy.int8): ivy.float32,
-    (ivy.float32, ivy.int16): ivy.float32,
-    (ivy.float32, ivy.int32): ivy.float32,
-    (ivy.float32, ivy.int64): ivy.float32,
-    (ivy.float32, ivy.bfloat16): ivy.float32,
-    (ivy.float32, ivy.float16): ivy.float32,
-    (ivy.float32, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.bool): ivy.float64,
-    (ivy.float64, ivy.uint8): ivy.float64,
-    (ivy.float64, ivy.uint16): ivy.float64,
-    (ivy.float64, ivy.uint32): ivy.float64,
-    (ivy.float64, ivy.uint64): ivy.float64,
-    (ivy.float64, ivy.int8): ivy.float64,
-    (ivy.float64, ivy.int16): ivy.float64,
-    (ivy.float64, ivy.int32): ivy.float64,
-    (ivy.float64, ivy.int64): ivy.float64,
-    (ivy.float64, ivy.bfloat16): ivy.float64,
-    (ivy.float64, ivy.float16): ivy.float64,
-    (ivy.float64, ivy.float32): ivy.float64,
-    (ivy.float64, ivy.float64): ivy.float64,
+    (_ivy.bool, _ivy.bool): _ivy.bool,
+    (_ivy.bool, _ivy.uint8): _ivy.uint8,
+    (_ivy.bool, _ivy.uint16): _ivy.uint16,
+    (_ivy.bool, _ivy.uint32): _ivy.uint32,
+    (_ivy.bool, _ivy.uint64): _ivy.uint64,
+    (_ivy.bool, _ivy.int8): _ivy.int8,
+    (_ivy.bool, _ivy.int16): _ivy.int16,
+    (_ivy.bool, _ivy.int32): _ivy.int32,
+    (_ivy.bool, _ivy.int64): _ivy.int64,
+    (_ivy.bool, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bool, _ivy.float16): _ivy.float16,
+    (_ivy.bool, _ivy.float32): _ivy.float32,
+    (_ivy.bool, _ivy.float64): _ivy.float64,
+    (_ivy.uint8, _ivy.bool): _ivy.uint8,
+    (_ivy.uint8, _ivy.uint8): _ivy.uint8,
+    (_ivy.uint8, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint8, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint8, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint8, _ivy.int8): _ivy.int16,
+    (_ivy.uint8, _ivy.int16): _ivy.int16,
+    (_ivy.uint8, _ivy.int32): _ivy.int32,
+    (_ivy.uint8, _ivy.int64): _ivy.int64,
+    (_ivy.uint8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.uint8, _ivy.float16): _ivy.float16,
+    (_ivy.uint8, _ivy.float32): _ivy.float32,
+    (_ivy.uint8, _ivy.float64): _ivy.float64,
+    (_ivy.uint16, _ivy.bool): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint8): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint16, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint16, _ivy.int8): _ivy.int32,
+    (_ivy.uint16, _ivy.int16): _ivy.int32,
+    (_ivy.uint16, _ivy.int32): _ivy.int32,
+    (_ivy.uint16, _ivy.int64): _ivy.int64,
+    (_ivy.uint16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.uint16, _ivy.float16): _ivy.float16,
+    (_ivy.uint16, _ivy.float32): _ivy.float32,
+    (_ivy.uint16, _ivy.float64): _ivy.float64,
+    (_ivy.uint32, _ivy.bool): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint8): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint16): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint32, _ivy.int8): _ivy.int64,
+    (_ivy.uint32, _ivy.int16): _ivy.int64,
+    (_ivy.uint32, _ivy.int32): _ivy.int64,
+    (_ivy.uint32, _ivy.int64): _ivy.int64,
+    (_ivy.uint32, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.uint32, _ivy.float16): _ivy.float16,
+    (_ivy.uint32, _ivy.float32): _ivy.float32,
+    (_ivy.uint32, _ivy.float64): _ivy.float64,
+    (_ivy.uint64, _ivy.bool): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint8): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint16): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint32): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint64, _ivy.int8): _ivy.float64,
+    (_ivy.uint64, _ivy.int16): _ivy.float64,
+    (_ivy.uint64, _ivy.int32): _ivy.float64,
+    (_ivy.uint64, _ivy.int64): _ivy.float64,
+    (_ivy.uint64, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.uint64, _ivy.float16): _ivy.float16,
+    (_ivy.uint64, _ivy.float32): _ivy.float32,
+    (_ivy.uint64, _ivy.float64): _ivy.float64,
+    (_ivy.int8, _ivy.bool): _ivy.int8,
+    (_ivy.int8, _ivy.uint8): _ivy.int16,
+    (_ivy.int8, _ivy.uint16): _ivy.int32,
+    (_ivy.int8, _ivy.uint32): _ivy.int64,
+    (_ivy.int8, _ivy.uint64): _ivy.float64,
+    (_ivy.int8, _ivy.int8): _ivy.int8,
+    (_ivy.int8, _ivy.int16): _ivy.int16,
+    (_ivy.int8, _ivy.int32): _ivy.int32,
+    (_ivy.int8, _ivy.int64): _ivy.int64,
+    (_ivy.int8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.int8, _ivy.float16): _ivy.float16,
+    (_ivy.int8, _ivy.float32): _ivy.float32,
+    (_ivy.int8, _ivy.float64): _ivy.float64,
+    (_ivy.int16, _ivy.bool): _ivy.int16,
+    (_ivy.int16, _ivy.uint8): _ivy.int16,
+    (_ivy.int16, _ivy.uint16): _ivy.int32,
+    (_ivy.int16, _ivy.uint32): _ivy.int64,
+    (_ivy.int16, _ivy.uint64): _ivy.float64,
+    (_ivy.int16, _ivy.int8): _ivy.int16,
+    (_ivy.int16, _ivy.int16): _ivy.int16,
+    (_ivy.int16, _ivy.int32): _ivy.int32,
+    (_ivy.int16, _ivy.int64): _ivy.int64,
+    (_ivy.int16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.int16, _ivy.float16): _ivy.float16,
+    (_ivy.int16, _ivy.float32): _ivy.float32,
+    (_ivy.int16, _ivy.float64): _ivy.float64,
+    (_ivy.int32, _ivy.bool): _ivy.int32,
+    (_ivy.int32, _ivy.uint8): _ivy.int32,
+    (_ivy.int32, _ivy.uint16): _ivy.int32,
+    (_ivy.int32, _ivy.uint32): _ivy.int64,
+    (_ivy.int32, _ivy.uint64): _ivy.float64,
+    (_ivy.int32, _ivy.int8): _ivy.int32,
+    (_ivy.int32, _ivy.int16): _ivy.int32,
+    (_ivy.int32, _ivy.int32): _ivy.int32,
+    (_ivy.int32, _ivy.int64): _ivy.int64,
+    (_ivy.int32, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.int32, _ivy.float16): _ivy.float16,
+    (_ivy.int32, _ivy.float32): _ivy.float32,
+    (_ivy.int32, _ivy.float64): _ivy.float64,
+    (_ivy.int64, _ivy.bool): _ivy.int64,
+    (_ivy.int64, _ivy.uint8): _ivy.int64,
+    (_ivy.int64, _ivy.uint16): _ivy.int64,
+    (_ivy.int64, _ivy.uint32): _ivy.int64,
+    (_ivy.int64, _ivy.uint64): _ivy.float64,
+    (_ivy.int64, _ivy.int8): _ivy.int64,
+    (_ivy.int64, _ivy.int16): _ivy.int64,
+    (_ivy.int64, _ivy.int32): _ivy.int64,
+    (_ivy.int64, _ivy.int64): _ivy.int64,
+    (_ivy.int64, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.int64, _ivy.float16): _ivy.float16,
+    (_ivy.int64, _ivy.float32): _ivy.float32,
+    (_ivy.int64, _ivy.float64): _ivy.float64,
+    (_ivy.bfloat16, _ivy.bool): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint8): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint32): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint64): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int8): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int32): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int64): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.float16): _ivy.float32,
+    (_ivy.bfloat16, _ivy.float32): _ivy.float32,
+    (_ivy.bfloat16, _ivy.float64): _ivy.float64,
+    (_ivy.float16, _ivy.bool): _ivy.float16,
+    (_ivy.float16, _ivy.uint8): _ivy.float16,
+    (_ivy.float16, _ivy.uint16): _ivy.float16,
+    (_ivy.float16, _ivy.uint32): _ivy.float16,
+    (_ivy.float16, _ivy.uint64): _ivy.float16,
+    (_ivy.float16, _ivy.int8): _ivy.float16,
+    (_ivy.float16, _ivy.int16): _ivy.float16,
+    (_ivy.float16, _ivy.int32): _ivy.float16,
+    (_ivy.float16, _ivy.int64): _ivy.float16,
+    (_ivy.float16, _ivy.bfloat16): _ivy.float32,
+    (_ivy.float16, _ivy.float16): _ivy.float16,
+    (_ivy.float16, _ivy.float32): _ivy.float32,
+    (_ivy.float16, _ivy.float64): _ivy.float64,
+    (_ivy.float32, _ivy.bool): _ivy.float32,
+    (_ivy.float32, _ivy.uint8): _ivy.float32,
+    (_ivy.float32, _ivy.uint16): _ivy.float32,
+    (_ivy.float32, _ivy.uint32): _ivy.float32,
+    (_ivy.float32, _ivy.uint64): _ivy.float32,
+    (_ivy.float32, _ivy.int8): _ivy.float32,
+    (_ivy.float32, _ivy.int16): _ivy.float32,
+    (_ivy.float32, _ivy.int32): _ivy.float32,
+    (_ivy.float32, _ivy.int64): _ivy.float32,
+    (_ivy.float32, _ivy.bfloat16): _ivy.float32,
+    (_ivy.float32, _ivy.float16): _ivy.float32,
+    (_ivy.float32, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.bool): _ivy.float64,
+    (_ivy.float64, _ivy.uint8): _ivy.float64,
+    (_ivy.float64, _ivy.uint16): _ivy.float64,
+    (_ivy.float64, _ivy.uint32): _ivy.float64,
+    (_ivy.float64, _ivy.uint64): _ivy.float64,
+    (_ivy.float64, _ivy.int8): _ivy.float64,
+    (_ivy.float64, _ivy.int16): _ivy.float64,
+    (_ivy.float64, _ivy.int32): _ivy.float64,
+    (_ivy.float64, _ivy.int64): _ivy.float64,
+    (_ivy.float64, _ivy.bfloat16): _ivy.float64,
+    (_ivy.float64, _ivy.float16): _ivy.float64,
+    (_ivy.float64, _ivy.float32): _ivy.float64,
+    (_ivy.float64, _ivy.float64): _ivy.float64,
 }
 
 
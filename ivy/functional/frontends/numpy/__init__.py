@@ -1,5 +1,6 @@
 # flake8: noqa
 import ivy
+from ivy.functional.frontends import _original_ivy as _ivy
 from ivy.exceptions import handle_exceptions
 from typing import Union, Iterable, Tuple
 from numbers import Number
@@ -11,169 +12,169 @@ from .scalars import *
 
 
 numpy_promotion_table = {
-    (ivy.bool, ivy.bool): ivy.bool,
-    (ivy.bool, ivy.int8): ivy.int8,
-    (ivy.bool, ivy.int16): ivy.int16,
-    (ivy.bool, ivy.int32): ivy.int32,
-    (ivy.bool, ivy.int64): ivy.int64,
-    (ivy.bool, ivy.uint8): ivy.uint8,
-    (ivy.bool, ivy.uint16): ivy.uint16,
-    (ivy.bool, ivy.uint32): ivy.uint32,
-    (ivy.bool, ivy.uint64): ivy.uint64,
-    (ivy.bool, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bool, ivy.float16): ivy.float16,
-    (ivy.bool, ivy.float32): ivy.float32,
-    (ivy.bool, ivy.float64): ivy.float64,
-    (ivy.bool, ivy.complex64): ivy.complex64,
-    (ivy.bool, ivy.complex128): ivy.complex128,
-    (ivy.bool, ivy.bool): ivy.bool,
-    (ivy.int8, ivy.bool): ivy.int8,
-    (ivy.int8, ivy.int8): ivy.int8,
-    (ivy.int8, ivy.int16): ivy.int16,
-    (ivy.int8, ivy.int32): ivy.int32,
-    (ivy.int8, ivy.int64): ivy.int64,
-    (ivy.int16, ivy.bool): ivy.int16,
-    (ivy.int16, ivy.int8): ivy.int16,
-    (ivy.int16, ivy.int16): ivy.int16,
-    (ivy.int16, ivy.int32): ivy.int32,
-    (ivy.int16, ivy.int64): ivy.int64,
-    (ivy.int32, ivy.bool): ivy.int32,
-    (ivy.int32, ivy.int8): ivy.int32,
-    (ivy.int32, ivy.int16): ivy.int32,
-    (ivy.int32, ivy.int32): ivy.int32,
-    (ivy.int32, ivy.int64): ivy.int64,
-    (ivy.int64, ivy.bool): ivy.int64,
-    (ivy.int64, ivy.int8): ivy.int64,
-    (ivy.int64, ivy.int16): ivy.int64,
-    (ivy.int64, ivy.int32): ivy.int64,
-    (ivy.int64, ivy.int64): ivy.int64,
-    (ivy.uint8, ivy.bool): ivy.uint8,
-    (ivy.uint8, ivy.uint8): ivy.uint8,
-    (ivy.uint8, ivy.uint16): ivy.uint16,
-    (ivy.uint8, ivy.uint32): ivy.uint32,
-    (ivy.uint8, ivy.uint64): ivy.uint64,
-    (ivy.uint16, ivy.bool): ivy.uint16,
-    (ivy.uint16, ivy.uint8): ivy.uint16,
-    (ivy.uint16, ivy.uint16): ivy.uint16,
-    (ivy.uint16, ivy.uint32): ivy.uint32,
-    (ivy.uint16, ivy.uint64): ivy.uint64,
-    (ivy.uint32, ivy.bool): ivy.uint32,
-    (ivy.uint32, ivy.uint8): ivy.uint32,
-    (ivy.uint32, ivy.uint16): ivy.uint32,
-    (ivy.uint32, ivy.uint32): ivy.uint32,
-    (ivy.uint32, ivy.uint64): ivy.uint64,
-    (ivy.uint64, ivy.bool): ivy.uint64,
-    (ivy.uint64, ivy.uint8): ivy.uint64,
-    (ivy.uint64, ivy.uint16): ivy.uint64,
-    (ivy.uint64, ivy.uint32): ivy.uint64,
-    (ivy.uint64, ivy.uint64): ivy.uint64,
-    (ivy.int8, ivy.uint8): ivy.int16,
-    (ivy.int8, ivy.uint16): ivy.int32,
-    (ivy.int8, ivy.uint32): ivy.int64,
-    (ivy.int16, ivy.uint8): ivy.int16,
-    (ivy.int16, ivy.uint16): ivy.int32,
-    (ivy.int16, ivy.uint32): ivy.int64,
-    (ivy.int32, ivy.uint8): ivy.int32,
-    (ivy.int32, ivy.uint16): ivy.int32,
-    (ivy.int32, ivy.uint32): ivy.int64,
-    (ivy.int64, ivy.uint8): ivy.int64,
-    (ivy.int64, ivy.uint16): ivy.int64,
-    (ivy.int64, ivy.uint32): ivy.int64,
-    (ivy.uint8, ivy.int8): ivy.int16,
-    (ivy.uint16, ivy.int8): ivy.int32,
-    (ivy.uint32, ivy.int8): ivy.int64,
-    (ivy.uint8, ivy.int16): ivy.int16,
-    (ivy.uint16, ivy.int16): ivy.int32,
-    (ivy.uint32, ivy.int16): ivy.int64,
-    (ivy.uint8, ivy.int32): ivy.int32,
-    (ivy.uint16, ivy.int32): ivy.int32,
-    (ivy.uint32, ivy.int32): ivy.int64,
-    (ivy.uint8, ivy.int64): ivy.int64,
-    (ivy.uint16, ivy.int64): ivy.int64,
-    (ivy.uint32, ivy.int64): ivy.int64,
-    (ivy.float16, ivy.bool): ivy.float16,
-    (ivy.float16, ivy.float16): ivy.float16,
-    (ivy.float16, ivy.float32): ivy.float32,
-    (ivy.float16, ivy.float64): ivy.float64,
-    (ivy.float32, ivy.bool): ivy.float32,
-    (ivy.float32, ivy.float16): ivy.float32,
-    (ivy.float32, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.bool): ivy.float64,
-    (ivy.float64, ivy.float16): ivy.float64,
-    (ivy.float64, ivy.float32): ivy.float64,
-    (ivy.float64, ivy.float64): ivy.float64,
-    (ivy.uint64, ivy.int8): ivy.float64,
-    (ivy.int8, ivy.uint64): ivy.float64,
-    (ivy.uint64, ivy.int16): ivy.float64,
-    (ivy.int16, ivy.uint64): ivy.float64,
-    (ivy.uint64, ivy.int32): ivy.float64,
-    (ivy.int32, ivy.uint64): ivy.float64,
-    (ivy.uint64, ivy.int64): ivy.float64,
-    (ivy.int64, ivy.uint64): ivy.float64,
-    (ivy.int8, ivy.float16): ivy.float16,
-    (ivy.float16, ivy.int8): ivy.float16,
-    (ivy.int8, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.int8): ivy.float32,
-    (ivy.int8, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.int8): ivy.float64,
-    (ivy.int16, ivy.float16): ivy.float32,
-    (ivy.float16, ivy.int16): ivy.float32,
-    (ivy.int16, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.int16): ivy.float32,
-    (ivy.int16, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.int16): ivy.float64,
-    (ivy.int32, ivy.float16): ivy.float64,
-    (ivy.float16, ivy.int32): ivy.float64,
-    (ivy.int32, ivy.float32): ivy.float64,
-    (ivy.float32, ivy.int32): ivy.float64,
-    (ivy.int32, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.int32): ivy.float64,
-    (ivy.int64, ivy.float16): ivy.float64,
-    (ivy.float16, ivy.int64): ivy.float64,
-    (ivy.int64, ivy.float32): ivy.float64,
-    (ivy.float32, ivy.int64): ivy.float64,
-    (ivy.int64, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.int64): ivy.float64,
-    (ivy.uint8, ivy.float16): ivy.float16,
-    (ivy.float16, ivy.uint8): ivy.float16,
-    (ivy.uint8, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.uint8): ivy.float32,
-    (ivy.uint8, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.uint8): ivy.float64,
-    (ivy.uint16, ivy.float16): ivy.float32,
-    (ivy.float16, ivy.uint16): ivy.float32,
-    (ivy.uint16, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.uint16): ivy.float32,
-    (ivy.uint16, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.uint16): ivy.float64,
-    (ivy.uint32, ivy.float16): ivy.float64,
-    (ivy.float16, ivy.uint32): ivy.float64,
-    (ivy.uint32, ivy.float32): ivy.float64,
-    (ivy.float32, ivy.uint32): ivy.float64,
-    (ivy.uint32, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.uint32): ivy.float64,
-    (ivy.uint64, ivy.float16): ivy.float64,
-    (ivy.float16, ivy.uint64): ivy.float64,
-    (ivy.uint64, ivy.float32): ivy.float64,
-    (ivy.float32, ivy.uint64): ivy.float64,
-    (ivy.uint64, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.uint64): ivy.float64,
-    (ivy.bfloat16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint8): ivy.bfloat16,
-    (ivy.uint8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int8): ivy.bfloat16,
-    (ivy.int8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.bfloat16): ivy.float32,
-    (ivy.bfloat16, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.bfloat16): ivy.float64,
-    (ivy.complex64, ivy.bool): ivy.complex64,
-    (ivy.complex64, ivy.complex64): ivy.complex64,
-    (ivy.complex64, ivy.complex128): ivy.complex128,
-    (ivy.complex128, ivy.bool): ivy.complex128,
-    (ivy.complex128, ivy.complex64): ivy.complex128,
-    (ivy.complex128, ivy.complex128): ivy.complex128,
+    (_ivy.bool, _ivy.bool): _ivy.bool,
+    (_ivy.bool, _ivy.int8): _ivy.int8,
+    (_ivy.bool, _ivy.int16): _ivy.int16,
+    (_ivy.bool, _ivy.int32): _ivy.int32,
+    (_ivy.bool, _ivy.int64): _ivy.int64,
+    (_ivy.bool, _ivy.uint8): _ivy.uint8,
+    (_ivy.bool, _ivy.uint16): _ivy.uint16,
+    (_ivy.bool, _ivy.uint32): _ivy.uint32,
+    (_ivy.bool, _ivy.uint64): _ivy.uint64,
+    (_ivy.bool, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bool, _ivy.float16): _ivy.float16,
+    (_ivy.bool, _ivy.float32): _ivy.float32,
+    (_ivy.bool, _ivy.float64): _ivy.float64,
+    (_ivy.bool, _ivy.complex64): _ivy.complex64,
+    (_ivy.bool, _ivy.complex128): _ivy.complex128,
+    (_ivy.bool, _ivy.bool): _ivy.bool,
+    (_ivy.int8, _ivy.bool): _ivy.int8,
+    (_ivy.int8, _ivy.int8): _ivy.int8,
+    (_ivy.int8, _ivy.int16): _ivy.int16,
+    (_ivy.int8, _ivy.int32): _ivy.int32,
+    (_ivy.int8, _ivy.int64): _ivy.int64,
+    (_ivy.int16, _ivy.bool): _ivy.int16,
+    (_ivy.int16, _ivy.int8): _ivy.int16,
+    (_ivy.int16, _ivy.int16): _ivy.int16,
+    (_ivy.int16, _ivy.int32): _ivy.int32,
+    (_ivy.int16, _ivy.int64): _ivy.int64,
+    (_ivy.int32, _ivy.bool): _ivy.int32,
+    (_ivy.int32, _ivy.int8): _ivy.int32,
+    (_ivy.int32, _ivy.int16): _ivy.int32,
+    (_ivy.int32, _ivy.int32): _ivy.int32,
+    (_ivy.int32, _ivy.int64): _ivy.int64,
+    (_ivy.int64, _ivy.bool): _ivy.int64,
+    (_ivy.int64, _ivy.int8): _ivy.int64,
+    (_ivy.int64, _ivy.int16): _ivy.int64,
+    (_ivy.int64, _ivy.int32): _ivy.int64,
+    (_ivy.int64, _ivy.int64): _ivy.int64,
+    (_ivy.uint8, _ivy.bool): _ivy.uint8,
+    (_ivy.uint8, _ivy.uint8): _ivy.uint8,
+    (_ivy.uint8, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint8, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint8, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint16, _ivy.bool): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint8): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint16, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint32, _ivy.bool): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint8): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint16): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint64, _ivy.bool): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint8): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint16): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint32): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint64): _ivy.uint64,
+    (_ivy.int8, _ivy.uint8): _ivy.int16,
+    (_ivy.int8, _ivy.uint16): _ivy.int32,
+    (_ivy.int8, _ivy.uint32): _ivy.int64,
+    (_ivy.int16, _ivy.uint8): _ivy.int16,
+    (_ivy.int16, _ivy.uint16): _ivy.int32,
+    (_ivy.int16, _ivy.uint32): _ivy.int64,
+    (_ivy.int32, _ivy.uint8): _ivy.int32,
+    (_ivy.int32, _ivy.uint16): _ivy.int32,
+    (_ivy.int32, _ivy.uint32): _ivy.int64,
+    (_ivy.int64, _ivy.uint8): _ivy.int64,
+    (_ivy.int64, _ivy.uint16): _ivy.int64,
+    (_ivy.int64, _ivy.uint32): _ivy.int64,
+    (_ivy.uint8, _ivy.int8): _ivy.int16,
+    (_ivy.uint16, _ivy.int8): _ivy.int32,
+    (_ivy.uint32, _ivy.int8): _ivy.int64,
+    (_ivy.uint8, _ivy.int16): _ivy.int16,
+    (_ivy.uint16, _ivy.int16): _ivy.int32,
+    (_ivy.uint32, _ivy.int16): _ivy.int64,
+    (_ivy.uint8, _ivy.int32): _ivy.int32,
+    (_ivy.uint16, _ivy.int32): _ivy.int32,
+    (_ivy.uint32, _ivy.int32): _ivy.int64,
+    (_ivy.uint8, _ivy.int64): _ivy.int64,
+    (_ivy.uint16, _ivy.int64): _ivy.int64,
+    (_ivy.uint32, _ivy.int64): _ivy.int64,
+    (_ivy.float16, _ivy.bool): _ivy.float16,
+    (_ivy.float16, _ivy.float16): _ivy.float16,
+    (_ivy.float16, _ivy.float32): _ivy.float32,
+    (_ivy.float16, _ivy.float64): _ivy.float64,
+    (_ivy.float32, _ivy.bool): _ivy.float32,
+    (_ivy.float32, _ivy.float16): _ivy.float32,
+    (_ivy.float32, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.bool): _ivy.float64,
+    (_ivy.float64, _ivy.float16): _ivy.float64,
+    (_ivy.float64, _ivy.float32): _ivy.float64,
+    (_ivy.float64, _ivy.float64): _ivy.float64,
+    (_ivy.uint64, _ivy.int8): _ivy.float64,
+    (_ivy.int8, _ivy.uint64): _ivy.float64,
+    (_ivy.uint64, _ivy.int16): _ivy.float64,
+    (_ivy.int16, _ivy.uint64): _ivy.float64,
+    (_ivy.uint64, _ivy.int32): _ivy.float64,
+    (_ivy.int32, _ivy.uint64): _ivy.float64,
+    (_ivy.uint64, _ivy.int64): _ivy.float64,
+    (_ivy.int64, _ivy.uint64): _ivy.float64,
+    (_ivy.int8, _ivy.float16): _ivy.float16,
+    (_ivy.float16, _ivy.int8): _ivy.float16,
+    (_ivy.int8, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.int8): _ivy.float32,
+    (_ivy.int8, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.int8): _ivy.float64,
+    (_ivy.int16, _ivy.float16): _ivy.float32,
+    (_ivy.float16, _ivy.int16): _ivy.float32,
+    (_ivy.int16, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.int16): _ivy.float32,
+    (_ivy.int16, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.int16): _ivy.float64,
+    (_ivy.int32, _ivy.float16): _ivy.float64,
+    (_ivy.float16, _ivy.int32): _ivy.float64,
+    (_ivy.int32, _ivy.float32): _ivy.float64,
+    (_ivy.float32, _ivy.int32): _ivy.float64,
+    (_ivy.int32, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.int32): _ivy.float64,
+    (_ivy.int64, _ivy.float16): _ivy.float64,
+    (_ivy.float16, _ivy.int64): _ivy.float64,
+    (_ivy.int64, _ivy.float32): _ivy.float64,
+    (_ivy.float32, _ivy.int64): _ivy.float64,
+    (_ivy.int64, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.int64): _ivy.float64,
+    (_ivy.uint8, _ivy.float16): _ivy.float16,
+    (_ivy.float16, _ivy.uint8): _ivy.float16,
+    (_ivy.uint8, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.uint8): _ivy.float32,
+    (_ivy.uint8, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.uint8): _ivy.float64,
+    (_ivy.uint16, _ivy.float16): _ivy.float32,
+    (_ivy.float16, _ivy.uint16): _ivy.float32,
+    (_ivy.uint16, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.uint16): _ivy.float32,
+    (_ivy.uint16, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.uint16): _ivy.float64,
+    (_ivy.uint32, _ivy.float16): _ivy.float64,
+    (_ivy.float16, _ivy.uint32): _ivy.float64,
+    (_ivy.uint32, _ivy.float32): _ivy.float64,
+    (_ivy.float32, _ivy.uint32): _ivy.float64,
+    (_ivy.uint32, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.uint32): _ivy.float64,
+    (_ivy.uint64, _ivy.float16): _ivy.float64,
+    (_ivy.float16, _ivy.uint64): _ivy.float64,
+    (_ivy.uint64, _ivy.float32): _ivy.float64,
+    (_ivy.float32, _ivy.uint64): _ivy.float64,
+    (_ivy.uint64, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.uint64): _ivy.float64,
+    (_ivy.bfloat16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint8): _ivy.bfloat16,
+    (_ivy.uint8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int8): _ivy.bfloat16,
+    (_ivy.int8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.bfloat16): _ivy.float32,
+    (_ivy.bfloat16, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.bfloat16): _ivy.float64,
+    (_ivy.complex64, _ivy.bool): _ivy.complex64,
+    (_ivy.complex64, _ivy.complex64): _ivy.complex64,
+    (_ivy.complex64, _ivy.complex128): _ivy.complex128,
+    (_ivy.complex128, _ivy.bool): _ivy.complex128,
+    (_ivy.complex128, _ivy.complex64): _ivy.complex128,
+    (_ivy.complex128, _ivy.complex128): _ivy.complex128,
 }
 
 numpy_str_to_type_table = {
@@ -226,121 +227,121 @@ numpy_type_to_str_and_num_table = {
 }
 
 numpy_scalar_to_dtype = {
-    bool_: ivy.bool,
-    number: ivy.float64,
-    integer: ivy.int64,
-    signedinteger: ivy.int64,
-    byte: ivy.int8,
-    short: ivy.int16,
-    intc: ivy.int32,
-    longlong: ivy.int64,
-    int_: ivy.int64,
-    unsignedinteger: ivy.uint64,
-    ubyte: ivy.uint8,
-    ushort: ivy.uint16,
-    uintc: ivy.uint32,
-    ulonglong: ivy.uint64,
-    uint: ivy.uint64,
-    inexact: ivy.float64,
-    floating: ivy.float64,
-    half: ivy.float16,
-    single: ivy.float32,
-    float_: ivy.float64,
-    complexfloating: ivy.complex128,
-    csingle: ivy.complex64,
-    complex_: ivy.complex128,
+    bool_: _ivy.bool,
+    number: _ivy.float64,
+    integer: _ivy.int64,
+    signedinteger: _ivy.int64,
+    byte: _ivy.int8,
+    short: _ivy.int16,
+    intc: _ivy.int32,
+    longlong: _ivy.int64,
+    int_: _ivy.int64,
+    unsignedinteger: _ivy.uint64,
+    ubyte: _ivy.uint8,
+    ushort: _ivy.uint16,
+    uintc: _ivy.uint32,
+    ulonglong: _ivy.uint64,
+    uint: _ivy.uint64,
+    inexact: _ivy.float64,
+    floating: _ivy.float64,
+    half: _ivy.float16,
+    single: _ivy.float32,
+    float_: _ivy.float64,
+    complexfloating: _ivy.complex128,
+    csingle: _ivy.complex64,
+    complex_: _ivy.complex128,
 }
 
 numpy_dtype_to_scalar = {v: k for k, v in numpy_scalar_to_dtype.items()}
 
 numpy_casting_rules = {
-    ivy.bool: [
-        ivy.bool,
-        ivy.uint8,
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.int8,
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.bool: [
+        _ivy.bool,
+        _ivy.uint8,
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.int8,
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.int8: [
-        ivy.int8,
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int8: [
+        _ivy.int8,
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.int16: [
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int16: [
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.int32: [ivy.int32, ivy.int64, ivy.float64, ivy.complex128],
-    ivy.int64: [ivy.int64, ivy.float64, ivy.complex128],
-    ivy.uint8: [
-        ivy.uint8,
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.int16,
-        ivy.int32,
-        ivy.int64,
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.int32: [_ivy.int32, _ivy.int64, _ivy.float64, _ivy.complex128],
+    _ivy.int64: [_ivy.int64, _ivy.float64, _ivy.complex128],
+    _ivy.uint8: [
+        _ivy.uint8,
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.int16,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.uint16: [
-        ivy.uint16,
-        ivy.uint32,
-        ivy.uint64,
-        ivy.int32,
-        ivy.int64,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.uint16: [
+        _ivy.uint16,
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.int32,
+        _ivy.int64,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.uint32: [
-        ivy.uint32,
-        ivy.uint64,
-        ivy.int64,
-        ivy.float64,
-        ivy.complex128,
+    _ivy.uint32: [
+        _ivy.uint32,
+        _ivy.uint64,
+        _ivy.int64,
+        _ivy.float64,
+        _ivy.complex128,
     ],
-    ivy.uint64: [ivy.uint64, ivy.float64, ivy.complex128],
-    ivy.float16: [
-        ivy.float16,
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.uint64: [_ivy.uint64, _ivy.float64, _ivy.complex128],
+    _ivy.float16: [
+        _ivy.float16,
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.float32: [
-        ivy.float32,
-        ivy.float64,
-        ivy.complex64,
-        ivy.complex128,
+    _ivy.float32: [
+        _ivy.float32,
+        _ivy.float64,
+        _ivy.complex64,
+        _ivy.complex128,
     ],
-    ivy.float64: [ivy.float64, ivy.complex128],
-    ivy.complex64: [ivy.complex64, ivy.complex128],
-    ivy.complex128: [ivy.complex128],
+    _ivy.float64: [_ivy.float64, _ivy.complex128],
+    _ivy.complex64: [_ivy.complex64, _ivy.complex128],
+    _ivy.complex128: [_ivy.complex128],
 }
 
 
@@ -434,3 +435,10 @@ from .linalg.decompositions import cholesky, qr, svd
 from .linalg.norms_and_other_numbers import det, slogdet, matrix_rank, norm, trace
 
 from .linalg.solving_equations_and_inverting_matrices import pinv, inv, solve
+
+
+# point the version specific functions to the version of the installed framework
+import sys
+from ivy.functional.frontends import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
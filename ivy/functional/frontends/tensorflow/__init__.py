@@ -2,26 +2,27 @@
 # local
 from ivy.exceptions import handle_exceptions
 import ivy
+from ivy.functional.frontends import _original_ivy as _ivy
 from numbers import Number
 from typing import Union, Tuple, Iterable
 from .dtypes import DType
 
 tensorflow_enum_to_type = {
-    1: ivy.float32,
-    2: ivy.float64,
-    3: ivy.int32,
-    4: ivy.uint8,
-    5: ivy.int16,
-    6: ivy.int8,
-    8: ivy.complex64,
-    9: ivy.int64,
-    10: ivy.bool,
-    14: ivy.bfloat16,
-    17: ivy.uint16,
-    18: ivy.complex128,
-    19: ivy.float16,
-    22: ivy.uint32,
-    23: ivy.uint64,
+    1: _ivy.float32,
+    2: _ivy.float64,
+    3: _ivy.int32,
+    4: _ivy.uint8,
+    5: _ivy.int16,
+    6: _ivy.int8,
+    8: _ivy.complex64,
+    9: _ivy.int64,
+    10: _ivy.bool,
+    14: _ivy.bfloat16,
+    17: _ivy.uint16,
+    18: _ivy.complex128,
+    19: _ivy.float16,
+    22: _ivy.uint32,
+    23: _ivy.uint64,
 }
 
 tensorflow_type_to_enum = {v: k for k, v in tensorflow_enum_to_type.items()}
@@ -46,153 +47,153 @@ double = float64
 half = float16
 
 standard_promotion_table = {
-    (ivy.int8, ivy.int8): ivy.int8,
-    (ivy.int8, ivy.int16): ivy.int16,
-    (ivy.int8, ivy.int32): ivy.int32,
-    (ivy.int8, ivy.int64): ivy.int64,
-    (ivy.int16, ivy.int8): ivy.int16,
-    (ivy.int16, ivy.int16): ivy.int16,
-    (ivy.int16, ivy.int32): ivy.int32,
-    (ivy.int16, ivy.int64): ivy.int64,
-    (ivy.int32, ivy.int8): ivy.int32,
-    (ivy.int32, ivy.int16): ivy.int32,
-    (ivy.int32, ivy.int32): ivy.int32,
-    (ivy.int32, ivy.int64): ivy.int64,
-    (ivy.int64, ivy.int8): ivy.int64,
-    (ivy.int64, ivy.int16): ivy.int64,
-    (ivy.int64, ivy.int32): ivy.int64,
-    (ivy.int64, ivy.int64): ivy.int64,
-    (ivy.uint8, ivy.uint8): ivy.uint8,
-    (ivy.uint8, ivy.uint16): ivy.uint16,
-    (ivy.uint8, ivy.uint32): ivy.uint32,
-    (ivy.uint8, ivy.uint64): ivy.uint64,
-    (ivy.uint16, ivy.uint8): ivy.uint16,
-    (ivy.uint16, ivy.uint16): ivy.uint16,
-    (ivy.uint16, ivy.uint32): ivy.uint32,
-    (ivy.uint16, ivy.uint64): ivy.uint64,
-    (ivy.uint32, ivy.uint8): ivy.uint32,
-    (ivy.uint32, ivy.uint16): ivy.uint32,
-    (ivy.uint32, ivy.uint32): ivy.uint32,
-    (ivy.uint32, ivy.uint64): ivy.uint64,
-    (ivy.uint64, ivy.uint8): ivy.uint64,
-    (ivy.uint64, ivy.uint16): ivy.uint64,
-    (ivy.uint64, ivy.uint32): ivy.uint64,
-    (ivy.uint64, ivy.uint64): ivy.uint64,
-    (ivy.int8, ivy.uint8): ivy.int16,
-    (ivy.int8, ivy.uint16): ivy.int32,
-    (ivy.int8, ivy.uint32): ivy.int64,
-    (ivy.int8, ivy.uint64): ivy.float64,
-    (ivy.int16, ivy.uint8): ivy.int16,
-    (ivy.int16, ivy.uint16): ivy.int32,
-    (ivy.int16, ivy.uint32): ivy.int64,
-    (ivy.int16, ivy.uint64): ivy.float64,
-    (ivy.int32, ivy.uint8): ivy.int32,
-    (ivy.int32, ivy.uint16): ivy.int32,
-    (ivy.int32, ivy.uint32): ivy.int64,
-    (ivy.int32, ivy.uint64): ivy.float64,
-    (ivy.int64, ivy.uint8): ivy.int64,
-    (ivy.int64, ivy.uint16): ivy.int64,
-    (ivy.int64, ivy.uint32): ivy.int64,
-    (ivy.int64, ivy.uint64): ivy.float64,
-    (ivy.uint8, ivy.int8): ivy.int16,
-    (ivy.uint8, ivy.int16): ivy.int16,
-    (ivy.uint8, ivy.int32): ivy.int32,
-    (ivy.uint8, ivy.int64): ivy.int64,
-    (ivy.uint16, ivy.int8): ivy.int32,
-    (ivy.uint16, ivy.int16): ivy.int32,
-    (ivy.uint16, ivy.int32): ivy.int32,
-    (ivy.uint16, ivy.int64): ivy.int64,
-    (ivy.uint32, ivy.int8): ivy.int64,
-    (ivy.uint32, ivy.int16): ivy.int64,
-    (ivy.uint32, ivy.int32): ivy.int64,
-    (ivy.uint32, ivy.int64): ivy.int64,
-    (ivy.uint64, ivy.int8): ivy.float64,
-    (ivy.uint64, ivy.int16): ivy.float64,
-    (ivy.uint64, ivy.int32): ivy.float64,
-    (ivy.uint64, ivy.int64): ivy.float64,
-    (ivy.float16, ivy.float16): ivy.float16,
-    (ivy.float16, ivy.float32): ivy.float32,
-    (ivy.float16, ivy.float64): ivy.float64,
-    (ivy.float32, ivy.float16): ivy.float32,
-    (ivy.float32, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.float16): ivy.float64,
-    (ivy.float64, ivy.float32): ivy.float64,
-    (ivy.float64, ivy.float64): ivy.float64,
-    (ivy.bool, ivy.bool): ivy.bool,
+    (_ivy.int8, _ivy.int8): _ivy.int8,
+    (_ivy.int8, _ivy.int16): _ivy.int16,
+    (_ivy.int8, _ivy.int32): _ivy.int32,
+    (_ivy.int8, _ivy.int64): _ivy.int64,
+    (_ivy.int16, _ivy.int8): _ivy.int16,
+    (_ivy.int16, _ivy.int16): _ivy.int16,
+    (_ivy.int16, _ivy.int32): _ivy.int32,
+    (_ivy.int16, _ivy.int64): _ivy.int64,
+    (_ivy.int32, _ivy.int8): _ivy.int32,
+    (_ivy.int32, _ivy.int16): _ivy.int32,
+    (_ivy.int32, _ivy.int32): _ivy.int32,
+    (_ivy.int32, _ivy.int64): _ivy.int64,
+    (_ivy.int64, _ivy.int8): _ivy.int64,
+    (_ivy.int64, _ivy.int16): _ivy.int64,
+    (_ivy.int64, _ivy.int32): _ivy.int64,
+    (_ivy.int64, _ivy.int64): _ivy.int64,
+    (_ivy.uint8, _ivy.uint8): _ivy.uint8,
+    (_ivy.uint8, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint8, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint8, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint16, _ivy.uint8): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint16): _ivy.uint16,
+    (_ivy.uint16, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint16, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint32, _ivy.uint8): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint16): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint32): _ivy.uint32,
+    (_ivy.uint32, _ivy.uint64): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint8): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint16): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint32): _ivy.uint64,
+    (_ivy.uint64, _ivy.uint64): _ivy.uint64,
+    (_ivy.int8, _ivy.uint8): _ivy.int16,
+    (_ivy.int8, _ivy.uint16): _ivy.int32,
+    (_ivy.int8, _ivy.uint32): _ivy.int64,
+    (_ivy.int8, _ivy.uint64): _ivy.float64,
+    (_ivy.int16, _ivy.uint8): _ivy.int16,
+    (_ivy.int16, _ivy.uint16): _ivy.int32,
+    (_ivy.int16, _ivy.uint32): _ivy.int64,
+    (_ivy.int16, _ivy.uint64): _ivy.float64,
+    (_ivy.int32, _ivy.uint8): _ivy.int32,
+    (_ivy.int32, _ivy.uint16): _ivy.int32,
+    (_ivy.int32, _ivy.uint32): _ivy.int64,
+    (_ivy.int32, _ivy.uint64): _ivy.float64,
+    (_ivy.int64, _ivy.uint8): _ivy.int64,
+    (_ivy.int64, _ivy.uint16): _ivy.int64,
+    (_ivy.int64, _ivy.uint32): _ivy.int64,
+    (_ivy.int64, _ivy.uint64): _ivy.float64,
+    (_ivy.uint8, _ivy.int8): _ivy.int16,
+    (_ivy.uint8, _ivy.int16): _ivy.int16,
+    (_ivy.uint8, _ivy.int32): _ivy.int32,
+    (_ivy.uint8, _ivy.int64): _ivy.int64,
+    (_ivy.uint16, _ivy.int8): _ivy.int32,
+    (_ivy.uint16, _ivy.int16): _ivy.int32,
+    (_ivy.uint16, _ivy.int32): _ivy.int32,
+    (_ivy.uint16, _ivy.int64): _ivy.int64,
+    (_ivy.uint32, _ivy.int8): _ivy.int64,
+    (_ivy.uint32, _ivy.int16): _ivy.int64,
+    (_ivy.uint32, _ivy.int32): _ivy.int64,
+    (_ivy.uint32, _ivy.int64): _ivy.int64,
+    (_ivy.uint64, _ivy.int8): _ivy.float64,
+    (_ivy.uint64, _ivy.int16): _ivy.float64,
+    (_ivy.uint64, _ivy.int32): _ivy.float64,
+    (_ivy.uint64, _ivy.int64): _ivy.float64,
+    (_ivy.float16, _ivy.float16): _ivy.float16,
+    (_ivy.float16, _ivy.float32): _ivy.float32,
+    (_ivy.float16, _ivy.float64): _ivy.float64,
+    (_ivy.float32, _ivy.float16): _ivy.float32,
+    (_ivy.float32, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.float16): _ivy.float64,
+    (_ivy.float64, _ivy.float32): _ivy.float64,
+    (_ivy.float64, _ivy.float64): _ivy.float64,
+    (_ivy.bool, _ivy.bool): _ivy.bool,
 }
 
 extra_promotion_table = {
-    (ivy.int8, ivy.float16): ivy.float16,
-    (ivy.int8, ivy.float32): ivy.float32,
-    (ivy.int8, ivy.float64): ivy.float64,
-    (ivy.int16, ivy.float16): ivy.float32,
-    (ivy.int16, ivy.float32): ivy.float32,
-    (ivy.int16, ivy.float64): ivy.float64,
-    (ivy.int32, ivy.float16): ivy.float64,
-    (ivy.int32, ivy.float32): ivy.float64,
-    (ivy.int32, ivy.float64): ivy.float64,
-    (ivy.int64, ivy.float16): ivy.float64,
-    (ivy.int64, ivy.float32): ivy.float64,
-    (ivy.int64, ivy.float64): ivy.float64,
-    (ivy.uint8, ivy.float16): ivy.float16,
-    (ivy.uint8, ivy.float32): ivy.float32,
-    (ivy.uint8, ivy.float64): ivy.float64,
-    (ivy.uint16, ivy.float16): ivy.float32,
-    (ivy.uint16, ivy.float32): ivy.float32,
-    (ivy.uint16, ivy.float64): ivy.float64,
-    (ivy.uint32, ivy.float16): ivy.float64,
-    (ivy.uint32, ivy.float32): ivy.float64,
-    (ivy.uint32, ivy.float64): ivy.float64,
-    (ivy.uint64, ivy.float16): ivy.float64,
-    (ivy.uint64, ivy.float32): ivy.float64,
-    (ivy.uint64, ivy.float64): ivy.float64,
-    (ivy.float16, ivy.int8): ivy.float16,
-    (ivy.float16, ivy.int16): ivy.float32,
-    (ivy.float16, ivy.int32): ivy.float64,
-    (ivy.float16, ivy.int64): ivy.float64,
-    (ivy.float32, ivy.int8): ivy.float32,
-    (ivy.float32, ivy.int16): ivy.float32,
-    (ivy.float32, ivy.int32): ivy.float64,
-    (ivy.float32, ivy.int64): ivy.float64,
-    (ivy.float64, ivy.int8): ivy.float64,
-    (ivy.float64, ivy.int16): ivy.float64,
-    (ivy.float64, ivy.int32): ivy.float64,
-    (ivy.float64, ivy.int64): ivy.float64,
-    (ivy.float16, ivy.uint8): ivy.float16,
-    (ivy.float16, ivy.uint16): ivy.float32,
-    (ivy.float16, ivy.uint32): ivy.float64,
-    (ivy.float32, ivy.uint8): ivy.float32,
-    (ivy.float32, ivy.uint16): ivy.float32,
-    (ivy.float32, ivy.uint32): ivy.float64,
-    (ivy.float32, ivy.uint64): ivy.float64,
-    (ivy.float64, ivy.uint8): ivy.float64,
-    (ivy.float64, ivy.uint16): ivy.float64,
-    (ivy.float64, ivy.uint32): ivy.float64,
-    (ivy.float64, ivy.uint64): ivy.float64,
-    (ivy.bfloat16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint8): ivy.bfloat16,
-    (ivy.uint8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint16): ivy.bfloat16,
-    (ivy.uint16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint32): ivy.bfloat16,
-    (ivy.uint32, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.uint64): ivy.bfloat16,
-    (ivy.uint64, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int8): ivy.bfloat16,
-    (ivy.int8, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int16): ivy.bfloat16,
-    (ivy.int16, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int32): ivy.bfloat16,
-    (ivy.int32, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.int64): ivy.bfloat16,
-    (ivy.int64, ivy.bfloat16): ivy.bfloat16,
-    (ivy.bfloat16, ivy.float16): ivy.float32,
-    (ivy.float16, ivy.bfloat16): ivy.float32,
-    (ivy.bfloat16, ivy.float32): ivy.float32,
-    (ivy.float32, ivy.bfloat16): ivy.float32,
-    (ivy.bfloat16, ivy.float64): ivy.float64,
-    (ivy.float64, ivy.bfloat16): ivy.float64,
+    (_ivy.int8, _ivy.float16): _ivy.float16,
+    (_ivy.int8, _ivy.float32): _ivy.float32,
+    (_ivy.int8, _ivy.float64): _ivy.float64,
+    (_ivy.int16, _ivy.float16): _ivy.float32,
+    (_ivy.int16, _ivy.float32): _ivy.float32,
+    (_ivy.int16, _ivy.float64): _ivy.float64,
+    (_ivy.int32, _ivy.float16): _ivy.float64,
+    (_ivy.int32, _ivy.float32): _ivy.float64,
+    (_ivy.int32, _ivy.float64): _ivy.float64,
+    (_ivy.int64, _ivy.float16): _ivy.float64,
+    (_ivy.int64, _ivy.float32): _ivy.float64,
+    (_ivy.int64, _ivy.float64): _ivy.float64,
+    (_ivy.uint8, _ivy.float16): _ivy.float16,
+    (_ivy.uint8, _ivy.float32): _ivy.float32,
+    (_ivy.uint8, _ivy.float64): _ivy.float64,
+    (_ivy.uint16, _ivy.float16): _ivy.float32,
+    (_ivy.uint16, _ivy.float32): _ivy.float32,
+    (_ivy.uint16, _ivy.float64): _ivy.float64,
+    (_ivy.uint32, _ivy.float16): _ivy.float64,
+    (_ivy.uint32, _ivy.float32): _ivy.float64,
+    (_ivy.uint32, _ivy.float64): _ivy.float64,
+    (_ivy.uint64, _ivy.float16): _ivy.float64,
+    (_ivy.uint64, _ivy.float32): _ivy.float64,
+    (_ivy.uint64, _ivy.float64): _ivy.float64,
+    (_ivy.float16, _ivy.int8): _ivy.float16,
+    (_ivy.float16, _ivy.int16): _ivy.float32,
+    (_ivy.float16, _ivy.int32): _ivy.float64,
+    (_ivy.float16, _ivy.int64): _ivy.float64,
+    (_ivy.float32, _ivy.int8): _ivy.float32,
+    (_ivy.float32, _ivy.int16): _ivy.float32,
+    (_ivy.float32, _ivy.int32): _ivy.float64,
+    (_ivy.float32, _ivy.int64): _ivy.float64,
+    (_ivy.float64, _ivy.int8): _ivy.float64,
+    (_ivy.float64, _ivy.int16): _ivy.float64,
+    (_ivy.float64, _ivy.int32): _ivy.float64,
+    (_ivy.float64, _ivy.int64): _ivy.float64,
+    (_ivy.float16, _ivy.uint8): _ivy.float16,
+    (_ivy.float16, _ivy.uint16): _ivy.float32,
+    (_ivy.float16, _ivy.uint32): _ivy.float64,
+    (_ivy.float32, _ivy.uint8): _ivy.float32,
+    (_ivy.float32, _ivy.uint16): _ivy.float32,
+    (_ivy.float32, _ivy.uint32): _ivy.float64,
+    (_ivy.float32, _ivy.uint64): _ivy.float64,
+    (_ivy.float64, _ivy.uint8): _ivy.float64,
+    (_ivy.float64, _ivy.uint16): _ivy.float64,
+    (_ivy.float64, _ivy.uint32): _ivy.float64,
+    (_ivy.float64, _ivy.uint64): _ivy.float64,
+    (_ivy.bfloat16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint8): _ivy.bfloat16,
+    (_ivy.uint8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint16): _ivy.bfloat16,
+    (_ivy.uint16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint32): _ivy.bfloat16,
+    (_ivy.uint32, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.uint64): _ivy.bfloat16,
+    (_ivy.uint64, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int8): _ivy.bfloat16,
+    (_ivy.int8, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int16): _ivy.bfloat16,
+    (_ivy.int16, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int32): _ivy.bfloat16,
+    (_ivy.int32, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.int64): _ivy.bfloat16,
+    (_ivy.int64, _ivy.bfloat16): _ivy.bfloat16,
+    (_ivy.bfloat16, _ivy.float16): _ivy.float32,
+    (_ivy.float16, _ivy.bfloat16): _ivy.float32,
+    (_ivy.bfloat16, _ivy.float32): _ivy.float32,
+    (_ivy.float32, _ivy.bfloat16): _ivy.float32,
+    (_ivy.bfloat16, _ivy.float64): _ivy.float64,
+    (_ivy.float64, _ivy.bfloat16): _ivy.float64,
 }
 
 # tensorflow data type promotion
@@ -293,3 +294,10 @@ from . import raw_ops
 from . import sets
 from . import signal
 from . import sparse
+
+
+# point the version specific functions to the version of the installed framework
+import sys
+from ivy.functional.frontends import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
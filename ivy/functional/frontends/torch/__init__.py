@@ -1,6 +1,6 @@
 # flake8: noqa
 
-from ivy import (
+from ivy.functional.frontends._original_ivy import (
     uint8,
     int8,
     int16,
@@ -222,3 +222,10 @@ def promote_types_of_torch_inputs(
         x1 = ivy.asarray(x1, dtype=promoted)
         x2 = ivy.asarray(x2, dtype=promoted)
     return x1, x2
+
+
+# point the version specific functions to the version of the installed framework
+import sys
+from ivy.functional.frontends import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
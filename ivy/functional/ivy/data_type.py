@@ -9,6 +9,7 @@ import importlib
 
 # local
 import ivy
+from ivy.context import ContextStack
 from ivy.backend_handler import current_backend
 from ivy.func_wrapper import (
     handle_out_argument,
@@ -785,11 +786,11 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
-default_complex_dtype_stack = list()
+default_dtype_stack = ContextStack("default_dtype_stack")
+default_float_dtype_stack = ContextStack("default_float_dtype_stack")
+default_int_dtype_stack = ContextStack("default_int_dtype_stack")
+default_uint_dtype_stack = ContextStack("default_uint_dtype_stack")
+default_complex_dtype_stack = ContextStack("default_complex_dtype_stack")
 
 
 class DefaultDtype:
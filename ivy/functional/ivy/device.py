@@ -3,9 +3,16 @@
 # global
 import os
 import gc
+import atexit
 import abc
 import math
 import psutil
+import functools
+import itertools
+import collections
+import concurrent.futures
+from multiprocessing import shared_memory
+import numpy as np
 import pynvml
 from typing import Optional, Tuple
 
@@ -18,6 +25,7 @@ from typing import Union, Callable, Iterable, Any
 
 # local
 import ivy
+from ivy.context import ContextStack
 from ivy.func_wrapper import (
     handle_out_argument,
     to_native_arrays_and_back,
@@ -26,10 +34,11 @@ from ivy.func_wrapper import (
 )
 from ivy.exceptions import handle_exceptions
 
-default_device_stack = list()
+default_device_stack = ContextStack("default_device_stack")
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
+split_executors = dict()
 
 
 # Extra #
@@ -909,6 +918,294 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _split_func_call_executor(
+    executor: Union[str, concurrent.futures.Executor],
+    num_workers: int,
+    /,
+) -> concurrent.futures.Executor:
+    if isinstance(executor, concurrent.futures.Executor):
+        return executor
+    key = (executor, num_workers)
+    if key in split_executors:
+        return split_executors[key]
+    if executor == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(num_workers)
+    elif executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(
+            num_workers, mp_context=ivy.multiprocessing()
+        )
+    else:
+        raise ivy.exceptions.IvyException(
+            "executor must be one of [ thread | process ] or a "
+            "concurrent.futures.Executor, but found {}".format(executor)
+        )
+    split_executors[key] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_split_executors():
+    for pool in split_executors.values():
+        pool.shutdown(cancel_futures=True)
+    split_executors.clear()
+
+
+def _ordered_results(executor, fn, args_iter, max_in_flight, /):
+    # submit the chunks with at most max_in_flight of them pending, and yield the
+    # results in submission order so that reductions stay deterministic
+    pending = collections.deque()
+    try:
+        for args in args_iter:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _split_func_call_chunk(func, post_fn, /, *inputs):
+    ret = func(*inputs)
+    return tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
+
+
+def _split_func_call_thread_chunk(backend, func, post_fn, /, *inputs):
+    # runs in a worker thread, which uses the global backend unless the backend of
+    # the calling thread or task is set in it
+    if not backend or ivy.current_backend_str() == backend:
+        return _split_func_call_chunk(func, post_fn, *inputs)
+    ivy.set_backend(backend)
+    try:
+        return _split_func_call_chunk(func, post_fn, *inputs)
+    finally:
+        ivy.unset_backend()
+
+
+def _chunk_index(axis, start, stop):
+    return (slice(None),) * axis + (slice(start, stop),)
+
+
+def _chunk_shape(shape, axis, start, stop):
+    return tuple(shape[:axis]) + (stop - start,) + tuple(shape[axis + 1 :])
+
+
+def _split_func_call_worker(func, inputs, start, stop, outputs, /):
+    # runs in a worker process of the process executor, with the inputs and the
+    # concat outputs held in shared memory blocks
+    if ivy.current_backend_str() != "numpy":
+        ivy.set_backend("numpy")
+    blocks = list()
+    try:
+        chunk = list()
+        for name, shape, dtype, axis in inputs:
+            blocks.append(shared_memory.SharedMemory(name=name))
+            x = np.ndarray(shape, dtype, buffer=blocks[-1].buf)
+            chunk.append(ivy.to_ivy(x[_chunk_index(axis, start, stop)]))
+        ret = _split_func_call_chunk(func, lambda x: x, *chunk)
+        del chunk, x
+        rets = list()
+        for r, out in zip(ret, outputs + (None,) * len(ret)):
+            r = np.asarray(ivy.to_native(r))
+            if out is not None:
+                name, shape, dtype, axis = out
+                idx = _chunk_index(axis, start, stop)
+                chunk_shape = _chunk_shape(shape, axis, start, stop)
+                if r.dtype == dtype and r.shape == chunk_shape:
+                    blocks.append(shared_memory.SharedMemory(name=name))
+                    np.ndarray(shape, dtype, buffer=blocks[-1].buf)[idx] = r
+                    rets.append(None)
+                    continue
+            # copy, as the return may be a view of a shared block
+            rets.append(np.array(r))
+        del ret, r
+        return tuple(rets)
+    finally:
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+
+
+def _split_func_call_processes(
+    func,
+    inputs,
+    input_axes,
+    output_axes,
+    offsets,
+    is_concat,
+    post_fn,
+    pool,
+    max_in_flight,
+    /,
+):
+    if ivy.current_backend_str() != "numpy" or not all(
+        ivy.is_array(inp) for inp in inputs
+    ):
+        raise ivy.exceptions.IvyException(
+            'the "process" executor is only supported for array inputs with the '
+            "numpy backend"
+        )
+    blocks = list()
+
+    def _share(shape, dtype):
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        blocks.append(shared_memory.SharedMemory(create=True, size=size))
+        return np.ndarray(shape, dtype, buffer=blocks[-1].buf)
+
+    def _run():
+        inputs_np = [np.asarray(ivy.to_native(inp)) for inp in inputs]
+        descs = list()
+        for x, axis in zip(inputs_np, input_axes):
+            _share(x.shape, x.dtype)[...] = x
+            descs.append((blocks[-1].name, x.shape, x.dtype, axis % max(x.ndim, 1)))
+        out_descs = ()
+        buffers = None
+        rets = iter(())
+        if is_concat:
+            # the first chunk runs here to find the shapes of the outputs, which
+            # are then preallocated in shared memory for the workers to write into
+            first = _split_func_call_chunk(
+                func,
+                post_fn,
+                *[
+                    ivy.to_ivy(x[_chunk_index(desc[3], offsets[0], offsets[1])])
+                    for x, desc in zip(inputs_np, descs)
+                ],
+            )
+            rets = iter((first,))
+            output_axes_ = _split_output_axes(output_axes, first, input_axes[0])
+            buffers = list()
+            for r, axis in zip(first, output_axes_):
+                shape = _split_buffer_shape(r, axis, offsets)
+                if shape is None:
+                    buffers.append(None)
+                    out_descs += (None,)
+                    continue
+                dtype = np.asarray(ivy.to_native(r)).dtype
+                buffers.append(ivy.to_ivy(_share(shape, dtype)))
+                out_descs += ((blocks[-1].name, shape, dtype, axis),)
+        rets = itertools.chain(
+            rets,
+            (
+                tuple(None if r is None else ivy.to_ivy(r) for r in ret)
+                for ret in _ordered_results(
+                    pool,
+                    _split_func_call_worker,
+                    (
+                        (func, descs, offsets[j], offsets[j + 1], out_descs)
+                        for j in range(int(is_concat), len(offsets) - 1)
+                    ),
+                    max_in_flight,
+                )
+            ),
+        )
+        if not is_concat:
+            return _sum_split_returns(rets)
+        ret = _concat_split_returns(rets, output_axes, input_axes[0], offsets, buffers)
+        # the outputs held in shared memory are copied out before it is released
+        return [
+            ivy.array(ivy.to_numpy(r), copy=True)
+            if any(r is buf for buf in buffers)
+            else r
+            for r in ret
+        ]
+
+    try:
+        return _run()
+    finally:
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+            block.unlink()
+
+
+def _split_output_axes(output_axes, ret, default, /):
+    if output_axes is None:
+        output_axes = [default] * len(ret)
+    elif isinstance(output_axes, int):
+        output_axes = [output_axes] * len(ret)
+    return [
+        axis % len(r.shape) if ivy.is_array(r) and len(r.shape) else axis
+        for r, axis in zip(ret, output_axes)
+    ]
+
+
+def _split_buffer_shape(r, axis, offsets, /):
+    # a concat output can only be preallocated when each chunk returns arrays which
+    # are as long as the chunk along the output axis
+    if not ivy.is_array(r) or not len(r.shape):
+        return None
+    shape = list(r.shape)
+    if shape[axis] != offsets[1] - offsets[0]:
+        return None
+    shape[axis] = offsets[-1]
+    return tuple(shape)
+
+
+def _sum_split_returns(rets, /):
+    # partial sums are accumulated as soon as each chunk returns
+    sums = None
+    for ret in rets:
+        sums = list(ret) if sums is None else [s + r for s, r in zip(sums, ret)]
+    return sums
+
+
+def _concat_split_returns(rets, output_axes, input_axis, offsets, buffers=None, /):
+    parts = None
+    for j, ret in enumerate(rets):
+        if parts is None:
+            parts = [list() for _ in ret]
+            output_axes = _split_output_axes(output_axes, ret, input_axis)
+            if buffers is None:
+                buffers = list()
+                for r, axis in zip(ret, output_axes):
+                    shape = (
+                        _split_buffer_shape(r, axis, offsets)
+                        if ivy.inplace_arrays_supported()
+                        else None
+                    )
+                    buffers.append(
+                        None
+                        if shape is None
+                        else ivy.empty(shape, dtype=ivy.dtype(r), device=ivy.dev(r))
+                    )
+        start, stop = offsets[j], offsets[j + 1]
+        for i, r in enumerate(ret):
+            buf, axis = buffers[i], output_axes[i]
+            if (
+                buf is not None
+                and ivy.is_array(r)
+                and ivy.dtype(r) == ivy.dtype(buf)
+                and tuple(r.shape) == _chunk_shape(buf.shape, axis, start, stop)
+            ):
+                ivy.to_native(buf)[_chunk_index(axis, start, stop)] = ivy.to_native(r)
+                r = None
+            parts[i].append(r)
+    ret = list()
+    for i, (part, buf) in enumerate(zip(parts, buffers)):
+        if all(r is None for r in part):
+            ret.append(buf)
+            continue
+        axis = output_axes[i]
+        ret.append(
+            ivy.concat(
+                [
+                    buf[_chunk_index(axis, offsets[j], offsets[j + 1])]
+                    if r is None
+                    else r
+                    for j, r in enumerate(part)
+                ],
+                axis=axis,
+            )
+        )
+    return ret
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -922,11 +1219,20 @@ def split_func_call(
     output_axes: Union[int, Iterable[int]] = None,
     stop_gradients: bool = False,
     device: Union[ivy.Device, ivy.NativeDevice] = None,
+    executor: Optional[Union[str, concurrent.futures.Executor]] = None,
+    num_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Call a function by splitting its inputs along a given axis, and calling the
     function in chunks, rather than feeding the entire input array at once. This can be
     useful to reduce memory usage of the device the arrays are on.
 
+    The chunks are run one after the other by default. With an executor they are run
+    concurrently, with at most ``max_in_flight`` of them pending at a time. The sums
+    of the ``"sum"`` and ``"mean"`` modes are accumulated as each chunk returns, and
+    the ``"concat"`` mode writes the returns into preallocated outputs where the
+    backend supports inplace arrays.
+
     Parameters
     ----------
     func
@@ -951,6 +1257,19 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    executor
+        How to run the chunks concurrently, must be one of [ thread | process ] or a
+        ``concurrent.futures.Executor``. Threads suit backends which release the GIL,
+        while the process executor passes the inputs to its workers through shared
+        memory, and is only supported for array inputs with the numpy backend. The
+        function must be picklable in this case. Default is ``None``, which runs the
+        chunks sequentially.
+    num_workers
+        The number of workers of the thread or process pool. Default is the number of
+        CPUs.
+    max_in_flight
+        The maximum number of chunks pending at any time. Default is twice the number
+        of workers.
 
     Returns
     -------
@@ -987,53 +1306,71 @@ def split_func_call(
     chunk_sizes = [chunk_size] * num_chunks_floored
     if num_chunks != num_chunks_floored:
         chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        ivy.split(
-            inp, num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        if ivy.is_array(inp)
-        else inp.split(
-            num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        for i, inp in enumerate(inputs)
-    ]
+    offsets = [0] + list(itertools.accumulate(chunk_sizes))
     is_mean = mode == "mean"
     is_sum = mode == "sum"
+    is_concat = not (is_mean or is_sum)
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
-    if is_mean or is_sum:
-        sums = None
-        for inps in zip(*inputs_split):
-            if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
-            else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
-        return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
-    rets = [
-        tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
-        for ret in rets
-    ]
-    num_outputs = len(rets[0])
-    if output_axes is None:
-        output_axes = [input_axes[0]] * num_outputs
-    elif isinstance(output_axes, int):
-        output_axes = [output_axes] * num_outputs
-    ret = [
-        ivy.concat([r[i] for r in rets], axis=output_axes[i])
-        for i in range(num_outputs)
-    ]
-    return ret[0] if len(ret) == 1 else ret
+    if executor is not None:
+        num_workers = ivy.default(
+            num_workers, getattr(executor, "_max_workers", os.cpu_count())
+        )
+        max_in_flight = ivy.default(max_in_flight, 2 * num_workers)
+        pool = _split_func_call_executor(executor, num_workers)
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor) or (
+        executor == "process"
+    ):
+        ret = _split_func_call_processes(
+            func,
+            inputs,
+            input_axes,
+            output_axes,
+            offsets,
+            is_concat,
+            post_fn,
+            pool,
+            max_in_flight,
+        )
+    else:
+        inputs_split = [
+            ivy.split(
+                inp,
+                num_or_size_splits=chunk_sizes,
+                axis=input_axes[i],
+                with_remainder=True,
+            )
+            if ivy.is_array(inp)
+            else inp.split(
+                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+            )
+            for i, inp in enumerate(inputs)
+        ]
+        if executor is None:
+            rets = (
+                _split_func_call_chunk(func, post_fn, *inps)
+                for inps in zip(*inputs_split)
+            )
+        else:
+            rets = _ordered_results(
+                pool,
+                functools.partial(
+                    _split_func_call_thread_chunk,
+                    ivy.current_backend_str(),
+                    func,
+                    post_fn,
+                ),
+                zip(*inputs_split),
+                max_in_flight,
+            )
+        ret = (
+            _concat_split_returns(rets, output_axes, input_axes[0], offsets)
+            if is_concat
+            else _sum_split_returns(rets)
+        )
+    if is_concat:
+        return ret[0] if len(ret) == 1 else ret
+    sums_or_means = [s / num_chunks_ceiled for s in ret] if is_mean else ret
+    return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
 
 
 def _is_valid_devices_attributes(fn: Callable) -> bool:
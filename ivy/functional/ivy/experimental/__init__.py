@@ -1,5 +1,6 @@
 # flake8: noqa
 from .activations import *
+from .compilation import *
 from .constants import *
 from .creation import *
 from .data_type import *
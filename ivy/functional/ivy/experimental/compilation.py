@@ -0,0 +1,569 @@
+# global
+import functools
+import contextvars
+from types import FunctionType
+from typing import Callable
+import numpy as np
+
+# local
+import ivy
+from ivy import backend_handler
+from ivy.func_wrapper import FN_DECORATORS, _wrap_function
+
+
+# Helpers #
+# --------#
+
+# the tracer recording the calls of the current thread or asyncio task, if any
+_current_tracer = contextvars.ContextVar("ivy_tracer", default=None)
+
+# the namespaces with recording backend functions, built once per backend namespace
+_traced_namespaces = dict()
+
+# ops whose outputs must not be folded or shared, as they differ between calls
+_NONDETERMINISTIC = ("random", "multinomial", "randint", "shuffle", "seed", "dropout")
+
+# ops which update their inputs, and are therefore kept even if their outputs are
+# not used
+_SIDE_EFFECTS = ("inplace", "seed")
+
+# the python values returned by ops which are checked when replaying, as the code
+# using them is not traced
+_GUARDED_TYPES = (bool, int, float, complex, str)
+
+# ops whose python values only depend on the types, shapes and dtypes of their
+# inputs, which are the same for every replay of a graph, and are not checked
+_METADATA = ("dtype", "shape", "dev", "num_dims")
+
+
+class _CompilationError(Exception):
+    """Raised when a traced function cannot be compiled into a graph. The errors
+    raised by the function itself are never wrapped in this exception."""
+
+
+class _GuardFailure(_CompilationError):
+    """Raised when replaying a graph if a python value returned by one of its ops
+    differs from the value it returned while tracing."""
+
+
+def _is_native(x):
+    # numpy scalars are returned by the numpy backend when indexing single elements,
+    # and are tracked as arrays
+    return isinstance(x, (ivy.NativeArray, np.generic))
+
+
+class _Node:
+    """A reference to an array in the traced graph."""
+
+    __slots__ = ("index", "is_ivy")
+
+    def __init__(self, index, is_ivy=False):
+        self.index = index
+        self.is_ivy = is_ivy
+
+
+def _map_sequence(fn, seq):
+    if hasattr(seq, "_fields"):
+        return type(seq)(*[fn(x) for x in seq])
+    return type(seq)([fn(x) for x in seq])
+
+
+class _Op:
+    """A call of a backend function, with its arrays replaced by nodes."""
+
+    __slots__ = ("name", "fn", "args", "kwargs", "outputs", "guards")
+
+    def __init__(self, name, fn, args, kwargs, outputs, guards):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        # the (path, node index, whether the output is an ivy array) of each array
+        # in the return of the call
+        self.outputs = outputs
+        # the (path, traced value) of each python value in the return of the call
+        self.guards = guards
+
+    @property
+    def nondeterministic(self):
+        return any(name in self.name for name in _NONDETERMINISTIC)
+
+    @property
+    def side_effect(self):
+        return any(name in self.name for name in _SIDE_EFFECTS)
+
+    @property
+    def metadata(self):
+        return self.name.startswith("is_") or any(
+            name in self.name for name in _METADATA
+        )
+
+
+class _Tracer:
+    """Records the outermost backend calls made while tracing a function."""
+
+    def __init__(self):
+        self.depth = 0
+        self.ops = list()
+        # the traced value of each node, which also keeps the arrays alive so that
+        # their ids are not reused while tracing
+        self.values = list()
+        self.ids = dict()
+        # whether the traced function computed on values derived from the inputs
+        # outside of ivy, in which case it cannot be replayed
+        self.untraceable = False
+
+    def add_node(self, native):
+        self.ids[id(native)] = len(self.values)
+        self.values.append(native)
+        return len(self.values) - 1
+
+    def check_unseen(self, native):
+        """Flags the trace as untraceable if the array `native`, which no traced op
+        returned, was computed from the traced arrays. Numpy scalars are always
+        results of a computation, and views are checked through their base."""
+        if isinstance(native, np.generic) or id(getattr(native, "base", None)) in (
+            self.ids
+        ):
+            self.untraceable = True
+
+    def to_graph(self, nest):
+        if isinstance(nest, ivy.Array):
+            nest = nest.data
+        if _is_native(nest):
+            index = self.ids.get(id(nest))
+            if index is None:
+                self.check_unseen(nest)
+                return nest
+            return _Node(index)
+        if isinstance(nest, (list, tuple)):
+            return _map_sequence(self.to_graph, nest)
+        if type(nest) is dict:
+            return {k: self.to_graph(v) for k, v in nest.items()}
+        return nest
+
+    def record(self, name, fn, args, kwargs, ret):
+        # the inputs are looked up first, as the outputs can be the input arrays
+        args, kwargs = self.to_graph(args), self.to_graph(kwargs)
+        outputs, guards = list(), list()
+        self._add_outputs(ret, (), outputs, guards)
+        op = _Op(name, fn, args, kwargs, outputs, guards)
+        if op.metadata:
+            op.guards = list()
+        if outputs or op.guards or op.side_effect:
+            self.ops.append(op)
+
+    def _add_outputs(self, ret, path, outputs, guards):
+        if isinstance(ret, ivy.Array):
+            outputs.append((path, self.add_node(ret.data), True))
+        elif _is_native(ret):
+            outputs.append((path, self.add_node(ret), False))
+        elif isinstance(ret, (list, tuple)):
+            for i, x in enumerate(ret):
+                self._add_outputs(x, path + (i,), outputs, guards)
+        elif isinstance(ret, _GUARDED_TYPES):
+            guards.append((path, ret))
+
+
+def _recording(name, fn):
+    """Wraps the backend function `fn`, so that its outermost calls are recorded by
+    the tracer of the current context, if any."""
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        tracer = _current_tracer.get()
+        if tracer is None or tracer.depth:
+            return fn(*args, **kwargs)
+        tracer.depth += 1
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            tracer.depth -= 1
+        tracer.record(name, fn, args, kwargs, ret)
+        return ret
+
+    return new_fn
+
+
+def _traced_namespace():
+    """Returns the ivy namespace of the current backend in which every wrapped
+    backend function records its calls."""
+    backend = ivy.current_backend()
+    namespace, to_remove = backend_handler._backend_namespace(backend, False)
+    cached = _traced_namespaces.get(backend.current_backend_str())
+    if cached is not None and cached[0] is namespace:
+        return cached[1]
+    original_dict = backend_handler.ivy_original_dict
+    traced = dict(namespace, **dict.fromkeys(to_remove, backend_handler._removed))
+    for k, v in namespace.items():
+        original = original_dict.get(k)
+        to_wrap = backend.__dict__.get(k)
+        if (
+            not isinstance(to_wrap, FunctionType)
+            or to_wrap is original
+            or not any(hasattr(original, attr) for attr in FN_DECORATORS)
+        ):
+            continue
+        traced[k] = _wrap_function(k, _recording(k, to_wrap), original)
+    _traced_namespaces[backend.current_backend_str()] = (namespace, traced)
+    return traced
+
+
+def _transforming():
+    """Whether the ivy namespace of the current context is that of a transform, such
+    as the tape of the NumPy gradients, `vmap`, or the trace of an enclosing compiled
+    function. The backend calls have to go through this namespace to be transformed,
+    which those of a graph do not. The namespaces of the contexts which have only
+    set a backend of their own are context namespaces."""
+    namespace = backend_handler._context_namespace.get()
+    return namespace is not None and not isinstance(
+        namespace, backend_handler._ContextNamespace
+    )
+
+
+def _flatten(nest, leaves):
+    """Appends the native arrays in `nest` to `leaves`, and returns a hashable
+    description of the structure of `nest`, of the shape and dtype of its arrays and
+    of its other values."""
+    if isinstance(nest, ivy.Array):
+        leaves.append(nest.data)
+        return ivy.Array, tuple(nest.data.shape), str(nest.data.dtype)
+    if isinstance(nest, ivy.NativeArray):
+        leaves.append(nest)
+        return ivy.NativeArray, tuple(nest.shape), str(nest.dtype)
+    if isinstance(nest, (list, tuple)):
+        return type(nest), tuple(_flatten(x, leaves) for x in nest)
+    if isinstance(nest, dict):
+        return type(nest), tuple((k, _flatten(v, leaves)) for k, v in nest.items())
+    try:
+        return type(nest), hash(nest), nest
+    except TypeError:
+        return type(nest), id(nest)
+
+
+def _to_graph_nest(nest, tracer):
+    """Replaces the arrays in the returned `nest` with nodes, keeping track of
+    whether they were ivy arrays."""
+    is_ivy = isinstance(nest, ivy.Array)
+    if is_ivy:
+        nest = nest.data
+    if _is_native(nest):
+        index = tracer.ids.get(id(nest))
+        if index is None:
+            tracer.check_unseen(nest)
+            index = tracer.add_node(nest)
+        return _Node(index, is_ivy)
+    if isinstance(nest, (list, tuple)):
+        return _map_sequence(lambda x: _to_graph_nest(x, tracer), nest)
+    if isinstance(nest, dict):
+        return type(nest)({k: _to_graph_nest(v, tracer) for k, v in nest.items()})
+    return nest
+
+
+def _native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+class _Graph:
+    """A traced function, optimized and compiled into a single python function which
+    calls the backend functions directly.
+
+    Parameters
+    ----------
+    tracer
+        the tracer holding the recorded calls.
+    num_inputs
+        the number of input arrays, which are the first nodes of the tracer.
+    output
+        the return of the traced function, with its arrays replaced by nodes.
+    """
+
+    def __init__(self, tracer, num_inputs, output):
+        self._values = tracer.values
+        self._num_inputs = num_inputs
+        self._constants = set()
+        self._aliases = dict()
+        ops = self._fold_constants(tracer.ops)
+        ops = self._remove_duplicates(ops)
+        self._ops = self._remove_dead(ops, output)
+        # the function is called directly if it cannot be replayed, or if a failed
+        # guard would leave the updates of the ops before it applied twice
+        guarded = [i for i, op in enumerate(self._ops) if op.guards]
+        self.eager = tracer.untraceable or (
+            bool(guarded) and any(op.side_effect for op in self._ops[: guarded[-1]])
+        )
+        self.source, self._fn = self._generate(output)
+        del self._values
+
+    # Passes #
+
+    def _fold_constants(self, ops):
+        # nodes whose values do not depend on the inputs are replaced by their traced
+        # values
+        folded = list()
+        for op in ops:
+            if (
+                not op.nondeterministic
+                and not op.side_effect
+                and all(i in self._constants for i in self._inputs_of(op))
+            ):
+                self._constants.update(i for _, i, _ in op.outputs)
+                continue
+            folded.append(op)
+        return folded
+
+    def _remove_duplicates(self, ops):
+        # deterministic calls of the same function with the same inputs are computed
+        # once
+        seen = dict()
+        unique = list()
+        for op in ops:
+            if op.nondeterministic or op.side_effect:
+                unique.append(op)
+                continue
+            key = (op.fn, self._key(op.args), self._key(op.kwargs))
+            if key in seen:
+                for (_, i, _), (_, j, _) in zip(op.outputs, seen[key].outputs):
+                    self._aliases[i] = self._aliases.get(j, j)
+                continue
+            seen[key] = op
+            unique.append(op)
+        return unique
+
+    def _remove_dead(self, ops, output):
+        # calls whose outputs are not needed by the return are dropped
+        needed = set(self._resolve(i) for i in self._nodes_of(output))
+        live = list()
+        for op in reversed(ops):
+            if (
+                op.side_effect
+                or op.guards
+                or any(i in needed for _, i, _ in op.outputs)
+            ):
+                needed.update(self._inputs_of(op))
+                live.append(op)
+        return live[::-1]
+
+    # Helpers #
+
+    def _resolve(self, index):
+        return self._aliases.get(index, index)
+
+    def _nodes_of(self, nest):
+        if isinstance(nest, _Node):
+            yield nest.index
+        elif isinstance(nest, (list, tuple)):
+            for x in nest:
+                yield from self._nodes_of(x)
+        elif isinstance(nest, dict):
+            for x in nest.values():
+                yield from self._nodes_of(x)
+
+    def _inputs_of(self, op):
+        return [self._resolve(i) for i in self._nodes_of([op.args, op.kwargs])]
+
+    def _key(self, nest):
+        if isinstance(nest, _Node):
+            index = self._resolve(nest.index)
+            if index in self._constants:
+                return "constant", id(self._values[index])
+            return "node", index
+        if isinstance(nest, (list, tuple)):
+            return type(nest), tuple(self._key(x) for x in nest)
+        if isinstance(nest, dict):
+            return dict, tuple((k, self._key(v)) for k, v in nest.items())
+        try:
+            return type(nest), hash(nest), nest
+        except TypeError:
+            return "object", id(nest)
+
+    # Code Generation #
+
+    def _generate(self, output):
+        globals_ = {"_native": _native}
+        constant_names = dict()
+
+        def constant(value):
+            if id(value) not in constant_names:
+                constant_names[id(value)] = "_c{}".format(len(constant_names))
+                globals_[constant_names[id(value)]] = value
+            return constant_names[id(value)]
+
+        def render(nest):
+            if isinstance(nest, _Node):
+                index = self._resolve(nest.index)
+                if index < self._num_inputs or index in produced:
+                    name = "x{}".format(index)
+                else:
+                    name = constant(self._values[index])
+                return "_Array({})".format(name) if nest.is_ivy else name
+            if isinstance(nest, (list, tuple)):
+                items = "".join(render(x) + ", " for x in nest)
+                if type(nest) is list:
+                    return "[{}]".format(items)
+                if type(nest) is tuple:
+                    return "({})".format(items)
+                if hasattr(nest, "_fields"):
+                    return "{}({})".format(constant(type(nest)), items)
+                return "{}([{}])".format(constant(type(nest)), items)
+            if isinstance(nest, dict):
+                items = ", ".join(
+                    "{}: {}".format(render(k), render(v)) for k, v in nest.items()
+                )
+                if type(nest) is dict:
+                    return "{" + items + "}"
+                return "{}({{{}}})".format(constant(type(nest)), items)
+            if nest is None or type(nest) in (bool, int, str):
+                return repr(nest)
+            return constant(nest)
+
+        globals_["_Array"] = ivy.Array
+        globals_["_GuardFailure"] = _GuardFailure
+        produced = set()
+        lines = list()
+        for op in self._ops:
+            call = "{}({})".format(
+                constant(op.fn),
+                ", ".join(
+                    [render(x) for x in op.args]
+                    + ["{}={}".format(k, render(v)) for k, v in op.kwargs.items()]
+                ),
+            )
+            produced.update(i for _, i, _ in op.outputs)
+            if len(op.outputs) == 1 and op.outputs[0][0] == () and not op.guards:
+                _, index, is_ivy = op.outputs[0]
+                if is_ivy:
+                    call = "_native({})".format(call)
+                lines.append("x{} = {}".format(index, call))
+                continue
+            lines.append("ret = {}".format(call))
+            for path, index, is_ivy in op.outputs:
+                value = "ret" + "".join("[{}]".format(i) for i in path)
+                if is_ivy:
+                    value = "_native({})".format(value)
+                lines.append("x{} = {}".format(index, value))
+            for path, value in op.guards:
+                lines.append(
+                    "if ret{} != {}:".format(
+                        "".join("[{}]".format(i) for i in path), constant(value)
+                    )
+                )
+                lines.append("    raise _GuardFailure")
+        lines.append("return {}".format(render(output)))
+        source = "def replay({}):\n{}\n".format(
+            ", ".join("x{}".format(i) for i in range(self._num_inputs)),
+            "\n".join("    " + line for line in lines),
+        )
+        exec(source, globals_)
+        return source, globals_["replay"]
+
+    # Properties #
+
+    @property
+    def num_ops(self):
+        """The number of backend calls made by the compiled function."""
+        return len(self._ops)
+
+    def __call__(self, *leaves):
+        return self._fn(*leaves)
+
+
+def _trace(fn, args, kwargs):
+    """Calls `fn` while recording its backend calls, and returns the graph of the
+    calls along with the return of `fn`."""
+    leaves = list()
+    _flatten((args, kwargs), leaves)
+    tracer = _Tracer()
+    for leaf in leaves:
+        tracer.add_node(leaf)
+    tracer_token = _current_tracer.set(tracer)
+    try:
+        with backend_handler._using_namespace(_traced_namespace()):
+            ret = fn(*args, **kwargs)
+    finally:
+        _current_tracer.reset(tracer_token)
+    try:
+        graph = _Graph(tracer, len(leaves), _to_graph_nest(ret, tracer))
+    except Exception as e:
+        raise _CompilationError(
+            "the trace of {} could not be compiled".format(fn)
+        ) from e
+    return graph, ret
+
+
+# Extra #
+# ------#
+
+
+def compile(fn: Callable, /, *args, **kwargs) -> Callable:
+    """Compiles `fn` by tracing the backend functions it calls into a graph, which is
+    then replayed by calling the backend functions directly, without any of ivy's
+    function wrappers. Calls whose outputs are not needed are removed, calls which
+    are repeated with the same inputs are made once, and calls which do not depend
+    on the inputs of `fn` are computed at compile time.
+
+    `fn` is traced on its first call with each structure of inputs, where the shape
+    and dtype of the arrays and the values of the other inputs are part of the
+    structure. Arrays which are not inputs of `fn`, and any python control flow,
+    are therefore fixed at tracing time, as are the values of any random calls
+    which do not draw from the backend.
+
+    Python values returned by the backend functions, such as those of
+    ``ivy.to_scalar``, are checked when replaying, and `fn` is called directly
+    whenever one of them differs from its traced value. `fn` is also always called
+    directly, with the inputs of the trace, if it computes on values derived from its
+    inputs outside of ivy's functions, for example with NumPy's operators on the
+    NumPy scalar returned by ``x[0]``. Within a transform of the ivy namespace, such
+    as the gradient functions and `vmap` of the NumPy backend, `fn` is neither traced
+    nor replayed, and is called directly so that its calls are transformed.
+
+    Parameters
+    ----------
+    fn
+        the function to compile.
+    args
+        example positional arguments, with which `fn` is traced straight away if
+        given.
+    kwargs
+        example keyword arguments, with which `fn` is traced straight away if given.
+
+    Returns
+    -------
+    ret
+        the compiled function, whose traced graphs are in its ``graphs`` attribute.
+
+    Examples
+    --------
+    >>> def fn(x):
+    ...     y = ivy.sin(x)
+    ...     return ivy.add(x, x) * ivy.add(x, x) + ivy.ones(3) * 2
+    >>> x = ivy.array([1., 2., 3.])
+    >>> compiled = ivy.compile(fn, x)
+    >>> print(compiled(x))
+    ivy.array([ 6., 18., 38.])
+    >>> print(list(compiled.graphs.values())[0].num_ops)
+    3
+    """
+    graphs = dict()
+
+    @functools.wraps(fn)
+    def compiled(*args, **kwargs):
+        if _transforming():
+            return fn(*args, **kwargs)
+        leaves = list()
+        key = (ivy.current_backend_str(), _flatten((args, kwargs), leaves))
+        graph = graphs.get(key)
+        if graph is None:
+            graphs[key], ret = _trace(fn, args, kwargs)
+            return ret
+        if not graph.eager:
+            try:
+                return graph(*leaves)
+            except _GuardFailure:
+                pass
+        return fn(*args, **kwargs)
+
+    compiled.graphs = graphs
+    if args or kwargs:
+        compiled(*args, **kwargs)
+    return compiled
@@ -706,61 +706,145 @@ class SparseArray:
     # Instance Methods #
     # ---------------- #
 
-    def to_dense_array(self, *, native=False):
-        all_coordinates = []
-
+    def _coordinates(self):
+        # returns the nnz x ndim coordinates of the flattened values, computed from the
+        # compressed indices with vectorized index arithmetic
         if self._coo_indices is not None:
             # COO sparse array
-            for i in range(self._values.shape[0]):
-                coordinate = ivy.gather(self._coo_indices, ivy.array([[i]]))
-                coordinate = ivy.reshape(coordinate, (self._coo_indices.shape[0],))
-                all_coordinates.append(coordinate.to_list())
-        elif self._csr_crow_indices is not None and self._csr_col_indices is not None:
-            # CSR sparse array
-            total_rows = self._dense_shape[0]
-            all_cols = self._csr_col_indices.to_list()
-            all_rows = self._csr_crow_indices.to_list()
-            for row in range(total_rows):
-                cols = all_cols[all_rows[row] : all_rows[row + 1]]
-                for col in cols:
-                    all_coordinates.append([row, col])
-        elif self._csc_ccol_indices is not None and self._csc_row_indices is not None:
-            # CSC sparse array
-            total_cols = self._dense_shape[1]
-            all_rows = self._csc_row_indices.to_list()
-            all_cols = self._csc_ccol_indices.to_list()
-            for col in range(total_cols):
-                rows = all_rows[all_cols[col] : all_cols[col + 1]]
-                for row in rows:
-                    all_coordinates.append([row, col])
-        else:
-            # BSC sparse array
-            total_cols = self._dense_shape[1]
-            all_rows = self._bsc_row_indices.to_list()
-            all_cols = self._bsc_ccol_indices.to_list()
-
-            nblockrows, nblockcols = self._values.shape[-2:]
-
-            for col in range(total_cols // nblockcols):
-                rows = all_rows[all_cols[col] : all_cols[col + 1]]
-                for row in rows:
-                    for col_index in range(nblockcols):
-                        for row_index in range(nblockrows):
-                            all_coordinates.append(
-                                [
-                                    nblockrows * row + row_index,
-                                    nblockcols * col + col_index,
-                                ]
-                            )
-
-        # make dense array
+            return ivy.permute_dims(self._coo_indices, axes=(1, 0))
+        if self._csr_crow_indices is not None and self._csr_col_indices is not None:
+            # CSR sparse array, each row repeated by its number of values
+            rows = ivy.repeat(
+                ivy.arange(self._dense_shape[0], dtype="int64"),
+                ivy.diff(self._csr_crow_indices),
+            )
+            return ivy.stack([rows, self._csr_col_indices], axis=-1)
+        if self._csc_ccol_indices is not None and self._csc_row_indices is not None:
+            # CSC sparse array, each column repeated by its number of values
+            cols = ivy.repeat(
+                ivy.arange(self._dense_shape[1], dtype="int64"),
+                ivy.diff(self._csc_ccol_indices),
+            )
+            return ivy.stack([self._csc_row_indices, cols], axis=-1)
+        # BSC sparse array, each block column repeated by its number of blocks
+        nblockrows, nblockcols = self._values.shape[-2:]
+        block_cols = ivy.repeat(
+            ivy.arange(self._dense_shape[1] // nblockcols, dtype="int64"),
+            ivy.diff(self._bsc_ccol_indices),
+        )
+        # the flattened values of each block are laid out column by column
+        row_offsets = ivy.tile(ivy.arange(nblockrows, dtype="int64"), (nblockcols,))
+        col_offsets = ivy.repeat(ivy.arange(nblockcols, dtype="int64"), nblockrows)
+        rows = ivy.expand_dims(self._bsc_row_indices * nblockrows, axis=-1)
+        cols = ivy.expand_dims(block_cols * nblockcols, axis=-1)
+        return ivy.stack(
+            [
+                ivy.reshape(rows + row_offsets, (-1,)),
+                ivy.reshape(cols + col_offsets, (-1,)),
+            ],
+            axis=-1,
+        )
+
+    def _compressed(self, axis):
+        # returns the pointers, the indices and the values of the CSR (axis=0) or CSC
+        # (axis=1) representation, with the values sorted by row and column
+        ivy.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D arrays can be converted to CSR or CSC sparse arrays",
+        )
+        coordinates = self._coordinates()
+        major = coordinates[:, axis]
+        minor = coordinates[:, 1 - axis]
+        order = ivy.argsort(major * self._dense_shape[1 - axis] + minor, stable=True)
+        pointers = ivy.searchsorted(
+            major[order], ivy.arange(self._dense_shape[axis] + 1, dtype="int64")
+        )
+        return pointers, minor[order], ivy.flatten(self._values)[order]
+
+    def to_dense_array(self, *, native=False):
         ret = ivy.scatter_nd(
-            ivy.array(all_coordinates),
+            self._coordinates(),
             ivy.flatten(self._values),
             ivy.array(self._dense_shape),
         )
         return ret.to_native() if native else ret
 
+    def to_coo(self):
+        """Returns the COO representation of the sparse array, without densifying
+        it."""
+        return SparseArray(
+            coo_indices=ivy.permute_dims(self._coordinates(), axes=(1, 0)),
+            values=ivy.flatten(self._values),
+            dense_shape=self._dense_shape,
+        )
+
+    def to_csr(self):
+        """Returns the CSR representation of the 2D sparse array, without densifying
+        it."""
+        crow_indices, col_indices, values = self._compressed(0)
+        return SparseArray(
+            csr_crow_indices=crow_indices,
+            csr_col_indices=col_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+        )
+
+    def to_csc(self):
+        """Returns the CSC representation of the 2D sparse array, without densifying
+        it."""
+        ccol_indices, row_indices, values = self._compressed(1)
+        return SparseArray(
+            csc_ccol_indices=ccol_indices,
+            csc_row_indices=row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+        )
+
+    def matmul(self, other, *, native=False):
+        """Computes the product of the 2D sparse array with the dense `other`, by
+        accumulating the product of each nonzero value with the corresponding row of
+        `other`, so that the sparse array is never densified.
+
+        Parameters
+        ----------
+        other
+            dense array with shape (N,) or (N, K), N being the number of columns of
+            the sparse array.
+        native
+            whether to return a native array. Default is ``False``.
+
+        Returns
+        -------
+        ret
+            the dense product, with shape (M,) or (M, K), M being the number of rows
+            of the sparse array.
+        """
+        ivy.assertions.check_equal(
+            len(self._dense_shape),
+            2,
+            message="only 2D sparse arrays can be multiplied",
+        )
+        other = ivy.array(other)
+        ivy.assertions.check_equal(
+            other.shape[0],
+            self._dense_shape[1],
+            message="number of columns of the sparse array and rows of other "
+            "do not match",
+        )
+        coordinates = self._coordinates()
+        values = ivy.flatten(self._values)
+        values = ivy.reshape(values, values.shape + (1,) * (len(other.shape) - 1))
+        ret = ivy.scatter_nd(
+            coordinates[:, :1],
+            values * ivy.gather(other, coordinates[:, 1], axis=0),
+            (self._dense_shape[0],) + other.shape[1:],
+        )
+        return ret.to_native() if native else ret
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
 
 class NativeSparseArray:
     pass
@@ -2,8 +2,11 @@
 
 # global
 import gc
+import hashlib
 import inspect
 import math
+import threading
+from collections import OrderedDict, namedtuple
 from functools import wraps
 from numbers import Number
 from typing import Callable, Any, Union, List, Tuple, Dict, Iterable, Optional, Sequence
@@ -12,6 +15,7 @@ import numpy as np
 
 # local
 import ivy
+from ivy.context import ContextStack
 from ivy.backend_handler import current_backend, backend_stack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.exceptions import handle_exceptions
@@ -30,16 +34,17 @@ FN_CACHE = dict()
 INF = float("inf")
 TMP_DIR = "/tmp"
 
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
+queue_timeout_stack = ContextStack("queue_timeout_stack")
+array_mode_stack = ContextStack("array_mode_stack")
+shape_array_mode_stack = ContextStack("shape_array_mode_stack")
+nestable_mode_stack = ContextStack("nestable_mode_stack")
+wrapper_fusion_mode_stack = ContextStack("wrapper_fusion_mode_stack")
+exception_trace_mode_stack = ContextStack("exception_trace_mode_stack")
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
-show_func_wrapper_trace_mode_stack = list()
+show_func_wrapper_trace_mode_stack = ContextStack("show_func_wrapper_trace_mode_stack")
 
 
 def _parse_ellipsis(so, ndims):
@@ -357,6 +362,98 @@ def get_nestable_mode() -> bool:
     return nestable_mode_stack[-1]
 
 
+class NestableMode:
+    """Nestable mode Context Manager. Entering ``NestableMode(False)`` declares that
+    no ivy.Container is passed to ivy functions within the scope, so the wrapped
+    functions skip searching their arguments for containers entirely.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2.])
+    >>> with ivy.NestableMode(False):
+    ...     for _ in range(3):
+    ...         x = ivy.add(x, x)
+    >>> print(x)
+    ivy.array([ 8., 16.])
+    """
+
+    def __init__(self, mode: bool):
+        self._mode = mode
+
+    def __enter__(self):
+        set_nestable_mode(self._mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_nestable_mode()
+
+
+@handle_exceptions
+def set_wrapper_fusion_mode(mode: bool) -> None:
+    """Set the mode of whether the function wrappers applied by ``ivy.set_backend``
+    are fused into a single wrapper per function, which converts and inspects the
+    arguments in one pass rather than once per decorator. The mode is read when the
+    backend is set, so it only affects backends set after calling this function.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to fuse the function wrappers
+
+    Examples
+    --------
+    >>> ivy.set_wrapper_fusion_mode(True)
+    >>> ivy.get_wrapper_fusion_mode()
+    True
+
+    >>> ivy.set_wrapper_fusion_mode(False)
+    >>> ivy.get_wrapper_fusion_mode()
+    False
+    """
+    global wrapper_fusion_mode_stack
+    ivy.assertions.check_isinstance(mode, bool)
+    wrapper_fusion_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_wrapper_fusion_mode() -> None:
+    """Reset the mode of fusing the function wrappers to the previous state
+
+    Examples
+    --------
+    >>> ivy.set_wrapper_fusion_mode(True)
+    >>> ivy.get_wrapper_fusion_mode()
+    True
+
+    >>> ivy.unset_wrapper_fusion_mode()
+    >>> ivy.get_wrapper_fusion_mode()
+    False
+    """
+    global wrapper_fusion_mode_stack
+    if wrapper_fusion_mode_stack:
+        wrapper_fusion_mode_stack.pop(-1)
+
+
+@handle_exceptions
+def get_wrapper_fusion_mode() -> bool:
+    """Get the current mode of whether to fuse the function wrappers.
+    Default is ``False``.
+
+    Examples
+    --------
+    >>> ivy.get_wrapper_fusion_mode()
+    False
+
+    >>> ivy.set_wrapper_fusion_mode(True)
+    >>> ivy.get_wrapper_fusion_mode()
+    True
+    """
+    global wrapper_fusion_mode_stack
+    if not wrapper_fusion_mode_stack:
+        return False
+    return wrapper_fusion_mode_stack[-1]
+
+
 @handle_exceptions
 def set_exception_trace_mode(mode: str) -> None:
     """Set the mode of whether to show frontend-truncated exception stack traces,
@@ -1560,20 +1657,118 @@ def match_kwargs(
     return split_kwargs
 
 
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class _FnCache:
+    """The cache of a function wrapped by ivy.cache_fn, holding the outputs in least
+    recently used order along with the hit, miss and eviction counts."""
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.outputs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.outputs:
+                self.hits += 1
+                self.outputs.move_to_end(key)
+                return True, self.outputs[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self.lock:
+            self.outputs[key] = value
+            self.outputs.move_to_end(key)
+            while self.maxsize is not None and len(self.outputs) > self.maxsize:
+                self.outputs.popitem(last=False)
+                self.evictions += 1
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self.outputs)
+            )
+
+    def clear(self):
+        with self.lock:
+            self.outputs.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def _array_digest(x):
+    x = np.ascontiguousarray(ivy.to_numpy(x))
+    return x.shape, str(x.dtype), hashlib.blake2b(x.view(np.uint8)).hexdigest()
+
+
+def _cache_key_item(x):
+    if ivy.is_array(x):
+        return ivy.Array, _array_digest(x)
+    if isinstance(x, (list, tuple)):
+        return type(x), tuple(_cache_key_item(i) for i in x)
+    if isinstance(x, dict):
+        # the keys may not be comparable with each other, for example 1 and "b"
+        items = sorted(x.items(), key=lambda kv: (type(kv[0]).__name__, repr(kv[0])))
+        return type(x), tuple((k, _cache_key_item(v)) for k, v in items)
+    try:
+        hash(x)
+    except TypeError:
+        return type(x), str(x)
+    # the type is part of the key so that, for example, 1, 1.0 and True differ
+    return type(x), x
+
+
+def _cache_key(*args, **kwargs):
+    return tuple(_cache_key_item(i) for i in args), tuple(
+        (k, _cache_key_item(v)) for k, v in sorted(kwargs.items())
+    )
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    maxsize: Optional[int] = None,
+    key_fn: Optional[Callable] = None,
+) -> Callable:
     """Decorator to wrap a function, such that computed outputs are cached
     to avoid recalculating them later.
 
+    The outputs of each function are stored in a single cache, shared by all of the
+    cached versions of the function with the same `maxsize` and `key_fn`, which
+    evicts the least recently used output once it holds more than `maxsize` outputs.
+    By default, arrays are keyed by their shape, dtype and a digest of their
+    contents, containers by their items, and any other argument by its type and
+    value.
+
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If not
+        given, a decorator with the given `maxsize` and `key_fn` is returned.
+    maxsize
+        The maximum number of outputs to keep in the cache of `func`. Default is
+        ``None``, in which case the cache is unbounded.
+    key_fn
+        Function computing a hashable cache key from the arguments of `func`. For
+        example, ``lambda x: id(x)`` keys an array by its identity rather than by
+        its contents. Default is ``None``, in which case the keys described above
+        are used.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function, with a ``cache_info`` method returning
+        the hits, misses, evictions, maxsize and current size of the cache, and a
+        ``cache_clear`` method emptying the cache.
 
     Examples
     --------
@@ -1614,25 +1809,39 @@ def cache_fn(func: Callable) -> Callable:
     >>> print(cached_line_eq(5)) # Output is re-computed
     10
 
+
+    With a bounded cache:
+
+    >>> @ivy.cache_fn(maxsize=2)
+    ... def square(x): return x ** 2
+    >>> print([square(x) for x in [1, 2, 1, 3, 2]])
+    [1, 4, 1, 9, 4]
+
+    >>> print(square.cache_info())
+    CacheInfo(hits=1, misses=4, evictions=2, maxsize=2, currsize=2)
+
     """
+    if func is None:
+        return lambda fn: cache_fn(fn, maxsize=maxsize, key_fn=key_fn)
     global FN_CACHE
-    if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+    # the outputs are only shared by the cached versions which key them alike
+    if (func, maxsize, key_fn) not in FN_CACHE:
+        FN_CACHE[(func, maxsize, key_fn)] = _FnCache(maxsize)
+    cache = FN_CACHE[(func, maxsize, key_fn)]
+    key_fn = _cache_key if key_fn is None else key_fn
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
-        )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        key = key_fn(*args, **kwargs)
+        found, ret = cache.get(key)
+        if found:
+            return ret
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.put(key, ret)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
@@ -3323,5 +3532,5 @@ def vmap(
     >>> print(z.shape)
     (3, 5, 2)
     """
-    # TODO: optimize in the numpy and tensorflow backends and extend functionality
+    # TODO: optimize in the tensorflow backend and extend functionality
     return current_backend().vmap(func, in_axes, out_axes)
@@ -7,6 +7,7 @@ import itertools
 
 # local
 import ivy
+from ivy.context import ContextStack
 from ivy.backend_handler import current_backend
 
 from ivy.func_wrapper import (
@@ -278,7 +279,7 @@ def _variable_data(x):
 # Extra #
 # ------#
 
-with_grads_stack = list()
+with_grads_stack = ContextStack("with_grads_stack")
 
 
 class GradientTracking:
@@ -345,7 +346,7 @@ def with_grads(*, with_grads: bool = None) -> bool:
         return with_grads
     global with_grads_stack
     if not with_grads_stack:
-        with_grads_stack = [True]
+        with_grads_stack.append(True)
     return with_grads_stack[-1]
 
 
@@ -791,7 +792,11 @@ def adam_step(
     })
 
     """
-    step = float(step)
+    if ivy.is_array(step):
+        # an array step stays an array, so that compiled steps do not fix its value
+        step = ivy.astype(ivy.reshape(step, ()), ivy.default_float_dtype())
+    else:
+        step = float(step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
     vw = ivy.add(ivy.multiply(beta2, vw), (1 - beta2) * dcdw_sqrd)
@@ -7,7 +7,6 @@ from typing import Optional, Tuple, Union, List, Callable
 import ivy
 from ivy.backend_handler import current_backend
 from ivy.func_wrapper import (
-    inputs_to_ivy_arrays,
     to_native_arrays_and_back,
     handle_out_argument,
     handle_nestable,
@@ -1657,7 +1656,13 @@ def conv(
 # LSTM #
 
 
-@inputs_to_ivy_arrays
+def _lstm_pack_gates(x):
+    # reorders the gates along the last axis from [i, f, g, o] to [i, f, o, g], so
+    # that the three sigmoid gates are contiguous
+    i, f, g, o = ivy.split(x, num_or_size_splits=4, axis=-1)
+    return ivy.concat([i, f, o, g], axis=-1)
+
+
 @handle_nestable
 @handle_exceptions
 @handle_array_like
@@ -1703,18 +1708,18 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
+    output_channels = recurrent_kernel.shape[0]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
+    # packed kernels, with both biases added once to the input projection
+    Wi = _lstm_pack_gates(kernel)
+    Wh = _lstm_pack_gates(recurrent_kernel)
+    Wi_x = ivy.matmul(x_flat, Wi)
+    if bias is not None:
+        Wi_x = Wi_x + _lstm_pack_gates(bias)
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + _lstm_pack_gates(recurrent_bias)
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # lstm states
     ht = init_h
@@ -1723,33 +1728,21 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    # unrolled time dimension with lstm steps, each activating the packed gates with
+    # one sigmoid and one tanh
+    for Wi_xt in ivy.unstack(Wi_x, axis=-2):
+        gates = Wi_xt + ivy.matmul(ht, Wh)
+        sigmoid_gates = ivy.sigmoid(gates[..., : 3 * output_channels])
+        it, ft, ot = ivy.split(sigmoid_gates, num_or_size_splits=3, axis=-1)
+        gt = ivy.tanh(gates[..., 3 * output_channels :])
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
+        hts_list.append(ht)
+
+    return ivy.stack(hts_list, axis=-2), ct
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
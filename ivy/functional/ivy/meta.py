@@ -329,6 +329,85 @@ def _train_tasks_with_for_loop(
     return total_cost / num_tasks
 
 
+def _map_tasks(batch_fn, batch, num_tasks):
+    # applies the batch function of a single task to each task sub-batch
+    if batch_fn is None:
+        return batch
+    sub_batches = batch.cont_unstack_conts(0, True, num_tasks)
+    return ivy.concat([batch_fn(sub_batch) for sub_batch in sub_batches], axis=0)
+
+
+def _vmap_tasks(cost_fn):
+    # the cost function of all tasks at once, which maps the cost function of a
+    # single task over the leading task axis of the batch and of the variables
+    if cost_fn is None:
+        return None
+
+    def tasks_cost_fn(batch, v):
+        batch_leaves = batch.cont_to_flat_list()
+        num_batch_leaves = len(batch_leaves)
+
+        def task_cost_fn(*leaves):
+            # the task sub-batches keep their leading axis, as in the for loop
+            sub_batch = batch.cont_from_flat_list(
+                [ivy.expand_dims(x, axis=0) for x in leaves[:num_batch_leaves]]
+            )
+            sub_v = v.cont_from_flat_list(list(leaves[num_batch_leaves:]))
+            return cost_fn(sub_batch, v=sub_v)
+
+        costs = ivy.vmap(task_cost_fn)(*batch_leaves, *v.cont_to_flat_list())
+        return ivy.mean(costs)
+
+    return tasks_cost_fn
+
+
+def _train_tasks_vectorized(
+    batch,
+    inner_batch_fn,
+    outer_batch_fn,
+    inner_cost_fn,
+    outer_cost_fn,
+    variables,
+    inner_grad_steps,
+    inner_learning_rate,
+    inner_optimization_step,
+    order,
+    average_across_steps,
+    inner_v,
+    keep_innver_v,
+    outer_v,
+    keep_outer_v,
+    return_inner_v,
+    num_tasks,
+    stop_gradients,
+):
+    # the variables of every task are broadcast along a leading task axis rather
+    # than copied, and the inner loop then trains all of the tasks at once
+    variables = variables.cont_map(
+        lambda x, kc: ivy.broadcast_to(x, (num_tasks,) + tuple(x.shape))
+    )
+    return _train_tasks_batched(
+        batch,
+        lambda b: _map_tasks(inner_batch_fn, b, num_tasks),
+        lambda b: _map_tasks(outer_batch_fn, b, num_tasks),
+        _vmap_tasks(inner_cost_fn),
+        _vmap_tasks(outer_cost_fn),
+        variables,
+        inner_grad_steps,
+        inner_learning_rate,
+        inner_optimization_step,
+        order,
+        average_across_steps,
+        inner_v,
+        keep_innver_v,
+        outer_v,
+        keep_outer_v,
+        return_inner_v,
+        num_tasks,
+        stop_gradients,
+    )
+
+
 def _train_tasks(
     batch,
     inner_batch_fn,
@@ -342,6 +421,7 @@ def _train_tasks(
     order,
     average_across_steps,
     batched,
+    vectorized,
     inner_v,
     keep_innver_v,
     outer_v,
@@ -371,6 +451,27 @@ def _train_tasks(
             num_tasks,
             stop_gradients,
         )
+    if vectorized:
+        return _train_tasks_vectorized(
+            batch,
+            inner_batch_fn,
+            outer_batch_fn,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            inner_learning_rate,
+            inner_optimization_step,
+            order,
+            average_across_steps,
+            inner_v,
+            keep_innver_v,
+            outer_v,
+            keep_outer_v,
+            return_inner_v,
+            num_tasks,
+            stop_gradients,
+        )
     return _train_tasks_with_for_loop(
         batch,
         inner_batch_fn,
@@ -413,6 +514,7 @@ def fomaml_step(
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
     batched: bool = True,
+    vectorized: bool = False,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -455,6 +557,10 @@ def fomaml_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to run the inner loop of all tasks at once when ``batched`` is False,
+        by mapping the cost functions of a single task over the tasks with
+        :func:`ivy.vmap`, rather than looping over the tasks. Default is ``False``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -498,6 +604,7 @@ def fomaml_step(
         1,
         average_across_steps,
         batched,
+        vectorized,
         inner_v,
         keep_inner_v,
         outer_v,
@@ -529,6 +636,7 @@ def reptile_step(
     *,
     inner_optimization_step: Callable = gradient_descent_update,
     batched: bool = True,
+    vectorized: bool = False,
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
@@ -554,6 +662,10 @@ def reptile_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to run the inner loop of all tasks at once when ``batched`` is False,
+        by mapping the cost functions of a single task over the tasks with
+        :func:`ivy.vmap`, rather than looping over the tasks. Default is ``False``.
     return_inner_v
         Either 'first', 'all', or False. 'first' means the variables for the first task
         inner loop will also be returned. variables for all tasks will be returned with
@@ -586,6 +698,7 @@ def reptile_step(
         1,
         True,
         batched,
+        vectorized,
         None,
         True,
         None,
@@ -624,6 +737,7 @@ def maml_step(
     outer_batch_fn: Optional[Callable] = None,
     average_across_steps: bool = False,
     batched: bool = True,
+    vectorized: bool = False,
     inner_v: Optional[ivy.Container] = None,
     keep_inner_v: bool = True,
     outer_v: Optional[ivy.Container] = None,
@@ -666,6 +780,10 @@ def maml_step(
     batched
         Whether to batch along the time dimension, and run the meta steps in batch.
         Default is ``True``.
+    vectorized
+        Whether to run the inner loop of all tasks at once when ``batched`` is False,
+        by mapping the cost functions of a single task over the tasks with
+        :func:`ivy.vmap`, rather than looping over the tasks. Default is ``False``.
     inner_v
         Nested variable keys to be optimized during the inner loop, with same keys and
         boolean values. (Default value = None)
@@ -711,6 +829,7 @@ def maml_step(
             2,
             average_across_steps,
             batched,
+            vectorized,
             inner_v,
             keep_inner_v,
             outer_v,
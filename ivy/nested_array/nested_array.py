@@ -1,5 +1,6 @@
 # global
 import abc
+import operator
 from typing import List
 
 # local
@@ -7,16 +8,24 @@ import ivy
 
 
 class NestedArray(abc.ABC):
-    """Base class for nested array objects."""
+    """Base class for nested array objects.
 
-    def __init__(self, data, dtype, device, internal=False):
+    The rows of a nested array are stored in one flat buffer of values, along with the
+    offsets at which each row starts in the buffer (the row splits) and the shape of
+    each row, so that dtype and device casts, elementwise operations and reductions
+    act on the whole buffer at once rather than row by row.
+    """
+
+    def __init__(self, values, row_splits, row_shapes, dtype, device, internal=False):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
-        self._data = data
+        self._values = values
+        self._row_splits = row_splits
+        self._row_shapes = row_shapes
         self._shape = self._generate_shape()
         self._dtype = dtype
         self._device = device
@@ -24,91 +33,248 @@ class NestedArray(abc.ABC):
 
     @classmethod
     def nested_array(cls, data, dtype=None, device=None):
-        dtype = ivy.default_dtype(dtype=dtype, item=data)
-        device = ivy.default_device(device, item=data)
-        if ivy.is_ivy_array(data):
-            data = [data]
-        elif isinstance(data, (list, tuple)):
-            data = ivy.to_ivy(data)
-        elif ivy.is_native_array(data):
-            data = [ivy.to_ivy(data)]
-        elif isinstance(data, cls):
-            data = data._data
+        if isinstance(data, cls):
+            values, row_splits, row_shapes = (
+                data._values,
+                data._row_splits,
+                data._row_shapes,
+            )
         else:
-            raise TypeError(
-                "Input data must be ivy.Array, ivy.NativeArray"
-                " or a list of either, got: {}".format(type(data))
+            if ivy.is_ivy_array(data) or ivy.is_native_array(data):
+                data = [data]
+            elif not isinstance(data, (list, tuple)):
+                raise TypeError(
+                    "Input data must be ivy.Array, ivy.NativeArray"
+                    " or a list of either, got: {}".format(type(data))
+                )
+            data = [ivy.to_ivy(ivy.array(arr)) for arr in data]
+            ndims = set(arr.ndim for arr in data)
+            if len(ndims) != 1:
+                raise RuntimeError(
+                    "All arrays in a nested array must have the same number of "
+                    "dimensions."
+                )
+            # the rows are raveled into a single buffer with one concatenation
+            values = ivy.concat([ivy.reshape(arr, (-1,)) for arr in data], axis=0)
+            row_splits = ivy.cumsum(
+                ivy.array([0] + [arr.size for arr in data], dtype="int64")
             )
-        for i in range(len(data)):
-            data[i] = ivy.astype(data[i], dtype)
-            data[i] = ivy.to_device(data[i], device)
-        return cls(data, dtype, device, internal=True)
+            row_shapes = ivy.array(
+                [list(arr.shape) for arr in data], dtype="int64"
+            ).reshape((len(data), ndims.pop()))
+        dtype = ivy.default_dtype(dtype=dtype, item=values)
+        device = ivy.default_device(device, item=values)
+        values = ivy.to_device(ivy.astype(values, dtype), device)
+        return cls(values, row_splits, row_shapes, dtype, device, internal=True)
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        """Creates a nested array whose rows are consecutive slices along the first
+        axis of `values`, of lengths `row_lengths`. The buffer of `values` is reused
+        without copying the rows."""
+        values = ivy.array(values)
+        row_lengths = ivy.array(row_lengths, dtype="int64")
+        inner_shape = list(values.shape[1:])
+        inner_size = 1
+        for dim in inner_shape:
+            inner_size *= dim
+        row_splits = ivy.cumsum(
+            ivy.concat([ivy.zeros((1,), dtype="int64"), row_lengths * inner_size])
+        )
+        row_shapes = ivy.concat(
+            [
+                ivy.expand_dims(row_lengths, axis=-1),
+                ivy.tile(
+                    ivy.array(inner_shape, dtype="int64"), (row_lengths.shape[0], 1)
+                ),
+            ],
+            axis=-1,
+        )
+        return cls(
+            ivy.reshape(values, (-1,)),
+            row_splits,
+            row_shapes,
+            values.dtype,
+            values.device,
+            internal=True,
+        )
 
     @classmethod
     def from_row_split(cls, values, row_split):
-        row_lengths = list()
-        for i in range(1, len(row_split)):
-            row_lengths.append(row_split[i] - row_split[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
+        return cls.from_row_lengths(values, ivy.diff(ivy.array(row_split)))
 
     def _generate_shape(
         self,
     ):
-        final_shape = [len(self._data)]
-        shapes = list()
-        ndims = list()
-        for arr in self._data:
-            shapes.append(arr.shape)
-            ndims.append(arr.ndim)
-        if ndims.count(ndims[0]) != len(ndims):
-            raise RuntimeError(
-                "All arrays in a nested array must have the same number of dimensions."
+        # a dimension is ragged if it differs between any two rows
+        row_shapes = self._row_shapes
+        uniform = ivy.all(row_shapes == row_shapes[0:1], axis=0)
+        return [row_shapes.shape[0]] + [
+            int(dim) if same else None
+            for dim, same in zip(
+                ivy.to_list(row_shapes[0]) if row_shapes.shape[0] else [],
+                ivy.to_list(uniform),
             )
-        for i in range(ndims[0]):
-            same_shape = True
-            current_shape = shapes[0][i]
-            for j in range(final_shape[0]):
-                if shapes[j][i] != current_shape:
-                    same_shape = False
-                    break
-            if same_shape:
-                final_shape.append(current_shape)
-            else:
-                final_shape.append(None)
-        return final_shape
+        ]
+
+    def _row(self, i):
+        start, end = ivy.to_list(self._row_splits[i : i + 2])
+        return ivy.reshape(self._values[start:end], ivy.to_list(self._row_shapes[i]))
 
     def unbind(self):
-        return tuple(self._data)
+        return tuple(self._row(i) for i in range(self._shape[0]))
 
     def reshape(self, shape):
         assert shape[0] == self._shape[0], "batch dimension is not changeable"
-        for i in range(0, shape[0]):
-            new_shape = list()
-            for j in range(1, len(shape)):
-                if shape[j] == -1:
-                    new_shape.append(self._data[i].shape[j - 1])
-                else:
-                    new_shape.append(shape[j])
-            self._data[i] = self._data[i].reshape(new_shape)
-            print(self._data[i].shape)
+        # -1 keeps the size of the corresponding dimension of each row
+        new_shape = ivy.array(list(shape[1:]), dtype="int64")
+        old_shapes = self._row_shapes[:, : len(shape) - 1]
+        old_shapes = ivy.concat(
+            [
+                old_shapes,
+                ivy.zeros(
+                    (self._shape[0], len(shape) - 1 - old_shapes.shape[1]),
+                    dtype="int64",
+                ),
+            ],
+            axis=-1,
+        )
+        row_shapes = ivy.where(new_shape == -1, old_shapes, new_shape)
+        assert ivy.all(
+            ivy.prod(row_shapes, axis=-1) == ivy.prod(self._row_shapes, axis=-1)
+        ), "cannot reshape the rows of the nested array to {}".format(shape)
+        self._row_shapes = row_shapes
         self._shape = self._generate_shape()
         return self
 
+    # Elementwise Operations #
+    # ---------------------- #
+
+    def _values_of(self, other):
+        if not isinstance(other, NestedArray):
+            return other
+        assert ivy.array_equal(
+            self._row_shapes, other._row_shapes
+        ), "nested arrays must have rows of the same shapes"
+        return other._values
+
+    def _elementwise(self, fn, other=None):
+        values = fn(self._values) if other is None else fn(self._values, other)
+        return self.__class__(
+            values,
+            self._row_splits,
+            self._row_shapes,
+            values.dtype,
+            self._device,
+            internal=True,
+        )
+
+    def __add__(self, other):
+        return self._elementwise(operator.add, self._values_of(other))
+
+    def __radd__(self, other):
+        return self._elementwise(lambda x, y: y + x, other)
+
+    def __sub__(self, other):
+        return self._elementwise(operator.sub, self._values_of(other))
+
+    def __rsub__(self, other):
+        return self._elementwise(lambda x, y: y - x, other)
+
+    def __mul__(self, other):
+        return self._elementwise(operator.mul, self._values_of(other))
+
+    def __rmul__(self, other):
+        return self._elementwise(lambda x, y: y * x, other)
+
+    def __truediv__(self, other):
+        return self._elementwise(operator.truediv, self._values_of(other))
+
+    def __rtruediv__(self, other):
+        return self._elementwise(lambda x, y: y / x, other)
+
+    def __pow__(self, other):
+        return self._elementwise(operator.pow, self._values_of(other))
+
+    def __neg__(self):
+        return self._elementwise(operator.neg)
+
+    def __abs__(self):
+        return self._elementwise(operator.abs)
+
+    # Reductions #
+    # ---------- #
+
+    def _reduce_rows(self, reduction):
+        # reduces each row over its first, ragged, dimension by scattering the values
+        # into their row
+        inner_shape = self._shape[2:]
+        assert (
+            None not in inner_shape
+        ), "only the first dimension of the rows can be reduced when it is ragged"
+        inner_size = 1
+        for dim in inner_shape:
+            inner_size *= dim
+        row_lengths = self._row_shapes[:, 0]
+        row_ids = ivy.repeat(
+            ivy.arange(self._shape[0], dtype="int64"), row_lengths, axis=0
+        )
+        return ivy.scatter_nd(
+            ivy.expand_dims(row_ids, axis=-1),
+            ivy.reshape(self._values, [-1] + inner_shape),
+            [self._shape[0]] + inner_shape,
+            reduction=reduction,
+        )
+
+    def sum(self, axis=None):
+        """Sums all the values, or each row over the ragged dimension if axis is 1."""
+        if axis is None:
+            return ivy.sum(self._values)
+        assert axis == 1, "only the ragged dimension 1 can be reduced"
+        return self._reduce_rows("sum")
+
+    def mean(self, axis=None):
+        """Averages all the values, or each row over the ragged dimension if axis is
+        1."""
+        if axis is None:
+            return ivy.mean(self._values)
+        row_lengths = ivy.astype(self._row_shapes[:, 0], self._values.dtype)
+        row_lengths = ivy.reshape(row_lengths, [-1] + [1] * (len(self._shape) - 2))
+        return self.sum(axis) / row_lengths
+
+    def max(self, axis=None):
+        """Returns the maximum of all the values, or of each row over the ragged
+        dimension if axis is 1."""
+        if axis is None:
+            return ivy.max(self._values)
+        assert axis == 1, "only the ragged dimension 1 can be reduced"
+        return self._reduce_rows("max")
+
+    def min(self, axis=None):
+        """Returns the minimum of all the values, or of each row over the ragged
+        dimension if axis is 1."""
+        if axis is None:
+            return ivy.min(self._values)
+        assert axis == 1, "only the ragged dimension 1 can be reduced"
+        return self._reduce_rows("min")
+
     # Properties #
     # ---------- #
 
     @property
-    def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
-        return self._data
+    def data(self) -> List[ivy.Array]:
+        """The rows of the nested array."""
+        return list(self.unbind())
+
+    @property
+    def values(self) -> ivy.Array:
+        """The flat buffer holding the values of every row."""
+        return self._values
+
+    @property
+    def row_splits(self) -> ivy.Array:
+        """The offsets of the rows in the values, of length rows + 1."""
+        return self._row_splits
 
     @property
     def dtype(self) -> ivy.Dtype:
@@ -134,11 +300,10 @@ class NestedArray(abc.ABC):
     # ----------#
 
     def __repr__(self):
-        arrays_repr = "\t"
-        for i in range(self._shape[0] - 1):
-            arrays_repr += repr(self._data[i]) + "\n\t"
-        arrays_repr += repr(self._data[-1])
+        arrays_repr = "\t" + "\n\t".join(repr(row) for row in self.unbind())
         return self._pre_repr + self.__class__.__name__ + "([\n" + arrays_repr + "\n])"
 
     def __getitem__(self, query):
-        return self._data[query]
+        if isinstance(query, int):
+            return self._row(range(self._shape[0])[query])
+        return self.data[query]
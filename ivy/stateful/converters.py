@@ -1,40 +1,11 @@
 """Converters from Native Modules to Ivy Modules"""
 # global
-from types import SimpleNamespace
+import functools
 from typing import Optional, Dict, List
 import re
 import inspect
 from collections import OrderedDict
 
-try:
-    import haiku as hk
-    from haiku._src.data_structures import FlatMapping
-    import jax
-except ImportError:
-    hk = SimpleNamespace()
-    hk.Module = SimpleNamespace
-    hk.transform = SimpleNamespace
-    hk.get_parameter = SimpleNamespace
-    FlatMapping = SimpleNamespace
-    jax = SimpleNamespace()
-    jax.random = SimpleNamespace()
-    jax.random.PRNGKey = SimpleNamespace
-
-try:
-    import torch
-except ImportError:
-    torch = SimpleNamespace()
-    torch.nn = SimpleNamespace()
-    torch.nn.Parameter = SimpleNamespace
-    torch.nn.Module = SimpleNamespace
-
-try:
-    import tensorflow as tf
-except ImportError:
-    tf = SimpleNamespace()
-    tf.keras = SimpleNamespace()
-    tf.keras.Model = SimpleNamespace
-
 # local
 import ivy
 from ivy.functional.ivy.gradients import _is_variable
@@ -108,6 +79,8 @@ class ModuleConverters:
         ret
             The new trainable hk.Module instance.
         """
+        import haiku as hk
+
         ivy_module = self
 
         class MyHaikuModel(hk.Module):
@@ -146,7 +119,7 @@ class ModuleConverters:
         ret
             The new trainable tf.keras.Module instance.
         """
-        return MyTFModule(self)
+        return _my_tf_module_class()(self)
 
     def to_torch_module(self):
         """
@@ -162,7 +135,7 @@ class ModuleConverters:
         ret
             The new trainable torch.nn.Module instance.
         """
-        return MyTorchModule(self)
+        return _my_torch_module_class()(self)
 
     @staticmethod
     def from_haiku_module(
@@ -204,6 +177,10 @@ class ModuleConverters:
             The new trainable torch module instance.
 
         """
+        import haiku as hk
+        from haiku._src.data_structures import FlatMapping
+        import jax
+
         RNG = jax.random.PRNGKey(42)
 
         def _hk_flat_map_to_dict(hk_flat_map):
@@ -472,6 +449,8 @@ class ModuleConverters:
                 )
 
             def _replace_update_v(self, new_v, native=None):
+                import torch
+
                 native = ivy.default(native, self._native_module)
                 for k, v in new_v.items():
                     if isinstance(v, ivy.Container):
@@ -519,52 +498,83 @@ class ModuleConverters:
         )
 
 
-class MyTorchModule(torch.nn.Module):
-    def __init__(self, ivy_module):
-        torch.nn.Module.__init__(self)
-        self._ivy_module = ivy_module
-        self._assign_variables()
+# Native Modules #
+# ---------------#
 
-    def _assign_variables(self):
-        self._ivy_module.v.cont_map(
-            lambda x, kc: self.register_parameter(
-                name=kc, param=torch.nn.Parameter(ivy.to_native(x))
+# the native modules are defined on first use, so that the frameworks are only
+# imported when converting to them
+
+
+@functools.lru_cache(maxsize=None)
+def _my_torch_module_class():
+    import torch
+
+    class MyTorchModule(torch.nn.Module):
+        def __init__(self, ivy_module):
+            torch.nn.Module.__init__(self)
+            self._ivy_module = ivy_module
+            self._assign_variables()
+
+        def _assign_variables(self):
+            self._ivy_module.v.cont_map(
+                lambda x, kc: self.register_parameter(
+                    name=kc, param=torch.nn.Parameter(ivy.to_native(x))
+                )
+            )
+            self._ivy_module.v = self._ivy_module.v.cont_map(
+                lambda x, kc: self._parameters[kc]
             )
-        )
-        self._ivy_module.v = self._ivy_module.v.cont_map(
-            lambda x, kc: self._parameters[kc]
-        )
 
-    def forward(self, *args, **kwargs):
-        a, kw = ivy.args_to_native(*args, **kwargs)
-        ret = self._ivy_module._forward(*a, **kw)
-        if isinstance(ret, tuple):
-            return ivy.args_to_native(*ret)
-        return ivy.to_native(ret)
+        def forward(self, *args, **kwargs):
+            a, kw = ivy.args_to_native(*args, **kwargs)
+            ret = self._ivy_module._forward(*a, **kw)
+            if isinstance(ret, tuple):
+                return ivy.args_to_native(*ret)
+            return ivy.to_native(ret)
 
+    return MyTorchModule
 
-class MyTFModule(tf.keras.Model):
-    def __init__(self, ivy_module):
-        super(MyTFModule, self).__init__()
-        self._ivy_module = ivy_module
-        self._assign_variables()
 
-    def _assign_variables(self):
-        self._ivy_module.v.cont_map(
-            lambda x, kc: self.add_weight(
-                name=kc, shape=x.shape, dtype=x.dtype, trainable=True
+@functools.lru_cache(maxsize=None)
+def _my_tf_module_class():
+    import tensorflow as tf
+
+    class MyTFModule(tf.keras.Model):
+        def __init__(self, ivy_module):
+            super(MyTFModule, self).__init__()
+            self._ivy_module = ivy_module
+            self._assign_variables()
+
+        def _assign_variables(self):
+            self._ivy_module.v.cont_map(
+                lambda x, kc: self.add_weight(
+                    name=kc, shape=x.shape, dtype=x.dtype, trainable=True
+                )
             )
-        )
-        model_weights = list()
-        self._ivy_module.v.cont_map(lambda x, kc: model_weights.append(ivy.to_numpy(x)))
-        self.set_weights(model_weights)
-        params = {re.sub(":\\d+", "", param.name): param for param in self.variables}
-        self._ivy_module.v = self._ivy_module.v.cont_map(lambda x, kc: params[kc])
-
-    def call(self, *args, **kwargs):
-        a, kw = ivy.args_to_native(*args, **kwargs)
-        ret = self._ivy_module._forward(*a, **kw)
-        if isinstance(ret, tuple):
-            return ivy.args_to_native(*ret)
-
-        return ivy.to_native(ret)
+            model_weights = list()
+            self._ivy_module.v.cont_map(
+                lambda x, kc: model_weights.append(ivy.to_numpy(x))
+            )
+            self.set_weights(model_weights)
+            params = {
+                re.sub(":\\d+", "", param.name): param for param in self.variables
+            }
+            self._ivy_module.v = self._ivy_module.v.cont_map(lambda x, kc: params[kc])
+
+        def call(self, *args, **kwargs):
+            a, kw = ivy.args_to_native(*args, **kwargs)
+            ret = self._ivy_module._forward(*a, **kw)
+            if isinstance(ret, tuple):
+                return ivy.args_to_native(*ret)
+
+            return ivy.to_native(ret)
+
+    return MyTFModule
+
+
+def __getattr__(name):
+    if name == "MyTorchModule":
+        return _my_torch_module_class()
+    if name == "MyTFModule":
+        return _my_tf_module_class()
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
@@ -3,12 +3,12 @@
 # global
 import os
 import abc
-import ivy.functional.backends.numpy
 
 # local
 import ivy
 from ivy.container import Container
 from ivy.func_wrapper import _get_first_array
+from ivy.functional.ivy.experimental.compilation import _CompilationError
 from ivy.stateful.helpers import ModuleHelpers
 from ivy.stateful.converters import ModuleConverters
 
@@ -67,8 +67,9 @@ class Module(ModuleConverters, ModuleHelpers):
             The nested keyword argument indices of stateful items to track as part of
             the forward pass. Used when graph compiling, default is ``None``.
         fallback_to_non_compiled
-            Whether to fall back to non-compiled forward call in the case that an error
-            is raised during the compiled forward pass. Default is ``True``.
+            Whether to fall back to non-compiled forward call in the case that the
+            forward pass cannot be compiled. The errors raised by the forward pass
+            itself are always raised. Default is ``False``.
         with_partial_v
             Whether to allow partial specification of variables. Default is ``False``.
         devices
@@ -124,12 +125,22 @@ class Module(ModuleConverters, ModuleHelpers):
     # Private #
     # --------#
 
-    def _fn_with_var_arg(self, fn, v_fn, /):
+    def _fn_with_var_arg(self, fn, v_fn, /, *, cache=False):
+        # with `cache` set, the variables of the submodule are a view onto self.v,
+        # which is extracted once for each container assigned to self.v rather than
+        # on every call, and which sees the variables set in place in self.v
+        extracted = dict(v_in=None, v=None)
+
         def new_fn(*a, with_grads=None, **kw):
             with_grads = ivy.with_grads(with_grads=with_grads)
             if "v" in kw.keys():
                 del kw["v"]
-            v = v_fn(self.v)
+            if not cache:
+                v = v_fn(self.v)
+            else:
+                if extracted["v_in"] is not self.v:
+                    extracted["v_in"], extracted["v"] = self.v, v_fn(self.v)
+                v = extracted["v"]
             if not with_grads:
                 v = v.stop_gradient()
             return fn(*a, **kw, v=v)
@@ -186,28 +197,31 @@ class Module(ModuleConverters, ModuleHelpers):
     @staticmethod
     def _extract_v(v, keychain_mappings: dict, orig_key_chain, /):
         """
-
+        Extract the variables of a submodule from the variables of its parent.
 
         Parameters
         ----------
         v
+            The variables of the parent module.
         keychain_mappings
+            The mappings of the duplicate key chains of the submodule, which were
+            removed from `v`, to the key chains of the variables they refer to.
         orig_key_chain
-
+            The key chain of the submodule in `v`.
 
         Returns
         -------
         ret_cont
+            The variables of the submodule.
         """
         if v.cont_has_key_chain(orig_key_chain):
             ret_cont = v.cont_at_key_chain(orig_key_chain)
         else:
             ret_cont = ivy.Container()
-        for old_kc, new_kc in keychain_mappings.items():
-            if orig_key_chain in old_kc:
-                ret_cont = ret_cont.cont_set_at_key_chain(
-                    "/".join(new_kc.split("/")[1:]), v.cont_at_key_chain(new_kc)
-                )
+        for new_kc in keychain_mappings.values():
+            ret_cont = ret_cont.cont_set_at_key_chain(
+                "/".join(new_kc.split("/")[1:]), v.cont_at_key_chain(new_kc)
+            )
         return ret_cont
 
     def _wrap_call_methods(self, keychain_mappings, /, *, key="", obj=None):
@@ -230,10 +244,20 @@ class Module(ModuleConverters, ModuleHelpers):
         """
         if isinstance(obj, Module) and obj is not self:
             orig_key_chain = key[1:] if key[0] == "_" else key
-
+            submod_keychain_mappings = {
+                old_kc: new_kc
+                for old_kc, new_kc in keychain_mappings.items()
+                if orig_key_chain in old_kc
+            }
+
+            # the variables extracted with keychain mappings are a new container,
+            # which would not see the variables later set in place in self.v
             obj.__call__ = self._fn_with_var_arg(
                 obj.__call__,
-                lambda v_: self._extract_v(v_, keychain_mappings, orig_key_chain),
+                lambda v_: self._extract_v(
+                    v_, submod_keychain_mappings, orig_key_chain
+                ),
+                cache=not submod_keychain_mappings,
             )
             return
         elif isinstance(obj, (list, tuple)):
@@ -417,6 +441,39 @@ class Module(ModuleConverters, ModuleHelpers):
             return ret
         return self._forward_with_tracking(*args, **kwargs)
 
+    def _compiled_call(self, *args, v=None, with_grads=None, **kwargs):
+        """
+        The forward pass of the layer, replayed from the graph which
+        :func:`ivy.compile` traces on the first call with each structure of inputs.
+        The variables are inputs of the graph, so that updating them does not
+        require compiling again.
+
+        Parameters
+        ----------
+        v
+            Replace `v` of current layer when forwarding.
+        with_grads
+            Whether to forward with gradients.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        if not self._built:
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        if not self._compiled:
+            self._compiled_fn = ivy.compile(self._call)
+            self._compiled = True
+            self._compile_on_next_step = False
+        v = ivy.default(v, self.v)
+        try:
+            return self._compiled_fn(*args, v=v, with_grads=with_grads, **kwargs)
+        except _CompilationError:
+            if not self._fallback_to_non_compiled:
+                raise
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
+
     # Public #
     # -------#
     def __call__(
@@ -461,12 +518,18 @@ class Module(ModuleConverters, ModuleHelpers):
         ret
         """
         with_grads = ivy.with_grads(with_grads=with_grads)
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+        tracking = (
+            track_submod_rets
+            or track_submod_call_order
+            or expected_submod_rets is not None
         )
+        if tracking:
+            self.submod_rets = ivy.Container(
+                alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+            )
+            self.submod_call_order = ivy.Container(
+                alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
+            )
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -477,7 +540,10 @@ class Module(ModuleConverters, ModuleHelpers):
 
         # convert variables to native arrays so that they can be tracked
         v = ivy.to_native(v)
-        ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        if (self._compile_on_next_step or self._compiled) and not tracking:
+            ret = self._compiled_call(*args, v=v, with_grads=with_grads, **kwargs)
+        else:
+            ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
         self._unset_submod_flags()
         return ret
 
@@ -3,10 +3,90 @@
 
 # global
 import abc
+import math
 from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.functional.ivy.experimental.compilation import _CompilationError
+
+
+# Helpers #
+# --------#
+
+
+def _shape(x):
+    # the shape of the native array, as building an ivy.Shape is comparatively slow
+    return tuple(x.data.shape if isinstance(x, ivy.Array) else x.shape)
+
+
+class _FlatLayout:
+    """The layout of the variables of a container packed into one flat buffer for
+    each dtype and device, with the leaves of the container being views onto the
+    buffers."""
+
+    def __init__(self, cont: ivy.Container):
+        self._template = cont
+        self.signature = self._signature(cont)
+        groups = dict()
+        for kc, x in cont.cont_to_iterator():
+            groups.setdefault((ivy.dtype(x), ivy.dev(x)), list()).append(
+                (kc, _shape(x))
+            )
+        self.groups = list(groups.values())
+        self.sizes = [[math.prod(shape) for _, shape in group] for group in self.groups]
+        # the index of the leaf of each element of the buffers
+        self.segment_ids = [
+            ivy.repeat(ivy.arange(len(sizes), dtype="int64", device=dev), sizes)
+            for sizes, (_, dev) in zip(self.sizes, groups.keys())
+        ]
+        self._last = None
+
+    @staticmethod
+    def _signature(cont):
+        return tuple((kc, _shape(x)) for kc, x in cont.cont_to_iterator())
+
+    def pack(self, cont: ivy.Container):
+        """Returns the flat buffers holding the leaves of the container, reusing the
+        buffers of the last unpacked container if it is the one given."""
+        leaves = dict(cont.cont_to_iterator())
+        if self._last is not None:
+            buffers, views = self._last
+            if all(leaves.get(kc) is x for kc, x in views.items()):
+                return buffers
+        return [
+            ivy.concat([ivy.reshape(leaves[kc], (-1,)) for kc, _ in group])
+            for group in self.groups
+        ]
+
+    def forget(self):
+        """Stops reusing the buffers of the last unpacked container."""
+        self._last = None
+
+    def unpack(self, buffers, reuse=False):
+        """Returns a container whose leaves are views onto the flat buffers, which are
+        reused when packing the container again if `reuse` is set."""
+        views = dict()
+        for buffer, group, sizes in zip(buffers, self.groups, self.sizes):
+            for (kc, shape), x in zip(
+                group, ivy.split(buffer, num_or_size_splits=sizes)
+            ):
+                views[kc] = ivy.reshape(x, shape)
+        if reuse:
+            self._last = (buffers, views)
+        return self._template.cont_map(lambda x, kc: views[kc])
+
+    def segment_norms(self, buffer, i):
+        """Returns the norm of each leaf in the i-th buffer."""
+        sums = ivy.scatter_flat(
+            self.segment_ids[i], buffer**2, size=len(self.sizes[i])
+        )
+        return sums**0.5
+
+    def broadcast(self, x, i):
+        """Returns the value of each leaf in `x` repeated over its elements in the i-th
+        buffer."""
+        return ivy.gather(x, self.segment_ids[i], axis=0)
 
 
 # Base #
@@ -23,6 +103,7 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -45,11 +126,16 @@ class Optimizer(abc.ABC):
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
         fallback_to_non_compiled
-            Whether to fall back to non-compiled forward call in the case that an error
-            is raised during the compiled forward pass. Default is ``True``.
+            Whether to fall back to non-compiled forward call in the case that the
+            forward pass cannot be compiled. The errors raised by the forward pass
+            itself are always raised. Default is ``False``.
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to pack the variables, gradients and state into one flat buffer
+            for each dtype and device, and update all of them at once.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +148,8 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._compiled_step_fn = None
         self._compiled = False
+        self._fused = fused
+        self._layout = None
 
     # Private #
     # --------#
@@ -90,8 +178,90 @@ class Optimizer(abc.ABC):
         """
         raise ivy.exceptions.IvyNotImplementedException
 
+    def _fused_step(self, ws, dcdws):
+        """
+        Update the flat buffers of the variables from update step, using the flat
+        buffers of the gradients. Override this method with child class custom
+        implementation to support fused steps.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of the variables, one for each dtype and device.
+        dcdws
+            Flat buffers of the gradients, in the same layout as the variables.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers of the variables, following update step.
+
+        """
+        raise ivy.exceptions.IvyNotImplementedException
+
     # Given #
 
+    def _flat_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Packs the variables and gradients into flat buffers, updates them with the
+        custom fused step function and returns the variables as views onto the
+        updated buffers.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, following update step.
+
+        """
+        if self._layout is None or self._layout.signature != _FlatLayout._signature(v):
+            # the state is unpacked with the layout of the old variables, and packed
+            # again with the layout of the new ones
+            state = None if self._layout is None else self.state
+            self._layout = _FlatLayout(v)
+            if state is not None:
+                self.set_state(self._relayout_state(state, v))
+        ws = self._fused_step(self._layout.pack(v), self._layout.pack(grads))
+        return self._layout.unpack(ws, reuse=True)
+
+    @staticmethod
+    def _relayout_state(state: ivy.Container, v: ivy.Container):
+        """Returns the state for the variables v, keeping the state of the variables
+        which are unchanged, and with zeros for the variables which are new or have
+        changed shape."""
+
+        def relayout(old):
+            if not isinstance(old, ivy.Container):
+                return old
+            leaves = dict(old.cont_to_iterator())
+            return v.cont_map(
+                lambda x, kc: leaves[kc]
+                if kc in leaves and _shape(leaves[kc]) == _shape(x)
+                else ivy.zeros_like(x)
+            )
+
+        return ivy.Container({k: relayout(x) for k, x in state.items()})
+
+    def _pack_state(self, state: ivy.Container):
+        """Returns the flat buffers of a state container when the steps are fused."""
+        if not self._fused or state is None:
+            return state
+        if self._layout is None:
+            self._layout = _FlatLayout(state)
+        return self._layout.pack(state)
+
+    def _unpack_state(self, buffers):
+        """Returns the state container of flat buffers when the steps are fused."""
+        if not self._fused or buffers is None:
+            return buffers
+        return self._layout.unpack(buffers)
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -109,9 +279,52 @@ class Optimizer(abc.ABC):
             the variables.
             Default is ``False``
         """
+        step = self._flat_step if self._fused else self._step
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
-        return self._step(v, grads)
+            return v.cont_set_at_keys(step(v.cont_at_key_chains(grads), grads))
+        return step(v, grads)
+
+    def _pure_step_fn(
+        self,
+        v: ivy.Container,
+        grads: ivy.Container,
+        count: ivy.Array,
+        state: ivy.Container,
+        ignore_missing: bool = False,
+    ):
+        """
+        Calls the step function with the step count and the state of the optimizer
+        as explicit inputs, and returns the new state along with the updated
+        variables, so that the step can be compiled.
+        """
+        self._count = count
+        if self._layout is not None:
+            # the buffers of the last fused step are not inputs of the compiled step
+            self._layout.forget()
+        self.set_state(state)
+        return self._step_fn(v, grads, ignore_missing), self.state
+
+    def _compiled_step(
+        self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
+    ):
+        """
+        Calls the step function through the graph which :func:`ivy.compile` traces on
+        the first call with each structure of inputs.
+        """
+        if not self._compiled:
+            self._compiled_step_fn = ivy.compile(self._pure_step_fn)
+            self._compiled = True
+            self._compile_on_next_step = False
+        try:
+            new_v, state = self._compiled_step_fn(
+                v, grads, self._count, self.state, ignore_missing
+            )
+        except _CompilationError:
+            if not self._fallback_to_non_compiled:
+                raise
+            return self._step_fn(v, grads, ignore_missing)
+        self.set_state(state)
+        return new_v
 
     # Public #
     # -------#
@@ -155,8 +368,18 @@ class Optimizer(abc.ABC):
             The updated variables, following update step.
 
         """
+        # the first step of optimizers initialized on their first step, and steps
+        # with learning rate schedules, are not compiled as they would be fixed in the
+        # graph
+        compiled = (
+            (self._compile_on_next_step or self._compiled)
+            and self._initialized
+            and not callable(self._lr)
+        )
         self._count += 1
         self._initialized = True
+        if compiled:
+            return self._compiled_step(v, grads, ignore_missing)
         return self._step_fn(v, grads, ignore_missing)
 
 
@@ -171,6 +394,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -189,9 +413,17 @@ class SGD(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all variables at once in flat buffers, one for each dtype
+            and device. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -221,6 +453,32 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _fused_step(self, ws, dcdws):
+        """
+        Update the flat buffers of the variables by gradient descent step, using the
+        flat buffers of the gradients.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of the variables, one for each dtype and device.
+        dcdws
+            Flat buffers of the gradients, in the same layout as the variables.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers, following gradient descent step.
+
+        """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        return [
+            ivy.gradient_descent_update(
+                w, dcdw, lr, stop_gradients=self._stop_gradients
+            )
+            for w, dcdw in zip(ws, dcdws)
+        ]
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -246,6 +504,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -266,10 +525,18 @@ class LARS(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all variables at once in flat buffers, one for each dtype
+            and device. Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -300,6 +567,43 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _fused_step(self, ws, dcdws):
+        """
+        Update the flat buffers of the variables by LARS step, using the flat buffers
+        of the gradients, with the norms of each variable computed as segment sums.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of the variables, one for each dtype and device.
+        dcdws
+            Flat buffers of the gradients, in the same layout as the variables.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers, following LARS step.
+
+        """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        new_ws = list()
+        for i, (w, dcdw) in enumerate(zip(ws, dcdws)):
+            w_norm = self._layout.segment_norms(w, i)
+            layer_lr = ivy.stable_divide(
+                w_norm * lr, self._layout.segment_norms(dcdw, i)
+            )
+            if self._decay_lambda > 0:
+                layer_lr /= w_norm * self._decay_lambda
+            new_ws.append(
+                ivy.gradient_descent_update(
+                    w,
+                    dcdw,
+                    self._layout.broadcast(layer_lr, i),
+                    stop_gradients=self._stop_gradients,
+                )
+            )
+        return new_ws
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -328,6 +632,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -356,6 +661,9 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all variables and state at once in flat buffers, one for
+            each dtype and device. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -366,7 +674,14 @@ class Adam(Optimizer):
         self._should_compile = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
 
     # Custom Step
@@ -408,6 +723,47 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _fused_step(self, ws, dcdws):
+        """
+        Update the flat buffers of the variables by Adam update step, using the flat
+        buffers of the gradients and of the state.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of the variables, one for each dtype and device.
+        dcdws
+            Flat buffers of the gradients, in the same layout as the variables.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers, following Adam update step.
+
+        """
+        if self._first_pass:
+            self._mw = list(dcdws)
+            self._vw = [dcdw**2 for dcdw in dcdws]
+            self._first_pass = False
+
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        new_ws = list()
+        for i, (w, dcdw) in enumerate(zip(ws, dcdws)):
+            new_w, self._mw[i], self._vw[i] = ivy.adam_update(
+                w,
+                dcdw,
+                lr,
+                self._mw[i],
+                self._vw[i],
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+                stop_gradients=self._stop_gradients,
+            )
+            new_ws.append(new_w)
+        return new_ws
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -417,13 +773,15 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._pack_state(state.mw)
+        self._vw = self._pack_state(state.vw)
 
     @property
     def state(self):
 
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unpack_state(self._mw), "vw": self._unpack_state(self._vw)}
+        )
 
 
 class LAMB(Optimizer):
@@ -439,6 +797,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -472,9 +831,19 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all variables and state at once in flat buffers, one for
+            each dtype and device. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -525,6 +894,58 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _fused_step(self, ws, dcdws):
+        """
+        Update the flat buffers of the variables by LAMB update step, using the flat
+        buffers of the gradients and of the state, with the norms of each variable
+        computed as segment sums.
+
+        Parameters
+        ----------
+        ws
+            Flat buffers of the variables, one for each dtype and device.
+        dcdws
+            Flat buffers of the gradients, in the same layout as the variables.
+
+        Returns
+        -------
+        ret
+            The updated flat buffers, following LAMB update step.
+
+        """
+        if self._first_pass:
+            self._mw = list(dcdws)
+            self._vw = [dcdw**2 for dcdw in dcdws]
+            self._first_pass = False
+
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        new_ws = list()
+        for i, (w, dcdw) in enumerate(zip(ws, dcdws)):
+            r1 = self._layout.segment_norms(w, i)
+            eff_grads, self._mw[i], self._vw[i] = ivy.adam_step(
+                dcdw,
+                self._mw[i],
+                self._vw[i],
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+            if self._decay_lambda > 0:
+                r2 = self._layout.segment_norms(eff_grads + self._decay_lambda * w, i)
+            else:
+                r2 = self._layout.segment_norms(eff_grads, i)
+            r = ivy.minimum(ivy.stable_divide(r1, r2), self._max_trust_ratio)
+            new_ws.append(
+                ivy.optimizer_update(
+                    w,
+                    eff_grads,
+                    self._layout.broadcast(r * lr, i),
+                    stop_gradients=self._stop_gradients,
+                )
+            )
+        return new_ws
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -533,10 +954,12 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._pack_state(state.mw)
+        self._vw = self._pack_state(state.vw)
 
     @property
     def state(self):
 
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unpack_state(self._mw), "vw": self._unpack_state(self._vw)}
+        )
@@ -1,7 +1,11 @@
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
+import ivy.functional.frontends.jax as jax_frontend
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_frontend_test
 
@@ -125,3 +129,54 @@ def test_jax_switch(
         branches=[_test_branch_1, _test_branch_2],
         operand=x[0],
     )
+
+
+def _branches():
+    return [lambda x: x + 1, lambda x: x * 2, lambda x: x - 1]
+
+
+@pytest.mark.parametrize("index", [-3, 0, 1, 2, 5])
+def test_jax_switch_branches(index):
+    # the index selects one of the branches through nested conditionals, with out of
+    # range indices clamped to the first and last branches
+    x = ivy.array([1.0, 2.0])
+    ret = jax_frontend.lax.switch(index, _branches(), x)
+    expected = _branches()[min(max(index, 0), 2)](ivy.to_numpy(x))
+    assert np.allclose(ivy.to_numpy(ret.ivy_array), expected)
+
+
+def test_jax_cond_operands():
+    x, y = ivy.array([1.0, 2.0]), ivy.array([3.0, 4.0])
+    ret = jax_frontend.lax.cond(False, lambda x, y: x + y, lambda x, y: x - y, x, y)
+    assert np.allclose(ivy.to_numpy(ret.ivy_array), [-2.0, -2.0])
+    with pytest.raises(ivy.exceptions.IvyException):
+        jax_frontend.lax.cond(True, lambda x: x, lambda x: x, x, operand=y)
+
+
+def test_jax_map_returns_frontend_arrays():
+    # the frontend arrays returned by the function are carried as ivy arrays
+    xs = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    ret = jax_frontend.lax.map(lambda x: (jax_frontend.numpy.sum(x), x * 2), xs)
+    assert np.allclose(ivy.to_numpy(ret[0].ivy_array), [3.0, 7.0])
+    assert np.allclose(ivy.to_numpy(ret[1].ivy_array), [[2.0, 4.0], [6.0, 8.0]])
+
+
+def test_jax_cond_switch_jit():
+    if ivy.current_backend_str() != "jax":
+        pytest.skip("the JAX backend compiles the control flow under jax.jit")
+    import jax
+
+    x = ivy.to_native(ivy.array([1.0, 2.0]))
+
+    def cond(pred, x):
+        return jax_frontend.lax.cond(pred, lambda x: x + 1, lambda x: x - 1, x)
+
+    def switch(index, x):
+        return jax_frontend.lax.switch(index, _branches(), x)
+
+    # a traced predicate or index is lowered to compiled conditionals
+    for fn, arg in ((cond, True), (switch, 1)):
+        jaxpr = jax.make_jaxpr(lambda a, x: fn(a, x).ivy_array.data)(arg, x)
+        assert "cond" in {eqn.primitive.name for eqn in jaxpr.jaxpr.eqns}
+    ret = jax.jit(lambda i, x: switch(i, x).ivy_array.data)(7, x)
+    assert np.allclose(np.asarray(ret), [0.0, 1.0])
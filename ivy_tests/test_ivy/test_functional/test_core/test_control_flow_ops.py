@@ -0,0 +1,78 @@
+"""Collection of tests for control flow functions."""
+
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _jax():
+    if ivy.current_backend_str() != "jax":
+        pytest.skip("the JAX backend compiles the control flow under jax.jit")
+    import jax
+
+    return jax
+
+
+def _primitives(jaxpr):
+    return {eqn.primitive.name for eqn in jaxpr.jaxpr.eqns}
+
+
+@pytest.mark.parametrize("cond", [True, False])
+def test_if_else(cond):
+    x = ivy.array([1.0, 2.0])
+    ret = ivy.IfElse(cond, lambda x: x + 1, lambda x: x - 1, (x,))
+    assert np.allclose(ivy.to_numpy(ret), [2.0, 3.0] if cond else [0.0, 1.0])
+
+
+def test_while_loop():
+    x = ivy.array([1.0, 2.0])
+    i, ret = ivy.WhileLoop(lambda i, x: i < 3, lambda i, x: (i + 1, x * 2), (0, x))
+    assert int(i) == 3
+    assert np.allclose(ivy.to_numpy(ret), [8.0, 16.0])
+
+
+def test_while_loop_captured_values():
+    # the values the functions capture are read on every call, rather than those of
+    # the first call being kept
+    num_iterations = 2
+    step = ivy.array([1.0])
+
+    def test_fn(i, x):
+        return i < num_iterations
+
+    def body_fn(i, x):
+        return i + 1, x + step
+
+    x = ivy.array([0.0])
+    assert np.allclose(ivy.to_numpy(ivy.WhileLoop(test_fn, body_fn, (0, x))[1]), 2.0)
+    num_iterations = 3
+    step = ivy.array([2.0])
+    assert np.allclose(ivy.to_numpy(ivy.WhileLoop(test_fn, body_fn, (0, x))[1]), 6.0)
+
+
+def test_if_else_jit():
+    jax = _jax()
+
+    def fn(pred, x):
+        return ivy.IfElse(pred, lambda x: x + 1, lambda x: x - 1, (x,))
+
+    x = ivy.to_native(ivy.array([1.0, 2.0]))
+    # a traced predicate is lowered to a conditional
+    assert "cond" in _primitives(jax.make_jaxpr(fn)(True, x))
+    assert np.allclose(np.asarray(jax.jit(fn)(False, x)), [0.0, 1.0])
+    # a concrete one calls the taken branch only
+    assert "cond" not in _primitives(jax.make_jaxpr(lambda x: fn(True, x))(x))
+
+
+def test_while_loop_jit():
+    jax = _jax()
+
+    def fn(n, x):
+        return ivy.WhileLoop(lambda i, x: i < n, lambda i, x: (i + 1, x * 2), (0, x))[1]
+
+    x = ivy.to_native(ivy.array([1.0, 2.0]))
+    assert "while" in _primitives(jax.make_jaxpr(fn)(3, x))
+    assert np.allclose(np.asarray(jax.jit(fn)(3, x)), [8.0, 16.0])
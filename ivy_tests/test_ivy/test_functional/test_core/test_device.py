@@ -7,6 +7,7 @@ import os
 import re
 import shutil
 import sys
+import threading
 
 import numpy as np
 import pynvml
@@ -390,6 +391,123 @@ def test_split_func_call_with_cont_input(
     helpers.assert_all_close(ivy.to_numpy(c.cont_key), ivy.to_numpy(c_true.cont_key))
 
 
+def _split_func(t0, t1):
+    return t0 * t1, t0 - t1
+
+
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    num_chunks=helpers.ints(min_value=2, max_value=4),
+    chunk_size=helpers.ints(min_value=1, max_value=3),
+    mode=st.sampled_from(["concat", "mean", "sum"]),
+    executor=st.sampled_from(["thread", "process"]),
+    max_in_flight=helpers.ints(min_value=1, max_value=3),
+)
+def test_split_func_call_with_executor(
+    *,
+    num_chunks,
+    chunk_size,
+    mode,
+    executor,
+    max_in_flight,
+):
+    assume(executor == "thread" or ivy.current_backend_str() == "numpy")
+    # inputs
+    shape = (num_chunks * chunk_size, 2)
+    x1 = ivy.asarray(np.random.uniform(size=shape).astype("float32"))
+    x2 = ivy.asarray(np.random.uniform(size=shape).astype("float32"))
+
+    # predictions
+    a, b = ivy.split_func_call(
+        _split_func,
+        [x1, x2],
+        mode,
+        chunk_size=chunk_size,
+        executor=executor,
+        num_workers=2,
+        max_in_flight=max_in_flight,
+    )
+
+    # true
+    a_true, b_true = (ivy.to_numpy(r) for r in _split_func(x1, x2))
+    if mode != "concat":
+        a_true, b_true = (
+            r.reshape((num_chunks, chunk_size, 2)).sum(0) for r in (a_true, b_true)
+        )
+    if mode == "mean":
+        a_true, b_true = a_true / num_chunks, b_true / num_chunks
+
+    # value test
+    helpers.assert_all_close(ivy.to_numpy(a), a_true)
+    helpers.assert_all_close(ivy.to_numpy(b), b_true)
+
+
+def _split_func_twice(t0):
+    # the return is twice as long as the chunk, so it is not preallocated
+    return ivy.concat([t0, t0]) * 2
+
+
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    executor=st.sampled_from(["thread", "process"]),
+)
+def test_split_func_call_stop_gradients_with_executor(*, executor):
+    assume(executor == "thread" or ivy.current_backend_str() == "numpy")
+    stopped = list()
+    stop_gradient = ivy.stop_gradient
+    ivy.stop_gradient = lambda x: stopped.append(x) or stop_gradient(x)
+    x = ivy.asarray(np.random.uniform(size=(4, 2)).astype("float32"))
+    try:
+        ret = ivy.split_func_call(
+            _split_func_twice,
+            [x],
+            "concat",
+            chunk_size=2,
+            stop_gradients=True,
+            executor=executor,
+            num_workers=2,
+        )
+    finally:
+        ivy.stop_gradient = stop_gradient
+    # the gradients are stopped for the chunks computed in this process
+    assert stopped
+    helpers.assert_all_close(
+        ivy.to_numpy(ret),
+        np.concatenate([ivy.to_numpy(x[:2])] * 2 + [ivy.to_numpy(x[2:])] * 2) * 2,
+    )
+
+
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+)
+def test_split_func_call_with_thread_backend():
+    # the chunks run with the backend of the calling thread, not the global one
+    ivy.clear_backend_stack()
+    backends = list()
+
+    def func(t0):
+        backends.append(ivy.current_backend_str())
+        return t0
+
+    def _worker():
+        ivy.set_backend("numpy")
+        ivy.split_func_call(
+            func,
+            [ivy.zeros((4, 2))],
+            "concat",
+            chunk_size=1,
+            executor="thread",
+            num_workers=2,
+        )
+        ivy.unset_backend()
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    assert backends == ["numpy"] * 4
+    assert ivy.current_backend_str() == ""
+
+
 # profiler
 @handle_test(
     fn_tree="functional.ivy.Profiler",
@@ -981,6 +981,73 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_maxsize():
+    def func(x):
+        return x**2
+
+    cached_fn = ivy.cache_fn(func, maxsize=2)
+    assert [cached_fn(x) for x in [1, 2, 1, 3, 2]] == [1, 4, 1, 9, 4]
+    hits, misses, evictions, maxsize, currsize = cached_fn.cache_info()
+    assert (hits, misses, evictions, maxsize, currsize) == (1, 4, 2, 2, 2)
+
+    # scalars of different types are cached separately
+    cached_fn.cache_clear()
+    assert type(cached_fn(2.0)) is float
+    assert type(cached_fn(2)) is int
+    assert cached_fn.cache_info().misses == 2
+
+    # a cache of another size does not resize the first one
+    other_cached_fn = ivy.cache_fn(func, maxsize=1)
+    assert [other_cached_fn(x) for x in [1, 2]] == [1, 4]
+    assert other_cached_fn.cache_info()[2:] == (1, 1, 1)
+    assert cached_fn.cache_info()[2:] == (0, 2, 2)
+    assert ivy.cache_fn(func, maxsize=2).cache_info() == cached_fn.cache_info()
+
+
+def test_cache_fn_with_arrays():
+    def func(x):
+        return ivy.random_uniform(shape=x.shape)
+
+    # arrays are keyed by their contents by default
+    cached_fn = ivy.cache_fn(func)
+    x = ivy.array([0.0, 1.0])
+    ret0 = cached_fn(x)
+    assert cached_fn(ivy.array([0.0, 1.0])) is ret0
+    assert cached_fn(ivy.array([0.0, 2.0])) is not ret0
+
+    # and by whatever key_fn returns otherwise
+    cached_fn = ivy.cache_fn(lambda x: func(x), key_fn=lambda x: id(x))
+    ret0 = cached_fn(x)
+    assert cached_fn(x) is ret0
+    assert cached_fn(ivy.array([0.0, 1.0])) is not ret0
+
+
+def test_cache_fn_with_key_fn():
+    def func(x):
+        return object()
+
+    # the versions with different key functions do not share their outputs
+    by_value = ivy.cache_fn(func)
+    by_type = ivy.cache_fn(func, key_fn=lambda x: type(x))
+    ret0 = by_type(1)
+    assert by_value(1) is not ret0
+    assert by_value(2) is not by_type(2)
+    assert by_type(3) is ret0
+    assert by_value.cache_info().currsize == 2
+    assert by_type.cache_info().currsize == 1
+
+
+def test_cache_fn_with_dicts():
+    def func(_):
+        return object()
+
+    # dicts are keyed by their items, whatever the types and order of their keys
+    cached_fn = ivy.cache_fn(func)
+    ret0 = cached_fn({1: 0, "b": 1})
+    assert cached_fn({"b": 1, 1: 0}) is ret0
+    assert cached_fn({1: 0, "b": 2}) is not ret0
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
@@ -2119,3 +2186,71 @@ def test_vmap(func, arrays_and_axes, in_axes_as_cont):
         pass
     else:
         assert False, "One of the results is None while other isn't"
+
+
+def _inplace_into_unmapped(x):
+    return ivy.inplace_update(ivy.zeros(x.shape), x * 2)
+
+
+def _python_control_flow(x):
+    return x if ivy.sum(x) > 0 else -x
+
+
+def _python_scalar(x):
+    return ivy.array(float(ivy.to_scalar(ivy.sum(x))))
+
+
+# vmap of the numpy backend, compared with a python loop
+@pytest.mark.parametrize(
+    "func",
+    [
+        # elementwise
+        lambda x: ivy.add(ivy.exp(x), ivy.arange(5.0)),
+        lambda x: ivy.where(x > 0, x, ivy.zeros((4, 5))),
+        # reductions
+        lambda x: ivy.sum(x, axis=1, keepdims=True),
+        lambda x: ivy.mean(x),
+        lambda x: ivy.argmax(x),
+        lambda x: ivy.cumsum(x, axis=-1),
+        lambda x: ivy.vector_norm(x),
+        # linear algebra
+        lambda x: ivy.matmul(x, ivy.ones((5, 2))),
+        lambda x: ivy.einsum("ij,j->i", x, ivy.arange(5.0)),
+        lambda x: ivy.tensordot(x, x, axes=2),
+        lambda x: ivy.outer(x[0], x[1]),
+        lambda x: ivy.det(x[:, :4]),
+        # manipulation
+        lambda x: ivy.reshape(x, (5, 4)),
+        lambda x: ivy.permute_dims(x, (1, 0)),
+        lambda x: ivy.roll(x, 2),
+        lambda x: ivy.concat([x, ivy.ones((1, 5))]),
+        lambda x: ivy.stack([x, x], axis=1),
+        lambda x: ivy.tile(x, (2, 1)),
+        lambda x: ivy.broadcast_to(x, (2, 4, 5)),
+        lambda x: ivy.constant_pad(x, [(1, 0), (0, 2)]),
+        # searching, sorting and indexing
+        lambda x: ivy.sort(x, axis=0),
+        lambda x: x[1:, ::2],
+        lambda x: x[ivy.array([0, 2])],
+        lambda x: ivy.gather(x, ivy.array([1, 3]), axis=1),
+        lambda x: ivy.gather_nd(x, ivy.array([[0, 1], [3, 4]])),
+        # layers
+        lambda x: ivy.conv1d(
+            ivy.expand_dims(x, axis=0), ivy.ones((3, 5, 2)), 1, "SAME"
+        ),
+        # no batching rule
+        lambda x: ivy.diff(x),
+        # not batched
+        _inplace_into_unmapped,
+        _python_control_flow,
+        _python_scalar,
+    ],
+)
+def test_numpy_vmap(func):
+    ivy.set_backend("numpy")
+    x = ivy.array(np.random.default_rng(0).normal(size=(3, 4, 5)))
+    expected = ivy.stack([func(x[i]) for i in range(3)])
+    ret = ivy.vmap(func)(x)
+    assert ret.shape == expected.shape
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    ivy.unset_backend()
@@ -180,8 +180,6 @@ def test_execute_with_gradients(
 )
 def test_value_and_grad(x, dtype, func, backend_fw):
     fw = backend_fw.current_backend_str()
-    if fw == "numpy":
-        return
     ivy.set_backend(fw)
     var = _variable(ivy.array(x, dtype=dtype))
     fn = ivy.value_and_grad(func)
@@ -215,8 +213,6 @@ def test_value_and_grad(x, dtype, func, backend_fw):
 )
 def test_jac(x, dtype, func, backend_fw):
     fw = backend_fw.current_backend_str()
-    if fw == "numpy":
-        return
     ivy.set_backend(fw)
     var = _variable(ivy.array(x, dtype=dtype))
     fn = ivy.jac(func)
@@ -243,8 +239,6 @@ def test_jac(x, dtype, func, backend_fw):
 )
 def test_grad(x, dtype, func, backend_fw):
     fw = backend_fw.current_backend_str()
-    if fw == "numpy":
-        return
     ivy.set_backend(fw)
     var = _variable(ivy.array(x, dtype=dtype))
     fn = ivy.grad(func)
@@ -261,6 +255,74 @@ def test_grad(x, dtype, func, backend_fw):
         assert np.allclose(grad, grad_from_gt)
 
 
+def _numerical_grad(func, x, eps=1e-6):
+    grad = np.zeros_like(x)
+    for i in np.ndindex(*x.shape):
+        shift = np.zeros_like(x)
+        shift[i] = eps
+        grad[i] = (
+            ivy.to_numpy(func(ivy.array(x + shift)))
+            - ivy.to_numpy(func(ivy.array(x - shift)))
+        ) / (2 * eps)
+    return grad
+
+
+_x = np.random.default_rng(0).uniform(-0.9, 0.9, (2, 5, 5, 3))
+_filters = np.random.default_rng(1).normal(size=(3, 3, 3, 2))
+
+
+# numpy gradients of the functions with a hand-written VJP
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda x: ivy.asin(x),
+        lambda x: ivy.acos(x),
+        lambda x: ivy.atan2(x, ivy.flip(x)),
+        lambda x: ivy.logaddexp(x, ivy.flip(x)),
+        lambda x: ivy.vector_norm(x, axis=(1, 2), ord=3),
+        lambda x: ivy.vector_norm(x, ord=float("inf")),
+        lambda x: ivy.matrix_norm(x, ord="nuc"),
+        lambda x: ivy.matrix_norm(x, ord=1, axis=(0, 2)),
+        lambda x: ivy.sort(x, axis=1, descending=True),
+        lambda x: ivy.gather_nd(x, ivy.array([[1, 2], [0, 4]])),
+        lambda x: ivy.scatter_nd(
+            ivy.array([[0], [2], [0]]), x[0, :3], shape=(4, 5, 3), reduction="max"
+        ),
+        lambda x: ivy.max_pool2d(x, [2, 2], 2, "SAME"),
+        lambda x: ivy.avg_pool2d(x, [3, 3], [2, 2], "SAME"),
+        lambda x: ivy.avg_pool1d(x[0], [2], [1], "VALID", data_format="NCW"),
+        lambda x: ivy.depthwise_conv2d(x, ivy.array(_filters[..., 0]), 2, "SAME"),
+        lambda x: ivy.depthwise_conv2d(
+            ivy.array(_x), x[0, :3, :3], 1, "VALID", dilations=2
+        ),
+        lambda x: ivy.conv2d_transpose(x, ivy.array(_filters), 2, "SAME"),
+        lambda x: ivy.conv2d_transpose(
+            ivy.array(_x), x[0, :3, :3, :, None], 2, "VALID", output_shape=[12, 12]
+        ),
+    ],
+)
+def test_numpy_vjp(func):
+    ivy.set_backend("numpy")
+    weights = ivy.array(np.random.default_rng(2).normal(size=func(ivy.array(_x)).shape))
+
+    def loss(x):
+        return ivy.sum(func(x) * weights)
+
+    _, grad = ivy.execute_with_gradients(loss, _variable(ivy.array(_x)))
+    assert np.allclose(ivy.to_numpy(grad), _numerical_grad(loss, _x), atol=1e-5)
+    ivy.unset_backend()
+
+
+def test_numpy_grad_without_vjp():
+    ivy.set_backend("numpy")
+    # the gradients are not silently lost through a function without a VJP
+    with pytest.raises(ivy.exceptions.IvyException, match="no gradient"):
+        ivy.execute_with_gradients(
+            lambda x: ivy.sum(ivy.cumprod(x)), _variable(ivy.array(_x))
+        )
+    ivy.unset_backend()
+
+
 # adam_step
 @handle_test(
     fn_tree="functional.ivy.adam_step",
@@ -26,6 +26,7 @@ from ivy_tests.test_ivy.helpers import handle_test
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -36,17 +37,13 @@ def test_fomaml_step_unique_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
     backend_fw,
 ):
 
-    # Numpy does not support gradients, and jax does not support gradients on
-    # custom nested classes
-    if backend_fw.current_backend_str() == "numpy":
-        return
-
     # config
     inner_learning_rate = 1e-2
 
@@ -149,6 +146,7 @@ def test_fomaml_step_unique_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         outer_v="weight",
         return_inner_v=return_inner_v,
@@ -176,6 +174,7 @@ def test_fomaml_step_unique_vars(
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -186,16 +185,12 @@ def test_fomaml_step_shared_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
     backend_fw,
 ):
-    # Numpy does not support gradients, jax does not support gradients on custom
-    # nested classes
-    if backend_fw.current_backend_str() == "numpy":
-        return
-
     # config
     inner_learning_rate = 1e-2
 
@@ -319,6 +314,7 @@ def test_fomaml_step_shared_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -344,6 +340,7 @@ def test_fomaml_step_shared_vars(
     with_outer_cost_fn=st.booleans(),
     average_across_steps=st.booleans(),
     batched=st.booleans(),
+    vectorized=st.booleans(),
     stop_gradients=st.booleans(),
     num_tasks=helpers.ints(min_value=1, max_value=2),
     return_inner_v=st.sampled_from(["first", "all", False]),
@@ -354,16 +351,12 @@ def test_fomaml_step_overlapping_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
     backend_fw,
 ):
-    # Numpy does not support gradients, jax does not support gradients on custom
-    # nested classes
-    if backend_fw.current_backend_str() == "numpy":
-        return
-
     # config
     inner_learning_rate = 1e-2
 
@@ -471,6 +464,7 @@ def test_fomaml_step_overlapping_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
@@ -494,17 +488,19 @@ def test_fomaml_step_overlapping_vars(
 # reptile step
 @pytest.mark.parametrize("inner_grad_steps", [1, 2, 3])
 @pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("vectorized", [True, False])
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
 def test_reptile_step(
-    on_device, inner_grad_steps, batched, stop_gradients, num_tasks, return_inner_v
+    on_device,
+    inner_grad_steps,
+    batched,
+    vectorized,
+    stop_gradients,
+    num_tasks,
+    return_inner_v,
 ):
-    if ivy.current_backend_str() == "numpy":
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes,
-        pytest.skip()
-
     # config
     inner_learning_rate = 1e-2
 
@@ -580,6 +576,7 @@ def test_reptile_step(
         inner_grad_steps,
         inner_learning_rate,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -606,6 +603,7 @@ def test_reptile_step(
 @pytest.mark.parametrize("with_outer_cost_fn", [True, False])
 @pytest.mark.parametrize("average_across_steps", [True, False])
 @pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("vectorized", [True, False])
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
@@ -615,13 +613,13 @@ def test_maml_step_unique_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
 ):
     if ivy.current_backend_str() == "numpy":
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients
         pytest.skip()
 
     if ivy.current_backend_str() == "tensorflow":
@@ -728,6 +726,7 @@ def test_maml_step_unique_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         outer_v="weight",
         return_inner_v=return_inner_v,
@@ -753,6 +752,7 @@ def test_maml_step_unique_vars(
 @pytest.mark.parametrize("with_outer_cost_fn", [True, False])
 @pytest.mark.parametrize("average_across_steps", [True, False])
 @pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("vectorized", [True, False])
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
@@ -762,13 +762,13 @@ def test_maml_step_shared_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
 ):
     if ivy.current_backend_str() == "numpy":
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients
         pytest.skip()
 
     if ivy.current_backend_str() == "tensorflow":
@@ -942,6 +942,7 @@ def test_maml_step_shared_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
     )
@@ -967,6 +968,7 @@ def test_maml_step_shared_vars(
 @pytest.mark.parametrize("with_outer_cost_fn", [True, False])
 @pytest.mark.parametrize("average_across_steps", [True, False])
 @pytest.mark.parametrize("batched", [True, False])
+@pytest.mark.parametrize("vectorized", [True, False])
 @pytest.mark.parametrize("stop_gradients", [True, False])
 @pytest.mark.parametrize("num_tasks", [1, 2])
 @pytest.mark.parametrize("return_inner_v", ["first", "all", False])
@@ -976,13 +978,13 @@ def test_maml_step_overlapping_vars(
     with_outer_cost_fn,
     average_across_steps,
     batched,
+    vectorized,
     stop_gradients,
     num_tasks,
     return_inner_v,
 ):
     if ivy.current_backend_str() == "numpy":
-        # Numpy does not support gradients, jax does not support gradients on custom
-        # nested classes
+        # Numpy only supports first order gradients
         pytest.skip()
 
     if ivy.current_backend_str() == "tensorflow":
@@ -1095,6 +1097,7 @@ def test_maml_step_overlapping_vars(
         inner_learning_rate,
         average_across_steps=average_across_steps,
         batched=batched,
+        vectorized=vectorized,
         inner_v="latent",
         return_inner_v=return_inner_v,
         stop_gradients=stop_gradients,
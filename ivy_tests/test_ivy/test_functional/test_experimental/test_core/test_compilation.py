@@ -0,0 +1,102 @@
+"""Collection of tests for ivy.compile."""
+
+# global
+from hypothesis import given
+import numpy as np
+import pytest
+
+# local
+import ivy
+from ivy.functional.ivy.experimental import compilation
+import ivy_tests.test_ivy.helpers as helpers
+
+
+def _fn(x, y):
+    # the sine is never used, the sum is computed twice and the ones do not depend on
+    # the inputs
+    ivy.sin(x)
+    z = ivy.add(x, y) * ivy.add(x, y)
+    return z + ivy.ones(x.shape) * 2, {"x": x}
+
+
+# compile
+@given(
+    x_y=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        num_arrays=2,
+        shared_dtype=True,
+        min_num_dims=1,
+        large_abs_safety_factor=8,
+        small_abs_safety_factor=8,
+        safety_factor_scale="log",
+    ),
+)
+def test_compile(x_y):
+    _, (x, y) = x_y
+    x, y = ivy.array(x), ivy.array(y)
+    compiled = ivy.compile(_fn, x, y)
+    graph = list(compiled.graphs.values())[0]
+    assert graph.num_ops == 3
+    # new values are replayed with the graph traced on the example inputs
+    x, y = x + 1, y * 2
+    ret, other = compiled(x, y)
+    ret_gt, other_gt = _fn(x, y)
+    assert len(compiled.graphs) == 1
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_gt), equal_nan=True)
+    assert np.array_equal(ivy.to_numpy(other["x"]), ivy.to_numpy(other_gt["x"]))
+    # inputs of a new shape are traced again
+    compiled(ivy.concat([x, x]), ivy.concat([y, y]))
+    assert len(compiled.graphs) == 2
+
+
+def test_compile_with_python_values():
+    def fn(x, scale, axis):
+        return ivy.sum(x * scale, axis=axis)
+
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    compiled = ivy.compile(fn)
+    assert np.allclose(ivy.to_numpy(compiled(x, 2.0, 0)), [8.0, 12.0])
+    # the python values are part of the traced structure, so changing them retraces
+    assert np.allclose(ivy.to_numpy(compiled(x, 3.0, 1)), [9.0, 21.0])
+    assert np.allclose(ivy.to_numpy(compiled(x + 1, 3.0, 1)), [15.0, 27.0])
+    assert len(compiled.graphs) == 2
+
+
+def test_compile_with_values_computed_outside_ivy():
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.array([10.0, 20.0, 30.0])
+    # the single elements returned by indexing are traced
+    compiled = ivy.compile(lambda x: x[0], x)
+    assert np.allclose(ivy.to_numpy(compiled(y)), 10.0)
+
+    # the function is called directly if it computes on them outside of ivy
+    def fn(x):
+        return x[0] * 2 + ivy.sum(x)
+
+    compiled = ivy.compile(fn, x)
+    assert np.allclose(ivy.to_numpy(compiled(y)), 80.0)
+
+    # and if the python values returned by ivy differ from their traced values
+    compiled = ivy.compile(lambda x: ivy.to_scalar(ivy.sum(x)) * 2, x)
+    assert compiled(x) == 12.0
+    assert compiled(y) == 120.0
+
+
+def test_compile_errors(monkeypatch):
+    x = ivy.array([1.0, 2.0, 3.0])
+
+    # the errors raised by the function are raised as they are
+    def fn(x):
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        ivy.compile(fn, x)
+
+    # whereas those raised while compiling its trace are compilation errors
+    def graph(*_):
+        raise TypeError
+
+    monkeypatch.setattr(compilation, "_Graph", graph)
+    with pytest.raises(compilation._CompilationError):
+        ivy.compile(ivy.sum, x)
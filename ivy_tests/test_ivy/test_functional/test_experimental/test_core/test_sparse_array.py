@@ -1,7 +1,9 @@
 # global
-from hypothesis import strategies as st
+import numpy as np
+from hypothesis import given, strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.helpers import test_parameter_flags as pf
@@ -278,3 +280,56 @@ def test_sparse_bsc(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# coo - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_coo_indices_values_shape(),
+)
+def test_sparse_coo_matmul(
+    sparse_data,
+    init_as_variable_flags: pf.AsVariableFlags,
+    init_native_array_flags: pf.NativeArrayFlags,
+    class_name,
+    method_name,
+    ground_truth_backend,
+):
+    coo_ind, val_dtype, val, shp = sparse_data
+    other = np.ones((shp[1], 3), dtype=val_dtype)
+    helpers.test_method(
+        ground_truth_backend=ground_truth_backend,
+        init_input_dtypes=["int64", val_dtype],
+        init_as_variable_flags=init_as_variable_flags,
+        init_num_positional_args=0,
+        init_native_array_flags=init_native_array_flags,
+        init_all_as_kwargs_np={
+            "coo_indices": coo_ind,
+            "values": val,
+            "dense_shape": shp,
+        },
+        method_input_dtypes=[val_dtype],
+        method_as_variable_flags=[False],
+        method_num_positional_args=0,
+        method_native_array_flags=[False],
+        method_container_flags=[False],
+        method_all_as_kwargs_np={"other": other},
+        class_name=class_name,
+        method_name=method_name,
+    )
+
+
+# csr - conversions
+@given(sparse_data=_sparse_csr_indices_values_shape())
+def test_sparse_csr_conversions(sparse_data):
+    crow_indices, col_indices, value_dtype, values, shape = sparse_data
+    x = ivy.SparseArray(
+        csr_crow_indices=crow_indices,
+        csr_col_indices=col_indices,
+        values=values,
+        dense_shape=shape,
+    )
+    dense = ivy.to_numpy(x.to_dense_array())
+    for converted in [x.to_coo(), x.to_csc(), x.to_coo().to_csr()]:
+        assert np.array_equal(ivy.to_numpy(converted.to_dense_array()), dense)
+    assert x.to_csc().csc_ccol_indices.shape == (shape[1] + 1,)
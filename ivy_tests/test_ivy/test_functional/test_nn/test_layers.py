@@ -2,9 +2,11 @@
 
 # global
 from hypothesis import strategies as st, assume
+import numpy as np
 
 # local
 import ivy
+from ivy.functional.ivy.layers import lstm_update as compositional_lstm_update
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
@@ -892,3 +894,41 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+@handle_test(
+    fn_tree="functional.ivy.lstm_update",
+    batch_shape=st.sampled_from([(), (2,), (2, 3)]),
+    t=helpers.ints(min_value=1, max_value=3),
+    in_out=st.tuples(
+        helpers.ints(min_value=1, max_value=3), helpers.ints(min_value=1, max_value=3)
+    ),
+    with_bias=st.booleans(),
+    broadcast_states=st.booleans(),
+)
+def test_lstm_update_backend_kernel(
+    *, batch_shape, t, in_out, with_bias, broadcast_states
+):
+    # the kernel of the backend, if it has one, matches the compositional version
+    _in_, _out_ = in_out
+    # the initial states may be broadcast over the leading batch dimension
+    state_shape = batch_shape[broadcast_states:] + (_out_,)
+    shapes = (
+        batch_shape + (t, _in_),
+        state_shape,
+        state_shape,
+        (_in_, 4 * _out_),
+        (_out_, 4 * _out_),
+    )
+    args = [ivy.array(np.random.uniform(-1, 1, s).astype("float32")) for s in shapes]
+    kwargs = dict()
+    if with_bias:
+        kwargs = {
+            k: ivy.array(np.random.uniform(-1, 1, (4 * _out_,)).astype("float32"))
+            for k in ("bias", "recurrent_bias")
+        }
+    ret = ivy.lstm_update(*args, **kwargs)
+    ret_gt = compositional_lstm_update(*args, **kwargs)
+    for r, r_gt in zip(ret, ret_gt):
+        assert r.shape == r_gt.shape
+        helpers.assert_all_close(ivy.to_numpy(r), ivy.to_numpy(r_gt), atol=1e-5)
@@ -240,6 +240,26 @@ def test_array_property_size(
     ivy.assertions.check_equal(x.size, size_gt)
 
 
+@handle_test(
+    fn_tree="functional.ivy.native_array",  # dummy fn_tree
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("valid"),
+    ),
+)
+def test_array_lazy_attributes(
+    dtype_x,
+):
+    dtype, data = dtype_x
+    data = ivy.native_array(data[0], dtype=dtype[0])
+    x = Array(data)
+    # only the native array is stored on construction
+    assert not hasattr(x, "__dict__")
+    assert x._dtype is None and x._device is None and x._size is None
+    ivy.assertions.check_equal(x.dtype, ivy.dtype(data))
+    ivy.assertions.check_equal(x.device, ivy.dev(data))
+    ivy.assertions.check_equal(x.backend, ivy.current_backend_str())
+
+
 @handle_test(
     fn_tree="functional.ivy.native_array",  # dummy fn_tree
     dtype_x=helpers.dtype_and_values(
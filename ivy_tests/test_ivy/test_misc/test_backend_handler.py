@@ -1,6 +1,13 @@
 # global
+import asyncio
 import pytest
 import importlib
+import importlib.util
+import inspect
+import os
+import subprocess
+import sys
+import threading
 import types
 
 
@@ -24,7 +31,8 @@ import numpy as np
 
 # local
 import ivy
-from ivy.backend_handler import _backend_dict
+from ivy.backend_handler import _backend_dict, _IvyModule
+from ivy.functional.frontends import _original_ivy
 
 from ivy_tests.test_ivy.helpers.available_frameworks import available_frameworks
 
@@ -67,18 +75,17 @@ if "torch" in available_frameworks:
 def test_set_backend(backend, array_type):
     # recording data before backend change
     stack_before = []
-    func_address_before = id(ivy.sum)
     stack_before.extend(ivy.backend_stack)
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
     # using ivy assertions to ensure the desired backend is set
     ivy.assertions.check_less(len(stack_before), len(stack_after))
     ivy.assertions.check_equal(ivy.current_backend_str(), backend)
     backend = importlib.import_module(_backend_dict[backend])
     ivy.assertions.check_equal(stack_after[-1], backend)
+    # check that the ivy namespace wraps the backend implementation
+    ivy.assertions.check_equal(inspect.unwrap(ivy.sum), backend.sum)
     x = ivy.array([1, 2, 3])
     ivy.assertions.check_equal(str(type(ivy.to_native(x))), array_type)
 
@@ -91,13 +98,19 @@ def test_unset_backend(backend):
 
     ivy.set_backend(backend)
     stack_before_unset = []
-    func_address_before_unset = id(ivy.sum)
     stack_before_unset.extend(ivy.backend_stack)
 
     unset_backend = ivy.unset_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before_unset, id(ivy.sum), inverse=True)
+    # check that the ivy namespace wraps the implementation of the backend still set
+    ivy.assertions.check_equal(
+        inspect.unwrap(ivy.sum),
+        inspect.unwrap(
+            stack_after_unset[-1].sum
+            if stack_after_unset
+            else ivy.backend_handler.ivy_original_dict["sum"]
+        ),
+    )
     ivy.assertions.check_equal(
         unset_backend, importlib.import_module(_backend_dict[backend])
     )
@@ -110,6 +123,155 @@ def test_unset_backend(backend):
     ivy.assertions.check_equal(ivy.current_backend_str(), backend)
 
 
+@pytest.mark.parametrize(("backend"), available_frameworks)
+def test_set_backend_cached_namespace(backend):
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.unset_backend()
+    # setting the same backend again reuses the wrapped functions
+    ivy.set_backend(backend)
+    assert ivy.sum is wrapped_sum
+    # as does returning to it from another backend
+    ivy.set_backend("numpy")
+    ivy.unset_backend()
+    assert ivy.sum is wrapped_sum
+    ivy.unset_backend()
+
+
+@pytest.mark.parametrize(("backend"), available_frameworks)
+def test_set_backend_in_thread(backend):
+    ivy.clear_backend_stack()
+    results = dict()
+
+    def _worker():
+        ivy.set_backend(backend)
+        results["set"] = (ivy.current_backend_str(), inspect.unwrap(ivy.sum))
+        ivy.unset_backend()
+        results["unset"] = ivy.current_backend_str()
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    imported_backend = importlib.import_module(_backend_dict[backend])
+    assert results["set"] == (backend, inspect.unwrap(imported_backend.sum))
+    assert results["unset"] == ""
+    # the backend set in the thread is not visible from the main thread
+    assert ivy.backend_stack == []
+    assert ivy.current_backend_str() == ""
+    assert ivy.sum is ivy.backend_handler.ivy_original_dict["sum"]
+    # once no thread has a backend of its own, ivy is a plain module again
+    assert type(ivy) is _IvyModule
+
+
+def test_set_backend_in_nested_asyncio_tasks():
+    ivy.clear_backend_stack()
+
+    async def _child():
+        ivy.set_backend("numpy")
+        ivy.unset_backend()
+        return ivy.current_backend_str()
+
+    async def _parent():
+        ivy.set_backend("numpy")
+        # the child task inherits the backend and releases it without affecting
+        # the parent task
+        child = await asyncio.create_task(_child())
+        ret = (child, ivy.current_backend_str(), type(ivy) is _IvyModule)
+        ivy.unset_backend()
+        return ret
+
+    assert asyncio.run(_parent()) == ("numpy", "numpy", False)
+    assert ivy.current_backend_str() == ""
+    assert type(ivy) is _IvyModule
+
+
+def test_transforms_restore_ivy_module():
+    ivy.set_backend("numpy")
+    x = ivy.array([1.0, 2.0])
+    ivy.execute_with_gradients(lambda x: ivy.sum(x**2), x)
+    ivy.vmap(lambda x: x * 2)(ivy.array([[1.0], [2.0]]))
+    ivy.compile(lambda x: ivy.sum(x * 2))(x)
+    # the ivy module only looks up the namespaces of the contexts while they are used
+    assert type(ivy) is _IvyModule
+    ivy.unset_backend()
+
+
+def test_original_dict_captured_once():
+    ivy.clear_backend_stack()
+    ivy.set_backend("numpy")
+    ivy.unset_backend()
+    original_dict = ivy.backend_handler.ivy_original_dict
+    ivy.set_backend("numpy")
+    ivy.unset_backend()
+    ivy.get_backend("numpy")
+    assert ivy.backend_handler.ivy_original_dict is original_dict
+    # setting an attribute of ivy captures the namespace again
+    ivy.my_fn = lambda x: x
+    try:
+        ivy.set_backend("numpy")
+        ivy.unset_backend()
+        assert ivy.backend_handler.ivy_original_dict["my_fn"] is ivy.my_fn
+    finally:
+        del ivy.my_fn
+
+
+def test_original_ivy():
+    ivy.set_backend("numpy")
+    try:
+        # the dtypes removed by the backend are still found in the original namespace
+        assert not hasattr(ivy, "bfloat16")
+        assert (
+            _original_ivy.bfloat16 is ivy.backend_handler.ivy_original_dict["bfloat16"]
+        )
+        from ivy.functional.frontends._original_ivy import float32
+
+        assert float32 == "float32"
+        with pytest.raises(AttributeError):
+            _original_ivy.not_an_attribute
+    finally:
+        ivy.unset_backend()
+
+
+@pytest.mark.parametrize(
+    ("frontend", "table"),
+    [
+        ("numpy", "numpy_promotion_table"),
+        ("jax.numpy", "jax_promotion_table"),
+        ("tensorflow", "tensorflow_promotion_table"),
+        ("torch", None),
+    ],
+)
+def test_exec_frontend_after_set_backend(frontend, table):
+    # the body of the frontend module is executed again, as the frontends are
+    # otherwise imported already
+    spec = importlib.util.find_spec("ivy.functional.frontends." + frontend)
+    module = importlib.util.module_from_spec(spec)
+    ivy.set_backend("numpy")
+    try:
+        spec.loader.exec_module(module)
+        assert type(ivy) is _IvyModule
+    finally:
+        ivy.unset_backend()
+    if table is not None:
+        assert ("float32", "bfloat16") in getattr(module, table)
+    else:
+        assert module.bfloat16 == "bfloat16"
+
+
+def test_import_frontend_after_set_backend():
+    # the frontends read ivy's dtypes from its original namespace, whichever backend
+    # is set, in a fresh interpreter as they are otherwise imported already
+    code = (
+        "import ivy\n"
+        "ivy.set_backend('numpy')\n"
+        "import ivy.functional.frontends.jax\n"
+        "x = ivy.functional.frontends.numpy.add(ivy.array([1.0]), ivy.array([2.0]))\n"
+        "assert ivy.to_numpy(x.ivy_array).tolist() == [3.0]\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
 def test_clear_backend_stack():
     for backend_str in available_frameworks:
         ivy.set_backend(backend_str)
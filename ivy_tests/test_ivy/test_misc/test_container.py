@@ -1,11 +1,14 @@
 # global
+import gc
 import os
 import queue
+import threading
 import pytest
 import random
 import numpy as np
 import multiprocessing
 import pickle
+from multiprocessing import shared_memory
 
 # local
 import ivy
@@ -2056,6 +2059,52 @@ def test_container_multi_map(device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f, copy=False), 3)
 
 
+def test_container_map_cached_structure(device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=device),
+            "b": {
+                "c": ivy.array([2], device=device),
+                "d": ivy.array([3], device=device),
+            },
+        }
+    )
+    container_mapped = container.cont_map(lambda x, _: x + 1)
+    # the structure is computed once, and shared with the mapped containers
+    treedef = container._treedef
+    assert container_mapped._treedef is treedef
+    container_sum = ivy.Container.cont_multi_map(
+        lambda xs, _: xs[0] + xs[1], [container, container_mapped]
+    )
+    assert container_sum._treedef is treedef
+    assert np.allclose(ivy.to_numpy(container_sum.b.d), np.array([7]))
+    assert container_sum.cont_config == container.cont_config
+
+    # the cached structure is recomputed when the container changes
+    container.b.e = ivy.array([4], device=device)
+    container_mapped = container.cont_map(lambda x, kc: kc)
+    assert container._treedef is not treedef
+    assert container_mapped.cont_to_dict() == {
+        "a": "a",
+        "b": {"c": "b/c", "d": "b/d", "e": "b/e"},
+    }
+
+    # dicts returned by the function become sub-containers
+    container_mapped = container.cont_map(lambda x, _: {"x": x})
+    assert isinstance(container_mapped.b.e, Container)
+    assert np.allclose(ivy.to_numpy(container_mapped.b.e.x), np.array([4]))
+
+    # the mapped containers do not share their configs
+    container_mapped = container.cont_map(lambda x, _: x + 1)
+    container_mapped_again = container.cont_map(lambda x, _: x + 1)
+    assert container_mapped._config is not container_mapped_again._config
+    container_mapped.cont_with_ivy_backend("SENTINEL", inplace=True)
+    container_mapped.b._keyword_color_dict["c"] = "red"
+    assert container_mapped_again._config["ivyh"] is None
+    assert container_mapped_again.b._keyword_color_dict == {}
+    assert container.cont_map(lambda x, _: x + 1)._config["ivyh"] is None
+
+
 def test_container_common_key_chains(device):
     arr1 = ivy.array([1], device=device)
     arr2 = ivy.array([2], device=device)
@@ -2474,6 +2523,39 @@ def test_container_to_and_from_disk_as_hdf5(device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_lazy(device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazy.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], device=device),
+            "b": {"c": ivy.array([1, 2, 3], device=device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 3), lazy=True
+    )
+    assert loaded_container.a.shape == (2, 2)
+    assert loaded_container.b.c.shape == (2,)
+    # the file opened from the filepath is closed once all the arrays are read
+    h5_file = loaded_container.a._file._h5_file
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a)[1:3]
+    )
+    assert h5_file
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c + 1), ivy.to_numpy(container.b.c)[1:3] + 1
+    )
+    assert not h5_file
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2799,6 +2881,81 @@ def test_container_from_queues(device):
     del container
 
 
+def test_container_from_queues_prefetched(device):
+
+    if "gpu" in device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    if ivy.gpu_is_available() and ivy.current_backend_str() == "jax":
+        pytest.skip()
+
+    def worker_fn(out_queues, load_sizes):
+        for i, (out_queue, load_size) in enumerate(zip(out_queues, load_sizes)):
+            out_queue.put(
+                Container(
+                    a=ivy.array([[1.0, 2.0, 3.0]] * load_size, device=device) * (i + 1)
+                ).cont_to_shared_memory()
+            )
+
+    queue_load_sizes = [1, 2, 1]
+    out_queues = [multiprocessing.Queue() for _ in queue_load_sizes]
+    worker = multiprocessing.Process(
+        target=worker_fn, args=(out_queues, queue_load_sizes)
+    )
+    worker.start()
+
+    container = Container(
+        queues=out_queues,
+        queue_load_sizes=queue_load_sizes,
+        container_combine_method="concat",
+        queue_timeout=5.0,
+        queue_prefetch_depth=2,
+        queue_cache_size=1,
+    )
+    assert np.allclose(ivy.to_numpy(container[0].a), np.array([[1.0, 2.0, 3.0]]))
+    assert np.allclose(ivy.to_numpy(container[1:3].a), np.array([[2.0, 4.0, 6.0]] * 2))
+    assert np.allclose(ivy.to_numpy(container[3].a), np.array([[3.0, 6.0, 9.0]]))
+    assert np.allclose(ivy.to_numpy(container[3].a), np.array([[3.0, 6.0, 9.0]]))
+
+    # least recently used containers are evicted
+    with pytest.raises(ivy.exceptions.IvyException):
+        container[0]
+
+    worker.join()
+    del container
+
+
+def test_container_release_shared_memory(device):
+    cont = Container(
+        a=ivy.array([1.0, 2.0], device=device), b=1
+    ).cont_to_shared_memory()
+    name = cont.a.name
+    # the blocks of a container which is never loaded are released by its producer
+    cont.cont_release_shared_memory()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+    cont.cont_release_shared_memory()
+
+
+def test_container_from_queues_deleted():
+    queues = [queue.Queue(), queue.Queue()]
+    threads = set(threading.enumerate())
+    container = Container(queues=queues, queue_load_sizes=[1, 1], queue_timeout=0.1)
+    with pytest.raises(queue.Empty):
+        container[0]
+    loading = set(threading.enumerate()) - threads
+    assert loading
+    # the threads waiting for the containers are stopped once the container is
+    # deleted
+    del container
+    gc.collect()
+    for thread in loading:
+        thread.join(timeout=5.0)
+        assert not thread.is_alive()
+
+
 def test_container_reduce(device):
     container_a = ivy.Container(
         {
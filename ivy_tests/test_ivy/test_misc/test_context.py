@@ -0,0 +1,75 @@
+# global
+import asyncio
+import threading
+
+# local
+import ivy
+from ivy.context import ContextStack, is_global_context
+
+
+def test_context_stack():
+    stack = ContextStack("test_stack")
+    assert not stack
+    stack.append(1)
+    stack.append(2)
+    assert stack == [1, 2]
+    assert stack[-1] == 2
+    assert stack[:1] == [1]
+    assert len(stack) == 2
+    assert list(stack) == [1, 2]
+    assert stack.copy() == [1, 2]
+    assert stack.pop() == 2
+    stack.clear()
+    assert stack == []
+
+
+def test_context_stack_in_thread():
+    stack = ContextStack("test_stack", [0])
+    barrier = threading.Barrier(2)
+    results = dict()
+
+    def _worker(value):
+        results[value] = [stack.is_local(), is_global_context()]
+        stack.append(value)
+        # both threads have modified the stack before either reads it
+        barrier.wait()
+        results[value] += [stack.copy()]
+        stack.pop()
+
+    threads = [threading.Thread(target=_worker, args=(v,)) for v in (1, 2)]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+    assert results[1] == [False, False, [0, 1]]
+    assert results[2] == [False, False, [0, 2]]
+    assert is_global_context()
+    assert not stack.is_local()
+    assert stack == [0]
+
+
+def test_context_stack_in_asyncio_task():
+    async def _task(float_dtype):
+        ivy.set_default_float_dtype(float_dtype)
+        await asyncio.sleep(0.01)
+        ret = ivy.default_float_dtype()
+        ivy.unset_default_float_dtype()
+        return ret
+
+    async def _main():
+        return await asyncio.gather(_task("float16"), _task("float64"))
+
+    default_float_dtype = ivy.default_float_dtype()
+    assert asyncio.run(_main()) == ["float16", "float64"]
+    assert ivy.default_float_dtype() == default_float_dtype
+
+
+def test_event_loop_on_main_thread():
+    # code running in an event loop on the main thread, as notebook cells run by
+    # ipykernel do, is local to the running task
+    async def _cell():
+        ivy.set_default_float_dtype("float16")
+        return is_global_context(), ivy.default_float_dtype()
+
+    default_float_dtype = ivy.default_float_dtype()
+    assert asyncio.run(_cell()) == (False, "float16")
+    assert is_global_context()
+    assert ivy.default_float_dtype() == default_float_dtype
@@ -32,6 +32,22 @@ def _fn4(x: Union[Sequence[ivy.Array], ivy.Array]):
 )
 def test_handle_array_like(fn, x, expected_type):
     assert isinstance(handle_array_like(fn)(x), expected_type)
+    # keyword arguments are handled in the same way as positional arguments
+    assert isinstance(handle_array_like(fn)(x=x), expected_type)
+
+
+def _fn_kw(x: ivy.Array, /, *, y: ivy.Array, z: List[ivy.Array]):
+    return x, y, z
+
+
+def test_handle_array_like_params():
+    wrapped = handle_array_like(_fn_kw)
+    # the parameter classification is computed once, when wrapping
+    assert wrapped._array_like_params == ((0,), ("y",))
+    x, y, z = wrapped([1, 2], y=(3, 4), z=[5, 6])
+    assert isinstance(x, ivy.Array)
+    assert isinstance(y, ivy.Array)
+    assert isinstance(z, list)
 
 
 def test_outputs_to_ivy_arrays():
@@ -85,3 +101,72 @@ def test_to_native_arrays_and_back():
 def test_integer_arrays_to_float(x, expected):
     # Todo: Fix dtype issue
     assert ivy.array_equal(ivy.func_wrapper.integer_arrays_to_float(_fn1)(x), expected)
+
+
+@pytest.mark.parametrize("fn_name", ["add", "matmul", "sum"])
+def test_fused_wrappers(fn_name):
+    original = ivy.backend_handler.ivy_original_dict[fn_name]
+    backend_fn = ivy.current_backend().__dict__[fn_name]
+    chained = ivy.func_wrapper._wrap_function(fn_name, backend_fn, original)
+    fused = ivy.func_wrapper._wrap_function(fn_name, backend_fn, original, fuse=True)
+    for attr in ivy.func_wrapper.FN_DECORATORS:
+        assert hasattr(fused, attr) == hasattr(chained, attr)
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    args = (x,) if fn_name == "sum" else (x, x)
+    ret = fused(*args)
+    assert isinstance(ret, ivy.Array)
+    assert ivy.array_equal(ret, chained(*args))
+    # containers are mapped over
+    cont = ivy.Container(a=x, b=x)
+    cont_args = (cont,) if fn_name == "sum" else (cont, x)
+    cont_ret = fused(*cont_args)
+    assert isinstance(cont_ret, ivy.Container)
+    assert ivy.array_equal(cont_ret.a, chained(*args))
+    # out argument
+    out = ivy.zeros_like(ret)
+    assert fused(*args, out=out) is out
+    assert ivy.array_equal(out, ret)
+
+
+def _fn8(*args, **kwargs):
+    # Assert no container reached the function
+    assert not ivy.nested_any((args, kwargs), ivy.is_ivy_container, check_nests=True)
+    return args[0]
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((ivy.Container(a=ivy.array([1.0])),), {}),
+        ((ivy.array([1.0]), [ivy.Container(a=ivy.array([1.0]))]), {}),
+        ((ivy.array([1.0]),), {"y": ivy.Container(a=ivy.array([1.0]))}),
+    ],
+)
+def test_handle_nestable(args, kwargs):
+    ret = ivy.func_wrapper.handle_nestable(_fn8)(*args, **kwargs)
+    assert isinstance(ret, ivy.Container)
+    # no containers are searched for within the nestable mode context manager
+    with ivy.NestableMode(False):
+        assert ivy.func_wrapper.handle_nestable(lambda *a, **kw: a[0])(*args) is args[0]
+
+
+def test_nestable_mode_propagates_exceptions():
+    with pytest.raises(ValueError):
+        with ivy.NestableMode(False):
+            raise ValueError
+    assert ivy.get_nestable_mode()
+
+
+def test_has_container_top_level(monkeypatch):
+    x = ivy.array([1.0])
+    cont = ivy.Container(a=x)
+    assert ivy.func_wrapper._scan_args((cont,), {}) == (False, True)
+    assert ivy.func_wrapper._scan_args((), {"x": cont}) == (False, True)
+    assert ivy.func_wrapper._scan_args(({"a": 1},), {}) == (False, False)
+
+    # containers at the top level are found without walking the nests
+    def nested_any(*_, **__):
+        raise AssertionError("nested_any should not be called")
+
+    monkeypatch.setattr(ivy, "nested_any", nested_any)
+    assert ivy.func_wrapper._has_container((cont, [x]), {})
@@ -1,8 +1,5 @@
 """Collection of tests for the demos."""
 
-# global
-import pytest
-
 # local
 import ivy
 import ivy.functional.backends.numpy
@@ -13,11 +10,6 @@ import ivy.functional.backends.numpy
 
 # training
 def test_training_demo(device):
-
-    if ivy.current_backend_str() == "numpy":
-        # numpy does not support gradients
-        pytest.skip()
-
     class MyModel(ivy.Module):
         def __init__(self):
             self.linear0 = ivy.Linear(3, 64)
@@ -0,0 +1,42 @@
+# global
+import numpy as np
+
+# local
+import ivy
+
+
+def test_nested_array():
+    x = ivy.NestedArray.nested_array(
+        [ivy.array([[1.0, 2.0], [3.0, 4.0]]), ivy.array([[5.0, 6.0]])],
+        dtype="float32",
+    )
+    assert x.shape == [2, None, 2]
+    assert x.ndim == 3
+    assert x.dtype == "float32"
+    assert np.array_equal(ivy.to_numpy(x[1]), np.array([[5.0, 6.0]]))
+    assert np.array_equal(ivy.to_numpy(x.values), np.arange(1.0, 7.0))
+    assert np.array_equal(ivy.to_numpy(x.row_splits), np.array([0, 4, 6]))
+    x.reshape([2, -1, 1, 2])
+    assert x.shape == [2, None, 1, 2]
+    assert x[0].shape == (2, 1, 2)
+
+
+def test_nested_array_from_row_lengths():
+    values = ivy.array(np.arange(10.0).reshape((5, 2)))
+    x = ivy.NestedArray.from_row_lengths(values, [2, 0, 3])
+    y = ivy.NestedArray.from_row_split(values, [0, 2, 2, 5])
+    assert x.shape == y.shape == [3, None, 2]
+    assert [tuple(row.shape) for row in x.unbind()] == [(2, 2), (0, 2), (3, 2)]
+    assert np.array_equal(ivy.to_numpy(x[2]), np.arange(4.0, 10.0).reshape((3, 2)))
+    assert np.array_equal(ivy.to_numpy(y.values), ivy.to_numpy(x.values))
+
+
+def test_nested_array_ops():
+    x = ivy.NestedArray.from_row_lengths(ivy.array([1.0, 2.0, 3.0, 4.0, 5.0]), [2, 3])
+    assert np.allclose(ivy.to_numpy((x * 2.0 + x)[1]), [9.0, 12.0, 15.0])
+    assert np.allclose(ivy.to_numpy((1.0 - x)[0]), [0.0, -1.0])
+    assert np.allclose(ivy.to_numpy(x.sum(axis=1)), [3.0, 12.0])
+    assert np.allclose(ivy.to_numpy(x.mean(axis=1)), [1.5, 4.0])
+    assert np.allclose(ivy.to_numpy(x.max(axis=1)), [2.0, 5.0])
+    assert np.allclose(ivy.to_numpy(x.min(axis=1)), [1.0, 3.0])
+    assert np.allclose(ivy.to_numpy(x.sum()), 15.0)
@@ -3,9 +3,11 @@
 # global
 from hypothesis import given, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
+from ivy.functional.ivy.experimental import compilation
 from ivy.functional.ivy.gradients import _variable
 import ivy_tests.test_ivy.helpers as helpers
 
@@ -19,11 +21,18 @@ class TrainableModule(ivy.Module):
         hidden_size=64,
         v=None,
         with_partial_v=False,
+        compile_on_next_step=False,
     ):
         self._linear0 = ivy.Linear(in_size, hidden_size, device=device)
         self._linear1 = ivy.Linear(hidden_size, hidden_size, device=device)
         self._linear2 = ivy.Linear(hidden_size, out_size, device=device)
-        ivy.Module.__init__(self, device=device, v=v, with_partial_v=with_partial_v)
+        ivy.Module.__init__(
+            self,
+            device=device,
+            v=v,
+            with_partial_v=with_partial_v,
+            compile_on_next_step=compile_on_next_step,
+        )
 
     def _forward(self, x):
         x = ivy.expand_dims(x, axis=0)
@@ -42,9 +51,6 @@ class TrainableModule(ivy.Module):
 )
 def test_module_training(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -83,6 +89,124 @@ def test_module_training(batch_shape, input_channels, output_channels, on_device
         return
 
 
+# compiled module
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_compiled(batch_shape, input_channels, output_channels, on_device):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    compiled = TrainableModule(
+        input_channels,
+        output_channels,
+        device=on_device,
+        v=module.v.cont_deep_copy(),
+        compile_on_next_step=True,
+    )
+    for i in range(3):
+        assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(compiled(x)))
+        # the variables are inputs of the compiled graph
+        module.v = module.v * 0.5
+        compiled.v = compiled.v * 0.5
+    assert compiled._compiled
+    assert len(compiled._compiled_fn.graphs) == 1
+    assert np.allclose(
+        ivy.to_numpy(module(x, v=module.v * 2)),
+        ivy.to_numpy(compiled(x, v=compiled.v * 2)),
+    )
+
+
+# compiled module training
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_compiled_training(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    compiled = TrainableModule(
+        input_channels,
+        output_channels,
+        device=on_device,
+        v=module.v.cont_deep_copy(),
+        compile_on_next_step=True,
+    )
+    # the graph is traced outside of the gradient function, and then replayed
+    compiled(x)
+    for i in range(3):
+        _, grads = ivy.execute_with_gradients(
+            lambda v_: ivy.mean(module(x, v=v_)), module.v
+        )
+        _, compiled_grads = ivy.execute_with_gradients(
+            lambda v_: ivy.mean(compiled(x, v=v_)), compiled.v
+        )
+        assert ivy.max(ivy.abs(compiled_grads.linear2.b)) > 0
+        assert ivy.Container.cont_all_true(
+            ivy.Container.cont_multi_map(
+                lambda xs, _: np.allclose(
+                    ivy.to_numpy(xs[0]), ivy.to_numpy(xs[1]), atol=1e-6
+                ),
+                [grads, compiled_grads],
+            )
+        )
+        module.v = ivy.gradient_descent_update(module.v, grads, 1e-3)
+        compiled.v = ivy.gradient_descent_update(compiled.v, compiled_grads, 1e-3)
+
+
+class FallbackModule(ivy.Module):
+    def __init__(self, fallback_to_non_compiled):
+        self.calls = 0
+        ivy.Module.__init__(
+            self,
+            compile_on_next_step=True,
+            fallback_to_non_compiled=fallback_to_non_compiled,
+        )
+
+    def _create_variables(self, device, dtype=None):
+        return {"w": ivy.array([2.0])}
+
+    def _forward(self, x):
+        self.calls += 1
+        if ivy.any(x < 0):
+            raise ValueError("negative input")
+        return x * self.v.w
+
+
+# compiled module fallback
+def test_module_compiled_fallback(monkeypatch):
+    x = ivy.array([1.0, 2.0])
+    # the errors raised by the forward pass are never hidden by the fallback
+    module = FallbackModule(True)
+    with pytest.raises(ValueError):
+        module(-x)
+    assert module.calls == 1
+
+    # whereas the forward pass is called directly if it cannot be compiled
+    def graph(*_):
+        raise TypeError
+
+    monkeypatch.setattr(compilation, "_Graph", graph)
+    module = FallbackModule(True)
+    assert np.allclose(ivy.to_numpy(module(x)), [2.0, 4.0])
+    with pytest.raises(compilation._CompilationError):
+        FallbackModule(False)(x)
+
+
 class TrainableModuleWithList(ivy.Module):
     def __init__(self, in_size, out_size, device=None, hidden_size=64):
         linear0 = ivy.Linear(in_size, hidden_size, device=device)
@@ -110,9 +234,6 @@ def test_module_w_list_training(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -241,9 +362,6 @@ def test_module_w_none_attribute(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
@@ -284,9 +402,6 @@ class TrainableModuleWithDuplicate(ivy.Module):
 )
 def test_module_training_with_duplicate(batch_shape, channels, same_layer, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), channels), "float32"
     )
@@ -322,6 +437,26 @@ def test_module_training_with_duplicate(batch_shape, channels, same_layer, on_de
         return
 
 
+def test_module_with_duplicate_v_updates(on_device):
+    x = ivy.array([[1.0, 2.0]], device=on_device)
+    module = TrainableModuleWithDuplicate(2, False, device=on_device)
+
+    def expected():
+        w = ivy.to_numpy(module.v.linear0.w)
+        b0 = ivy.to_numpy(module.v.linear0.b)
+        b1 = ivy.to_numpy(module.v.linear1.b)
+        return (ivy.to_numpy(x) @ w.T + b0) @ w.T + b1
+
+    assert np.allclose(ivy.to_numpy(module(x)), expected())
+    # linear1 reads w from linear0, and both see the variables set in place
+    module.v.linear0.w = module.v.linear0.w * 2
+    module.v.linear1.b = module.v.linear1.b + 1
+    assert np.allclose(ivy.to_numpy(module(x)), expected())
+    # and the variables of a new container
+    module.v = module.v * 3
+    assert np.allclose(ivy.to_numpy(module(x)), expected())
+
+
 class TrainableModuleWithDict(ivy.Module):
     def __init__(self, in_size, out_size, device=None, hidden_size=64):
         linear0 = ivy.Linear(in_size, hidden_size, device=device)
@@ -349,9 +484,6 @@ def test_module_w_dict_training(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -416,9 +548,6 @@ def test_with_custom_var_structure(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     module = WithCustomVarStructure(input_channels, output_channels, device=on_device)
     assert "x" in module.v
     assert "y" in module.v
@@ -460,9 +589,6 @@ class WithNestedModules(ivy.Module):
 )
 def test_top_variables(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     module = WithNestedModules(input_channels, output_channels, device=on_device)
     for key_chain in [
         "dl0",
@@ -502,9 +628,6 @@ def test_top_variables(batch_shape, input_channels, output_channels, on_device):
 )
 def test_top_module(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
@@ -536,9 +659,6 @@ def test_v_with_top_v_key_chains(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
@@ -600,9 +720,6 @@ def test_v_with_top_v_key_chains(
 )
 def test_module_depth(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
@@ -630,9 +747,6 @@ def test_module_depth(batch_shape, input_channels, output_channels, on_device):
 )
 def test_module_height(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
@@ -660,9 +774,6 @@ def test_module_height(batch_shape, input_channels, output_channels, on_device):
 )
 def test_sub_modules(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     module = WithNestedModules(input_channels, output_channels, device=on_device)
 
@@ -698,9 +809,6 @@ def test_module_track_submod_rets(
     batch_shape, input_channels, output_channels, on_device
 ):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
 
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
@@ -2,9 +2,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
-from hypothesis import strategies as st
+from hypothesis import given, strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 import ivy_tests.test_ivy.helpers.test_parameter_flags as pf
 from ivy_tests.test_ivy.helpers import handle_method
@@ -194,6 +197,117 @@ def test_adam_optimizer(
     )
 
 
+# compiled adam
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", full=False),
+        num_arrays=4,
+        shared_dtype=True,
+        min_value=-10,
+        max_value=10,
+    ),
+    inplace=st.booleans(),
+)
+def test_adam_optimizer_compiled(dtype_x, inplace, on_device):
+    _, (v, *grads) = dtype_x
+    vs = [ivy.Container(w=ivy.array(v, device=on_device)) for _ in range(2)]
+    optimizers = [
+        ivy.Adam(lr=1e-2, inplace=inplace, device=on_device),
+        ivy.Adam(lr=1e-2, inplace=inplace, compile_on_next_step=True, device=on_device),
+    ]
+    for grad in grads:
+        grad = ivy.Container(w=ivy.array(grad, device=on_device))
+        vs = [optimizer.step(v, grad) for optimizer, v in zip(optimizers, vs)]
+    # the first step initializes the optimizer, and the next ones are compiled
+    assert optimizers[1]._compiled
+    assert len(optimizers[1]._compiled_step_fn.graphs) == 1
+    assert np.allclose(ivy.to_numpy(vs[0].w), ivy.to_numpy(vs[1].w), rtol=1e-3)
+    assert np.allclose(
+        ivy.to_numpy(optimizers[0].state.mw.w),
+        ivy.to_numpy(optimizers[1].state.mw.w),
+        rtol=1e-3,
+    )
+
+
+# fused
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float", full=False),
+        num_arrays=6,
+        shared_dtype=True,
+        min_value=-10,
+        max_value=10,
+        min_num_dims=1,
+    ),
+    optimizer=st.sampled_from(
+        [
+            (ivy.SGD, {}),
+            (ivy.LARS, {"decay_lambda": 0.1}),
+            (ivy.Adam, {}),
+            (ivy.LAMB, {"decay_lambda": 0.1}),
+        ]
+    ),
+)
+def test_optimizer_fused(dtype_x, optimizer, on_device):
+    _, (w0, w1, *grads) = dtype_x
+    cls, kwargs = optimizer
+    vs = [
+        ivy.Container(
+            a=ivy.array(w0, device=on_device),
+            b={"c": ivy.array(w1, device=on_device)},
+        )
+        for _ in range(2)
+    ]
+    optimizers = [
+        cls(lr=1e-2, **kwargs),
+        cls(lr=1e-2, fused=True, **kwargs),
+    ]
+    for grad0, grad1 in zip(grads[::2], grads[1::2]):
+        grad = ivy.Container(
+            a=ivy.array(grad0, device=on_device),
+            b={"c": ivy.array(grad1, device=on_device)},
+        )
+        vs = [optimizer.step(v, grad) for optimizer, v in zip(optimizers, vs)]
+    # the variables and the state are views onto the flat buffers
+    assert len(optimizers[1]._layout.groups) == 1
+    for kc, x in vs[0].cont_to_iterator():
+        assert np.allclose(
+            ivy.to_numpy(x), ivy.to_numpy(vs[1][kc]), rtol=1e-3, atol=1e-5
+        )
+    for kc, x in optimizers[0].state.cont_to_iterator():
+        assert np.allclose(
+            ivy.to_numpy(x),
+            ivy.to_numpy(optimizers[1].state[kc]),
+            rtol=1e-3,
+            atol=1e-5,
+        )
+
+
+@pytest.mark.parametrize("cls", [ivy.Adam, ivy.LAMB])
+def test_optimizer_fused_new_variables(cls, on_device):
+    def cont(**kwargs):
+        return ivy.Container(
+            {k: ivy.array(x, device=on_device) for k, x in kwargs.items()}
+        )
+
+    optimizers = [cls(lr=1e-2), cls(lr=1e-2, fused=True)]
+    v = cont(a=[1.0, 2.0], b=[3.0])
+    grads = cont(a=[0.5, -0.5], b=[1.0])
+    vs = [optimizer.step(v, grads) for optimizer in optimizers]
+    # the variables change between the steps, keeping only a
+    v = cont(a=ivy.to_numpy(vs[1].a), c=[[4.0, 5.0], [6.0, 7.0]])
+    grads = cont(a=[1.0, 2.0], c=[[1.0, 1.0], [1.0, 1.0]])
+    # the state of a is kept, and compared with the optimizer which only updates a
+    optimizers[0].set_state(optimizers[0].state.cont_at_key_chains(["mw/a", "vw/a"]))
+    new_a = optimizers[0].step(cont(a=ivy.to_numpy(vs[0].a)), cont(a=[1.0, 2.0])).a
+    new_v = optimizers[1].step(v, grads)
+    state = optimizers[1].state
+    assert np.allclose(ivy.to_numpy(new_v.a), ivy.to_numpy(new_a))
+    assert np.allclose(ivy.to_numpy(state.mw.a), ivy.to_numpy(optimizers[0].state.mw.a))
+    assert state.mw.c.shape == (2, 2)
+    assert "b" not in state.mw
+
+
 # lamb
 @handle_method(
     method_tree="LAMB._step",